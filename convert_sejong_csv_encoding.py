@@ -1,11 +1,44 @@
-import pandas as pd
+"""
+공공데이터 CSV 인코딩 변환 (cp949/EUC-KR → UTF-8-SIG)
+
+- 바이트 스트리밍 변환 (scripts/csv_encoding.py): DataFrame으로 읽지 않으므로
+  따옴표·숫자 표기(앞자리 0, 소수점 자리수)·줄바꿈이 원본과 같고 인코딩만 바뀐다
+- 원본 인코딩은 파일 앞부분으로 판별 (이미 UTF-8인 파일도 BOM만 붙여 그대로 복사)
+- 여러 파일은 프로세스 풀로 동시에 변환
+
+실행: python convert_sejong_csv_encoding.py                  # 아래 기본 4개 파일
+      python convert_sejong_csv_encoding.py a.csv b.csv      # 지정 파일
+결과: 원본 옆에 <이름>_utf8.csv
+"""
+
+import argparse
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent / "scripts"))
+
+from csv_encoding import transcode_file, transcode_files
+
+DEFAULT_FILES = [
+    # 1) 세종특별자치시 체력 측정 내역
+    "/Users/jaysmac/Downloads/세종특별자치시_체력 측정 내역_20241231.csv",
+    # 2) 충청북도 청주시 굿충주헬스케어 체력평가 현황
+    "/Users/jaysmac/Downloads/충청북도 충주시_굿충주헬스케어 체력평가 현황_20240331.csv",
+    # 3) 한국건강증진개발원 모바일 헬스케어 운동
+    "/Users/jaysmac/Downloads/한국건강증진개발원_보건소 모바일 헬스케어 운동_20251120.csv",
+    # 4) 경기도 화성시 만성질환관리 프로그램 통계(운동)
+    "/Users/jaysmac/Downloads/경기도 화성시_만성질환관리 프로그램 통계(운동)_20191231.csv",
+]
+
+
+def utf8_path(src_path: Path) -> Path:
+    return src_path.with_name(src_path.stem + "_utf8.csv")
+
 
 def convert_cp949_to_utf8(src: str) -> None:
-    """cp949(EUC-KR) CSV → UTF-8-SIG CSV로 변환."""
+    """cp949(EUC-KR) CSV → UTF-8-SIG CSV로 변환 (단일 파일)."""
     src_path = Path(src)
-    dst_path = src_path.with_name(src_path.stem + "_utf8.csv")
+    dst_path = utf8_path(src_path)
 
     print(f"원본 파일: {src_path}")
 
@@ -16,35 +49,38 @@ def convert_cp949_to_utf8(src: str) -> None:
     print(f"변환 파일: {dst_path}")
 
     try:
-        df = pd.read_csv(src_path, encoding="cp949")
-        df.to_csv(dst_path, index=False, encoding="utf-8-sig")
-        print("✅ 인코딩 변환 완료 (cp949 → utf-8-sig).")
+        enc, _ = transcode_file(src_path, dst_path)
+        print(f"✅ 인코딩 변환 완료 ({enc} → utf-8-sig).")
     except Exception as e:
         print(f"🚨 변환 중 오류 발생: {e}")
 
 
-def main():
-    # 1) 세종특별자치시 체력 측정 내역
-    convert_cp949_to_utf8(
-        "/Users/jaysmac/Downloads/세종특별자치시_체력 측정 내역_20241231.csv"
-    )
+def convert_all(files: list[str], workers: int | None = None) -> None:
+    """여러 파일을 동시에 변환 (없는 파일은 건너뜀)"""
+    pairs = []
+    for src in files:
+        src_path = Path(src)
+        if not src_path.exists():
+            print(f"⚠️ 파일이 존재하지 않습니다. 건너뜁니다: {src_path}")
+            continue
+        pairs.append((src_path, utf8_path(src_path)))
+    if not pairs:
+        return
 
-    # 2) 충청북도 청주시 굿충주헬스케어 체력평가 현황
-    convert_cp949_to_utf8(
-        "/Users/jaysmac/Downloads/충청북도 충주시_굿충주헬스케어 체력평가 현황_20240331.csv"
-    )
+    for src, dst, enc, n, err in transcode_files(pairs, workers=workers):
+        if err:
+            print(f"🚨 {Path(src).name}: 변환 중 오류 발생: {err}")
+        else:
+            print(f"✅ {Path(src).name} → {Path(dst).name} ({enc} → utf-8-sig, {n / 1e6:,.1f} MB)")
 
-    # 3) 한국건강증진개발원 모바일 헬스케어 운동
-    convert_cp949_to_utf8(
-        "/Users/jaysmac/Downloads/한국건강증진개발원_보건소 모바일 헬스케어 운동_20251120.csv"
-    )
 
-    # 4) 경기도 화성시 만성질환관리 프로그램 통계(운동)
-    convert_cp949_to_utf8(
-        "/Users/jaysmac/Downloads/경기도 화성시_만성질환관리 프로그램 통계(운동)_20191231.csv"
-    )
+def main():
+    ap = argparse.ArgumentParser(description="공공데이터 CSV → UTF-8-SIG 변환")
+    ap.add_argument("files", nargs="*", default=DEFAULT_FILES)
+    ap.add_argument("--workers", type=int, default=None, help="동시 변환 프로세스 수 (기본: 파일 수·CPU 수 중 작은 값, 최대 4)")
+    args = ap.parse_args()
+    convert_all(args.files, args.workers)
 
 
 if __name__ == "__main__":
     main()
-
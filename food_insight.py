@@ -0,0 +1,112 @@
+"""
+clinical_insight / synthetic_qa 컬럼 일괄 생성 (벡터화)
+
+process_large_xlsx_to_csv.py · process_new_data.py · process_data.py 공용.
+행마다 df.apply(axis=1) + json.dumps 하던 것을 불리언 마스크와 컬럼 단위
+문자열 연결로 대체한다. 출력 문자열은 기존 행 단위 구현과 바이트 단위로 동일.
+
+  - 숫자 → 문자열은 f-string과 같은 str() 표현 (12.3, 0, nan ...)
+  - `x or 0` / `x or ""` 의미 유지 (0·None·"" → 기본값, NaN은 그대로 'nan')
+  - JSON은 json.dumps(ensure_ascii=False) 기본 구분자(", ", ": ") 형식.
+    문자열 이스케이프는 json 모듈의 C 인코더(encode_basestring)를 그대로 사용
+
+검증·속도 비교: python3 scripts/bench/bench_food_insight.py
+"""
+
+import json
+import operator
+from json.encoder import encode_basestring
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_INSIGHT = "균형 잡힌 영양 성분입니다."
+SODIUM_WARN_MG  = 500   # 1인분 나트륨 (mg) 이상 → 고혈압 주의
+SUGAR_WARN_G    = 10    # 당류 (g) 이상 → 당뇨 관리
+PROTEIN_RICH_G  = 15    # 단백질 (g) 이상 → 근성장·유지
+
+
+# ── 컬럼 단위 문자열 변환 ───────────────────────────────────────
+def to_text(s: pd.Series) -> pd.Series:
+    """각 값의 str() (f-string 삽입 결과와 동일)"""
+    return s.astype(object).map(str).astype(object)
+
+
+def or_default(s: pd.Series, default):
+    """`v or default` 의 컬럼 버전 (falsy 값만 default로, NaN은 truthy라 그대로)"""
+    if pd.api.types.is_numeric_dtype(s):
+        falsy = (s == 0).to_numpy()
+    else:
+        falsy = s.astype(object).map(operator.not_).to_numpy(dtype=bool)
+    if not falsy.any():
+        return s
+    return s.astype(object).mask(falsy, default)
+
+
+def column(df: pd.DataFrame, name: str, default) -> pd.Series:
+    """row.get(name) or default — 컬럼이 없으면 전부 default"""
+    if name not in df.columns:
+        return pd.Series(default, index=df.index, dtype=object)
+    return or_default(df[name], default)
+
+
+def json_string(s: pd.Series) -> pd.Series:
+    """문자열 컬럼 → JSON 문자열 리터럴 (따옴표 포함).
+
+    json.dumps(str, ensure_ascii=False)가 내부에서 쓰는 C 인코더를 값마다 직접 호출.
+    """
+    return s.astype(object).map(encode_basestring).astype(object)
+
+
+def json_object(fields: dict) -> pd.Series:
+    """{키: 문자열 컬럼} → 행마다 json.dumps({...}, ensure_ascii=False) 와 같은 문자열"""
+    out = None
+    for i, (key, s) in enumerate(fields.items()):
+        head = ("{" if i == 0 else ", ") + json.dumps(key, ensure_ascii=False) + ": "
+        part = head + json_string(s)
+        out = part if out is None else out + part
+    return out + "}"
+
+
+# ── clinical_insight / synthetic_qa ────────────────────────────
+def clinical_insight(df: pd.DataFrame) -> pd.Series:
+    """나트륨·당류·단백질 기준 임상 코멘트 (해당 항목 문장을 공백으로 연결)"""
+    sodium  = column(df, "sodium", 0)
+    sugar   = column(df, "sugar", 0)
+    protein = column(df, "protein", 0)
+
+    parts = []
+    m = (sodium >= SODIUM_WARN_MG).to_numpy(dtype=bool)
+    if m.any():
+        txt = pd.Series("", index=df.index, dtype=object)
+        txt[m] = "1인분 기준 나트륨 " + sodium[m].map(int).map(str) + "mg로 고혈압 주의가 필요합니다."
+        parts.append((m, txt))
+    m = (sugar >= SUGAR_WARN_G).to_numpy(dtype=bool)
+    if m.any():
+        txt = pd.Series("", index=df.index, dtype=object)
+        txt[m] = "당류 " + to_text(sugar[m]) + "g 포함으로 당뇨 관리 시 양을 조절하세요."
+        parts.append((m, txt))
+    m = (protein >= PROTEIN_RICH_G).to_numpy(dtype=bool)
+    if m.any():
+        parts.append((m, pd.Series(np.where(m, "단백질이 풍부해 근성장·유지에 도움이 됩니다.", ""),
+                                   index=df.index, dtype=object)))
+
+    out = pd.Series("", index=df.index, dtype=object)
+    any_part = np.zeros(len(df), dtype=bool)
+    for m, txt in parts:
+        sep = np.where(m & any_part, " ", "")
+        out = out + sep + txt
+        any_part |= m
+    out[~any_part] = DEFAULT_INSIGHT
+    return out
+
+
+def synthetic_qa(df: pd.DataFrame) -> pd.Series:
+    """{"question": "<식품명>의 칼로리와 영양은?", "answer": "1인분 기준 <kcal>kcal이며, <insight>"}"""
+    name    = to_text(column(df, "food_name", ""))
+    cal     = to_text(column(df, "calories", 0))
+    insight = to_text(column(df, "clinical_insight", ""))
+    return json_object({
+        "question": name + "의 칼로리와 영양은?",
+        "answer":   "1인분 기준 " + cal + "kcal이며, " + insight,
+    })
@@ -3,14 +3,16 @@ raw_food_db.xlsx 상위 100행만 추출해서 check_sample.xlsx로 저장하는
 
 실행:
     python make_check_sample.py
+    python make_check_sample.py --engine calamine
 결과:
     - 원본: raw_food_db.xlsx
     - 샘플: check_sample.xlsx (상위 100행)
 """
 
+import argparse
 from pathlib import Path
 
-import pandas as pd
+from xlsx_reader import DEFAULT_ENGINE, ENGINES, check_engine, read_excel
 
 
 INPUT_XLSX = "raw_food_db.xlsx"
@@ -19,6 +21,11 @@ NROWS = 100
 
 
 def main():
+    ap = argparse.ArgumentParser(description=f"{INPUT_XLSX} 상위 {NROWS}행 → {OUTPUT_XLSX}")
+    ap.add_argument("--engine", choices=ENGINES, default=DEFAULT_ENGINE, help="엑셀 파서 (기본 openpyxl)")
+    engine = ap.parse_args().engine
+    check_engine(engine)
+
     base_dir = Path(__file__).resolve().parent
     src = base_dir / INPUT_XLSX
     dst = base_dir / OUTPUT_XLSX
@@ -29,7 +36,7 @@ def main():
 
     print(f"📥 {INPUT_XLSX}에서 상위 {NROWS}행만 읽는 중...")
     # nrows 옵션으로 상위 N행만 메모리에 로드
-    df = pd.read_excel(src, nrows=NROWS)
+    df = read_excel(src, engine, nrows=NROWS)
 
     print(f"💾 {OUTPUT_XLSX}로 저장 중...")
     df.to_excel(dst, index=False)
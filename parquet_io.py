@@ -0,0 +1,141 @@
+"""
+가공 결과 Parquet 입출력 (CSV 대신 쓰는 중간 포맷)
+
+process_large_xlsx_to_csv.py · process_new_data.py · process_rda_xlsx.py 가 --format parquet 로 쓰고,
+upload_data.py · upload_rda_final.py 는 .parquet 경로를 받으면 이 모듈로 읽는다.
+
+  - 스키마 고정: 텍스트 컬럼은 string, 나머지는 float64 → 업로드 시 타입 재추론 없음
+  - zstd 압축, ROW_GROUP_SIZE 행마다 row group 하나
+  - 업로드 이어하기: 메타데이터의 row group별 행 수로 start_row가 든 그룹부터 바로 읽음
+    (앞쪽 그룹은 열지 않음). 필요한 컬럼만 읽는 열 투영 지원
+  - 텍스트 컬럼의 빈 문자열은 None 으로 읽음 (pd.read_csv 가 빈 칸을 NaN → None 으로 올리는 것과 같게)
+
+pyarrow 필요 (pip install pyarrow). CSV만 쓸 때는 설치하지 않아도 된다.
+CSV 대비 크기·읽기 속도: python3 scripts/bench/bench_parquet_io.py
+"""
+
+from pathlib import Path
+
+import pandas as pd
+
+FORMATS = ("csv", "parquet")
+DEFAULT_FORMAT = "csv"
+ROW_GROUP_SIZE = 50_000
+COMPRESSION = "zstd"
+
+
+def check_pyarrow():
+    """pyarrow 사용 가능 여부 확인 → 불가하면 설치 안내와 함께 종료"""
+    try:
+        import pyarrow  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        raise SystemExit("❌ pyarrow 필요: pip install pyarrow")
+
+
+def output_path(path: Path, fmt: str) -> Path:
+    """출력 형식에 맞는 파일 경로 (parquet이면 확장자만 .parquet 로 교체)"""
+    return Path(path).with_suffix(".parquet") if fmt == "parquet" else Path(path)
+
+
+def is_parquet(path) -> bool:
+    return Path(path).suffix.lower() == ".parquet"
+
+
+def schema(columns: list[str], text_cols: set[str]):
+    """columns 순서 그대로, text_cols는 string · 나머지는 float64"""
+    import pyarrow as pa
+    return pa.schema([(c, pa.string() if c in text_cols else pa.float64()) for c in columns])
+
+
+def _to_table(df: pd.DataFrame, sch):
+    import pyarrow as pa
+    return pa.Table.from_pandas(df[sch.names], schema=sch, preserve_index=False)
+
+
+def write_frame(df: pd.DataFrame, path: Path, text_cols: set[str]):
+    """DataFrame 전체를 한 번에 Parquet으로 저장"""
+    import pyarrow.parquet as pq
+    sch = schema(list(df.columns), text_cols)
+    pq.write_table(_to_table(df, sch), path, row_group_size=ROW_GROUP_SIZE, compression=COMPRESSION)
+
+
+class ChunkWriter:
+    """청크 DataFrame을 이어 쓰되 row group은 ROW_GROUP_SIZE 행 단위로 모아서 기록"""
+
+    def __init__(self, path: Path, columns: list[str], text_cols: set[str]):
+        import pyarrow.parquet as pq
+        self.schema = schema(columns, text_cols)
+        self._writer = pq.ParquetWriter(path, self.schema, compression=COMPRESSION)
+        self._pending = []
+        self._pending_rows = 0
+
+    def write(self, df: pd.DataFrame):
+        self._pending.append(_to_table(df, self.schema))
+        self._pending_rows += len(df)
+        if self._pending_rows >= ROW_GROUP_SIZE:
+            self._flush(final=False)
+
+    def _flush(self, final: bool):
+        import pyarrow as pa
+        table = pa.concat_tables(self._pending)
+        full = len(table) if final else len(table) - len(table) % ROW_GROUP_SIZE
+        if full:
+            self._writer.write_table(table.slice(0, full), row_group_size=ROW_GROUP_SIZE)
+        rest = table.slice(full)
+        self._pending = [rest] if len(rest) else []
+        self._pending_rows = len(rest)
+
+    def close(self):
+        if self._pending:
+            self._flush(final=True)
+        self._writer.close()
+
+
+def read_batches(path, batch_size: int, start_row: int = 0, columns: list[str] | None = None):
+    """
+    업로드용 배치 읽기 → (전체 행 수, DataFrame 배치 iterator)
+    배치 경계는 start_row + k × batch_size 로 CSV 경로(df.iloc 슬라이스)와 같다.
+      .parquet : row group 단위 스트리밍, start_row 이전 그룹은 건너뜀, columns 로 열 투영
+      그 외    : pd.read_csv 로 전체 로드 (기존 동작, columns 무시)
+    """
+    if not is_parquet(path):
+        df = pd.read_csv(path)
+        total = len(df)
+        return total, (df.iloc[i:i + batch_size] for i in range(start_row, total, batch_size))
+
+    check_pyarrow()
+    import pyarrow.parquet as pq
+    pf = pq.ParquetFile(path)
+    if columns is not None:
+        names = set(pf.schema_arrow.names)
+        columns = [c for c in columns if c in names]
+    return pf.metadata.num_rows, _iter_row_groups(pf, batch_size, start_row, columns)
+
+
+def _iter_row_groups(pf, batch_size: int, start_row: int, columns):
+    import pyarrow as pa
+    meta = pf.metadata
+    text_cols = [f.name for f in pf.schema_arrow
+                 if pa.types.is_string(f.type) and (columns is None or f.name in columns)]
+    offset = 0
+    carry = None   # 이전 row group에서 배치를 채우지 못하고 남은 행
+    for g in range(meta.num_row_groups):
+        n = meta.row_group(g).num_rows
+        if offset + n <= start_row:   # 이미 올린 구간 → 읽지 않음
+            offset += n
+            continue
+        df = pf.read_row_group(g, columns=columns).to_pandas()
+        if text_cols:  # CSV 경로와 같은 레코드가 되도록 빈 문자열 → None
+            df[text_cols] = df[text_cols].replace({"": None})
+        if offset < start_row:
+            df = df.iloc[start_row - offset:]
+        offset += n
+        if carry is not None:
+            df = pd.concat([carry, df], ignore_index=True)
+        full = len(df) - len(df) % batch_size
+        for i in range(0, full, batch_size):
+            yield df.iloc[i:i + batch_size]
+        carry = df.iloc[full:] if full < len(df) else None
+    if carry is not None:
+        yield carry
@@ -1,9 +1,10 @@
-import json
 import pandas as pd
 from numbers_parser import Document
 from pathlib import Path
 import glob
 
+from food_insight import json_object, to_text
+
 def main():
     # 1. 파일 찾기
     files = glob.glob("*.numbers")
@@ -32,8 +33,8 @@ def main():
         print(f"⚖️ {weight_cols[0]} 기준으로 1인분 환산 완료!")
 
     # 4. 인사이트 및 QA 생성
-    df['clinical_insight'] = df.apply(lambda r: f"1인분 기준 나트륨 {r['sodium']}mg 함유 식품입니다.", axis=1)
-    df['synthetic_qa'] = df.apply(lambda r: json.dumps({"q": f"{r['food_name']} 영양은?", "a": f"{r['calories']}kcal입니다."}, ensure_ascii=False), axis=1)
+    df['clinical_insight'] = "1인분 기준 나트륨 " + to_text(df['sodium']) + "mg 함유 식품입니다."
+    df['synthetic_qa'] = json_object({"q": to_text(df['food_name']) + " 영양은?", "a": to_text(df['calories']) + "kcal입니다."})
 
     # 5. 수파베이스 전용 컬럼만 추출 (매우 중요!)
     final_cols = ["food_name", "calories", "protein", "fat", "carbs", "sugar", "sodium", "clinical_insight", "synthetic_qa"]
@@ -1,7 +1,7 @@
 """
 엑셀 → Supabase 업로드용 CSV 변환 (메모리 절약 청크 처리)
 
-- openpyxl read_only=True로 엑셀 스트리밍, 1만 행 단위 청킹 후 CSV에 이어붙이기
+- 엑셀 행 스트리밍(openpyxl read_only 또는 --engine calamine), 1만 행 단위 청킹 후 CSV에 이어붙이기
 - 9개 영문 컬럼, 1인분 영양 환산, clinical_insight, synthetic_qa 생성 (동일 로직)
 
 실행 예:
@@ -10,34 +10,48 @@
 
   python process_large_xlsx_to_csv.py raw_food_db_part2.xlsx processed_food_db_part2.csv
     → part2 전용 (기존 _final_250k.csv 파일은 건드리지 않음)
+
+  python process_large_xlsx_to_csv.py --engine calamine
+    → Rust 기반 calamine 파서 사용 (pip install python-calamine, 출력 동일)
+
+  python process_large_xlsx_to_csv.py --workers 1
+    → 변환을 메인 프로세스에서 순차 실행 (기본: 프로세스 풀)
+
+  python process_large_xlsx_to_csv.py --format parquet
+    → processed_food_db_final_250k.parquet (타입 고정·압축, pip install pyarrow, parquet_io.py)
+
+파이프라인: 읽기(메인 스레드) → 변환(프로세스 풀, 청크 단위) → 쓰기(전용 스레드, 청크 순서 유지).
+진행 중인 청크 수는 workers × 2 로 제한되어 파일 크기와 관계없이 메모리가 일정하다.
 """
 
-import json
-import sys
+import argparse
+import multiprocessing as mp
+import os
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import pandas as pd
 
-try:
-    from openpyxl import load_workbook
-except ImportError:
-    raise SystemExit("❌ openpyxl 필요: pip install openpyxl")
+import parquet_io
+from food_insight import clinical_insight, synthetic_qa
+from xlsx_reader import DEFAULT_ENGINE, ENGINES, check_engine, iter_rows
 
-# 입출력: 인자 2개 주면 part2 등 별도 파일로 동작, 없으면 기본 25만 건용
-if len(sys.argv) >= 3:
-    INPUT_XLSX = sys.argv[1]
-    OUTPUT_CSV = sys.argv[2]
-else:
-    INPUT_XLSX = "raw_food_db.xlsx"
-    OUTPUT_CSV = "processed_food_db_final_250k.csv"
+# 입출력 기본값 (기본 25만 건용). 인자 2개 주면 part2 등 별도 파일로 동작
+INPUT_XLSX = "raw_food_db.xlsx"
+OUTPUT_CSV = "processed_food_db_final_250k.csv"
 
 CHUNK_SIZE = 10_000
+DEFAULT_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
 
 NUTRIENT_COLS = ["calories", "protein", "fat", "carbs", "sugar", "sodium"]
 FINAL_COLS = [
     "food_name", "calories", "protein", "fat", "carbs", "sugar", "sodium",
     "clinical_insight", "synthetic_qa",
 ]
+TEXT_COLS = {"food_name", "clinical_insight", "synthetic_qa"}
 
 # 원본 한글 컬럼 → 수파베이스 영문 컬럼 (여러 표기 허용)
 COLUMN_MAPPING = [
@@ -93,39 +107,11 @@ def apply_serving_conversion(df: pd.DataFrame, weight_col) -> pd.DataFrame:
     return df
 
 
-def add_clinical_insight(row: pd.Series) -> str:
-    sodium = row.get("sodium") or 0
-    sugar = row.get("sugar") or 0
-    protein = row.get("protein") or 0
-    parts = []
-    if sodium >= 500:
-        parts.append(f"1인분 기준 나트륨 {int(sodium)}mg로 고혈압 주의가 필요합니다.")
-    if sugar >= 10:
-        parts.append(f"당류 {sugar}g 포함으로 당뇨 관리 시 양을 조절하세요.")
-    if protein >= 15:
-        parts.append("단백질이 풍부해 근성장·유지에 도움이 됩니다.")
-    if not parts:
-        return "균형 잡힌 영양 성분입니다."
-    return " ".join(parts)
-
-
-def add_synthetic_qa(row: pd.Series) -> str:
-    name = row.get("food_name") or ""
-    cal = row.get("calories") or 0
-    insight = row.get("clinical_insight") or ""
-    return json.dumps({
-        "question": f"{name}의 칼로리와 영양은?",
-        "answer": f"1인분 기준 {cal}kcal이며, {insight}"
-    }, ensure_ascii=False)
-
-
-def stream_xlsx_rows(path: Path, chunk_size: int):
-    """엑셀을 read_only로 열고 행을 청크 단위로 yield (메모리 절약)."""
-    wb = load_workbook(path, read_only=True, data_only=True)
-    ws = wb.active
+def stream_xlsx_rows(path: Path, chunk_size: int, engine: str = DEFAULT_ENGINE):
+    """엑셀 행을 청크 단위로 yield (메모리 절약). engine: openpyxl / calamine"""
     header = None
     chunk = []
-    for row in ws.iter_rows(values_only=True):
+    for row in iter_rows(path, engine=engine):
         if header is None:
             header = [str(c) if c is not None else "" for c in row]
             continue
@@ -135,62 +121,145 @@ def stream_xlsx_rows(path: Path, chunk_size: int):
             chunk = []
     if chunk:
         yield header, chunk
-    wb.close()
+
+
+def transform_chunk(header: list, rows: list, weight_col, with_header: bool, fmt: str = "csv"):
+    """원본 행 청크 → FINAL_COLS CSV 텍스트 (parquet이면 DataFrame). 프로세스 풀 워커에서 실행"""
+    n_cols = len(header)
+    # 셀 개수가 헤더와 다를 수 있으므로 길이 맞춤
+    normalized = [(r + [None] * n_cols)[:n_cols] for r in rows]
+    df = pd.DataFrame(normalized, columns=header)
+    df = apply_column_mapping(df)
+    df = apply_serving_conversion(df, weight_col)
+    df["clinical_insight"] = clinical_insight(df)
+    df["synthetic_qa"] = synthetic_qa(df)
+    if fmt == "parquet":
+        return df[FINAL_COLS]
+    return df[FINAL_COLS].to_csv(index=False, header=with_header)
+
+
+def chunk_writer(out_path: Path, fmt: str, q: queue.Queue, state: dict):
+    """큐에서 (CSV 텍스트 또는 DataFrame, 행 수)를 받아 순서대로 파일에 기록 (None = 종료)
+
+    열기·쓰기 오류는 종류와 관계없이(OSError, pyarrow ArrowInvalid/ArrowTypeError 등) state["error"]에
+    남기고 큐는 끝까지 비운다 — 스레드가 죽으면 생산자가 꽉 찬 큐의 put 에서 영원히 멈춘다.
+    """
+    try:
+        if fmt == "parquet":
+            f = parquet_io.ChunkWriter(out_path, FINAL_COLS, TEXT_COLS)
+        else:
+            f = open(out_path, "w", encoding="utf-8-sig", newline="")
+    except Exception as e:
+        state["error"], f = e, None
+    while True:
+        item = q.get()
+        if item is None:
+            break
+        if state["error"]:
+            continue  # 쓰기 실패 후에는 큐만 비워서 생산자가 막히지 않게 함
+        data, n = item
+        try:
+            f.write(data)
+        except Exception as e:
+            state["error"] = e
+            continue
+        state["rows"] += n
+        # 1만 건마다 "X만 건 변환 완료" 로그 출력
+        if state["rows"] % 10_000 == 0:
+            print(f"   ✅ {state['rows'] // 10_000}만 건 변환 완료")
+    if f:
+        try:
+            f.close()
+        except Exception as e:
+            state["error"] = state["error"] or e
+
+
+def parse_args():
+    ap = argparse.ArgumentParser(description="엑셀 → Supabase 업로드용 CSV 변환 (청크 처리)")
+    ap.add_argument("input_xlsx", nargs="?", default=INPUT_XLSX)
+    ap.add_argument("output_csv", nargs="?", default=None)
+    ap.add_argument("--engine", choices=ENGINES, default=DEFAULT_ENGINE, help="엑셀 파서 (기본 openpyxl)")
+    ap.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                    help=f"변환 프로세스 수 (기본 {DEFAULT_WORKERS}, 1이면 순차 실행)")
+    ap.add_argument("--format", choices=parquet_io.FORMATS, default=parquet_io.DEFAULT_FORMAT,
+                    help="출력 형식 (parquet이면 확장자를 .parquet 로 바꿔 저장)")
+    args = ap.parse_args()
+    if args.output_csv is None:  # 인자 2개를 모두 줄 때만 별도 파일로 동작
+        args.input_xlsx, args.output_csv = INPUT_XLSX, OUTPUT_CSV
+    return args
 
 
 def main():
+    args = parse_args()
+    check_engine(args.engine)
+    if args.format == "parquet":
+        parquet_io.check_pyarrow()
+
     folder = Path(__file__).resolve().parent
-    xlsx_path = folder / INPUT_XLSX
-    csv_path = folder / OUTPUT_CSV
+    input_xlsx = args.input_xlsx
+    xlsx_path = folder / input_xlsx
+    out_path = parquet_io.output_path(folder / args.output_csv, args.format)
+    output_name = out_path.name
 
     if not xlsx_path.exists():
-        print(f"❌ 현재 폴더에 {INPUT_XLSX} 이(가) 없습니다.")
+        print(f"❌ 현재 폴더에 {input_xlsx} 이(가) 없습니다.")
         return
 
-    print(f"📥 {INPUT_XLSX} → {OUTPUT_CSV} (청크당 {CHUNK_SIZE:,}행)")
-    weight_col_global = None
-    total_rows = 0
-    first_chunk = True
-
-    for header, rows in stream_xlsx_rows(xlsx_path, CHUNK_SIZE):
-        n_cols = len(header)
-        # 셀 개수가 헤더와 다를 수 있으므로 길이 맞춤
-        normalized = [(r + [None] * n_cols)[:n_cols] for r in rows]
-        df = pd.DataFrame(normalized, columns=header)
-        # 첫 청크에서만 기준 중량 컬럼 결정
-        if weight_col_global is None:
-            weight_col_global = find_weight_column(df.columns)
-            if weight_col_global:
-                print(f"⚖️ 기준 중량 컬럼: '{weight_col_global}' (1인분 환산)")
-            else:
-                print("⚖️ 기준 중량 컬럼 없음 → 100g 기준 유지")
-
-        df = apply_column_mapping(df)
-        missing = [c for c in ["food_name"] + NUTRIENT_COLS if c not in df.columns]
-        if missing:
-            print(f"❌ 원본에 필수 컬럼 없음: {missing}. 원본 컬럼: {list(df.columns)[:20]}...")
-            return
-
-        df = apply_serving_conversion(df, weight_col_global)
-        df["clinical_insight"] = df.apply(add_clinical_insight, axis=1)
-        df["synthetic_qa"] = df.apply(add_synthetic_qa, axis=1)
-        out = df[FINAL_COLS]
-
-        out.to_csv(
-            csv_path,
-            index=False,
-            encoding="utf-8-sig",
-            mode="w" if first_chunk else "a",
-            header=first_chunk,
-        )
-        total_rows += len(out)
-        first_chunk = False
+    workers = max(1, args.workers)
+    print(f"📥 {input_xlsx} → {output_name} (청크당 {CHUNK_SIZE:,}행, {args.engine}, 변환 프로세스 {workers}개)")
 
-        # 1만 건마다 "X만 건 변환 완료" 로그 출력
-        if total_rows and total_rows % 10_000 == 0:
-            print(f"   ✅ {total_rows // 10_000}만 건 변환 완료")
+    chunks = stream_xlsx_rows(xlsx_path, CHUNK_SIZE, args.engine)
+    first = next(chunks, None)
+    if first is None:
+        print(f"❌ {input_xlsx} 에 데이터 행이 없습니다.")
+        return
+    header = first[0]
+
+    # 헤더 기준 검사 (모든 청크가 같은 헤더를 공유)
+    weight_col = find_weight_column(header)
+    if weight_col:
+        print(f"⚖️ 기준 중량 컬럼: '{weight_col}' (1인분 환산)")
+    else:
+        print("⚖️ 기준 중량 컬럼 없음 → 100g 기준 유지")
+    mapped = apply_column_mapping(pd.DataFrame(columns=header)).columns
+    missing = [c for c in ["food_name"] + NUTRIENT_COLS if c not in mapped]
+    if missing:
+        print(f"❌ 원본에 필수 컬럼 없음: {missing}. 원본 컬럼: {list(mapped)[:20]}...")
+        return
+
+    def all_chunks():
+        yield first
+        yield from chunks
+
+    state = {"rows": 0, "error": None}
+    q: queue.Queue = queue.Queue(maxsize=workers * 2)
+    writer = threading.Thread(target=chunk_writer, args=(out_path, args.format, q, state), daemon=True)
+    writer.start()
+    try:
+        if workers == 1:
+            for i, (_, rows) in enumerate(all_chunks()):
+                q.put((transform_chunk(header, rows, weight_col, i == 0, args.format), len(rows)))
+        else:
+            # spawn: 작성 스레드가 떠 있는 상태에서 fork 하지 않도록 (macOS 기본값과 동일)
+            with ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context("spawn")) as pool:
+                in_flight: deque = deque()
+                for i, (_, rows) in enumerate(all_chunks()):
+                    if len(in_flight) >= workers * 2:  # 진행 중 청크 수 제한
+                        fut, n = in_flight.popleft()
+                        q.put((fut.result(), n))
+                    fut = pool.submit(transform_chunk, header, rows, weight_col, i == 0, args.format)
+                    in_flight.append((fut, len(rows)))
+                while in_flight:
+                    fut, n = in_flight.popleft()
+                    q.put((fut.result(), n))
+    finally:
+        q.put(None)
+        writer.join()
+    if state["error"]:
+        print(f"❌ {output_name} 쓰기 실패: {state['error']}")
+        return
 
-    print(f"✅ {OUTPUT_CSV} 저장 완료 (총 {total_rows:,}행, 9개 컬럼)")
+    print(f"✅ {output_name} 저장 완료 (총 {state['rows']:,}행, 9개 컬럼)")
 
 
 if __name__ == "__main__":
@@ -2,14 +2,20 @@
 새 가공식품 DB(raw_food_db.xlsx 또는 .numbers) → Supabase 업로드용 CSV 변환
 
 실행: python process_new_data.py
+      python process_new_data.py --engine calamine   # Rust 기반 엑셀 파서 (출력 동일)
+      python process_new_data.py --format parquet    # processed_food_db_v2.parquet (pip install pyarrow)
 결과: processed_food_db_v2.csv (9개 컬럼만)
 """
 
-import json
+import argparse
 from pathlib import Path
 
 import pandas as pd
 
+import parquet_io
+from food_insight import clinical_insight, synthetic_qa
+from xlsx_reader import DEFAULT_ENGINE, ENGINES, check_engine, read_excel
+
 # 출력 파일명
 OUTPUT_CSV = "processed_food_db_v2.csv"
 NUTRIENT_COLS = ["calories", "protein", "fat", "carbs", "sugar", "sodium"]
@@ -17,6 +23,7 @@ FINAL_COLS = [
     "food_name", "calories", "protein", "fat", "carbs", "sugar", "sodium",
     "clinical_insight", "synthetic_qa",
 ]
+TEXT_COLS = {"food_name", "clinical_insight", "synthetic_qa"}
 
 # 원본 한글 컬럼 → 수파베이스 영문 컬럼 (여러 표기 허용)
 COLUMN_MAPPING = [
@@ -50,8 +57,8 @@ def find_raw_file():
     return None, None
 
 
-def load_xlsx(path: Path) -> pd.DataFrame:
-    return pd.read_excel(path)
+def load_xlsx(path: Path, engine: str = DEFAULT_ENGINE) -> pd.DataFrame:
+    return read_excel(path, engine)
 
 
 def load_numbers(path: Path) -> pd.DataFrame:
@@ -62,9 +69,9 @@ def load_numbers(path: Path) -> pd.DataFrame:
     return pd.DataFrame(rows[1:], columns=rows[0])
 
 
-def load_dataframe(path: Path, fmt: str) -> pd.DataFrame:
+def load_dataframe(path: Path, fmt: str, engine: str = DEFAULT_ENGINE) -> pd.DataFrame:
     if fmt == "xlsx":
-        return load_xlsx(path)
+        return load_xlsx(path, engine)
     return load_numbers(path)
 
 
@@ -110,40 +117,25 @@ def apply_serving_conversion(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def add_clinical_insight(row: pd.Series) -> str:
-    sodium = row.get("sodium") or 0
-    sugar = row.get("sugar") or 0
-    protein = row.get("protein") or 0
-    parts = []
-    if sodium >= 500:
-        parts.append(f"1인분 기준 나트륨 {int(sodium)}mg로 고혈압 주의가 필요합니다.")
-    if sugar >= 10:
-        parts.append(f"당류 {sugar}g 포함으로 당뇨 관리 시 양을 조절하세요.")
-    if protein >= 15:
-        parts.append("단백질이 풍부해 근성장·유지에 도움이 됩니다.")
-    if not parts:
-        return "균형 잡힌 영양 성분입니다."
-    return " ".join(parts)
-
-
-def add_synthetic_qa(row: pd.Series) -> str:
-    name = row.get("food_name") or ""
-    cal = row.get("calories") or 0
-    insight = row.get("clinical_insight") or ""
-    return json.dumps({
-        "question": f"{name}의 칼로리와 영양은?",
-        "answer": f"1인분 기준 {cal}kcal이며, {insight}"
-    }, ensure_ascii=False)
-
-
 def main():
+    ap = argparse.ArgumentParser(description="raw_food_db → processed_food_db_v2.csv")
+    ap.add_argument("--engine", choices=ENGINES, default=DEFAULT_ENGINE, help="엑셀 파서 (기본 openpyxl)")
+    ap.add_argument("--format", choices=parquet_io.FORMATS, default=parquet_io.DEFAULT_FORMAT,
+                    help="출력 형식 (parquet이면 processed_food_db_v2.parquet)")
+    args = ap.parse_args()
+    engine = args.engine
+    if args.format == "parquet":
+        parquet_io.check_pyarrow()
+
     path, fmt = find_raw_file()
     if path is None:
         print("❌ 현재 폴더에 raw_food_db.xlsx 또는 raw_food_db.numbers 파일이 없습니다.")
         return
 
+    if fmt == "xlsx":
+        check_engine(engine)
     print(f"📥 파일 로드: {path.name} ({fmt})")
-    df = load_dataframe(path, fmt)
+    df = load_dataframe(path, fmt, engine)
 
     print("📋 컬럼 매핑 적용 중...")
     df = apply_column_mapping(df)
@@ -158,13 +150,16 @@ def main():
     df = apply_serving_conversion(df)
 
     print("🩺 clinical_insight, synthetic_qa 생성 중...")
-    df["clinical_insight"] = df.apply(add_clinical_insight, axis=1)
-    df["synthetic_qa"] = df.apply(add_synthetic_qa, axis=1)
+    df["clinical_insight"] = clinical_insight(df)
+    df["synthetic_qa"] = synthetic_qa(df)
 
     out = df[FINAL_COLS].copy()
-    out_path = Path(__file__).resolve().parent / OUTPUT_CSV
-    out.to_csv(out_path, index=False, encoding="utf-8-sig")
-    print(f"✅ {OUTPUT_CSV} 저장 완료 (총 {len(out)}행)")
+    out_path = parquet_io.output_path(Path(__file__).resolve().parent / OUTPUT_CSV, args.format)
+    if args.format == "parquet":
+        parquet_io.write_frame(out, out_path, TEXT_COLS)
+    else:
+        out.to_csv(out_path, index=False, encoding="utf-8-sig")
+    print(f"✅ {out_path.name} 저장 완료 (총 {len(out)}행)")
 
 
 if __name__ == "__main__":
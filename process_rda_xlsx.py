@@ -7,16 +7,27 @@ raw_rda_db.xlsx → processed_rda_final.csv (열 좌표 기반 100% 정밀 추
 3. 정밀 열(Column) 매핑: 대문자 좌표(D,F,G,...) → 영문 컬럼명 정확 매핑.
 4. 결측치: 0.0, -, TR, (0), . 등 → 숫자 0. unit 컬럼 생성, 값 "100g".
 5. 저장: processed_rda_final.csv. 성공 시 첫 5행 + 총 행 개수 출력.
+6. 읽기: 행 스트리밍으로 COLUMN_MAPPING 열만 골라 보관
+   (시트 전체 ~130열을 object로 올리지 않음 → 메모리는 매핑 열 수에 비례).
+   --engine calamine 으로 Rust 기반 파서 사용 가능 (xlsx_reader.py).
+7. --format parquet: processed_rda_final.parquet (food_name·unit은 string, 영양소는 float64, parquet_io.py).
 
 실행: python process_rda_xlsx.py
+      python process_rda_xlsx.py --engine calamine
+      python process_rda_xlsx.py --format parquet
 """
 
+import argparse
 import os
 import re
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
+import parquet_io
+from xlsx_reader import DEFAULT_ENGINE, ENGINES, check_engine, iter_rows, sheet_names, trim_row
+
 INPUT_XLSX = "raw_rda_db.xlsx"
 OUTPUT_CSV = "processed_rda_final.csv"
 SHEET_NAME = "국가표준식품성분 Database 10.3"
@@ -118,7 +129,157 @@ def to_numeric_value(val):
     return 0
 
 
+# to_numeric_value에서 0을 반환하는 문자열 (공백·괄호·쉼표 정리 후 기준)
+_ZERO_AFTER_CLEAN = ("", ".", "-", "TR", "0", "0.0")
+_NUMBER_RE = r"(-?\d+\.?\d*)"
+
+
+def to_numeric_block(block: pd.DataFrame) -> pd.DataFrame:
+    """to_numeric_value의 일괄 버전. 여러 컬럼을 한 줄로 쌓아 한 번에 변환한다.
+
+    - int/float 셀은 float 변환 (NaN·None → 0)
+    - 문자열 셀은 고유값 단위로 NON_NUMERIC_VALUES 토큰 → 0, 나머지는 정규식 추출 한 번
+    - 결과 dtype도 셀 단위 apply와 같게 맞춤: 모든 셀이 0 분기면 int64, 아니면 float64
+    """
+    nrows, ncols = block.shape
+    cells = block.to_numpy(dtype=object).ravel(order="F")
+
+    values = np.zeros(len(cells), dtype="float64")
+    is_zero = np.ones(len(cells), dtype=bool)   # 0(int)을 반환하는 분기
+
+    # 셀 타입별 분기 (타입 종류는 몇 개 안 되므로 고유 타입 단위로 판정)
+    # 0: None, 1: int/float(bool·np.float64 포함), 2: str, 3: 그 밖의 객체 → str()
+    types = np.fromiter(map(type, cells), dtype=object, count=len(cells))
+    tcodes, tuniq = pd.factorize(types)
+    kinds = np.array([0 if t is type(None) else 1 if issubclass(t, (int, float))
+                      else 2 if t is str else 3 for t in tuniq], dtype=np.int8)
+    kind = kinds[tcodes] if len(cells) else np.zeros(0, dtype=np.int8)
+
+    is_num = kind == 1
+    if is_num.any():
+        v = cells[is_num].astype("float64")
+        ok = ~np.isnan(v)
+        idx = np.flatnonzero(is_num)[ok]
+        values[idx] = v[ok]
+        is_zero[idx] = False
+
+    is_str = kind >= 2
+    if is_str.any():
+        texts = cells[is_str]
+        other = kind[is_str] == 3
+        if other.any():
+            texts[other] = [str(v) for v in texts[other]]
+        # 같은 문자열이 반복되므로 고유값만 파싱한 뒤 코드로 되돌려 배치
+        codes, uniq = pd.factorize(texts)
+        s = pd.Series(uniq, dtype=object).str.strip()
+        s_clean = s.str.replace(r"[(),]", "", regex=True).str.strip()
+        cand = ~(s.isin(NON_NUMERIC_VALUES) | s_clean.isin(_ZERO_AFTER_CLEAN))
+        m = s_clean[cand].str.extract(_NUMBER_RE, expand=False).dropna()
+        u_val = np.zeros(len(uniq), dtype="float64")
+        u_zero = np.ones(len(uniq), dtype=bool)
+        u_val[m.index] = m.map(float).to_numpy(dtype="float64")
+        u_zero[m.index] = False
+        idx = np.flatnonzero(is_str)
+        values[idx] = u_val[codes]
+        is_zero[idx] = u_zero[codes]
+
+    values = values.reshape((nrows, ncols), order="F")
+    is_zero = is_zero.reshape((nrows, ncols), order="F")
+    out = {}
+    for j, col in enumerate(block.columns):
+        if nrows and is_zero[:, j].all():
+            out[col] = np.zeros(nrows, dtype="int64")
+        else:
+            out[col] = values[:, j]
+    return pd.DataFrame(out, index=block.index)
+
+
+# pd.read_excel 기본 결측 문자열 (read_excel(header=None)과 같은 값으로 맞추기 위함)
+_EXCEL_NA_STRINGS = frozenset({
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+    # 수식 오류 셀 (pandas는 오류 셀을 NaN 처리)
+    "#DIV/0!", "#VALUE!", "#REF!", "#NAME?", "#NUM!", "#NULL!",
+})
+
+
+def _excel_value(v):
+    """openpyxl 셀 값 → pd.read_excel과 같은 값 (결측 NaN, 정수형 float → int)"""
+    if v is None:
+        return np.nan
+    if isinstance(v, str):
+        return np.nan if v in _EXCEL_NA_STRINGS else v
+    if isinstance(v, float) and v.is_integer():
+        return int(v)
+    return v
+
+
+def read_projected_sheet(xlsx_path, sheet_name: str, indices: list[int],
+                         start_row: int, engine: str = DEFAULT_ENGINE) -> tuple[pd.DataFrame, int]:
+    """시트를 스트리밍하며 indices 열만 start_row(0-based)부터 수집.
+
+    반환: (열 라벨 = 시트 열 인덱스인 object 프레임, 시트 전체 열 수)
+    pd.read_excel(header=None)처럼 각 행의 뒤쪽 빈 셀과 시트 끝의 빈 행은 잘라내고,
+    열 수는 모든 행(헤더 포함) 중 최대 너비로 계산한다.
+    """
+    cols: list[list] = [[] for _ in indices]
+    ncols = 0
+    nrows = seen = 0   # 값이 있는 마지막 데이터 행까지의 수 / 읽은 데이터 행 수
+    for r, row in enumerate(iter_rows(xlsx_path, sheet_name, engine)):
+        row = trim_row(row)
+        n = len(row)
+        if n > ncols:
+            ncols = n
+        if r < start_row:
+            continue
+        for c, idx in zip(cols, indices):
+            c.append(_excel_value(row[idx]) if idx < n else np.nan)
+        seen += 1
+        if n:
+            nrows = seen
+
+    data = {idx: pd.Series(c[:nrows], dtype=object) for idx, c in zip(indices, cols) if idx < ncols}
+    return pd.DataFrame(data, index=pd.RangeIndex(nrows)), ncols
+
+
+def build_output(df_raw: pd.DataFrame, ncols: int | None = None) -> pd.DataFrame:
+    """데이터 행(DATA_START_ROW 이후) → food_name, unit, 영양소 컬럼 프레임
+
+    df_raw의 열 라벨은 시트 열 인덱스 (read_excel(header=None) 전체 프레임 또는
+    read_projected_sheet 결과). ncols는 시트 전체 열 수 (생략 시 df_raw 너비).
+    """
+    df_raw = df_raw.reset_index(drop=True)
+    if ncols is None:
+        ncols = df_raw.shape[1]
+
+    col_indices = [(col_letter_to_index(letter), name) for letter, name in COLUMN_MAPPING]
+    out = pd.DataFrame()
+    d_idx = col_indices[0][0]
+    out["food_name"] = df_raw[d_idx].astype(str).replace("nan", "").str.strip() if d_idx < ncols else ""
+    out["unit"] = PER_100G_LABEL
+
+    nutrient_cols = [(idx, name) for idx, name in col_indices if name != "food_name"]
+    present = [(idx, name) for idx, name in nutrient_cols if idx < ncols]
+    parsed = to_numeric_block(df_raw[[idx for idx, _ in present]])
+    parsed.columns = [name for _, name in present]
+    for idx, name in nutrient_cols:
+        out[name] = parsed[name] if idx < ncols else 0
+
+    col_order = ["food_name", "unit"] + [name for _, name in COLUMN_MAPPING if name != "food_name"]
+    return out[[c for c in col_order if c in out.columns]]
+
+
 def main():
+    ap = argparse.ArgumentParser(description=f"{INPUT_XLSX} → {OUTPUT_CSV}")
+    ap.add_argument("--engine", choices=ENGINES, default=DEFAULT_ENGINE, help="엑셀 파서 (기본 openpyxl)")
+    ap.add_argument("--format", choices=parquet_io.FORMATS, default=parquet_io.DEFAULT_FORMAT,
+                    help="출력 형식 (parquet이면 processed_rda_final.parquet)")
+    args = ap.parse_args()
+    engine = args.engine
+    check_engine(engine)
+    if args.format == "parquet":
+        parquet_io.check_pyarrow()
+
     folder = Path(__file__).resolve().parent
     cwd = Path.cwd()
     xlsx_path = folder / INPUT_XLSX
@@ -129,22 +290,23 @@ def main():
         return
 
     xlsx_abs = os.path.abspath(str(xlsx_path.resolve()))
-    csv_path = folder / OUTPUT_CSV
+    out_path = parquet_io.output_path(folder / OUTPUT_CSV, args.format)
 
     try:
-        xl = pd.ExcelFile(xlsx_abs, engine="openpyxl")
+        names = sheet_names(xlsx_abs, engine)
     except Exception as e:
         print(f"❌ 엑셀 파일을 열 수 없습니다: {e}")
         return
 
-    if SHEET_NAME not in xl.sheet_names:
+    if SHEET_NAME not in names:
         print(f"❌ 시트 '{SHEET_NAME}' 이(가) 없습니다.")
-        print(f"   실제 시트 목록: {xl.sheet_names}")
+        print(f"   실제 시트 목록: {names}")
         return
 
-    # 시트 전체를 헤더 없이 읽고, 데이터 시작 행(DATA_START_ROW)부터 사용
-    raw = pd.read_excel(xl, sheet_name=SHEET_NAME, header=None)
-    ncols_raw = raw.shape[1]
+    # 매핑된 열만 스트리밍으로 읽고, 데이터 시작 행(DATA_START_ROW)부터 사용
+    indices = sorted({col_letter_to_index(letter) for letter, _ in COLUMN_MAPPING})
+    data, ncols_raw = read_projected_sheet(xlsx_abs, SHEET_NAME, indices, DATA_START_ROW, engine)
+    print(f"📥 {len(data):,}행 로드 (시트 {ncols_raw}열 중 매핑된 {data.shape[1]}열만 보관)")
 
     # 1) 좌표 재확인: 대문자 좌표 → iloc 인덱스(숫자) 터미널 출력
     col_list = [(letter, col_letter_to_index(letter), name) for letter, name in COLUMN_MAPPING]
@@ -154,48 +316,35 @@ def main():
 
     # 2) 샘플 추출: 엑셀 5행(Index 4) 데이터 → 영양소명 vs 실제 숫자 표
     SAMPLE_ROW = 4  # 엑셀 5행 = 0-based index 4
-    sample_data = []
-    for letter, idx, name in col_list:
-        if idx >= ncols_raw:
-            val = "(열 없음)"
-        else:
-            raw_val = raw.iloc[SAMPLE_ROW, idx]
-            if name == "food_name":
-                val = str(raw_val).strip() if pd.notna(raw_val) else ""
+    if len(data) > SAMPLE_ROW - DATA_START_ROW:
+        sample_data = []
+        for letter, idx, name in col_list:
+            if idx >= ncols_raw:
+                val = "(열 없음)"
             else:
-                num = to_numeric_value(raw_val)
-                val = f"{raw_val} → {num}"
-        sample_data.append({"엑셀열": letter, "영문컬럼": name, "5행(Index4) 값": val})
-    sample_df = pd.DataFrame(sample_data)
-    print("📋 샘플 추출 (엑셀 5행(Index 4) — 영양소별 실제 값):")
-    print(sample_df.to_string(index=False))
-    print()
-
-    # 3) 강제 쓰기: 동일 로직으로 전체 데이터 추출 후 CSV 덮어쓰기
-    df_raw = raw.iloc[DATA_START_ROW:].copy()
-    df_raw.reset_index(drop=True, inplace=True)
-    ncols = df_raw.shape[1]
-
-    col_indices = [(idx, name) for _, idx, name in col_list]
-    out = pd.DataFrame()
-    d_idx = col_indices[0][0]
-    out["food_name"] = df_raw.iloc[:, d_idx].astype(str).replace("nan", "").str.strip() if d_idx < ncols else ""
-    out["unit"] = PER_100G_LABEL
-
-    for idx, name in col_indices:
-        if name == "food_name":
-            continue
-        if idx >= ncols:
-            out[name] = 0
-            continue
-        out[name] = df_raw.iloc[:, idx].apply(to_numeric_value)
+                raw_val = data.at[SAMPLE_ROW - DATA_START_ROW, idx]
+                if name == "food_name":
+                    val = str(raw_val).strip() if pd.notna(raw_val) else ""
+                else:
+                    num = to_numeric_value(raw_val)
+                    val = f"{raw_val} → {num}"
+            sample_data.append({"엑셀열": letter, "영문컬럼": name, "5행(Index4) 값": val})
+        sample_df = pd.DataFrame(sample_data)
+        print("📋 샘플 추출 (엑셀 5행(Index 4) — 영양소별 실제 값):")
+        print(sample_df.to_string(index=False))
+        print()
+    else:
+        print(f"📋 샘플 추출 건너뜀 — 데이터가 {len(data)}행뿐 (엑셀 5행 없음)\n")
 
-    col_order = ["food_name", "unit"] + [name for _, name in COLUMN_MAPPING if name != "food_name"]
-    out = out[[c for c in col_order if c in out.columns]]
-    out.to_csv(csv_path, index=False, encoding="utf-8-sig")
+    # 3) 강제 쓰기: 동일 로직으로 전체 데이터 추출 후 CSV(또는 Parquet) 덮어쓰기
+    out = build_output(data, ncols_raw)
+    if args.format == "parquet":
+        parquet_io.write_frame(out, out_path, {"food_name", "unit"})
+    else:
+        out.to_csv(out_path, index=False, encoding="utf-8-sig")
 
     total = len(out)
-    print(f"✅ {OUTPUT_CSV} 덮어쓰기 완료 (총 {total:,}행)")
+    print(f"✅ {out_path.name} 덮어쓰기 완료 (총 {total:,}행)")
 
     # 4) 단위 확인: unit 컬럼 전체 "100g" 여부 체크
     unit_ok = out["unit"].eq(PER_100G_LABEL).all()
@@ -0,0 +1,132 @@
+"""
+age_intervals.py
+────────────────────────────────────────────────────────────────────
+DUR 연령 조건(age_limit_value / unit / condition, TEXT) → 개월 단위 구간
+
+"12 / 세 / 미만" → [−∞, 144) 처럼 하한·상한(개월)과 포함 여부를 타입 있는 값으로 바꿔
+dur_rules 에 age_min_months / age_max_months / age_min_inclusive / age_max_inclusive 로
+올린다 (supabase/dur_rules-age-interval.sql 의 age_range numrange + GiST 인덱스로 조회).
+
+  parse_age_limits : 값·단위·조건 Series → 구간 프레임 (행 단위 문자열 파싱 없이 str.extract).
+                     단위·조건이 값 칸에 함께 적힌 경우("6개월 미만")도 처리, 해석 불가 행 표시
+  AgeIntervalIndex : 구간 끝점을 정렬해 만든 원자 구간(끝점 자체 / 끝점 사이)으로
+                     나이 배열 → 해당 규칙 조회 (끝점 포함·미포함 정확히 구분)
+
+사용처: dur_records (업로드 레코드 타입 컬럼), dur_engine (연령금기·어린이주의 점검)
+────────────────────────────────────────────────────────────────────
+"""
+
+import numpy as np
+import pandas as pd
+
+AGE_UNIT_MONTHS = {"개월": 1.0, "세": 12.0, "살": 12.0, "년": 12.0, "월": 1.0,
+                   "주": 12 / 52, "일": 12 / 365.25}
+# 조건 → (상한/하한, 끝점 포함 여부)
+AGE_CONDITIONS = {"미만": ("max", False), "이하": ("max", True),
+                  "이상": ("min", True), "초과": ("min", False)}
+AGE_INTERVAL_COLS = ["age_min_months", "age_max_months", "age_min_inclusive", "age_max_inclusive"]
+MONTH_DIGITS = 6
+
+_NUMBER = r'(\d+(?:\.\d+)?)'
+_UNIT = "(" + "|".join(AGE_UNIT_MONTHS) + ")"   # '개월' 이 '월' 보다 먼저
+_COND = "(" + "|".join(AGE_CONDITIONS) + ")"
+
+
+def _text(s, n: int) -> pd.Series:
+    if s is None:
+        return pd.Series([""] * n, dtype=object)
+    return pd.Series(s, dtype=object).fillna("").astype(str).str.strip().reset_index(drop=True)
+
+
+def parse_age_limits(value, unit=None, condition=None) -> pd.DataFrame:
+    """연령 조건 → AGE_INTERVAL_COLS + has_age(연령 정보 있음) + age_ok(해석 성공) 프레임
+
+    단위·조건 칸이 비어 있으면 값 칸에서 찾는다. 숫자가 2개 이상이거나 숫자·단위·조건 중
+    하나라도 없으면 해석 불가(age_ok=False, 구간 컬럼 NaN/None).
+    """
+    value = _text(value, 0)
+    n = len(value)
+    unit, condition = _text(unit, n), _text(condition, n)
+    full = value + " " + unit + " " + condition
+
+    num = pd.to_numeric(value.str.extract(_NUMBER, expand=False), errors="coerce")
+    n_nums = full.str.count(r'\d+(?:\.\d+)?')
+    u = unit.str.extract(_UNIT, expand=False).fillna(value.str.extract(_UNIT, expand=False))
+    c = condition.str.extract(_COND, expand=False).fillna(value.str.extract(_COND, expand=False))
+
+    has_age = (value != "") | (unit != "") | (condition != "")
+    ok = has_age & num.notna() & u.notna() & c.notna() & (n_nums == 1)
+    months = (num * u.map(AGE_UNIT_MONTHS)).round(MONTH_DIGITS).where(ok)
+    side = c.map(lambda x: AGE_CONDITIONS[x][0] if isinstance(x, str) else None)
+    incl = c.map(lambda x: AGE_CONDITIONS[x][1] if isinstance(x, str) else None)
+
+    is_min, is_max = ok & (side == "min"), ok & (side == "max")
+    return pd.DataFrame({
+        "age_min_months": months.where(is_min),
+        "age_max_months": months.where(is_max),
+        "age_min_inclusive": incl.where(is_min, None).astype(object),
+        "age_max_inclusive": incl.where(is_max, None).astype(object),
+        "has_age": has_age,
+        "age_ok": ok,
+    })
+
+
+def _flag(x) -> bool:
+    """포함 여부 값 → bool (bool · 'true'/'false' 문자열 export · None 모두 허용)"""
+    return str(x).strip().lower() in ("true", "t", "1")
+
+
+class AgeIntervalIndex:
+    """개월 구간 N개에 대한 찌르기(stabbing) 조회.
+
+    끝점 k개를 정렬하면 수직선은 원자 구간 2k+1개(끝점 사이 열린 구간 / 끝점 한 점)로 나뉘고,
+    각 구간은 연속된 원자 범위 [first, last] 가 된다. 나이 → 원자 번호는 searchsorted 1회.
+    구간이 없는 행(NaN 하한·상한 모두)은 빈 범위로 어떤 나이도 포함하지 않는다.
+    """
+
+    def __init__(self, lo, hi, lo_inclusive, hi_inclusive):
+        lo = np.asarray(lo, dtype=float)
+        hi = np.asarray(hi, dtype=float)
+        lo_inc = np.asarray([_flag(x) for x in lo_inclusive], dtype=bool)
+        hi_inc = np.asarray([_flag(x) for x in hi_inclusive], dtype=bool)
+        ends = np.concatenate([lo[~np.isnan(lo)], hi[~np.isnan(hi)]])
+        self.bounds = np.unique(ends)
+        n_atoms = 2 * len(self.bounds) + 1
+
+        li = np.searchsorted(self.bounds, np.nan_to_num(lo))
+        hj = np.searchsorted(self.bounds, np.nan_to_num(hi))
+        first = np.where(np.isnan(lo), 0, 2 * li + np.where(lo_inc, 1, 2))
+        last = np.where(np.isnan(hi), n_atoms - 1, 2 * hj + np.where(hi_inc, 1, 0))
+        empty = np.isnan(lo) & np.isnan(hi)
+        self.first = np.where(empty, 1, first).astype(np.int64)
+        self.last = np.where(empty, 0, last).astype(np.int64)
+        # 원자 구간별 포함 규칙 (원자 수 × 구간 있는 규칙 수 비교 — 원자는 끝점 수에 비례해 적음)
+        ids = np.flatnonzero(~empty)
+        atoms = np.arange(n_atoms)[:, None]
+        hit = (self.first[ids][None, :] <= atoms) & (atoms <= self.last[ids][None, :])
+        self.members = [ids[row] for row in hit]
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "AgeIntervalIndex":
+        return cls(df["age_min_months"], df["age_max_months"],
+                   df["age_min_inclusive"], df["age_max_inclusive"])
+
+    def __len__(self) -> int:
+        return len(self.first)
+
+    def atoms(self, months) -> np.ndarray:
+        """나이(개월) 배열 → 원자 구간 번호 (끝점과 같으면 홀수, 끝점 사이면 짝수)"""
+        m = np.atleast_1d(np.asarray(months, dtype=float))
+        pos = np.searchsorted(self.bounds, m, side="left")
+        on_bound = np.append(self.bounds, np.nan)[pos] == m
+        return 2 * pos + on_bound
+
+    def contains(self, ids, months) -> np.ndarray:
+        """(규칙 번호, 나이) 쌍 배열 → 구간 포함 여부 (브로드캐스트)"""
+        ids = np.asarray(ids)
+        a = self.atoms(months).reshape(np.shape(months)) if np.ndim(months) else self.atoms(months)[0]
+        return (self.first[ids] <= a) & (a <= self.last[ids])
+
+    def stab(self, months) -> list[np.ndarray]:
+        """나이(개월) 배열 → 나이마다 해당 구간 규칙 번호 배열"""
+        return [self.members[a] for a in self.atoms(months)]
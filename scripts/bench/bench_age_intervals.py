@@ -0,0 +1,168 @@
+"""
+age_intervals.py 회귀 확인 + 나이 일괄 조회 속도
+===============================================
+합성 연령 조건 R개(값/단위/조건 칸 분리 · 값 칸에 단위·조건 포함 · 빈 칸 · 범위 표기 등 해석 불가 포함)를
+  row    : 행마다 정규식으로 파싱 (기존처럼 조회 때 문자열 해석)
+  vector : parse_age_limits (str.extract 일괄)
+로 해석해 구간·포함 여부·해석 불가 행이 같은지 확인하고,
+나이 M개 × 규칙 R개 "이 나이에 걸리는 규칙" 조회를
+  row    : 나이마다 모든 규칙 문자열을 파싱해 비교
+  index  : AgeIntervalIndex.stab (원자 구간 searchsorted)
+로 비교한다. 끝점(12세 = 144개월 등) 나이를 일부러 섞어 포함·미포함 경계를 확인한다.
+
+실행:
+  python3 scripts/bench/bench_age_intervals.py
+  python3 scripts/bench/bench_age_intervals.py --rules 200000 --ages 2000
+"""
+
+import argparse
+import math
+import re
+import sys
+import time
+from pathlib import Path
+
+BENCH_DIR   = Path(__file__).resolve().parent
+SCRIPTS_DIR = BENCH_DIR.parent
+sys.path[:0] = [str(BENCH_DIR), str(SCRIPTS_DIR)]
+
+import numpy as np
+import pandas as pd
+
+from age_intervals import AGE_UNIT_MONTHS, AgeIntervalIndex, parse_age_limits
+
+CONDS = {"미만": ("max", False), "이하": ("max", True), "이상": ("min", True), "초과": ("min", False)}
+
+
+def row_parse(value: str, unit: str, cond: str):
+    """한 행 파싱 → (하한, 상한, 하한 포함, 상한 포함) / 연령 정보 없음 None / 해석 불가 False"""
+    value, unit, cond = value.strip(), unit.strip(), cond.strip()
+    if not (value or unit or cond):
+        return None
+    nums = re.findall(r"\d+(?:\.\d+)?", " ".join([value, unit, cond]))
+    m = re.search(r"\d+(?:\.\d+)?", value)
+    u = next((k for k in AGE_UNIT_MONTHS if k in unit), None) or \
+        next((k for k in sorted(AGE_UNIT_MONTHS, key=lambda k: value.find(k) if k in value else 99) if k in value), None)
+    c = next((k for k in CONDS if k in cond), None) or \
+        next((k for k in sorted(CONDS, key=lambda k: value.find(k) if k in value else 99) if k in value), None)
+    if not m or not u or not c or len(nums) != 1:
+        return False
+    months = round(float(m.group()) * AGE_UNIT_MONTHS[u], 6)
+    side, inc = CONDS[c]
+    return (months, None, inc, None) if side == "min" else (None, months, None, inc)
+
+
+def row_hits(months: float, rules) -> list[int]:
+    out = []
+    for i, (v, u, c) in enumerate(rules):
+        iv = row_parse(v, u, c)
+        if not iv:
+            continue
+        lo, hi, li, hi_inc = iv
+        if lo is not None and not (months > lo or (li and months == lo)):
+            continue
+        if hi is not None and not (months < hi or (hi_inc and months == hi)):
+            continue
+        out.append(i)
+    return out
+
+
+def make_rules(n: int, seed: int = 0) -> list[tuple[str, str, str]]:
+    rng = np.random.default_rng(seed)
+    vals = ["1", "2", "3", "6", "12", "15", "18", "65", "0.5", "28"]
+    units = ["세", "세", "세", "개월", "주", "일"]
+    conds = ["미만", "이하", "이상", "초과"]
+    out = []
+    for r in rng.random(n):
+        v, u, c = rng.choice(vals), rng.choice(units), rng.choice(conds)
+        if r < 0.70:
+            out.append((v, u, c))
+        elif r < 0.80:
+            out.append((f"만 {v}{u} {c}", "", ""))        # 값 칸에 모두
+        elif r < 0.85:
+            out.append((f"{v}{u}", "", c))               # 값+단위, 조건 칸
+        elif r < 0.90:
+            out.append(("", "", ""))                     # 연령 정보 없음
+        elif r < 0.94:
+            out.append((f"{v}~{int(rng.integers(20, 40))}", u, c))  # 범위 → 해석 불가
+        elif r < 0.97:
+            out.append(("소아", "", ""))                  # 숫자 없음 → 해석 불가
+        else:
+            out.append((v, "", c))                       # 단위 없음 → 해석 불가
+    return out
+
+
+def main():
+    ap = argparse.ArgumentParser(description="age_intervals 회귀 확인 + 나이 일괄 조회 속도")
+    ap.add_argument("--rules", type=int, default=50_000)
+    ap.add_argument("--ages", type=int, default=200)
+    args = ap.parse_args()
+
+    rules = make_rules(args.rules)
+    v, u, c = (pd.Series(x, dtype=object) for x in zip(*rules))
+
+    t0 = time.perf_counter()
+    row = [row_parse(*r) for r in rules]
+    t_row_parse = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    ages = parse_age_limits(v, u, c)
+    t_vec_parse = time.perf_counter() - t0
+
+    def as_tuple(rec) -> tuple:
+        def num(x):
+            return None if x is None or (isinstance(x, float) and math.isnan(x)) else float(x)
+        return (num(rec.age_min_months), num(rec.age_max_months),
+                rec.age_min_inclusive, rec.age_max_inclusive)
+
+    for i, (r, rec) in enumerate(zip(row, ages.itertuples(index=False))):
+        if r is None:
+            ok = not rec.has_age
+        elif r is False:
+            ok = rec.has_age and not rec.age_ok
+        else:
+            ok = rec.age_ok and as_tuple(rec) == r
+        if not ok:
+            print(f"  ❌ 파싱 불일치 행 {i}: {rules[i]} → row {r} / vector {as_tuple(rec)} ok={rec.age_ok}")
+            sys.exit(1)
+    n_bad = int((ages["has_age"] & ~ages["age_ok"]).sum())
+    print(f"  ✅ parse_age_limits: {len(rules):,}행 행 단위 파서와 동일 "
+          f"(해석 {int(ages['age_ok'].sum()):,} · 해석 불가 {n_bad:,} · 정보 없음 {int((~ages['has_age']).sum()):,})")
+
+    index = AgeIntervalIndex.from_frame(ages)
+    rng = np.random.default_rng(1)
+    ends = np.unique(np.concatenate([ages["age_min_months"].dropna(), ages["age_max_months"].dropna()]))
+    months = np.concatenate([rng.choice(ends, args.ages // 2), rng.uniform(0, 1000, args.ages - args.ages // 2)])
+
+    n_row = min(len(months), 40)  # 행 단위 조회는 느리므로 일부만 측정 후 환산
+    t0 = time.perf_counter()
+    base = [row_hits(m, rules) for m in months[:n_row]]
+    t_row = (time.perf_counter() - t0) / n_row
+    t0 = time.perf_counter()
+    got = index.stab(months)
+    t_idx = (time.perf_counter() - t0) / len(months)
+    for m, a, b in zip(months, base, got):
+        if a != b.tolist():
+            print(f"  ❌ 나이 {m}개월: 행 단위 {len(a)}건 vs 색인 {len(b)}건")
+            sys.exit(1)
+    print(f"  ✅ stab: 나이 {n_row}개(끝점 포함) 행 단위 조회와 동일 · 원자 구간 {2 * len(index.bounds) + 1}개")
+
+    pairs = rng.integers(0, len(rules), 100_000)
+    pm = rng.choice(months, len(pairs))
+    t0 = time.perf_counter()
+    inside = index.contains(pairs, pm)
+    t_pairs = time.perf_counter() - t0
+    if not all(inside[i] == (pairs[i] in set(got[np.flatnonzero(months == pm[i])[0]].tolist()))
+               for i in range(200)):
+        print("  ❌ contains 결과가 stab 과 다름")
+        sys.exit(1)
+    print(f"  ✅ contains: (규칙, 나이) 쌍 {len(pairs):,}개 {t_pairs * 1e3:.1f}ms")
+
+    print(f"\n규칙 {len(rules):,}개")
+    print(f"{'단계':<16}{'행 단위':>12}{'일괄':>12}{'배수':>9}")
+    print("─" * 49)
+    print(f"{'파싱 (초)':<16}{t_row_parse:>12.3f}{t_vec_parse:>12.3f}{t_row_parse / t_vec_parse:>9.1f}")
+    print(f"{'나이 1개 (ms)':<16}{t_row * 1e3:>12.3f}{t_idx * 1e3:>12.3f}{t_row / t_idx:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+benchmark_lookup.py 회귀 확인 + 사용자당 채점 비용
+=================================================
+합성 검진 CSV를 checkup_aggregate 로 집계해 만든 health_benchmarks / health_benchmark_quantiles
+레코드로 BenchmarkLookup 을 구성한 뒤, 합성 사용자 N명을 채점한다.
+
+  loop   : 사용자·지표마다 레코드 dict 조회 + TDigest.cdf (DB 1회 조회를 dict 조회로 바꾼 하한)
+  vector : BenchmarkLookup.score_arrays / score_frame 1회 호출
+
+vector 결과가 loop 와 같은지(z 완전 일치, 백분위 격자 보간 오차 ±0.5%p) 확인하고
+사용자당 µs 를 비교한다. 실제 DB 조회는 왕복마다 수 ms 이므로 loop 보다도 훨씬 느리다.
+
+실행:
+  python3 scripts/bench/bench_benchmark_lookup.py
+  python3 scripts/bench/bench_benchmark_lookup.py --users 100000
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR   = Path(__file__).resolve().parent
+SCRIPTS_DIR = BENCH_DIR.parent
+sys.path[:0] = [str(BENCH_DIR), str(SCRIPTS_DIR)]
+
+import numpy as np
+import pandas as pd
+
+import checkup_aggregate as ca
+import synthetic
+from benchmark_lookup import GENDERS, METRICS, BenchmarkLookup
+from quantile_sketch import TDigest
+
+
+def make_users(n: int, seed: int = 1) -> pd.DataFrame:
+    """검진 분포를 따르는 사용자 수치 (성별 일부 미상, 수치 일부 결측)"""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "gender": rng.choice(["남성", "여성", None], n, p=[0.49, 0.49, 0.02]),
+        "age": rng.integers(20, 90, n),
+    })
+    for col, (mu, sd) in synthetic.CHECKUP_METRICS.items():
+        v = rng.normal(mu, sd * 1.2, n)
+        if col in synthetic.LOGNORMAL_METRICS:
+            v = np.exp(v)
+        v[rng.random(n) < 0.03] = np.nan
+        df[ca.DB_FIELD.get(col, col)] = np.round(v, 1)
+    df["bmi"] = df["weight"] / (df["height"] / 100) ** 2
+    return df
+
+
+def score_loop(users: pd.DataFrame, bench: dict, digests: dict) -> tuple[np.ndarray, np.ndarray]:
+    """사용자·지표별 개별 조회 (기존 방식의 메모리 내 하한)"""
+    z = np.full((len(users), len(METRICS)), np.nan)
+    pct = np.full_like(z, np.nan)
+    for r, row in enumerate(users.itertuples(index=False)):
+        key = (row.gender, min(int(row.age) // 5 + 1, 18))
+        rec = bench.get(key)
+        if rec is None:
+            continue
+        for i, m in enumerate(METRICS):
+            x = getattr(row, m)
+            avg, std = rec[f"{m}_avg"], rec[f"{m}_std"]
+            if x != x or avg is None or not std:
+                continue
+            z[r, i] = (x - avg) / std
+            d = digests.get(key + (m,))
+            if d is not None:
+                pct[r, i] = min(max(float(d.cdf(x)) * 100, 0.1), 99.9)
+    return z, pct
+
+
+def main():
+    ap = argparse.ArgumentParser(description="benchmark_lookup 회귀 확인 + 사용자당 채점 비용")
+    ap.add_argument("--rows", type=int, default=200_000, help="벤치마크 집계용 검진 행 수")
+    ap.add_argument("--users", type=int, default=20_000)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench_lookup_") as tmp:
+        path = synthetic.write_checkup_csv(Path(tmp) / "checkup.csv", args.rows)
+        moments, sketches = ca.aggregate_checkup(path, workers=1, quantiles=True)
+    bench_recs = ca.benchmark_records(moments)
+    q_recs = ca.quantile_records(sketches)
+
+    t0 = time.perf_counter()
+    lookup = BenchmarkLookup(bench_recs, q_recs)
+    t_load = time.perf_counter() - t0
+    print(f"🧪 벤치마크 {len(bench_recs)}행 · 분위수 {lookup.sketched}행 → 배열 구성 {t_load * 1e3:.1f} ms "
+          f"(knots {lookup.knots.nbytes / 1e6:.2f} MB)")
+
+    users = make_users(args.users)
+    bench = {(r["gender"], r["age_group_code"]): r for r in bench_recs}
+    digests = {(r["gender"], r["age_group_code"], r["metric"]): TDigest.from_dict(r["sketch"]) for r in q_recs}
+
+    t0 = time.perf_counter()
+    z_loop, pct_loop = score_loop(users, bench, digests)
+    t_loop = time.perf_counter() - t0
+
+    gender = users["gender"].map(GENDERS).fillna(-1).to_numpy(np.int64)
+    age = np.minimum(users["age"].to_numpy() // 5 + 1, 18)
+    values = users[METRICS].to_numpy(np.float64)
+    t0 = time.perf_counter()
+    z, pct, flag = lookup.score_arrays(gender, age, values)
+    t_vec = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    frame = lookup.score_frame(users)
+    t_frame = time.perf_counter() - t0
+
+    # ── 회귀 확인 ─────────────────────────────────────────────
+    if not np.array_equal(np.isnan(z), np.isnan(z_loop)) or np.nanmax(np.abs(z - z_loop)) > 1e-9:
+        print("  ❌ z-score 불일치")
+        sys.exit(1)
+    if not np.array_equal(np.isnan(pct), np.isnan(pct_loop)):
+        print("  ❌ 백분위 결측 위치 불일치")
+        sys.exit(1)
+    pct_err = np.nanmax(np.abs(pct - pct_loop))
+    if pct_err > 0.5:
+        print(f"  ❌ 백분위 차이 {pct_err:.2f}%p (허용 0.5)")
+        sys.exit(1)
+    if not np.allclose(frame[[f"{m}_z" for m in METRICS]].to_numpy(), np.round(z, 3), equal_nan=True):
+        print("  ❌ score_frame 결과가 score_arrays 와 다름")
+        sys.exit(1)
+    print(f"  ✅ z-score 일치 · 백분위 최대 차이 {pct_err:.3f}%p · score_frame 일치")
+    tri = METRICS.index("triglyceride")
+    print(f"  ℹ️  중성지방 플래그: 낮음 {(flag[:, tri] < 0).mean():.1%} · 높음 {(flag[:, tri] > 0).mean():.1%}")
+
+    n = len(users)
+    print(f"\n사용자 {n:,}명 × 지표 {len(METRICS)}개")
+    print(f"{'방식':<16}{'초':>9}{'µs/사용자':>12}{'배수':>8}")
+    print("─" * 45)
+    for label, sec in [("loop", t_loop), ("score_arrays", t_vec), ("score_frame", t_frame)]:
+        print(f"{label:<16}{sec:>9.3f}{sec / n * 1e6:>12.1f}{t_loop / sec:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+upload_health_engine 암 통계 레코드 변환 회귀 확인 + 속도 비교
+===============================================================
+기존 행 단위 변환(apply 정규식 + iterrows + 값마다 nan_to_none)과
+컬럼 단위 변환(str.extract + column_batches)의 결과가 완전히 같은지 확인하고
+소요 시간을 비교한다. 암발생 통계는 매년 (암종 × 성별 × 연령군) 행이 늘어나므로
+--years 로 연도 수를 늘려 볼 수 있다.
+Supabase에는 접속하지 않는다 (모듈 import용 더미 환경 변수만 설정).
+
+실행:
+  python3 scripts/bench/bench_cancer_records.py
+  python3 scripts/bench/bench_cancer_records.py --years 200
+"""
+
+import argparse
+import contextlib
+import io
+import math
+import os
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR   = Path(__file__).resolve().parent
+SCRIPTS_DIR = BENCH_DIR.parent
+sys.path[:0] = [str(BENCH_DIR), str(SCRIPTS_DIR)]
+
+os.environ.setdefault("NEXT_PUBLIC_SUPABASE_URL", "http://127.0.0.1:9")
+os.environ.setdefault("SUPABASE_SERVICE_ROLE_KEY", "bench-service-key")
+
+import numpy as np
+import pandas as pd
+
+import synthetic
+import upload_health_engine as he
+
+
+def nan_to_none(v):
+    if v is None: return None
+    try:
+        if math.isnan(float(v)): return None
+    except (TypeError, ValueError):
+        pass
+    return float(v) if isinstance(v, (float, np.floating)) else v
+
+
+def extract_kcd(s: str) -> str:
+    m = re.search(r'C[\w\-]+', str(s))
+    return m.group() if m else None
+
+
+def legacy_incidence(path: Path) -> list[dict]:
+    """변경 전 build_cancer_incidence"""
+    df = pd.read_csv(path, encoding='utf-8')
+    df['kcd_code']         = df['국제질병분류'].apply(extract_kcd)
+    df['gender']           = df['성별'].map(he.GENDER_KR)
+    df['age_group_label']  = df['연령군'].map(he.AGE_STR_MAP).fillna(df['연령군'])
+    df['cancer_type']      = df['암종'].str.strip()
+    df = df[pd.to_numeric(df['발생연도'], errors='coerce').notna()].copy()
+    df['incidence_year']   = df['발생연도'].astype(int)
+    df['patient_count']    = pd.to_numeric(df['발생자수'], errors='coerce').fillna(0).astype(int)
+    df['incidence_rate']   = pd.to_numeric(df['조발생률'],  errors='coerce')
+    df = df[df['age_group_label'] != '연령미상']
+    return [{
+        "cancer_type":     row['cancer_type'],
+        "kcd_code":        row['kcd_code'],
+        "gender":          row['gender'],
+        "age_group_label": row['age_group_label'],
+        "incidence_year":  row['incidence_year'],
+        "patient_count":   int(row['patient_count']),
+        "incidence_rate":  nan_to_none(row['incidence_rate']),
+    } for _, row in df.iterrows()]
+
+
+def legacy_survival(path: Path) -> list[dict]:
+    """변경 전 build_cancer_survival"""
+    df = pd.read_csv(path, encoding='utf-8')
+    df['kcd_code']               = df['국제질병분류'].apply(extract_kcd)
+    df['gender']                 = df['성별'].map(he.GENDER_KR)
+    df['cancer_type']            = df['암종'].str.strip()
+    df['period']                 = df['발생기간'].str.strip()
+    df['is_latest']              = df['period'] == "2019-2023"
+    df['patient_count']          = pd.to_numeric(df['환자수'], errors='coerce').fillna(0).astype(int)
+    df['five_year_survival_rate']= pd.to_numeric(df['5년상대생존율'], errors='coerce')
+    return [{
+        "cancer_type":             row['cancer_type'],
+        "kcd_code":                row['kcd_code'],
+        "gender":                  row['gender'],
+        "period":                  row['period'],
+        "is_latest":               bool(row['is_latest']),
+        "patient_count":           int(row['patient_count']),
+        "five_year_survival_rate": nan_to_none(row['five_year_survival_rate']),
+    } for _, row in df.iterrows()]
+
+
+def vector(build) -> list[dict]:
+    with contextlib.redirect_stdout(io.StringIO()):
+        _, batches = build()
+        return [rec for batch in batches for rec in batch]
+
+
+def same(a: list[dict], b: list[dict]) -> bool:
+    """값·타입(int/float/bool/None/str) 까지 같은지 — JSON 직렬화 결과가 같아야 함"""
+    return len(a) == len(b) and all(
+        ra.keys() == rb.keys() and all(
+            type(ra[k]) is type(rb[k]) or isinstance(ra[k], float) and isinstance(rb[k], float)
+            for k in ra) and ra == rb
+        for ra, rb in zip(a, b))
+
+
+def main():
+    ap = argparse.ArgumentParser(description="암 통계 레코드 변환 회귀 확인 + 속도 비교")
+    ap.add_argument("--years", type=int, default=100, help="암발생 통계 연도 수")
+    args = ap.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory(prefix="bench_cancer_") as tmp:
+        tmp = Path(tmp)
+        he.CANCER_INCIDENCE_CSV = synthetic.write_cancer_incidence_csv(tmp / "incidence.csv", years=args.years)
+        he.CANCER_SURVIVAL_CSV = synthetic.write_cancer_survival_csv(tmp / "survival.csv")
+        for label, legacy, build, path in [
+            ("incidence", legacy_incidence, he.build_cancer_incidence, he.CANCER_INCIDENCE_CSV),
+            ("survival", legacy_survival, he.build_cancer_survival, he.CANCER_SURVIVAL_CSV),
+        ]:
+            t0 = time.perf_counter()
+            old = legacy(path)
+            t1 = time.perf_counter()
+            new = vector(build)
+            t2 = time.perf_counter()
+            if not same(old, new):
+                bad = next(i for i, (x, y) in enumerate(zip(old, new)) if x != y) if len(old) == len(new) else -1
+                print(f"  ❌ {label}: 결과 다름 (행 {bad}) {old[bad] if bad >= 0 else ''} / "
+                      f"{new[bad] if bad >= 0 else f'{len(old)} vs {len(new)}건'}")
+                sys.exit(1)
+            print(f"  ✅ {label}: {len(new):,}건 레코드 동일")
+            rows.append((label, len(new), t1 - t0, t2 - t1))
+
+    print(f"\n{'테이블':<12}{'레코드':>10}{'기존(초)':>10}{'신규(초)':>10}{'배수':>8}")
+    print("─" * 50)
+    for label, n, old_s, new_s in rows:
+        print(f"{label:<12}{n:>10,}{old_s:>10.3f}{new_s:>10.3f}{old_s / new_s:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+health_benchmarks 집계: 전체 로드 groupby vs 청크 1회 읽기 (checkup_aggregate.py)
+================================================================================
+합성 검진 CSV(결측 2%, 로그정규 지표 포함)를 별도 프로세스에서
+  legacy : 변경 전 build_health_benchmarks (float32 전체 로드 → groupby mean / std)
+  chunk  : checkup_aggregate.aggregate_checkup (workers=1 / --workers)
+로 집계해 레코드가 같은지(반올림 2자리 기준 ±0.01) 확인하고 소요 시간 · 최대 RSS를 비교한다.
+workers > 1 은 메인 프로세스와 작업 프로세스(가장 큰 것) RSS를 따로 표시.
+--files 2 이상이면 같은 크기 파일 여러 개(여러 해 데이터)를 한 번에 집계.
+
+실행:
+  python3 scripts/bench/bench_checkup_aggregate.py
+  python3 scripts/bench/bench_checkup_aggregate.py --rows 1000000 --files 2 --workers 4
+"""
+
+import argparse
+import json
+import math
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR   = Path(__file__).resolve().parent
+SCRIPTS_DIR = BENCH_DIR.parent
+sys.path[:0] = [str(BENCH_DIR), str(SCRIPTS_DIR)]
+
+import numpy as np
+import pandas as pd
+
+import checkup_aggregate as ca
+import synthetic
+
+
+def peak_rss_mb() -> float:
+    """이 프로세스의 최대 RSS (VmHWM). ru_maxrss는 exec 전 부모 값을 물려받을 수 있어 쓰지 않음"""
+    for line in open("/proc/self/status"):
+        if line.startswith("VmHWM:"):
+            return int(line.split()[1]) / 1024
+    return float("nan")
+
+
+def legacy_records(paths: list[str]) -> list[dict]:
+    """변경 전 build_health_benchmarks 집계 부분 (여러 파일은 concat)"""
+    df = pd.concat([pd.read_csv(
+        p, usecols=ca.GROUP_COLS + ca.NUMERIC_COLS,
+        dtype={c: "float32" for c in ca.NUMERIC_COLS},
+    ) for p in paths], ignore_index=True)
+    h = df["height_cm"] / 100.0
+    df["bmi"] = (df["weight_kg"] / (h ** 2)).replace([np.inf, -np.inf], np.nan)
+    grp = df.groupby(ca.GROUP_COLS)
+    agg_avg = grp[ca.ALL_METRICS].mean().round(2)
+    agg_std = grp[ca.ALL_METRICS].std().round(2)
+    agg_cnt = grp["height_cm"].count()
+    records = []
+    for key, row_avg in agg_avg.iterrows():
+        row_std = agg_std.loc[key]
+        rec = {"gender": key[0], "age_group_code": int(key[1]), "age_group_label": key[2],
+               "sample_count": int(agg_cnt.loc[key]), "data_year": 2024}
+        for m in ca.ALL_METRICS:
+            f = ca.DB_FIELD.get(m, m)
+            rec[f"{f}_avg"] = None if math.isnan(row_avg[m]) else float(row_avg[m])
+            rec[f"{f}_std"] = None if math.isnan(row_std[m]) else float(row_std[m])
+        records.append(rec)
+    return records
+
+
+def child(mode: str, workers: str, out: str, paths: list[str]):
+    t0 = time.perf_counter()
+    if mode == "legacy":
+        recs = legacy_records(paths)
+    else:
+        recs = ca.benchmark_records(ca.aggregate_checkup(paths, workers=int(workers))[0])
+    sec = time.perf_counter() - t0
+    Path(out).write_text(json.dumps(recs, ensure_ascii=False))
+    kid = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+    print(json.dumps({"sec": sec, "rss_mb": peak_rss_mb(), "child_rss_mb": kid}))
+
+
+def run_child(mode: str, workers: int, out: Path, paths: list[Path]) -> dict:
+    res = subprocess.run([sys.executable, __file__, "--child", mode, str(workers), str(out), *map(str, paths)],
+                         capture_output=True, text=True)
+    if res.returncode != 0:
+        print(res.stderr[-2000:])
+        sys.exit(1)
+    return json.loads(res.stdout.strip().splitlines()[-1])
+
+
+def compare(a: list[dict], b: list[dict]) -> tuple[int, float]:
+    """→ (±0.01 초과 차이 개수, 최대 절대 차이). 키·개수·None 위치는 완전히 같아야 함"""
+    if len(a) != len(b):
+        raise SystemExit(f"  ❌ 그룹 수 다름: {len(a)} vs {len(b)}")
+    bad, worst = 0, 0.0
+    for ra, rb in zip(a, b):
+        if ra.keys() != rb.keys():
+            raise SystemExit("  ❌ 컬럼 다름")
+        for k, va in ra.items():
+            vb = rb[k]
+            if isinstance(va, float) or isinstance(vb, float):
+                if (va is None) != (vb is None):
+                    raise SystemExit(f"  ❌ {ra['gender']} {ra['age_group_label']} {k}: {va} vs {vb}")
+                if va is not None:
+                    d = abs(va - vb)
+                    worst = max(worst, d)
+                    bad += d > 0.0100001
+            elif va != vb:
+                raise SystemExit(f"  ❌ {ra['gender']} {ra['age_group_label']} {k}: {va} vs {vb}")
+    return bad, worst
+
+
+def main():
+    ap = argparse.ArgumentParser(description="health_benchmarks 집계: 전체 로드 vs 청크 1회 읽기")
+    ap.add_argument("--rows", type=int, default=500_000, help="파일당 행 수")
+    ap.add_argument("--files", type=int, default=1)
+    ap.add_argument("--workers", type=int, default=4)
+    ap.add_argument("--child", nargs="+", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.child:
+        return child(args.child[0], args.child[1], args.child[2], args.child[3:])
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="bench_checkup_") as tmp:
+        tmp = Path(tmp)
+        print(f"🧪 합성 검진 CSV {args.files}개 생성 중 (파일당 {args.rows:,}행)... (CPU {os.cpu_count()}개)",
+              flush=True)
+        paths = [synthetic.write_checkup_csv(tmp / f"checkup{i}.csv", args.rows, seed=i)
+                 for i in range(args.files)]
+        size_mb = sum(p.stat().st_size for p in paths) / 1e6
+
+        cases = [("legacy", 1)] + [("chunk", w) for w in dict.fromkeys([1, args.workers])]
+        outs = {}
+        for mode, w in cases:
+            out = tmp / f"{mode}{w}.json"
+            results.append((mode, w, run_child(mode, w, out, paths)))
+            outs[(mode, w)] = json.loads(out.read_text())
+
+        base = outs[("legacy", 1)]
+        for (mode, w), recs in outs.items():
+            if mode == "legacy":
+                continue
+            bad, worst = compare(base, recs)
+            if bad:
+                print(f"  ❌ chunk(workers={w}): ±0.01 초과 차이 {bad}건 (최대 {worst:.4f})")
+                sys.exit(1)
+            print(f"  ✅ chunk(workers={w}): {len(recs)}개 그룹 · 표본 수 일치, 평균/표준편차 최대 차이 {worst:.2f}")
+
+    print(f"\n입력 {args.files}개 · 합계 {size_mb:.1f} MB · {args.rows * args.files:,}행")
+    print(f"{'방식':<9}{'workers':>8}{'초':>8}{'최대 RSS(MB)':>14}{'작업 프로세스(MB)':>18}")
+    print("─" * 57)
+    for mode, w, r in results:
+        kid = f"{r['child_rss_mb']:>18.1f}" if r["child_rss_mb"] else f"{'-':>18}"
+        print(f"{mode:<9}{w:>8}{r['sec']:>8.2f}{r['rss_mb']:>14.1f}{kid}")
+
+
+if __name__ == "__main__":
+    main()
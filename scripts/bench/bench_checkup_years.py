@@ -0,0 +1,116 @@
+"""
+연도별 health_benchmarks 집계: 연도마다 순차 vs 한 풀에서 동시 + 파일 해시 캐시
+==============================================================================
+cleaned_checkup_data_<연도>.csv 합성 파일 여러 개를
+  sequential : 연도마다 aggregate_checkup(workers=1) 을 차례로 실행 (기존 방식을 연도 수만큼)
+  years cold : checkup_aggregate.aggregate_years (캐시 비어 있음)
+  years warm : 같은 파일로 다시 실행 (전 연도 캐시 적중)
+  years 1 chg: 한 연도 파일만 바꾼 뒤 실행 (그 연도만 다시 집계)
+로 처리해 연도별 레코드(평균/표준편차 · 분위수)가 sequential 과 같은지 확인하고 시간을 비교한다.
+upload_health_engine.discover_checkup_files 로 파일을 찾는다 (Supabase 접속 없음).
+
+실행:
+  python3 scripts/bench/bench_checkup_years.py
+  python3 scripts/bench/bench_checkup_years.py --rows 1000000 --years 4 --workers 4
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR   = Path(__file__).resolve().parent
+SCRIPTS_DIR = BENCH_DIR.parent
+sys.path[:0] = [str(BENCH_DIR), str(SCRIPTS_DIR)]
+
+os.environ.setdefault("NEXT_PUBLIC_SUPABASE_URL", "http://127.0.0.1:9")
+os.environ.setdefault("SUPABASE_SERVICE_ROLE_KEY", "bench-service-key")
+
+import checkup_aggregate as ca
+import synthetic
+import upload_health_engine as he
+
+
+def records(aggregates: dict) -> tuple[list[dict], list[dict]]:
+    bench, quant = [], []
+    for year, (acc, sk) in aggregates.items():
+        bench += ca.benchmark_records(acc, data_year=year)
+        quant += ca.quantile_records(sk, data_year=year)
+    return bench, quant
+
+
+def timed(fn):
+    out = io.StringIO()
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(out):
+        res = fn()
+    return res, time.perf_counter() - t0, out.getvalue()
+
+
+def main():
+    ap = argparse.ArgumentParser(description="연도별 health_benchmarks 집계 + 캐시")
+    ap.add_argument("--rows", type=int, default=200_000, help="연도 파일당 행 수")
+    ap.add_argument("--years", type=int, default=3)
+    ap.add_argument("--workers", type=int, default=4)
+    args = ap.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="bench_years_") as tmp:
+        tmp = Path(tmp)
+        first = 2025 - args.years
+        print(f"🧪 연도별 합성 검진 CSV {args.years}개 생성 중 ({first}~2024년, 파일당 {args.rows:,}행)... "
+              f"(CPU {os.cpu_count()}개)", flush=True)
+        for i in range(args.years):
+            synthetic.write_checkup_csv(tmp / f"cleaned_checkup_data_{first + i}.csv", args.rows, seed=i)
+        files = he.discover_checkup_files(tmp)
+        assert sorted(files) == list(range(first, 2025)), files
+        cache = tmp / "cache"
+
+        seq, sec, _ = timed(lambda: {y: ca.aggregate_checkup(p, workers=1, quantiles=True)
+                                     for y, p in files.items()})
+        results.append(("sequential", sec, len(files)))
+        base = records(seq)
+
+        def run(label: str, expect_read: int):
+            agg, sec, log = timed(lambda: ca.aggregate_years(files, workers=args.workers,
+                                                             quantiles=True, cache_dir=cache))
+            got = records(agg)
+            if got != base:
+                print(f"  ❌ {label}: 연도별 레코드가 sequential 과 다름")
+                sys.exit(1)
+            read = log.count("집계 완료")
+            if read != expect_read:
+                print(f"  ❌ {label}: 다시 집계한 연도 {read}개 (기대 {expect_read}개)")
+                sys.exit(1)
+            print(f"  ✅ {label}: {len(got[0])}+{len(got[1])}행 sequential 과 동일 · 집계 {read}개 연도")
+            results.append((label, sec, read))
+
+        run("years cold", len(files))
+        run("years warm", 0)
+
+        # 한 연도 파일 내용 변경 → 그 연도만 다시 집계
+        changed = files[first]
+        synthetic.write_checkup_csv(changed, args.rows, seed=99)
+        # 남은 1개 연도는 workers 개 구간으로 나뉘므로 기준도 같은 구간 분할로 계산
+        # (구간 병합 순서에 따라 스케치·부동소수점 끝자리가 달라질 수 있음)
+        seq[first] = ca.aggregate_checkup(changed, workers=args.workers, quantiles=True)
+        base = records(seq)
+        run("years 1 chg", 1)
+        left = sorted(p.name for p in cache.glob(f"checkup_{first}_*.json"))
+        if len(left) != 1:
+            print(f"  ❌ {first}년 캐시 파일 {len(left)}개 (이전 해시 캐시가 남음)")
+            sys.exit(1)
+
+    print(f"\n연도 {args.years}개 × {args.rows:,}행 · workers={args.workers}")
+    print(f"{'방식':<14}{'초':>8}{'집계 연도':>10}")
+    print("─" * 32)
+    for label, sec, n in results:
+        print(f"{label:<14}{sec:>8.2f}{n:>10}")
+
+
+if __name__ == "__main__":
+    main()
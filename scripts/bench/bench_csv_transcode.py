@@ -0,0 +1,164 @@
+"""
+CSV 인코딩 변환: pandas 왕복 vs 바이트 스트리밍 (csv_encoding.py)
+=================================================================
+cp949 합성 CSV 여러 개(따옴표 안 쉼표·줄바꿈, 앞자리 0 코드, '1.50' 같은 소수,
+CRLF 줄끝)를 별도 프로세스에서
+  pandas  : 기존 convert_cp949_to_utf8 (read_csv → to_csv, 파일 순차)
+  stream  : csv_encoding.transcode_files (workers=1 / 기본값)
+로 변환해 소요 시간 · 최대 RSS를 비교한다.
+stream 출력은 "원본을 cp949로 디코드 → UTF-8(BOM)" 바이트와 완전히 같아야 하고,
+pandas 출력이 원본과 달라지는 줄 수도 함께 보여준다.
+upload_dur_rules.read_csv_safe(인코딩 판별 후 읽기)도 기존 순차 시도와 결과·시간 비교.
+
+실행:
+  python3 scripts/bench/bench_csv_transcode.py
+  python3 scripts/bench/bench_csv_transcode.py --rows 500000 --files 4
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR   = Path(__file__).resolve().parent
+SCRIPTS_DIR = BENCH_DIR.parent
+ROOT_DIR    = SCRIPTS_DIR.parent
+sys.path[:0] = [str(BENCH_DIR), str(SCRIPTS_DIR), str(ROOT_DIR)]
+
+os.environ.setdefault("NEXT_PUBLIC_SUPABASE_URL", "http://127.0.0.1:9")
+os.environ.setdefault("SUPABASE_SERVICE_ROLE_KEY", "bench-service-key")
+
+import numpy as np
+import pandas as pd
+
+import csv_encoding
+import synthetic
+
+
+def peak_rss_mb() -> float:
+    """이 프로세스의 최대 RSS (VmHWM). ru_maxrss는 exec 전 부모 값을 물려받을 수 있어 쓰지 않음"""
+    for line in open("/proc/self/status"):
+        if line.startswith("VmHWM:"):
+            return int(line.split()[1]) / 1024
+    return float("nan")
+
+
+def write_cp949_csv(path: Path, n: int, seed: int = 0, ascii_head: int = 0) -> Path:
+    """pandas 왕복 시 표기가 바뀌는 값들이 섞인 cp949 CSV (CRLF).
+    ascii_head: 앞쪽 ASCII 전용 행 수 (인코딩 판별 샘플에 한글이 없는 경우)"""
+    rng = np.random.default_rng(seed)
+    names = synthetic._names(rng, n)
+    codes = np.char.zfill(rng.integers(0, 99_999, n).astype(str), 6)
+    vals = np.round(rng.gamma(2.0, 5.0, n), 2)
+    lines = ["측정일자,센터코드,성명,측정값,비고"]
+    for i in range(ascii_head):
+        lines.append(f"2024-01-01,{i:06d},user{i},1.50,ok")
+    notes = ["", "\"좌측, 우측 평균\"", "\"재측정\r\n필요\"", "양호", "\"\"\"표준\"\" 초과\""]
+    for i in range(n):
+        lines.append(f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d},{codes[i]},{names[i]},"
+                     f"{vals[i]:.2f},{notes[i % len(notes)]}")
+    path.write_bytes(("\r\n".join(lines) + "\r\n").encode("cp949"))
+    return path
+
+
+def legacy_read_csv_safe(path: Path) -> pd.DataFrame:
+    """변경 전 upload_dur_rules.read_csv_safe (인코딩마다 전체 재시도)"""
+    for enc in ("utf-8", "cp949", "euc-kr"):
+        try:
+            return pd.read_csv(path, dtype=str, encoding=enc, keep_default_na=False)
+        except (UnicodeDecodeError, LookupError):
+            continue
+    raise ValueError(path.name)
+
+
+def child(mode: str, workers: str, srcs: list[str]):
+    t0 = time.perf_counter()
+    if mode == "pandas":
+        for s in srcs:
+            df = pd.read_csv(s, encoding="cp949")
+            df.to_csv(Path(s).with_suffix(".pandas.csv"), index=False, encoding="utf-8-sig")
+    else:
+        pairs = [(Path(s), Path(s).with_suffix(f".stream{workers}.csv")) for s in srcs]
+        for *_, err in csv_encoding.transcode_files(pairs, workers=int(workers)):
+            if err:
+                raise SystemExit(err)
+    print(json.dumps({"sec": time.perf_counter() - t0, "rss_mb": peak_rss_mb()}))
+
+
+def run_child(mode: str, workers: int, srcs: list[Path]) -> dict:
+    res = subprocess.run([sys.executable, __file__, "--child", mode, str(workers), *map(str, srcs)],
+                         capture_output=True, text=True)
+    if res.returncode != 0:
+        print(res.stderr[-2000:])
+        sys.exit(1)
+    return json.loads(res.stdout.strip().splitlines()[-1])
+
+
+def main():
+    ap = argparse.ArgumentParser(description="CSV 인코딩 변환: pandas 왕복 vs 바이트 스트리밍")
+    ap.add_argument("--rows", type=int, default=200_000, help="파일당 행 수")
+    ap.add_argument("--files", type=int, default=4)
+    ap.add_argument("--workers", type=int, default=4)
+    ap.add_argument("--child", nargs="+", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.child:
+        return child(args.child[0], args.child[1], args.child[2:])
+
+    import upload_dur_rules as ud
+
+    with tempfile.TemporaryDirectory(prefix="bench_transcode_") as tmp:
+        tmp = Path(tmp)
+        print(f"🧪 cp949 합성 CSV {args.files}개 생성 중 (파일당 {args.rows:,}행)... (CPU {os.cpu_count()}개)",
+              flush=True)
+        srcs = [write_cp949_csv(tmp / f"src{i}.csv", args.rows, seed=i) for i in range(args.files)]
+        size_mb = sum(p.stat().st_size for p in srcs) / 1e6
+
+        # 판별 샘플(앞 64KB)이 ASCII뿐인 파일 → utf-8로 판별됐다가 cp949로 재시도해야 함
+        tricky = write_cp949_csv(tmp / "ascii_head.csv", 1_000, ascii_head=5_000)
+        enc, _ = csv_encoding.transcode_file(tricky, tmp / "ascii_head.out.csv")
+        expected = b"\xef\xbb\xbf" + tricky.read_bytes().decode("cp949").encode("utf-8")
+        if enc != "cp949" or (tmp / "ascii_head.out.csv").read_bytes() != expected:
+            print(f"  ❌ ASCII 머리 파일 재시도 실패 (판별 {enc})")
+            sys.exit(1)
+        print("  ✅ 앞부분 ASCII 파일: utf-8 실패 후 cp949로 재변환")
+
+        results = [("pandas", 1, run_child("pandas", 1, srcs))]
+        for w in dict.fromkeys([1, args.workers]):
+            results.append(("stream", w, run_child("stream", w, srcs)))
+
+        changed = 0
+        for src in srcs:
+            expected = b"\xef\xbb\xbf" + src.read_bytes().decode("cp949").encode("utf-8")
+            for w in dict.fromkeys([1, args.workers]):
+                if src.with_suffix(f".stream{w}.csv").read_bytes() != expected:
+                    print(f"  ❌ {src.name}: stream(workers={w}) 출력이 원본과 다름")
+                    sys.exit(1)
+            a = expected.decode("utf-8-sig").replace("\r\n", "\n").split("\n")
+            b = src.with_suffix(".pandas.csv").read_text(encoding="utf-8-sig").split("\n")
+            changed += sum(x != y for x, y in zip(a, b)) + abs(len(a) - len(b))
+        print(f"  ✅ stream 출력 {len(srcs)}개: 원본과 인코딩 외 바이트 동일")
+        print(f"  ℹ️  pandas 왕복 출력은 원본과 {changed:,}줄 다름 (앞자리 0·소수 자리수·CRLF 등)")
+
+        t0 = time.perf_counter()
+        old = legacy_read_csv_safe(srcs[0])
+        t1 = time.perf_counter()
+        new = ud.read_csv_safe(srcs[0])
+        t2 = time.perf_counter()
+        if not old.equals(new):
+            print("  ❌ read_csv_safe: 기존 순차 시도와 결과 다름")
+            sys.exit(1)
+        print(f"  ✅ read_csv_safe (cp949): 결과 동일, {t1 - t0:.2f}초 → {t2 - t1:.2f}초")
+
+    print(f"\n입력 {args.files}개 · 합계 {size_mb:.1f} MB")
+    print(f"{'방식':<9}{'workers':>8}{'초':>8}{'MB/s':>9}{'최대 RSS(MB)':>14}")
+    print("─" * 48)
+    for mode, w, r in results:
+        print(f"{mode:<9}{w:>8}{r['sec']:>8.2f}{size_mb / r['sec']:>9.1f}{r['rss_mb']:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+dedup_csv.py 회귀 확인 + 속도·메모리 비교 (pandas 전체 로드 vs 스트리밍 2회 읽기)
+==================================================================================
+item_seq 중복이 섞인 DUR 형태 CSV(따옴표 안 쉼표·줄바꿈, 빈 item_seq, 빈 줄, BOM)를
+  legacy : 변경 전 흐름 (개수 집계용 read_csv + dedup_file 의 read_csv 전체 →
+           drop_duplicates(keep="last") → to_csv QUOTE_ALL + 재집계 read_csv)
+  stream : dedup_csv.dedup_file (item_seq → 마지막 행 번호 인덱스, 중복 있을 때만 2차 읽기)
+로 별도 프로세스에서 처리해 결과 파일이 바이트 단위로 같은지 확인하고
+소요 시간 · 최대 RSS를 비교한다. stream은 키 인덱스를 SQLite로 내리는 경우(spill)도 실행.
+
+실행:
+  python3 scripts/bench/bench_dedup_csv.py
+  python3 scripts/bench/bench_dedup_csv.py --rows 2000000
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR   = Path(__file__).resolve().parent
+SCRIPTS_DIR = BENCH_DIR.parent
+sys.path[:0] = [str(BENCH_DIR), str(SCRIPTS_DIR)]
+
+import numpy as np
+
+import dedup_csv
+import synthetic
+
+
+def peak_rss_mb() -> float:
+    """이 프로세스의 최대 RSS (VmHWM). ru_maxrss는 exec 전 부모 값을 물려받을 수 있어 쓰지 않음"""
+    for line in open("/proc/self/status"):
+        if line.startswith("VmHWM:"):
+            return int(line.split()[1]) / 1024
+    return float("nan")
+
+
+def legacy_dedup(path: Path):
+    """변경 전 main 흐름: 개수 집계 읽기 → dedup_file(읽기 · 중복 제거 · 저장) → 재집계 읽기"""
+    import pandas as pd
+    len(pd.read_csv(path, dtype=str, keep_default_na=False))
+    df = pd.read_csv(path, dtype=str, keep_default_na=False)
+    df_dedup = df.drop_duplicates(subset="item_seq", keep="last").reset_index(drop=True)
+    if len(df_dedup) != len(df):
+        df_dedup.to_csv(path, index=False, encoding="utf-8", quoting=1)
+    len(pd.read_csv(path, dtype=str, keep_default_na=False))
+
+
+def write_dup_csv(path: Path, n: int, dup_ratio: float = 0.3, seed: int = 0) -> Path:
+    rng = np.random.default_rng(seed)
+    seqs = rng.integers(200000000, 200000000 + int(n * (1 - dup_ratio)), n).astype(str).astype(object)
+    seqs[rng.random(n) < 0.01] = ""
+    names = synthetic._names(rng, n, "정")
+    details = np.array(["상세 사유", "\"쉼표, 포함\"", "\"줄바꿈\n포함\"", "", "\"\"\"인용\"\" 포함\""],
+                       dtype=object)[rng.integers(0, 5, n)]
+    lines = ["item_seq,item_name,main_ingr_name,caution_detail"]
+    ingr = rng.choice(synthetic.INGREDIENTS, n)
+    for i in range(n):
+        lines.append(f"{seqs[i]},{names[i]},{ingr[i]},{details[i]}")
+        if i % 997 == 0:
+            lines.append("")                        # 빈 줄 (pandas와 같이 건너뜀)
+    path.write_bytes(b"\xef\xbb\xbf" + ("\n".join(lines) + "\n").encode("utf-8"))
+    return path
+
+
+def child(mode: str, path: str, max_keys: str):
+    t0 = time.perf_counter()
+    if mode == "legacy":
+        legacy_dedup(Path(path))
+    else:
+        with contextlib.redirect_stdout(io.StringIO()):
+            dedup_csv.dedup_file(Path(path), int(max_keys))
+    print(json.dumps({"sec": time.perf_counter() - t0, "rss_mb": peak_rss_mb()}))
+
+
+def run_child(mode: str, path: Path, max_keys: int) -> dict:
+    res = subprocess.run([sys.executable, __file__, "--child", mode, str(path), str(max_keys)],
+                         capture_output=True, text=True)
+    if res.returncode != 0:
+        print(res.stderr[-2000:])
+        sys.exit(1)
+    return json.loads(res.stdout.strip().splitlines()[-1])
+
+
+def main():
+    ap = argparse.ArgumentParser(description="dedup_csv.py 회귀 확인 + 속도·메모리 비교")
+    ap.add_argument("--rows", type=int, default=500_000)
+    ap.add_argument("--child", nargs=3, metavar=("MODE", "CSV", "MAX_KEYS"), help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.child:
+        return child(*args.child)
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="bench_dedup_") as tmp:
+        tmp = Path(tmp)
+        print(f"🧪 중복 포함 CSV 생성 중 ({args.rows:,}행)...", flush=True)
+        src = write_dup_csv(tmp / "src.csv", args.rows)
+        size_mb = src.stat().st_size / 1e6
+        cases = [("legacy", dedup_csv.MAX_KEYS_IN_MEMORY), ("stream", dedup_csv.MAX_KEYS_IN_MEMORY),
+                 ("stream spill", max(args.rows // 20, 1))]
+        outs = []
+        for label, max_keys in cases:
+            work = tmp / f"{label.replace(' ', '_')}.csv"
+            shutil.copy(src, work)
+            results.append((label, max_keys, run_child(label.split()[0], work, max_keys)))
+            outs.append(work)
+        first = outs[0].read_bytes()
+        for (label, _), p in zip(cases[1:], outs[1:]):
+            if p.read_bytes() != first:
+                print(f"  ❌ {label}: 결과 파일이 legacy와 다름")
+                sys.exit(1)
+        print(f"  ✅ stream / stream spill 결과 파일 legacy와 바이트 동일")
+
+        # 중복 없는 파일은 건드리지 않아야 함
+        clean = tmp / "clean.csv"
+        clean.write_bytes(first)
+        with contextlib.redirect_stdout(io.StringIO()):
+            counts = dedup_csv.dedup_file(clean)
+        if clean.read_bytes() != first or counts[0] != counts[1] or clean.with_suffix(".csv.bak").exists():
+            print("  ❌ 중복 없는 파일이 변경됨")
+            sys.exit(1)
+        print(f"  ✅ 중복 없는 파일: 변경 없음 ({counts[0]:,}건)")
+
+    print(f"\n입력 {size_mb:.1f} MB · {args.rows:,}행")
+    print(f"{'방식':<14}{'키 상한':>12}{'초':>8}{'최대 RSS(MB)':>14}")
+    print("─" * 48)
+    for label, max_keys, r in results:
+        print(f"{label:<14}{max_keys:>12,}{r['sec']:>8.2f}{r['rss_mb']:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
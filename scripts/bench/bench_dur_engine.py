@@ -0,0 +1,207 @@
+"""
+dur_engine.py 회귀 확인 + 처방 점검 속도
+=========================================
+합성 DUR CSV 8종을 PostgREST 대역 서버(dur_rules)에 올려 두고 무작위 처방(약 N개 · 나이 · 임신 여부)을
+  remote : 약마다 dur_rules 를 item_seq(없으면 ingr_code)로 조회하고, 효능군중복은 약 쌍마다 비교
+           (약 1개당 1~2회 왕복 + O(N²) 쌍 비교 — 기존 조회 방식)
+  engine : DurIndex.check (CSV 폴더로 만든 메모리 색인, 호출 1번)
+  supabase: DurIndex.from_supabase 로 같은 서버에서 만든 색인
+으로 점검해 경고 목록이 같은지 확인하고 처방당 시간·왕복 수를 비교한다.
+(대역 서버는 인덱스 없이 전체 행을 훑으므로 remote 시간은 왕복 수와 함께 참고용)
+약 수가 많은 처방 1건으로 효능군중복 쌍 비교(O(N²))와 효능군 해시 버킷(O(N))도 비교한다.
+
+실행:
+  python3 scripts/bench/bench_dur_engine.py
+  python3 scripts/bench/bench_dur_engine.py --rows 5000 --rx 500 --latency-ms 20
+"""
+
+import argparse
+import json
+import re
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+BENCH_DIR   = Path(__file__).resolve().parent
+SCRIPTS_DIR = BENCH_DIR.parent
+sys.path[:0] = [str(BENCH_DIR), str(SCRIPTS_DIR)]
+
+import numpy as np
+from supabase import create_client
+
+import postgrest_stub
+import synthetic
+from dur_engine import DurIndex
+from dur_records import load_rules_dir
+
+UNIT = {"세": 12.0, "개월": 1.0, "주": 12 / 52}
+
+
+# ── 기존 방식: 약마다 조회 + 규칙 순회 + 쌍 비교 ────────────────
+def _age_hit(r: dict, months: float):
+    m = re.search(r"\d+(?:\.\d+)?", r.get("age_limit_value") or "")
+    unit, cond = r.get("age_limit_unit"), r.get("age_limit_condition")
+    if not m or unit not in UNIT or cond not in ("미만", "이하", "이상", "초과"):
+        return None
+    lim = float(m.group()) * UNIT[unit]
+    return {"미만": months < lim, "이하": months <= lim, "이상": months >= lim, "초과": months > lim}[cond]
+
+
+def _alert(drug, r, severity, **extra):
+    out = {"drug": drug, "item_seq": r.get("item_seq"), "item_name": r.get("item_name"),
+           "dur_type": r.get("dur_type"), "severity": severity, "reason": r.get("restriction_reason")}
+    for f in ("preg_grade", "age_limit_value", "age_limit_unit", "age_limit_condition",
+              "max_daily_dose_mg", "max_dosage_days"):
+        if r.get(f):
+            out[f] = r[f]
+    out.update(extra)
+    return out
+
+
+def remote_check(sb, drugs, age, pregnant) -> dict:
+    months = None if age is None else age * 12
+    alerts, unknown, drug_groups = [], [], []
+    for drug in dict.fromkeys(drugs):
+        rows = sb.table("dur_rules").select("*").eq("item_seq", drug).order("id").execute().data
+        if not rows:
+            rows = sb.table("dur_rules").select("*").eq("ingr_code", drug).order("id").execute().data
+        if not rows:
+            unknown.append(drug)
+            continue
+        groups = []
+        for r in rows:
+            t = re.sub(r"(?<=[가-힣])2$", "", re.sub(r"_DUR$", "", r["dur_type"]))
+            if t == "효능군중복":
+                if r.get("therapeutic_group") and r["therapeutic_group"] not in groups:
+                    groups.append(r["therapeutic_group"])
+            elif t == "임부금기" and pregnant:
+                alerts.append(_alert(drug, r, "금기"))
+            elif t in ("연령금기", "어린이주의") and months is not None:
+                sev = "금기" if t == "연령금기" else "주의"
+                hit = _age_hit(r, months)
+                if hit is None:
+                    alerts.append(_alert(drug, r, sev, age_unparsed=True))
+                elif hit:
+                    alerts.append(_alert(drug, r, sev))
+            elif t in ("노인금기", "노인주의") and months is not None and months >= 65 * 12:
+                alerts.append(_alert(drug, r, "금기" if t == "노인금기" else "주의"))
+            elif t in ("용량주의", "지속기간주의"):
+                alerts.append(_alert(drug, r, "주의"))
+        drug_groups.append((drug, groups))
+    alerts += pairwise_duplication(drug_groups)
+    return {"alerts": alerts, "unknown": unknown}
+
+
+def pairwise_duplication(drug_groups: list[tuple[str, list]]) -> list[dict]:
+    found: dict[str, set] = defaultdict(set)
+    for i, (a, ga) in enumerate(drug_groups):
+        for b, gb in drug_groups[i + 1:]:
+            for g in set(ga) & set(gb):
+                found[g] |= {a, b}
+    return [{"drug": None, "dur_type": "효능군중복", "severity": "주의",
+             "therapeutic_group": g, "drugs": sorted(m)} for g, m in found.items()]
+
+
+def canon(res: dict) -> tuple:
+    alerts = [{**a, "drugs": sorted(a["drugs"])} if "drugs" in a else a for a in res["alerts"]]
+    return (sorted(json.dumps(a, sort_keys=True, ensure_ascii=False) for a in alerts),
+            sorted(res["unknown"]))
+
+
+def make_prescriptions(records: list[dict], n: int, drugs_per_rx: int, seed: int = 1) -> list:
+    rng = np.random.default_rng(seed)
+    seqs = sorted({r["item_seq"] for r in records})
+    ingrs = sorted({r["ingr_code"] for r in records if r.get("ingr_code")})
+    out = []
+    for _ in range(n):
+        k = int(rng.integers(2, drugs_per_rx + 1))
+        drugs = list(rng.choice(seqs, k))
+        if rng.random() < 0.3:
+            drugs.append(str(rng.choice(ingrs)))
+        if rng.random() < 0.2:
+            drugs.append("999999999")  # 미등록
+        age = None if rng.random() < 0.05 else float(rng.choice([0.25, 1, 3, 7, 11, 15, 30, 50, 66, 80]))
+        out.append((drugs, age, bool(rng.random() < 0.2)))
+    return out
+
+
+def main():
+    ap = argparse.ArgumentParser(description="dur_engine 회귀 확인 + 처방 점검 속도")
+    ap.add_argument("--rows", type=int, default=2_000, help="DUR CSV 파일당 행 수")
+    ap.add_argument("--rx", type=int, default=40, help="처방 수")
+    ap.add_argument("--drugs", type=int, default=8, help="처방당 최대 약 수")
+    ap.add_argument("--big-n", type=int, default=3_000, help="효능군중복 확장성 확인용 약 수")
+    ap.add_argument("--latency-ms", type=float, default=0, help="대역 서버 요청당 지연")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench_dur_engine_") as tmp:
+        folder = Path(tmp)
+        synthetic.write_dur_csvs(folder, args.rows)
+        records = load_rules_dir(folder)
+        t0 = time.perf_counter()
+        index = DurIndex.from_csv_dir(folder)
+        t_build = time.perf_counter() - t0
+
+    state = postgrest_stub.StubState(latency_ms=args.latency_ms)
+    state.table("dur_rules").write(records, None, None, False)
+    server, url = postgrest_stub.start_in_thread(state)
+    sb = create_client(url, "bench-service-key")
+    print(f"🧪 DUR 규칙 {len(index):,}건 (색인 {t_build:.2f}초) | 품목 {len(index.by_item):,}개 · "
+          f"성분 {len(index.by_ingr):,}개 · 효능군 {len(index.group_members)}개 | 처방 {args.rx}건")
+
+    t0 = time.perf_counter()
+    remote_index = DurIndex.from_supabase(sb)
+    t_fetch = time.perf_counter() - t0
+    print(f"  from_supabase: {len(remote_index):,}건 {t_fetch:.2f}초")
+
+    rxs = make_prescriptions(records, args.rx, args.drugs)
+    state.reset_stats()
+    t0 = time.perf_counter()
+    base = [remote_check(sb, d, a, p) for d, a, p in rxs]
+    t_remote = time.perf_counter() - t0
+    trips = state.snapshot()["requests"]
+    server.shutdown()
+
+    results = [("remote", t_remote, trips)]
+    for label, ix in [("engine", index), ("supabase", remote_index)]:
+        t0 = time.perf_counter()
+        got = [ix.check(d, age=a, pregnant=p) for d, a, p in rxs]
+        sec = time.perf_counter() - t0
+        for i, (x, y) in enumerate(zip(base, got)):
+            if canon(x) != canon(y):
+                print(f"  ❌ {label}: 처방 {i} 경고 목록이 remote 와 다름 "
+                      f"({len(x['alerts'])} vs {len(y['alerts'])}건)")
+                sys.exit(1)
+        results.append((label, sec, 0))
+        print(f"  ✅ {label}: 처방 {len(rxs)}건 경고 {sum(len(r['alerts']) for r in got):,}건 remote 와 동일")
+
+    # 효능군중복: 약 수 N 에 대한 쌍 비교 vs 해시 버킷
+    seqs = sorted(index.by_item)
+    big = [str(s) for s in np.random.default_rng(2).choice(seqs, min(args.big_n, len(seqs)), replace=False)]
+    groups = [(d, list(dict.fromkeys(index.rules[r]["therapeutic_group"] for r in index.by_item[d]
+                                     if index.kinds[r] == "효능군중복")))
+              for d in big]
+    t0 = time.perf_counter()
+    pw = pairwise_duplication(groups)
+    t_pair = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    dup = [a for a in index.check(big)["alerts"] if a["dur_type"] == "효능군중복"]
+    t_hash = time.perf_counter() - t0
+    if sorted((a["therapeutic_group"], sorted(a["drugs"])) for a in pw) != \
+            sorted((a["therapeutic_group"], sorted(a["drugs"])) for a in dup):
+        print("  ❌ 효능군중복: 쌍 비교와 해시 버킷 결과 다름")
+        sys.exit(1)
+    print(f"  ✅ 효능군중복 (약 {len(big):,}개): 쌍 비교 {t_pair:.3f}초 vs 해시 버킷 {t_hash:.3f}초"
+          f" (check 전체) — 효능군 {len(dup)}개 동일")
+
+    print(f"\n처방 {len(rxs)}건 · 대역 서버 지연 {args.latency_ms:g}ms")
+    print(f"{'방식':<10}{'초':>9}{'ms/처방':>10}{'왕복':>8}")
+    print("─" * 37)
+    for label, sec, n in results:
+        print(f"{label:<10}{sec:>9.3f}{sec / len(rxs) * 1e3:>10.3f}{n:>8,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+upload_dur_rules 레코드 변환 회귀 확인 + 속도 비교
+===================================================
+기존 행 단위 변환(iterrows + COLUMN_MAP 순회)과 컬럼 단위 변환
+(build_record_batches)의 결과가 완전히 같은지 확인하고 소요 시간을 비교한다.
+Supabase에는 접속하지 않는다 (모듈 import용 더미 환경 변수만 설정).
+
+실행:
+  python3 scripts/bench/bench_dur_records.py
+  python3 scripts/bench/bench_dur_records.py --rows 50000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR   = Path(__file__).resolve().parent
+SCRIPTS_DIR = BENCH_DIR.parent
+sys.path[:0] = [str(BENCH_DIR), str(SCRIPTS_DIR)]
+
+os.environ.setdefault("NEXT_PUBLIC_SUPABASE_URL", "http://127.0.0.1:9")
+os.environ.setdefault("SUPABASE_SERVICE_ROLE_KEY", "bench-service-key")
+
+import pandas as pd
+
+import synthetic
+import upload_dur_rules as ud
+from age_intervals import AGE_INTERVAL_COLS
+from delta_sync import row_hash
+from dur_records import COLUMN_MAP
+
+
+def legacy_build(df: pd.DataFrame, dur_type: str, allowed_cols: set[str]) -> list[dict]:
+    """변경 전 build_records 와 동일한 행 단위 구현"""
+    records = []
+    for _, row in df.iterrows():
+        rec: dict = {"dur_type": dur_type}
+        reason_set = False
+        for csv_col, db_col in COLUMN_MAP.items():
+            if csv_col not in df.columns:
+                continue
+            if db_col not in allowed_cols:
+                continue
+            val = row[csv_col].strip() if isinstance(row[csv_col], str) else ""
+            if not val:
+                continue
+            if db_col == "restriction_reason":
+                if not reason_set:
+                    rec["restriction_reason"] = val
+                    reason_set = True
+            else:
+                rec[db_col] = val
+        if not rec.get("item_seq"):
+            continue
+        records.append(rec)
+    return records
+
+
+def edge_frame() -> pd.DataFrame:
+    """공백·빈 item_seq·detail 컬럼 여러 개(우선순위) 포함 프레임"""
+    return pd.DataFrame({
+        "item_seq":             ["100", " 200 ", "", "   ", "500", "600"],
+        "item_name":            ["가정", "", "다정", "라정", "  마정 ", "바정"],
+        "caution_detail":       ["", "  ", "c3", "c4", "", "c6"],
+        "prohibited_detail":    ["p1", "p2", "", "", "", " "],
+        "child_caution_detail": ["k1", "k2", "k3", "k4", "k5", "k6"],
+        "age_limit_value":      ["1", "", "3", "4", "", "6"],
+    })
+
+
+def check(label: str, df: pd.DataFrame, dur_type: str, allowed: set[str]) -> tuple[float, float]:
+    t0 = time.perf_counter()
+    old = legacy_build(df, dur_type, allowed)
+    t1 = time.perf_counter()
+    new = ud.build_records(df, dur_type, allowed)
+    t2 = time.perf_counter()
+
+    same = old == new and [list(r) for r in old] == [list(r) for r in new]
+    if not same or [row_hash(r) for r in old] != [row_hash(r) for r in new]:
+        bad = next((i for i, (a, b) in enumerate(zip(old, new)) if a != b), min(len(old), len(new)))
+        print(f"  ❌ {label}: 결과 불일치 (행 {bad}, 기존 {len(old):,}건 / 신규 {len(new):,}건)")
+        sys.exit(1)
+    print(f"  ✅ {label}: {len(new):,}건 동일 (row_hash 포함)")
+    return t1 - t0, t2 - t1
+
+
+def main():
+    ap = argparse.ArgumentParser(description="upload_dur_rules 레코드 변환 회귀 확인 + 속도 비교")
+    ap.add_argument("--rows", type=int, default=20_000, help="카테고리 파일당 행 수")
+    args = ap.parse_args()
+
+    # 연령 구간 타입 컬럼(age_intervals)은 기존 구현에 없던 컬럼 → 비교에서 제외하고 따로 확인
+    allowed = set(ud.ALL_TARGET_COLS) - set(AGE_INTERVAL_COLS)
+    check("경계값", edge_frame(), "노인주의", allowed)
+    check("경계값 (컬럼 제한)", edge_frame(), "노인주의", allowed - {"restriction_reason", "item_name"})
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="bench_dur_") as tmp:
+        synthetic.write_dur_csvs(Path(tmp), args.rows)
+        for path in sorted(Path(tmp).glob("*.csv")):
+            dur_type = ud.get_dur_type(path.stem)
+            df = ud.read_csv_safe(path)
+            old_sec, new_sec = check(dur_type, df, dur_type, allowed)
+            results.append((dur_type, len(df), old_sec, new_sec))
+            typed = ud.build_records(df, dur_type, set(ud.ALL_TARGET_COLS))
+            plain = [{k: v for k, v in r.items() if k not in AGE_INTERVAL_COLS} for r in typed]
+            # 연령 조건 파일은 모든 행에 구간 컬럼 4개(없는 값은 None)가 있어야 bulk upsert 가 이전 구간을 지운다
+            age_keys = AGE_INTERVAL_COLS if "age_limit_value" in df.columns else []
+            if plain != ud.build_records(df, dur_type, allowed) or \
+                    any(list(r)[len(p):] != age_keys for r, p in zip(typed, plain)):
+                print(f"  ❌ {dur_type}: 연령 구간 컬럼이 빠졌거나 다른 컬럼·순서가 달라짐")
+                sys.exit(1)
+
+    print(f"\n{'dur_type':<14}{'행':>9}{'행 단위(초)':>14}{'컬럼 단위(초)':>15}{'배율':>8}")
+    print("─" * 60)
+    for label, n, old_sec, new_sec in results:
+        print(f"{label:<14}{n:>9,}{old_sec:>14.3f}{new_sec:>15.3f}{old_sec / new_sec:>7.1f}x")
+    old_sum = sum(r[2] for r in results)
+    new_sum = sum(r[3] for r in results)
+    print("─" * 60)
+    print(f"{'합계':<14}{sum(r[1] for r in results):>9,}{old_sum:>14.3f}{new_sum:>15.3f}{old_sum / new_sum:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
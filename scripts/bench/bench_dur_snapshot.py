@@ -0,0 +1,188 @@
+"""
+dur_snapshot.py 회귀 확인 + 로컬 조회·배포판 비교 속도
+======================================================
+합성 DUR CSV 8종(배포판 A)으로 SQLite 스냅샷을 만들고
+  레코드   : 스냅샷 행 == dur_records 변환 결과 ((item_seq, dur_type) 마지막 행)
+  조회     : by_item / by_ingr (B-tree) vs 레코드 리스트 순회
+  검색     : search (FTS5) vs pandas str.contains (item_name · ingr_name), 3글자 미만은 LIKE 경로
+             — 결과 집합은 전체로 비교, 시간은 상위 20건 기준
+  색인     : DurIndex.from_snapshot vs from_csv_dir — 처방 점검 결과 동일, 적재 시간 비교
+를 확인하고, 일부 행을 바꾸고·지우고·더한 배포판 B 와의 diff_snapshots 를
+파이썬 dict 비교(기존 방식: CSV 두 벌을 읽어 키별 비교)와 맞춰 본다.
+
+실행:
+  python3 scripts/bench/bench_dur_snapshot.py
+  python3 scripts/bench/bench_dur_snapshot.py --rows 50000 --lookups 5000
+"""
+
+import argparse
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR   = Path(__file__).resolve().parent
+SCRIPTS_DIR = BENCH_DIR.parent
+sys.path[:0] = [str(BENCH_DIR), str(SCRIPTS_DIR)]
+
+import numpy as np
+import pandas as pd
+
+import synthetic
+from bench_dur_engine import canon, make_prescriptions
+from delta_sync import HASH_COL, row_hash
+from dur_engine import DurIndex
+from dur_records import load_rules_dir, read_csv_safe
+from dur_snapshot import SNAPSHOT_COLS, DurSnapshot, build_snapshot, diff_snapshots
+
+
+def keyed(records: list[dict]) -> dict:
+    """(item_seq, dur_type) → 레코드 (마지막 행). None 컬럼은 스냅샷의 NULL 처럼 뺀다"""
+    return {(r["item_seq"], r["dur_type"]): {k: v for k, v in r.items() if v is not None} for r in records}
+
+
+def make_release_b(src: Path, dst: Path, seed: int = 3) -> None:
+    """배포판 A 폴더 복사 → 파일마다 행 2% 삭제 · 3% 사유 변경 · 1% 신규"""
+    rng = np.random.default_rng(seed)
+    shutil.copytree(src, dst)
+    for p in sorted(dst.glob("*.csv")):
+        df = read_csv_safe(p)
+        n = len(df)
+        drop = rng.random(n) < 0.02
+        edit = ~drop & (rng.random(n) < 0.03)
+        col = next((c for c in df.columns if c.endswith("_detail") or c == "max_dosage_days"), "company_name")
+        df.loc[edit, col] = df.loc[edit, col] + " (개정)"
+        new = df.sample(max(1, n // 100), random_state=seed).copy()
+        new["item_seq"] = [str(900000000 + i) for i in range(len(new))]
+        pd.concat([df[~drop], new]).to_csv(p, index=False, encoding="utf-8")
+
+
+def dict_diff(old: dict, new: dict) -> set:
+    out = {("added", *k) for k in new.keys() - old.keys()}
+    out |= {("removed", *k) for k in old.keys() - new.keys()}
+    out |= {("changed", *k) for k in new.keys() & old.keys() if row_hash(new[k]) != row_hash(old[k])}
+    return out
+
+
+def main():
+    ap = argparse.ArgumentParser(description="dur_snapshot 회귀 확인 + 로컬 조회·배포판 비교 속도")
+    ap.add_argument("--rows", type=int, default=10_000, help="DUR CSV 파일당 행 수")
+    ap.add_argument("--lookups", type=int, default=2_000, help="품목·성분 조회 수")
+    ap.add_argument("--queries", type=int, default=100, help="검색어 수")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench_dur_snapshot_") as tmp:
+        tmp = Path(tmp)
+        dir_a, dir_b = tmp / "release_a", tmp / "release_b"
+        files_a = synthetic.write_dur_csvs(dir_a, args.rows)
+        make_release_b(dir_a, dir_b)
+        files_b = sorted(dir_b.glob("*.csv"))
+        snap_a, snap_b = tmp / "a.sqlite", tmp / "b.sqlite"
+
+        t0 = time.perf_counter()
+        n = build_snapshot(files_a, snap_a)
+        t_build = time.perf_counter() - t0
+        build_snapshot(files_b, snap_b)
+        print(f"🧪 DUR 규칙 {n:,}건 → 스냅샷 {t_build:.2f}초 ({snap_a.stat().st_size / 1e6:.1f}MB)")
+
+        records = load_rules_dir(dir_a, set(SNAPSHOT_COLS))
+        expect = keyed(records)
+        snap = DurSnapshot(snap_a)
+        got = keyed(snap.records())
+        if got != expect:
+            bad = next(k for k in expect if got.get(k) != expect[k])
+            print(f"  ❌ 레코드 불일치 {bad}: {expect[bad]} vs {got.get(bad)}")
+            sys.exit(1)
+        print(f"  ✅ 레코드 {len(got):,}건 dur_records 변환과 동일 (tokenizer {snap.tokenizer})")
+
+        rng = np.random.default_rng(1)
+        uniq = list(expect.values())
+        seqs = rng.choice([r["item_seq"] for r in uniq], args.lookups).tolist() + ["999999999"] * 10
+        ingrs = rng.choice([r["ingr_code"] for r in uniq], args.lookups).tolist()
+
+        def hashes(rows):
+            return sorted(row_hash({k: v for k, v in r.items() if k != HASH_COL}) for r in rows)
+
+        t0 = time.perf_counter()
+        base = [[r for r in uniq if r["item_seq"] == s] for s in seqs[:200]]
+        t_scan = (time.perf_counter() - t0) / 200
+        t0 = time.perf_counter()
+        hit = [snap.by_item(s) for s in seqs]
+        hit_i = [snap.by_ingr(c) for c in ingrs]
+        t_lookup = (time.perf_counter() - t0) / (len(seqs) + len(ingrs))
+        if any(hashes(a) != hashes(b) for a, b in zip(base, hit)) or \
+                any(hashes([r for r in uniq if r["ingr_code"] == c]) != hashes(h)
+                    for c, h in zip(ingrs[:200], hit_i)):
+            print("  ❌ by_item / by_ingr 결과가 레코드 순회와 다름")
+            sys.exit(1)
+        print(f"  ✅ by_item · by_ingr: {len(seqs) + len(ingrs):,}회 조회 레코드 순회와 동일")
+
+        frame = pd.DataFrame(uniq)
+        names = frame["item_name"].fillna("") + "\n" + frame["ingr_name"].fillna("")
+        pool = frame["item_name"].dropna().tolist() + frame["ingr_name"].dropna().tolist()
+        queries = []
+        for s in rng.choice(pool, args.queries):
+            k = int(rng.integers(2, 6))
+            i = int(rng.integers(0, max(1, len(s) - k + 1)))
+            queries.append(s[i:i + k])
+        keys = frame["item_seq"] + "|" + frame["dur_type"]
+        base_q = [set(keys[names.str.contains(q, regex=False)]) for q in queries]
+        got_q = [{r["item_seq"] + "|" + r["dur_type"] for r in snap.search(q, limit=None)} for q in queries]
+        for q, a, b in zip(queries, base_q, got_q):
+            if a != b:
+                print(f"  ❌ search '{q}': str.contains {len(a)}건 vs 스냅샷 {len(b)}건")
+                sys.exit(1)
+        # 시간은 검색 화면처럼 상위 20건 기준
+        t0 = time.perf_counter()
+        for q in queries:
+            frame[names.str.contains(q, regex=False)].head(20).to_dict(orient="records")
+        t_contains = (time.perf_counter() - t0) / len(queries)
+        t0 = time.perf_counter()
+        for q in queries:
+            snap.search(q, limit=20)
+        t_search = (time.perf_counter() - t0) / len(queries)
+        n_short = sum(len(q) < 3 for q in queries)
+        print(f"  ✅ search: 검색어 {len(queries)}개 (3글자 미만 {n_short}개 LIKE) str.contains 와 동일")
+
+        t0 = time.perf_counter()
+        ix_csv = DurIndex.from_csv_dir(dir_a)
+        t_ix_csv = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        ix_snap = DurIndex.from_snapshot(snap_a)
+        t_ix_snap = time.perf_counter() - t0
+        for d, a, p in make_prescriptions(records, 200, 8):
+            if canon(ix_csv.check(d, age=a, pregnant=p)) != canon(ix_snap.check(d, age=a, pregnant=p)):
+                print("  ❌ DurIndex.from_snapshot 점검 결과가 from_csv_dir 와 다름")
+                sys.exit(1)
+        print(f"  ✅ DurIndex: from_snapshot {t_ix_snap:.2f}초 vs from_csv_dir {t_ix_csv:.2f}초 — 처방 200건 동일")
+        snap.close()
+
+        t0 = time.perf_counter()
+        old = keyed(load_rules_dir(dir_a, set(SNAPSHOT_COLS)))
+        new = keyed(load_rules_dir(dir_b, set(SNAPSHOT_COLS)))
+        base_d = dict_diff(old, new)
+        t_dict = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        diff = diff_snapshots(snap_a, snap_b)
+        t_diff = time.perf_counter() - t0
+        got_d = set(zip(diff["status"], diff["item_seq"], diff["dur_type"]))
+        if got_d != base_d or len(got_d) != len(diff):
+            print(f"  ❌ diff_snapshots {len(diff):,}건 vs dict 비교 {len(base_d):,}건")
+            sys.exit(1)
+        changed = diff.loc[diff["status"] == "changed", "changed_cols"]
+        counts = diff["status"].value_counts()
+        print(f"  ✅ diff: 추가 {counts.get('added', 0):,} · 삭제 {counts.get('removed', 0):,} · "
+              f"변경 {counts.get('changed', 0):,}건 dict 비교와 동일 (변경 컬럼: {', '.join(changed.unique()[:3])})")
+
+    print(f"\n규칙 {n:,}건")
+    print(f"{'작업':<22}{'기존':>12}{'스냅샷':>12}{'배수':>9}")
+    print("─" * 55)
+    print(f"{'품목 조회 (ms)':<22}{t_scan * 1e3:>12.3f}{t_lookup * 1e3:>12.3f}{t_scan / t_lookup:>9.0f}")
+    print(f"{'이름 검색 (ms)':<22}{t_contains * 1e3:>12.3f}{t_search * 1e3:>12.3f}{t_contains / t_search:>9.1f}")
+    print(f"{'색인 적재 (초)':<22}{t_ix_csv:>12.3f}{t_ix_snap:>12.3f}{t_ix_csv / t_ix_snap:>9.1f}")
+    print(f"{'배포판 비교 (초)':<22}{t_dict:>12.3f}{t_diff:>12.3f}{t_dict / t_diff:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+clinical_insight / synthetic_qa 생성 회귀 확인 + 속도 비교
+==========================================================
+기존 df.apply(axis=1) + 행별 json.dumps 구현과 food_insight.py 벡터화 구현의
+출력이 바이트 단위로 같은지(CSV 저장 결과 포함) 확인하고 소요 시간을 비교한다.
+
+실행:
+  python3 scripts/bench/bench_food_insight.py
+  python3 scripts/bench/bench_food_insight.py --rows 250000
+"""
+
+import argparse
+import io
+import json
+import sys
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+ROOT_DIR  = BENCH_DIR.parent.parent
+sys.path[:0] = [str(ROOT_DIR)]
+
+import numpy as np
+import pandas as pd
+
+import food_insight
+from process_new_data import apply_column_mapping, apply_serving_conversion
+
+
+# ── 변경 전 행 단위 구현 (process_large_xlsx_to_csv / process_new_data) ──
+def add_clinical_insight(row: pd.Series) -> str:
+    sodium = row.get("sodium") or 0
+    sugar = row.get("sugar") or 0
+    protein = row.get("protein") or 0
+    parts = []
+    if sodium >= 500:
+        parts.append(f"1인분 기준 나트륨 {int(sodium)}mg로 고혈압 주의가 필요합니다.")
+    if sugar >= 10:
+        parts.append(f"당류 {sugar}g 포함으로 당뇨 관리 시 양을 조절하세요.")
+    if protein >= 15:
+        parts.append("단백질이 풍부해 근성장·유지에 도움이 됩니다.")
+    if not parts:
+        return "균형 잡힌 영양 성분입니다."
+    return " ".join(parts)
+
+
+def add_synthetic_qa(row: pd.Series) -> str:
+    name = row.get("food_name") or ""
+    cal = row.get("calories") or 0
+    insight = row.get("clinical_insight") or ""
+    return json.dumps({
+        "question": f"{name}의 칼로리와 영양은?",
+        "answer": f"1인분 기준 {cal}kcal이며, {insight}"
+    }, ensure_ascii=False)
+
+
+def legacy_full(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.copy()
+    df["clinical_insight"] = df.apply(add_clinical_insight, axis=1)
+    df["synthetic_qa"] = df.apply(add_synthetic_qa, axis=1)
+    return df
+
+
+def vector_full(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.copy()
+    df["clinical_insight"] = food_insight.clinical_insight(df)
+    df["synthetic_qa"] = food_insight.synthetic_qa(df)
+    return df
+
+
+# ── 변경 전 process_data.py 구현 ───────────────────────────────
+def legacy_simple(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.copy()
+    df['clinical_insight'] = df.apply(lambda r: f"1인분 기준 나트륨 {r['sodium']}mg 함유 식품입니다.", axis=1)
+    df['synthetic_qa'] = df.apply(lambda r: json.dumps({"q": f"{r['food_name']} 영양은?", "a": f"{r['calories']}kcal입니다."}, ensure_ascii=False), axis=1)
+    return df
+
+
+def vector_simple(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.copy()
+    df['clinical_insight'] = "1인분 기준 나트륨 " + food_insight.to_text(df['sodium']) + "mg 함유 식품입니다."
+    df['synthetic_qa'] = food_insight.json_object({"q": food_insight.to_text(df['food_name']) + " 영양은?",
+                                                   "a": food_insight.to_text(df['calories']) + "kcal입니다."})
+    return df
+
+
+# ── 입력 데이터 ────────────────────────────────────────────────
+NAMES = ["김치찌개", "된장국", "불고기", "비빔밥", "떡볶이", "라면", "초코우유", "닭가슴살 샐러드",
+         '"특가" 도시락', "감자칩\\소금맛", "줄바꿈\n식품", "탭\t식품", "제어\x01문자", "유니코드 구분"]
+
+
+def raw_frame(n: int, seed: int = 0) -> pd.DataFrame:
+    """원본 한글 컬럼 + 중량 컬럼 (process_* 스크립트 입력과 같은 형태)"""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "식품명":       rng.choice(NAMES, n).astype(object) + pd.Series(np.arange(n)).astype(str).to_numpy(dtype=object),
+        "에너지(kcal)": rng.gamma(2.0, 150.0, n).round(1),
+        "단백질(g)":    rng.gamma(1.5, 8.0, n).round(2),
+        "지방(g)":      rng.gamma(1.5, 6.0, n).round(2),
+        "탄수화물(g)":  rng.gamma(2.0, 20.0, n).round(2),
+        "당류(g)":      rng.gamma(1.0, 8.0, n).round(2),
+        "나트륨(mg)":   rng.gamma(1.5, 350.0, n).round(0),
+        "1회제공량":    rng.choice([50, 100, 150, 200, 250, 330], n).astype(float),
+    })
+    # 0·결측·문자 섞인 값
+    df.loc[df.index[::17], "에너지(kcal)"] = 0
+    df.loc[df.index[::23], "당류(g)"] = np.nan
+    df.loc[df.index[::29], "1회제공량"] = np.nan
+    return df
+
+
+def edge_frame() -> pd.DataFrame:
+    """x or 0 / x or "" 경계 + JSON 이스케이프 대상 값"""
+    return pd.DataFrame({
+        "food_name":  ['따옴표"', "역\\슬래시", "줄\n바꿈", None, "", 0, np.nan, "정상", " ", "x\x1f"],
+        "calories":   [0.0, -0.0, np.nan, 1e16, 1e-5, 12.0, 3, 0.1 + 0.2, 999.95, 5],
+        "sodium":     [500.0, 499.99, np.nan, 1234.56, 0.0, 500, 10_000.9, None, 700, 0],
+        "sugar":      [10.0, 9.99, np.nan, 12.345, 0.0, 10, 1e-5, 55.5, None, 0],
+        "protein":    [15.0, 14.9, np.nan, 30.0, 0.0, 15, 100.5, 0.0, 20, None],
+    })
+
+
+def check(label: str, legacy, vector, df: pd.DataFrame) -> tuple[float, float]:
+    t0 = time.perf_counter()
+    old = legacy(df)
+    t1 = time.perf_counter()
+    new = vector(df)
+    t2 = time.perf_counter()
+
+    for col in ("clinical_insight", "synthetic_qa"):
+        a, b = old[col].tolist(), new[col].tolist()
+        if a != b:
+            i = next(i for i, (x, y) in enumerate(zip(a, b)) if x != y)
+            print(f"  ❌ {label}: {col} 불일치 (행 {i})\n     기존: {a[i]!r}\n     신규: {b[i]!r}")
+            sys.exit(1)
+    buf_old, buf_new = io.StringIO(), io.StringIO()
+    old.to_csv(buf_old, index=False)
+    new.to_csv(buf_new, index=False)
+    if buf_old.getvalue().encode("utf-8-sig") != buf_new.getvalue().encode("utf-8-sig"):
+        print(f"  ❌ {label}: CSV 바이트 불일치")
+        sys.exit(1)
+    print(f"  ✅ {label}: {len(df):,}행 바이트 동일")
+    return t1 - t0, t2 - t1
+
+
+def main():
+    ap = argparse.ArgumentParser(description="clinical_insight / synthetic_qa 회귀 확인 + 속도 비교")
+    ap.add_argument("--rows", type=int, default=100_000)
+    args = ap.parse_args()
+
+    check("경계값 (insight/qa)", legacy_full, vector_full, edge_frame())
+    check("경계값 (process_data)", legacy_simple, vector_simple, edge_frame())
+    check("경계값 (object 컬럼)", legacy_full, vector_full, edge_frame().astype(object))
+
+    df = apply_serving_conversion(apply_column_mapping(raw_frame(args.rows)))
+    results = [
+        ("insight + qa", len(df), *check("insight + qa", legacy_full, vector_full, df)),
+        ("process_data", len(df), *check("process_data", legacy_simple, vector_simple, df)),
+    ]
+
+    print(f"\n{'대상':<16}{'행':>10}{'apply(초)':>12}{'벡터화(초)':>13}{'배율':>8}")
+    print("─" * 59)
+    for label, n, old_sec, new_sec in results:
+        print(f"{label:<16}{n:>10,}{old_sec:>12.2f}{new_sec:>13.2f}{old_sec / new_sec:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+kcd_ranges.py 회귀 확인 + 코드 해석 속도
+=======================================
+합성 암 참조 범위(synthetic.CANCERS + 쉼표 나열 범위)와 무작위 KCD 코드 N개(세부코드·소문자·
+형식 오류 포함)를
+  naive  : 코드마다 모든 범위 문자열을 정규식으로 파싱해 비교 (조회 시점 문자열 파싱과 같은 방식)
+  index  : KcdRangeIndex.lookup / most_specific (정렬 경계 searchsorted 1회)
+로 해석해 결과가 같은지 확인하고 코드당 µs 를 비교한다.
+mapping_records 가 만든 매핑 행으로 동등 조인한 결과도 naive 와 같은지 확인한다.
+
+실행:
+  python3 scripts/bench/bench_kcd_ranges.py
+  python3 scripts/bench/bench_kcd_ranges.py --codes 1000000
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+BENCH_DIR   = Path(__file__).resolve().parent
+SCRIPTS_DIR = BENCH_DIR.parent
+sys.path[:0] = [str(BENCH_DIR), str(SCRIPTS_DIR)]
+
+import numpy as np
+
+import synthetic
+from kcd_ranges import KcdRangeIndex
+
+
+def naive_lookup(code, ranges: list[tuple[str, str]]) -> tuple:
+    """코드 1개를 모든 범위 문자열과 비교 (좁은 범위 먼저)"""
+    m = re.match(r'\s*([A-Za-z])(\d{2})', str(code)) if code is not None else None
+    if not m:
+        return ()
+    c = m.group(1).upper() + m.group(2)
+    hits = []
+    for label, _ in ranges:
+        size = 0
+        inside = False
+        for a, b in re.findall(r'([A-Z]\d{2})(?:\.\d+)?(?:\s*[-~]\s*([A-Z]\d{2}))?', label):
+            lo, hi = sorted([a, b or a], key=lambda x: (x[0], int(x[1:])))
+            size += (ord(hi[0]) - ord(lo[0])) * 100 + int(hi[1:]) - int(lo[1:]) + 1
+            if (lo[0], int(lo[1:])) <= (c[0], int(c[1:])) <= (hi[0], int(hi[1:])):
+                inside = True
+        if inside:
+            hits.append((size, label))
+    return tuple(label for _, label in sorted(hits))
+
+
+def make_codes(n: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    letters = np.array(list("ABCDEFGHIJKLMNOPQRSTUVWXYZ"))
+    letters = np.where(rng.random(n) < 0.5, "C", rng.choice(letters, n))
+    codes = np.char.add(letters, np.char.zfill(rng.integers(0, 100, n).astype(str), 2)).astype(object)
+    sub = rng.random(n)
+    codes[sub < 0.2] = codes[sub < 0.2] + "." + rng.integers(0, 10, (sub < 0.2).sum()).astype(str)
+    codes[(sub >= 0.2) & (sub < 0.25)] = [c.lower() for c in codes[(sub >= 0.2) & (sub < 0.25)]]
+    codes[(sub >= 0.25) & (sub < 0.27)] = "미상"
+    codes[(sub >= 0.27) & (sub < 0.28)] = None
+    return codes
+
+
+def main():
+    ap = argparse.ArgumentParser(description="kcd_ranges 회귀 확인 + 코드 해석 속도")
+    ap.add_argument("--codes", type=int, default=200_000)
+    args = ap.parse_args()
+
+    ranges = [(re.search(r'C[\w\-]+', kcd).group(), name) for kcd, name in synthetic.CANCERS]
+    ranges += [("C81-C86, C88", "림프종"), ("D00-D09", "제자리암"), ("C50", "유방")]  # 나열 · 중복 라벨
+    index = KcdRangeIndex(ranges)
+    codes = make_codes(args.codes)
+    uniq = list(dict.fromkeys(r[0] for r in ranges))
+    print(f"🧪 범위 {len(index.labels)}개 · 기본 구간 {len(index.bounds) - 1}개 · 코드 {len(codes):,}개")
+
+    t0 = time.perf_counter()
+    old = [naive_lookup(c, [(l, None) for l in uniq]) for c in codes]
+    t_naive = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    new = index.lookup(codes)
+    best = index.most_specific(codes)
+    t_index = time.perf_counter() - t0
+
+    bad = [i for i, (a, b) in enumerate(zip(old, new)) if a != b]
+    if bad:
+        i = bad[0]
+        print(f"  ❌ lookup 불일치 {len(bad)}건 — 예: {codes[i]!r}: {old[i]} vs {new[i]}")
+        sys.exit(1)
+    if any((a[0] if a else None) != b for a, b in zip(old, best)):
+        print("  ❌ most_specific 불일치")
+        sys.exit(1)
+    print(f"  ✅ lookup / most_specific: naive 와 {len(codes):,}건 동일 "
+          f"(범위 안 {sum(bool(x) for x in old):,}건)")
+
+    # 매핑 테이블 동등 조인 = naive 해석
+    real = sorted({c.strip() for c in codes if isinstance(c, str) and c.strip()})
+    records = index.mapping_records(real)
+    joined: dict[str, list] = {}
+    for r in records:
+        joined.setdefault(r["kcd_code"], []).append(r)
+    for c in real:
+        expect = naive_lookup(c, [(l, None) for l in uniq])
+        got = tuple(r["kcd_range"] for r in joined.get(c, []))
+        flags = [r["is_most_specific"] for r in joined.get(c, [])]
+        if got != expect or flags != [i == 0 for i in range(len(got))]:
+            print(f"  ❌ 매핑 조인 불일치: {c!r}: {got} vs {expect}")
+            sys.exit(1)
+    print(f"  ✅ mapping_records {len(records):,}행: 코드 {len(real):,}개 동등 조인 결과 naive 와 동일")
+
+    n = len(codes)
+    print(f"\n{'방식':<8}{'초':>9}{'µs/코드':>10}{'배수':>8}")
+    print("─" * 35)
+    for label, sec in [("naive", t_naive), ("index", t_index)]:
+        print(f"{label:<8}{sec:>9.3f}{sec / n * 1e6:>10.2f}{t_naive / sec:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
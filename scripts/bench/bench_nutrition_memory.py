@@ -0,0 +1,113 @@
+"""
+upload_nutrition CSV 로드 메모리 비교 (전체 object 로드 vs read_mfds_csv)
+==========================================================================
+같은 합성 식약처 CSV(매핑 컬럼 + 매핑되지 않은 영양소 컬럼)에 대해 별도 프로세스에서
+  legacy : pd.read_csv(low_memory=False) 전체 컬럼 → 중복 제거 → build_records
+  lean   : read_mfds_csv (usecols · category · 영양소 float64) → 중복 제거 → build_records
+를 실행해 최대 RSS(로드 직후 / 레코드 변환까지) · DataFrame 메모리 · 소요 시간을 비교하고, 업로드 레코드의
+row_hash 목록이 같은지 확인한다. Supabase에는 접속하지 않는다.
+
+실행:
+  python3 scripts/bench/bench_nutrition_memory.py
+  python3 scripts/bench/bench_nutrition_memory.py --rows 500000 --extra-cols 80
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR   = Path(__file__).resolve().parent
+SCRIPTS_DIR = BENCH_DIR.parent
+sys.path[:0] = [str(BENCH_DIR), str(SCRIPTS_DIR)]
+
+os.environ.setdefault("NEXT_PUBLIC_SUPABASE_URL", "http://127.0.0.1:9")
+os.environ.setdefault("SUPABASE_SERVICE_ROLE_KEY", "bench-service-key")
+
+import synthetic
+
+
+def peak_rss_mb() -> float:
+    """이 프로세스의 최대 RSS (VmHWM). ru_maxrss는 exec 전 부모 값을 물려받을 수 있어 쓰지 않음"""
+    for line in open("/proc/self/status"):
+        if line.startswith("VmHWM:"):
+            return int(line.split()[1]) / 1024
+    return float("nan")
+
+
+def child(mode: str, table: str, csv: str):
+    import pandas as pd
+    import upload_nutrition as un
+    from delta_sync import row_hash
+
+    col_map, float_cols = ((un.FOOD_COL_MAP, un.FOOD_FLOAT_COLS) if table == "food"
+                           else (un.SUPP_COL_MAP, un.SUPP_FLOAT_COLS))
+    t0 = time.perf_counter()
+    if mode == "legacy":
+        df = pd.read_csv(csv, encoding="utf-8", low_memory=False)
+    else:
+        df = un.read_mfds_csv(csv, col_map, float_cols)
+    frame_mb = df.memory_usage(deep=True).sum() / 1e6
+    load_rss_mb = peak_rss_mb()
+    # upload_food 와 같은 중복 제거 (최신 기준일자 우선)
+    df = df.sort_values("데이터기준일자").drop_duplicates(subset="식품코드", keep="last")
+    total, batches = un.build_records(df, col_map, float_cols)
+    digest = hashlib.sha256()
+    for batch in batches:
+        for rec in batch:
+            digest.update(row_hash(rec).encode())
+    sec = time.perf_counter() - t0
+    rss_mb = peak_rss_mb()
+    print(json.dumps({"rows": total, "sec": sec, "rss_mb": rss_mb, "load_rss_mb": load_rss_mb, "frame_mb": frame_mb,
+                      "digest": digest.hexdigest()}))
+
+
+def run_child(mode: str, table: str, csv: Path) -> dict:
+    res = subprocess.run([sys.executable, __file__, "--child", mode, table, str(csv)],
+                         capture_output=True, text=True)
+    if res.returncode != 0:
+        print(res.stderr[-2000:])
+        sys.exit(1)
+    return json.loads(res.stdout.strip().splitlines()[-1])
+
+
+def main():
+    ap = argparse.ArgumentParser(description="upload_nutrition CSV 로드 메모리 비교")
+    ap.add_argument("--rows", type=int, default=200_000)
+    ap.add_argument("--extra-cols", type=int, default=40, help="매핑되지 않은 영양소 컬럼 수")
+    ap.add_argument("--child", nargs=3, metavar=("MODE", "TABLE", "CSV"), help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.child:
+        return child(*args.child)
+
+    import upload_nutrition as un
+    results = []
+    with tempfile.TemporaryDirectory(prefix="bench_nutrition_mem_") as tmp:
+        for table, col_map, float_cols, n, seed in (
+                ("food", un.FOOD_COL_MAP, un.FOOD_FLOAT_COLS, args.rows, 0),
+                ("supplement", un.SUPP_COL_MAP, un.SUPP_FLOAT_COLS, max(args.rows // 4, 1), 1)):
+            print(f"🧪 {table} 합성 CSV 생성 중 ({n:,}행, 미사용 컬럼 {args.extra_cols}개)...", flush=True)
+            csv = synthetic.write_mfds_csv(Path(tmp) / f"{table}.csv", n, col_map, float_cols,
+                                           seed=seed, extra_cols=args.extra_cols)
+            size_mb = csv.stat().st_size / 1e6
+            runs = {mode: run_child(mode, table, csv) for mode in ("legacy", "lean")}
+            if runs["legacy"]["digest"] != runs["lean"]["digest"]:
+                print(f"  ❌ {table}: 업로드 레코드(row_hash) 불일치")
+                sys.exit(1)
+            print(f"  ✅ {table}: {runs['lean']['rows']:,}건 레코드 동일 (row_hash)")
+            results.extend((table, size_mb, mode, r) for mode, r in runs.items())
+
+    print(f"\n{'대상':<12}{'CSV MB':>8}  {'방식':<8}{'초':>7}{'DataFrame MB':>14}{'로드 RSS':>10}{'최대 RSS(MB)':>14}")
+    print("─" * 75)
+    for table, size_mb, mode, r in results:
+        print(f"{table:<12}{size_mb:>8.1f}  {mode:<8}{r['sec']:>7.2f}{r['frame_mb']:>14.1f}"
+              f"{r['load_rss_mb']:>10.1f}{r['rss_mb']:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
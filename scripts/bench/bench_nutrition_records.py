@@ -0,0 +1,125 @@
+"""
+upload_nutrition 레코드 변환 회귀 확인 + 속도 비교
+===================================================
+기존 행 단위 변환(iterrows + 셀마다 to_float 정규식)과 컬럼 단위 변환
+(build_records)의 결과가 완전히 같은지 확인하고 소요 시간을 비교한다.
+단, 숫자형 컬럼의 지수 표기 값(1e-05 → 105.0 등)은 기존 구현의 버그라
+신규 구현에서는 값 그대로 쓰는지를 따로 확인한다.
+Supabase에는 접속하지 않는다 (모듈 import용 더미 환경 변수만 설정).
+
+실행:
+  python3 scripts/bench/bench_nutrition_records.py
+  python3 scripts/bench/bench_nutrition_records.py --rows 200000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR   = Path(__file__).resolve().parent
+SCRIPTS_DIR = BENCH_DIR.parent
+sys.path[:0] = [str(BENCH_DIR), str(SCRIPTS_DIR)]
+
+os.environ.setdefault("NEXT_PUBLIC_SUPABASE_URL", "http://127.0.0.1:9")
+os.environ.setdefault("SUPABASE_SERVICE_ROLE_KEY", "bench-service-key")
+
+import numpy as np
+import pandas as pd
+
+import synthetic
+import upload_nutrition as un
+from delta_sync import row_hash
+
+
+def legacy_build(df: pd.DataFrame, col_map: dict, float_cols: set) -> list:
+    """변경 전 build_food_records / build_supp_records 와 동일한 행 단위 구현"""
+    records = []
+    for _, row in df.iterrows():
+        rec = {}
+        for kr, en in col_map.items():
+            if kr not in df.columns:
+                continue
+            val = row[kr]
+            if en in float_cols:
+                rec[en] = un.to_float(val)
+            else:
+                rec[en] = un.to_text(val)
+        if rec.get("food_code") and rec.get("food_name"):
+            records.append(rec)
+    return records
+
+
+def vector_build(df: pd.DataFrame, col_map: dict, float_cols: set) -> list:
+    _, batches = un.build_records(df, col_map, float_cols)
+    return [rec for batch in batches for rec in batch]
+
+
+def edge_frame() -> pd.DataFrame:
+    """숫자형으로 추론된 컬럼의 경계값 (지수 표기·inf·NaN·정수) 포함 프레임"""
+    return pd.DataFrame({
+        "식품코드":     ["A1", "A2", " A3 ", "", None, "A6", "A7"],
+        "식품명":       ["가", "나", "다", "라", "마", "  ", "사"],
+        "에너지(kcal)": [1e-3, 2.5e15, np.inf, -np.inf, np.nan, 0.0, 123.456],
+        "단백질(g)":    [1, 2, 3, 4, 5, 6, 7],
+        "지방(g)":      ["1,234.5", "-", "Tr", "", "1.2.3", "-3", None],
+        "식품중량":     [100.0, np.nan, 1.5, 2.0, 3.0, 4.0, 5.0],
+    })
+
+
+def check(label: str, df: pd.DataFrame, col_map: dict, float_cols: set) -> tuple[float, float]:
+    t0 = time.perf_counter()
+    old = legacy_build(df, col_map, float_cols)
+    t1 = time.perf_counter()
+    new = vector_build(df, col_map, float_cols)
+    t2 = time.perf_counter()
+
+    if old != new or [list(r) for r in old] != [list(r) for r in new]:
+        bad = next((i for i, (a, b) in enumerate(zip(old, new)) if a != b), min(len(old), len(new)))
+        print(f"  ❌ {label}: 결과 불일치 (행 {bad}, 기존 {len(old):,}건 / 신규 {len(new):,}건)")
+        if bad < min(len(old), len(new)):
+            diff = {k: (old[bad].get(k), new[bad].get(k)) for k in old[bad] if old[bad].get(k) != new[bad].get(k)}
+            print(f"     {diff}")
+        sys.exit(1)
+    if [row_hash(r) for r in old] != [row_hash(r) for r in new]:
+        print(f"  ❌ {label}: row_hash 불일치")
+        sys.exit(1)
+    print(f"  ✅ {label}: {len(new):,}건 동일 (row_hash 포함)")
+    return t1 - t0, t2 - t1
+
+
+def main():
+    ap = argparse.ArgumentParser(description="upload_nutrition 레코드 변환 회귀 확인 + 속도 비교")
+    ap.add_argument("--rows", type=int, default=50_000)
+    args = ap.parse_args()
+
+    check("경계값", edge_frame(), un.FOOD_COL_MAP, un.FOOD_FLOAT_COLS)
+    sci = list(un.float_column(pd.Series([1e-5, 2.5e16, -3e-7, np.inf])))
+    if sci != [1e-5, 2.5e16, -3e-7, None]:
+        print(f"  ❌ 지수 표기 숫자 변환 오류: {sci}")
+        sys.exit(1)
+    print("  ✅ 지수 표기 숫자: 값 그대로 유지")
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="bench_nutrition_") as tmp:
+        cases = [
+            ("food", un.FOOD_COL_MAP, un.FOOD_FLOAT_COLS, args.rows, 0),
+            ("supplement", un.SUPP_COL_MAP, un.SUPP_FLOAT_COLS, max(args.rows // 4, 1), 1),
+        ]
+        for label, col_map, float_cols, n, seed in cases:
+            path = synthetic.write_mfds_csv(Path(tmp) / f"{label}.csv", n, col_map, float_cols, seed=seed)
+            # upload_food / upload_supplement 와 같은 방식으로 로드 (숫자 컬럼 dtype 추론 포함)
+            df = pd.read_csv(path, encoding="utf-8", low_memory=False)
+            old_sec, new_sec = check(label, df, col_map, float_cols)
+            results.append((label, len(df), old_sec, new_sec))
+
+    print(f"\n{'대상':<12}{'행':>10}{'행 단위(초)':>14}{'컬럼 단위(초)':>15}{'배율':>8}")
+    print("─" * 59)
+    for label, n, old_sec, new_sec in results:
+        print(f"{label:<12}{n:>10,}{old_sec:>14.2f}{new_sec:>15.2f}{old_sec / new_sec:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
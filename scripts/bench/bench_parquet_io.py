@@ -0,0 +1,136 @@
+"""
+가공 결과 CSV vs Parquet (parquet_io.py) 크기 · 업로드 읽기 속도 비교
+======================================================================
+합성 processed_food_db(9개 컬럼)와 processed_rda_final(영양소 ~120열)을
+CSV / Parquet 으로 각각 저장한 뒤 업로드 스크립트와 같은 방식으로
+(parquet_io.read_batches, 500행 배치) 읽어
+  - 파일 크기
+  - 처음부터 전부 읽기 / 90% 지점에서 이어 읽기 소요 시간
+  - 업로드 레코드(NaN → None 정리 후, 빈 문자열 포함)가 CSV 경로와 같은지
+를 확인한다. process_large_xlsx_to_csv.py --format parquet 출력(ChunkWriter)도
+CSV 출력과 같은 레코드인지, row group 크기가 ROW_GROUP_SIZE 인지 함께 확인.
+
+실행:
+  python3 scripts/bench/bench_parquet_io.py
+  python3 scripts/bench/bench_parquet_io.py --rows 500000
+"""
+
+import argparse
+import math
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+ROOT_DIR  = BENCH_DIR.parent.parent
+sys.path[:0] = [str(BENCH_DIR), str(ROOT_DIR)]
+
+import pandas as pd
+
+import parquet_io
+import process_rda_xlsx as rda
+import synthetic
+
+BATCH_SIZE = 500
+FOOD_COLS = ["food_name", "calories", "protein", "fat", "carbs", "sugar", "sodium",
+             "clinical_insight", "synthetic_qa"]
+
+
+def records(path: Path, start_row: int, columns=None) -> tuple[list[dict], float]:
+    """업로드 스크립트 루프와 같은 배치 순회 → (정리된 레코드, 초)"""
+    t0 = time.perf_counter()
+    total, batches = parquet_io.read_batches(path, BATCH_SIZE, start_row, columns)
+    out = []
+    for i, frame in zip(range(start_row, total, BATCH_SIZE), batches):
+        assert len(frame) == min(BATCH_SIZE, total - i), "배치 경계 불일치"
+        out.extend({k: (None if isinstance(v, float) and not math.isfinite(v) else v) for k, v in r.items()}
+                   for r in frame.to_dict(orient="records"))
+    return out, time.perf_counter() - t0
+
+
+def compare(label: str, csv_path: Path, pq_path: Path, columns=None) -> list[tuple]:
+    total = parquet_io.read_batches(pq_path, BATCH_SIZE)[0]
+    rows = []
+    for start in (0, int(total * 0.9) + 7):
+        a, sec_csv = records(csv_path, start)
+        b, sec_pq = records(pq_path, start, columns)
+        if columns is not None:
+            a = [{k: r[k] for k in columns} for r in a]
+        if a != b:
+            i = next((i for i, (x, y) in enumerate(zip(a, b)) if x != y), min(len(a), len(b)))
+            print(f"  ❌ {label} (start={start}): 레코드 불일치 (행 {start + i}, {len(a)} vs {len(b)}건)")
+            if i < min(len(a), len(b)):
+                print(f"     csv    : {str(a[i])[:160]}\n     parquet: {str(b[i])[:160]}")
+            sys.exit(1)
+        rows.append((label, start, len(b), sec_csv, sec_pq))
+    print(f"  ✅ {label}: 처음부터 / 이어하기 모두 레코드 동일")
+    return rows
+
+
+def check_chunk_writer(tmp: Path, n: int):
+    """process_large_xlsx_to_csv.py --format csv / parquet 출력 비교 (ChunkWriter 경로)"""
+    import process_large_xlsx_to_csv as plx
+    xlsx = synthetic.write_raw_food_xlsx(tmp / "raw.xlsx", n)
+    for fmt in ("csv", "parquet"):
+        sys.argv = ["process_large_xlsx_to_csv.py", str(xlsx), str(tmp / "plx.csv"),
+                    "--engine", "calamine", "--workers", "1", "--format", fmt]
+        plx.main()
+    import pyarrow.parquet as pq
+    meta = pq.ParquetFile(tmp / "plx.parquet").metadata
+    sizes = [meta.row_group(g).num_rows for g in range(meta.num_row_groups)]
+    if any(s != parquet_io.ROW_GROUP_SIZE for s in sizes[:-1]):
+        print(f"  ❌ row group 크기 불일치: {sizes}")
+        sys.exit(1)
+    compare("process_large 출력", tmp / "plx.csv", tmp / "plx.parquet")
+    print(f"     row group {len(sizes)}개 ({sizes[0]:,}행 단위)")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="CSV vs Parquet 크기 · 업로드 읽기 속도 비교")
+    ap.add_argument("--rows", type=int, default=250_000, help="processed_food_db 행 수")
+    ap.add_argument("--rda-rows", type=int, default=20_000)
+    ap.add_argument("--xlsx-rows", type=int, default=120_000, help="process_large 출력 비교용 엑셀 행 수")
+    args = ap.parse_args()
+    parquet_io.check_pyarrow()
+
+    results, sizes = [], []
+    with tempfile.TemporaryDirectory(prefix="bench_parquet_") as tmp:
+        tmp = Path(tmp)
+        print("🧪 ChunkWriter 출력 확인 중...", flush=True)
+        check_chunk_writer(tmp, args.xlsx_rows)
+
+        print(f"🧪 합성 processed_food_db ({args.rows:,}행) / processed_rda ({args.rda_rows:,}행) 생성 중...",
+              flush=True)
+        food_csv = synthetic.write_processed_food_csv(tmp / "food.csv", args.rows)
+        food = pd.read_csv(food_csv)
+        food.loc[::97, "sugar"] = float("nan")            # 결측 → None 경로
+        food.to_csv(food_csv, index=False, encoding="utf-8-sig")
+        parquet_io.write_frame(food, tmp / "food.parquet", {"food_name", "clinical_insight", "synthetic_qa"})
+
+        rda_out = rda.build_output(synthetic.rda_raw_frame(args.rda_rows).iloc[rda.DATA_START_ROW:])
+        rda_out.loc[rda_out.index[::53], "food_name"] = ""   # 빈 문자열 → CSV 와 같이 None
+        rda_out.to_csv(tmp / "rda.csv", index=False, encoding="utf-8-sig")
+        parquet_io.write_frame(rda_out, tmp / "rda.parquet", {"food_name", "unit"})
+
+        for label, stem, cols in (("food_knowledge", "food", FOOD_COLS),
+                                  ("food (열 투영 2개)", "food", ["food_name", "calories"]),
+                                  ("rda", "rda", None)):
+            results += compare(label, tmp / f"{stem}.csv", tmp / f"{stem}.parquet", cols)
+        for stem in ("food", "rda"):
+            sizes.append((stem, (tmp / f"{stem}.csv").stat().st_size / 1e6,
+                          (tmp / f"{stem}.parquet").stat().st_size / 1e6))
+
+    print(f"\n{'파일':<8}{'CSV MB':>10}{'Parquet MB':>12}{'비율':>8}")
+    print("─" * 38)
+    for stem, c, p in sizes:
+        print(f"{stem:<8}{c:>10.1f}{p:>12.1f}{p / c:>7.0%}")
+
+    print(f"\n{'대상':<20}{'시작 행':>10}{'읽은 행':>10}{'CSV 초':>9}{'Parquet 초':>12}{'배속':>7}")
+    print("─" * 68)
+    for label, start, n, sec_csv, sec_pq in results:
+        print(f"{label:<20}{start:>10,}{n:>10,}{sec_csv:>9.2f}{sec_pq:>12.2f}{sec_csv / sec_pq:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
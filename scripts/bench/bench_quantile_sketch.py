@@ -0,0 +1,130 @@
+"""
+health_benchmark_quantiles 정확도 · 비용 확인 (quantile_sketch.TDigest)
+=====================================================================
+합성 검진 CSV를 checkup_aggregate.aggregate_checkup(quantiles=True)로 집계해
+  - 그룹·지표별 p5~p95 추정값을 전체 로드 np.quantile(정확값)과 비교 (순위 오차)
+  - 로그정규 지표(중성지방·감마GTP 등)에서 정규분포 가정(평균 ± z·표준편차) 백분위 오차와 비교
+  - --workers 로 나눠 만든 스케치(병합 순서가 다름)도 같은 순위 오차 기준(1%p)을 지키는지, workers=1 과의 차이
+  - 직렬화(to_dict → from_dict) 왕복 후 같은 값인지, JSON 크기
+  - 스케치 유무에 따른 집계 시간
+을 출력한다.
+
+실행:
+  python3 scripts/bench/bench_quantile_sketch.py
+  python3 scripts/bench/bench_quantile_sketch.py --rows 1000000 --workers 4
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR   = Path(__file__).resolve().parent
+SCRIPTS_DIR = BENCH_DIR.parent
+sys.path[:0] = [str(BENCH_DIR), str(SCRIPTS_DIR)]
+
+import numpy as np
+
+import checkup_aggregate as ca
+import synthetic
+from quantile_sketch import TDigest
+
+# 정규분포 가정 백분위용 z 값 (p5 ~ p95)
+Z = {5: -1.6449, 10: -1.2816, 25: -0.6745, 50: 0.0, 75: 0.6745, 90: 1.2816, 95: 1.6449}
+
+
+def rank_error(sorted_vals: np.ndarray, est: float, p: int) -> float:
+    """추정값의 실제 누적 비율과 목표 백분위의 차이 (%p).
+    측정값이 0.1 단위라 동률이 많으므로, 추정값 양옆 관측값(a ≤ est ≤ b)의
+    동률 구간 [F(a⁻), F(b)] 안이면 0"""
+    n = len(sorted_vals)
+    i = np.searchsorted(sorted_vals, est, side="right")
+    a = sorted_vals[max(i - 1, 0)]
+    b = sorted_vals[min(np.searchsorted(sorted_vals, est, side="left"), n - 1)]
+    lo = np.searchsorted(sorted_vals, a, side="left") / n
+    hi = np.searchsorted(sorted_vals, b, side="right") / n
+    q = p / 100
+    return 0.0 if lo <= q <= hi else min(abs(lo - q), abs(hi - q)) * 100
+
+
+def main():
+    ap = argparse.ArgumentParser(description="health_benchmark_quantiles 정확도 · 비용 확인")
+    ap.add_argument("--rows", type=int, default=500_000)
+    ap.add_argument("--workers", type=int, default=4)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench_quantile_") as tmp:
+        path = synthetic.write_checkup_csv(Path(tmp) / "checkup.csv", args.rows)
+        print(f"🧪 합성 검진 CSV {args.rows:,}행 (CPU {os.cpu_count()}개)", flush=True)
+
+        t0 = time.perf_counter()
+        moments, _ = ca.aggregate_checkup(path, workers=1)
+        t1 = time.perf_counter()
+        _, sk1 = ca.aggregate_checkup(path, workers=1, quantiles=True)
+        t2 = time.perf_counter()
+        _, skn = ca.aggregate_checkup(path, workers=args.workers, quantiles=True)
+        t3 = time.perf_counter()
+
+        # 정확값 기준: 전체 로드 (BMI 계산까지 같은 경로)
+        header, ranges = ca.split_ranges(path, 1)
+        df = next(ca.read_chunks(path, header, *ranges[0], chunk_rows=args.rows + 1))
+
+    recs = ca.quantile_records(sk1)
+    recs_n = ca.quantile_records(skn)
+    cols = [f"p{p}" for p in ca.PERCENTILES]
+
+    # ── 정확도: 스케치 vs 정확값, 정규 가정 vs 정확값 ─────────
+    groups = {(g, int(a), l): idx for (g, a, l), idx in df.groupby(ca.GROUP_COLS).indices.items()}
+    values = df[ca.ALL_METRICS].to_numpy(np.float64)
+    by_key_n = {(r["gender"], r["age_group_code"], r["metric"]): r for r in recs_n}
+    worst_sketch, worst_sketch_n, worst_normal = {}, {}, {}
+    for rec in recs:
+        key = (rec["gender"], rec["age_group_code"], rec["age_group_label"])
+        m = next(k for k in ca.ALL_METRICS if ca.DB_FIELD.get(k, k) == rec["metric"])
+        j = ca.ALL_METRICS.index(m)
+        v = np.sort(values[groups[key], j])
+        v = v[~np.isnan(v)]
+        if rec["sample_count"] != len(v):
+            raise SystemExit(f"  ❌ {key} {m}: 표본 수 {rec['sample_count']} vs {len(v)}")
+        n, avg, std = moments.stats(key)
+        rec_n = by_key_n[(rec["gender"], rec["age_group_code"], rec["metric"])]
+        for p in ca.PERCENTILES:
+            worst_sketch[m] = max(worst_sketch.get(m, 0), rank_error(v, rec[f"p{p}"], p))
+            worst_sketch_n[m] = max(worst_sketch_n.get(m, 0), rank_error(v, rec_n[f"p{p}"], p))
+            worst_normal[m] = max(worst_normal.get(m, 0), rank_error(v, avg[j] + Z[p] * std[j], p))
+
+    workers_col = f"workers={args.workers}(%p)"
+    print(f"\n{'지표':<20}{'스케치 최대 순위오차(%p)':>26}{workers_col:>18}{'정규 가정(%p)':>16}")
+    print("─" * 80)
+    for m in ca.ALL_METRICS:
+        mark = " *" if m in synthetic.LOGNORMAL_METRICS else ""
+        print(f"{m + mark:<20}{worst_sketch[m]:>26.2f}{worst_sketch_n[m]:>18.2f}{worst_normal[m]:>16.2f}")
+    print("  * 로그정규 분포 지표")
+    if max(worst_sketch.values()) > 1.0:
+        print("  ❌ 스케치 순위 오차 1%p 초과")
+        sys.exit(1)
+    if max(worst_sketch_n.values()) > 1.0:
+        print(f"  ❌ workers={args.workers} 스케치 순위 오차 1%p 초과")
+        sys.exit(1)
+
+    # ── 병합 순서 · 직렬화 ────────────────────────────────────
+    diff = max(abs(a[c] - b[c]) for a, b in zip(recs, recs_n) for c in cols if a[c] is not None)
+    print(f"\n  ✅ workers=1 vs {args.workers}: 순위 오차 모두 1%p 이내 (백분위 값 최대 차이 {diff:.2f})")
+    rt = max(abs(TDigest.from_dict(json.loads(json.dumps(r["sketch"]))).quantile(p / 100) - r[f"p{p}"])
+             for r in recs for p in ca.PERCENTILES)
+    size = np.mean([len(json.dumps(r["sketch"])) for r in recs])
+    print(f"  ✅ 직렬화 왕복 백분위 최대 차이 {rt:.3f} · 스케치 JSON 평균 {size / 1024:.1f} KB "
+          f"({len(recs)}행 합계 {size * len(recs) / 1e6:.2f} MB)")
+
+    print(f"\n{'집계':<28}{'초':>8}")
+    print("─" * 36)
+    print(f"{'평균/표준편차만':<28}{t1 - t0:>8.2f}")
+    print(f"{'+ 분위수 스케치':<28}{t2 - t1:>8.2f}")
+    print(f"{f'+ 분위수 스케치 (workers={args.workers})':<28}{t3 - t2:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
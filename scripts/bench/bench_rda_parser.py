@@ -0,0 +1,105 @@
+"""
+process_rda_xlsx 영양소 셀 파서 회귀 확인 + 속도 비교
+======================================================
+기존 컬럼별 Series.apply(to_numeric_value)와 일괄 변환(to_numeric_block)의
+결과 CSV가 바이트 단위로 같은지(컬럼 dtype 포함) 확인하고 소요 시간을 비교한다.
+입력은 pd.read_excel(header=None) 결과와 같은 모양의 합성 시트.
+
+실행:
+  python3 scripts/bench/bench_rda_parser.py
+  python3 scripts/bench/bench_rda_parser.py --rows 30000
+"""
+
+import argparse
+import io
+import sys
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+ROOT_DIR  = BENCH_DIR.parent.parent
+sys.path[:0] = [str(BENCH_DIR), str(ROOT_DIR)]
+
+import numpy as np
+import pandas as pd
+
+import process_rda_xlsx as rda
+import synthetic
+
+
+def legacy_output(df_raw: pd.DataFrame) -> pd.DataFrame:
+    """변경 전 main()의 추출 단계 (셀 단위 apply)"""
+    df_raw = df_raw.reset_index(drop=True)
+    ncols = df_raw.shape[1]
+    col_indices = [(rda.col_letter_to_index(letter), name) for letter, name in rda.COLUMN_MAPPING]
+    out = pd.DataFrame()
+    d_idx = col_indices[0][0]
+    out["food_name"] = df_raw.iloc[:, d_idx].astype(str).replace("nan", "").str.strip() if d_idx < ncols else ""
+    out["unit"] = rda.PER_100G_LABEL
+    for idx, name in col_indices:
+        if name == "food_name":
+            continue
+        if idx >= ncols:
+            out[name] = 0
+            continue
+        out[name] = df_raw.iloc[:, idx].apply(rda.to_numeric_value)
+    col_order = ["food_name", "unit"] + [name for _, name in rda.COLUMN_MAPPING if name != "food_name"]
+    return out[[c for c in col_order if c in out.columns]]
+
+
+def edge_frame() -> pd.DataFrame:
+    """셀 타입·토큰 경계값 (numpy 정수, bool, 유니코드 숫자, 음수 0 등)"""
+    cells = [None, np.nan, 0, 0.0, -0.0, 1.5, True, np.int64(0), np.int64(7), np.float64(2.25),
+             "0", "0.0", "0.00", "-0", " (0) ", "(1,234.5)", "1,2", "TR", "trace", "N.D.",
+             "12.3a", "a-4.5b", "..5", "１２", "1.", "-", "", "   ", pd.Timestamp("2024-01-02"), "nan"]
+    n = len(cells)
+    width = rda.col_letter_to_index("EB") + 1
+    rows = [[f"r{i}c{c}" for c in range(width)] for i in range(n)]
+    for i, v in enumerate(cells):
+        for c in range(width):
+            if c != 3:
+                rows[i][c] = cells[(i + c) % n]
+    frame = pd.DataFrame(rows, dtype=object)
+    frame[rda.col_letter_to_index("CA")] = "-"      # 전부 0 분기 → int64 컬럼
+    frame[rda.col_letter_to_index("CB")] = np.nan
+    return frame
+
+
+def check(label: str, df_raw: pd.DataFrame) -> tuple[float, float]:
+    t0 = time.perf_counter()
+    old = legacy_output(df_raw)
+    t1 = time.perf_counter()
+    new = rda.build_output(df_raw)
+    t2 = time.perf_counter()
+
+    if list(old.dtypes) != list(new.dtypes):
+        diff = [(c, str(a), str(b)) for c, a, b in zip(old.columns, old.dtypes, new.dtypes) if a != b]
+        print(f"  ❌ {label}: dtype 불일치 {diff[:5]}")
+        sys.exit(1)
+    a, b = io.StringIO(), io.StringIO()
+    old.to_csv(a, index=False)
+    new.to_csv(b, index=False)
+    if a.getvalue() != b.getvalue():
+        la, lb = a.getvalue().splitlines(), b.getvalue().splitlines()
+        i = next((i for i, (x, y) in enumerate(zip(la, lb)) if x != y), min(len(la), len(lb)))
+        print(f"  ❌ {label}: CSV 불일치 (줄 {i})\n     기존: {la[i][:160]}\n     신규: {lb[i][:160]}")
+        sys.exit(1)
+    print(f"  ✅ {label}: {len(new):,}행 × {new.shape[1]}열 바이트·dtype 동일")
+    return t1 - t0, t2 - t1
+
+
+def main():
+    ap = argparse.ArgumentParser(description="process_rda_xlsx 셀 파서 회귀 확인 + 속도 비교")
+    ap.add_argument("--rows", type=int, default=20_000)
+    args = ap.parse_args()
+
+    check("경계값", edge_frame())
+    check("좁은 시트 (일부 열 없음)", edge_frame().iloc[:, :60])
+
+    raw = synthetic.rda_raw_frame(args.rows)
+    old_sec, new_sec = check("합성 시트", raw.iloc[rda.DATA_START_ROW:])
+    print(f"\n  셀 단위 apply: {old_sec:.2f}초  |  일괄 변환: {new_sec:.2f}초  ({old_sec / new_sec:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
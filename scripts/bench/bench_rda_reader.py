@@ -0,0 +1,124 @@
+"""
+process_rda_xlsx 시트 읽기: 전체 read_excel vs 열 투영 스트리밍
+================================================================
+같은 합성 엑셀(국가표준식품성분 시트 모양, A~EB 132열)을
+  legacy : pd.read_excel(header=None) 전체 → build_output
+  stream : read_projected_sheet (매핑 열만) → build_output
+로 각각 별도 프로세스에서 변환해 결과 CSV가 같은지 확인하고
+소요 시간 · 최대 RSS를 비교한다.
+
+실행:
+  python3 scripts/bench/bench_rda_reader.py
+  python3 scripts/bench/bench_rda_reader.py --rows 20000
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+ROOT_DIR  = BENCH_DIR.parent.parent
+sys.path[:0] = [str(BENCH_DIR), str(ROOT_DIR)]
+
+import pandas as pd
+
+import process_rda_xlsx as rda
+import synthetic
+
+
+def convert(mode: str, xlsx: Path, out_csv: Path) -> int:
+    if mode == "legacy":
+        raw = pd.read_excel(xlsx, sheet_name=rda.SHEET_NAME, header=None)
+        out = rda.build_output(raw.iloc[rda.DATA_START_ROW:])
+    else:
+        indices = sorted({rda.col_letter_to_index(letter) for letter, _ in rda.COLUMN_MAPPING})
+        data, ncols = rda.read_projected_sheet(xlsx, rda.SHEET_NAME, indices, rda.DATA_START_ROW)
+        out = rda.build_output(data, ncols)
+    out.to_csv(out_csv, index=False, encoding="utf-8-sig")
+    return len(out)
+
+
+def child(mode: str, xlsx: str, out_csv: str):
+    t0 = time.perf_counter()
+    rows = convert(mode, Path(xlsx), Path(out_csv))
+    sec = time.perf_counter() - t0
+    rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # Linux: KB
+    print(json.dumps({"rows": rows, "sec": sec, "rss_mb": rss_mb}))
+
+
+def run_child(mode: str, xlsx: Path, out_csv: Path) -> dict:
+    res = subprocess.run([sys.executable, __file__, "--child", mode, str(xlsx), str(out_csv)],
+                         capture_output=True, text=True)
+    if res.returncode != 0:
+        print(res.stderr)
+        sys.exit(1)
+    return json.loads(res.stdout.strip().splitlines()[-1])
+
+
+def write_edge_xlsx(path: Path) -> Path:
+    """빈 행 · 행마다 다른 너비 · 결측 문자열 · 정수형 float · 오류 문자열"""
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(rda.SHEET_NAME)
+    width = synthetic.RDA_NCOLS
+    ws.append(["표제"] + [None] * 10)
+    ws.append([None] * 5)
+    ws.append([f"h{c}" for c in range(width)])
+    ws.append([])
+    cells = [1.0, 2.5, "NA", "N/A", "#DIV/0!", "nan", "", "(0)", "1,234", "Tr", 0.0, 7, None, True, "None"]
+    for i in range(40):
+        if i in (5, 6):
+            ws.append([])                    # 중간 빈 행 (유지돼야 함)
+            continue
+        row = [cells[(i + c) % len(cells)] for c in range(width - (i % 7) * 3)]
+        row[3] = ["김치", 1.0, "NA", None, " 된장 "][i % 5]
+        ws.append(row)
+    ws.append([])                            # 시트 끝 빈 행 (잘려야 함)
+    ws.append([None, None, ""])
+    wb.save(path)
+    return path
+
+
+def main():
+    ap = argparse.ArgumentParser(description="process_rda_xlsx 전체 읽기 vs 열 투영 스트리밍")
+    ap.add_argument("--rows", type=int, default=10_000)
+    ap.add_argument("--child", nargs=3, metavar=("MODE", "XLSX", "OUT"), help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.child:
+        return child(*args.child)
+
+    with tempfile.TemporaryDirectory(prefix="bench_rda_reader_") as tmp:
+        tmp = Path(tmp)
+        cases = [("경계값", write_edge_xlsx(tmp / "edge.xlsx"))]
+        print(f"🧪 합성 시트 생성 중 ({args.rows:,}행 × {synthetic.RDA_NCOLS}열)...")
+        cases.append(("합성 시트", synthetic.write_rda_xlsx(tmp / "rda.xlsx", args.rows, rda.SHEET_NAME)))
+
+        results = []
+        for label, xlsx in cases:
+            runs = {mode: run_child(mode, xlsx, tmp / f"{label}_{mode}.csv") for mode in ("legacy", "stream")}
+            a = (tmp / f"{label}_legacy.csv").read_bytes()
+            b = (tmp / f"{label}_stream.csv").read_bytes()
+            if a != b:
+                la, lb = a.decode("utf-8-sig").splitlines(), b.decode("utf-8-sig").splitlines()
+                i = next((i for i, (x, y) in enumerate(zip(la, lb)) if x != y), min(len(la), len(lb)))
+                print(f"  ❌ {label}: CSV 불일치 (줄 {i}, {len(la)} vs {len(lb)}줄)")
+                if i < min(len(la), len(lb)):
+                    print(f"     legacy: {la[i][:160]}\n     stream: {lb[i][:160]}")
+                sys.exit(1)
+            print(f"  ✅ {label}: {runs['stream']['rows']:,}행 CSV 바이트 동일")
+            results.extend((label, mode, r) for mode, r in runs.items())
+
+    print(f"\n{'시트':<12}{'방식':<9}{'행':>9}{'초':>8}{'rows/s':>10}{'최대 RSS(MB)':>14}")
+    print("─" * 62)
+    for label, mode, r in results:
+        print(f"{label:<12}{mode:<9}{r['rows']:>9,}{r['sec']:>8.2f}{r['rows'] / r['sec']:>10,.0f}{r['rss_mb']:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
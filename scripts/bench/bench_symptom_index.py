@@ -0,0 +1,145 @@
+"""
+symptom_index.py 회귀 확인 + 증상 → 질병 조회 속도
+===================================================
+합성 disease_stats(키워드 어휘 V개, 표기 흔들림: 공백·구분자·#·괄호·전각 쉼표·중복 포함)에 대해
+  scan   : 질의마다 전체 행의 symptom_keywords 를 파이썬으로 분리·정규화해 비교
+           (ILIKE 전체 스캔과 같은 행 단위 비용, 결과는 토큰 정확 일치)
+  index  : SymptomIndex.match (키워드 키 조회 + posting list 병합)
+  file   : save → load 한 로컬 파일 색인으로 같은 질의
+로 후보 목록(일치 키워드 수 · patient_count 합 · 순서)이 같은지 확인하고 질의당 시간을 비교한다.
+
+실행:
+  python3 scripts/bench/bench_symptom_index.py
+  python3 scripts/bench/bench_symptom_index.py --rows 100000 --vocab 5000 --queries 500
+"""
+
+import argparse
+import re
+import sys
+import tempfile
+import time
+import unicodedata
+from pathlib import Path
+
+BENCH_DIR   = Path(__file__).resolve().parent
+SCRIPTS_DIR = BENCH_DIR.parent
+sys.path[:0] = [str(BENCH_DIR), str(SCRIPTS_DIR)]
+
+import numpy as np
+import pandas as pd
+
+from symptom_index import SymptomIndex, build_postings, index_records
+
+SYLLABLES = list("가나다라마바사아자차카타파하통열증감기침복부두허리관절")
+
+
+def make_frame(rows: int, vocab_size: int, seed: int = 0) -> tuple[pd.DataFrame, list[str]]:
+    rng = np.random.default_rng(seed)
+    vocab = sorted({"".join(rng.choice(SYLLABLES, rng.integers(2, 5))) for _ in range(vocab_size * 2)})
+    vocab = list(rng.choice(vocab, min(vocab_size, len(vocab)), replace=False))
+    letters = np.array(list("ABCDEFGHIJKLMNOPQRSTUVWXYZ"))
+    codes = np.char.add(rng.choice(letters, rows), np.char.zfill(rng.integers(0, 100, rows).astype(str), 2))
+
+    def messy(word: str) -> str:
+        r = rng.random()
+        if r < 0.1 and len(word) > 2:
+            return word[:2] + " " + word[2:]
+        if r < 0.15:
+            return "#" + word
+        if r < 0.2:
+            return f"({word})"
+        return word
+
+    seps = [", ", ",", " / ", "·", "，", "; "]
+    texts = []
+    for _ in range(rows):
+        words = [messy(w) for w in rng.choice(vocab, rng.integers(1, 6))]
+        texts.append("".join(w + (seps[rng.integers(len(seps))] if i < len(words) - 1 else "")
+                             for i, w in enumerate(words)))
+    texts = np.array(texts, dtype=object)
+    texts[rng.random(rows) < 0.02] = None
+    df = pd.DataFrame({
+        "kcd_code": codes,
+        "patient_count": rng.integers(0, 1_000_000, rows),
+        "symptom_keywords": texts,
+    })
+    return df, vocab
+
+
+def scan_match(df: pd.DataFrame, query: list[str]) -> list[dict]:
+    """행마다 키워드 텍스트를 분리·정규화해 질의 키워드와 비교 (색인 없는 조회)"""
+    want = set(query)
+    hits: dict[str, set] = {}
+    score: dict[str, int] = {}
+    for code, count, text in zip(df["kcd_code"], df["patient_count"], df["symptom_keywords"]):
+        if not isinstance(text, str):
+            continue
+        toks = {re.sub(r'[\s()\[\]{}"\'#`]+', "", t)
+                for t in re.split(r'[,，、/·;|\n]+', unicodedata.normalize("NFKC", text).lower())}
+        found = toks & want
+        for kw in found:
+            hits.setdefault(code, set()).add(kw)
+            score[code] = score.get(code, 0) + int(count)
+    out = [{"kcd_code": c, "matched": len(k), "score": score[c]} for c, k in hits.items()]
+    return sorted(out, key=lambda r: (-r["matched"], -r["score"], r["kcd_code"]))
+
+
+def main():
+    ap = argparse.ArgumentParser(description="symptom_index 회귀 확인 + 조회 속도")
+    ap.add_argument("--rows", type=int, default=20_000)
+    ap.add_argument("--vocab", type=int, default=2_000)
+    ap.add_argument("--queries", type=int, default=50)
+    args = ap.parse_args()
+
+    df, vocab = make_frame(args.rows, args.vocab)
+    rng = np.random.default_rng(1)
+    queries = [list(rng.choice(vocab, rng.integers(1, 4), replace=False)) for _ in range(args.queries)]
+    print(f"🧪 disease_stats 합성 {len(df):,}행 · 어휘 {len(vocab):,}개 · 질의 {len(queries)}개")
+
+    t0 = time.perf_counter()
+    postings = build_postings(df)
+    index = SymptomIndex.from_postings(postings)
+    records = index_records(postings)
+    t_build = time.perf_counter() - t0
+    print(f"  색인 생성 {t_build:.2f}초: 키워드 {len(index):,}개 · posting {len(postings):,}건 · 레코드 {len(records):,}행")
+    if len(index) != len(vocab):
+        print(f"  ❌ 정규화 후 키워드 {len(index):,}개 (어휘 {len(vocab):,}개와 다름)")
+        sys.exit(1)
+
+    with tempfile.TemporaryDirectory(prefix="bench_symptom_") as tmp:
+        path = index.save(Path(tmp) / "symptom_index.json.gz")
+        size_kb = path.stat().st_size / 1024
+        loaded = SymptomIndex.load(path)
+    raw_kb = df["symptom_keywords"].dropna().str.len().sum() * 3 / 1024
+
+    t0 = time.perf_counter()
+    base = [scan_match(df, q) for q in queries]
+    t_scan = time.perf_counter() - t0
+
+    results = [("scan", t_scan)]
+    for label, ix in [("index", index), ("file", loaded)]:
+        t0 = time.perf_counter()
+        got = [ix.match(q, limit=len(ix.codes)) for q in queries]
+        sec = time.perf_counter() - t0
+        for q, a, b in zip(queries, base, got):
+            if a != b:
+                print(f"  ❌ {label}: 질의 {q} 결과가 scan 과 다름 ({len(a)} vs {len(b)}건)")
+                sys.exit(1)
+        print(f"  ✅ {label}: 질의 {len(queries)}개 후보 목록 scan 과 동일")
+        results.append((label, sec))
+
+    # 표기 흔들림 질의도 같은 키워드로 정규화
+    w = next(v for v in vocab if len(v) > 2)
+    if index.match(f" #{w[:2]} {w[2:]} ") != index.match([w]):
+        print(f"  ❌ 질의 정규화 불일치: {w}")
+        sys.exit(1)
+
+    print(f"\n로컬 파일 {size_kb:,.1f} KB (원본 키워드 텍스트 약 {raw_kb:,.0f} KB)")
+    print(f"{'방식':<8}{'초':>9}{'ms/질의':>10}{'배수':>10}")
+    print("─" * 37)
+    for label, sec in results:
+        print(f"{label:<8}{sec:>9.3f}{sec / len(queries) * 1e3:>10.3f}{t_scan / sec:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
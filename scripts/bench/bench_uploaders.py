@@ -0,0 +1,241 @@
+"""
+업로드 스크립트 처리량 벤치마크 (로컬 PostgREST 대역 사용)
+============================================================
+postgrest_stub.py 서버를 백그라운드로 띄우고 합성 데이터로 각 업로더를 실행해
+rows/s · 요청 수 · 전송 바이트를 측정한다. 실제 Supabase 프로젝트에는 접속하지 않는다.
+
+대상:
+  upload_data.py              (processed_food_db → food_knowledge insert)
+  upload_nutrition.py         (식약처 음식/건강기능식품 → upsert, --delta 재실행 포함)
+  upload_dur_rules.py         (DUR 카테고리 CSV 8종 → dur_rules upsert, 순차 / --parallel /
+                               --delta · --incremental 월간 갱신)
+  upload_disease_stats.py     (질병통계 → disease_stats upsert)
+  upload_health_engine.py     (검진 집계 + 암 통계 → 3개 참조 테이블)
+
+실행:
+  python3 scripts/bench/bench_uploaders.py
+  python3 scripts/bench/bench_uploaders.py --rows 50000 --latency-ms 40 --error-rate 0.01
+  python3 scripts/bench/bench_uploaders.py --only dur nutrition
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR   = Path(__file__).resolve().parent
+SCRIPTS_DIR = BENCH_DIR.parent
+ROOT_DIR    = SCRIPTS_DIR.parent
+sys.path[:0] = [str(BENCH_DIR), str(SCRIPTS_DIR), str(ROOT_DIR)]
+
+import pandas as pd
+
+import synthetic
+from postgrest_stub import StubState, start_in_thread
+
+
+def load_module(name: str, argv: list[str] | None = None):
+    """업로더 모듈을 새로 import (모듈 레벨에서 클라이언트·sys.argv를 읽으므로 매번 재로딩)"""
+    sys.argv = argv or [f"{name}.py"]
+    sys.modules.pop(name, None)
+    return importlib.import_module(name)
+
+
+def run_case(state: StubState, label: str, fn, verbose: bool) -> dict:
+    before = state.snapshot()
+    out = io.StringIO()
+    err = None
+    t0 = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(sys.stdout if verbose else out):
+            fn()
+    except (Exception, SystemExit) as e:  # 업로더의 sys.exit 포함
+        err = f"{type(e).__name__}: {e}"
+    sec = time.perf_counter() - t0
+    after = state.snapshot()
+    d = {k: after[k] - before[k] for k in ("requests", "bytes_in", "bytes_out",
+                                           "rows_written", "rows_read", "rows_deleted",
+                                           "errors_injected", "rate_limited")}
+    d.update(label=label, sec=sec, error=err)
+    return d
+
+
+# ── 케이스 정의 ────────────────────────────────────────────────
+def case_upload_data(tmp: Path, rows: int, throttle: bool):
+    csv = synthetic.write_processed_food_csv(tmp / "processed_food_db_bench.csv", rows)
+    mod = load_module("upload_data", ["upload_data.py", str(csv)])
+    mod.STATUS_PATH = tmp / "upload_status_bench.txt"
+    if not throttle:
+        mod.THROTTLE_SEC = 0
+    yield "upload_data", mod.run_upload
+
+
+def case_nutrition(tmp: Path, rows: int, throttle: bool):
+    mod = load_module("upload_nutrition")
+    mod.FOOD_CSV = synthetic.write_mfds_csv(tmp / "food.csv", rows, mod.FOOD_COL_MAP, mod.FOOD_FLOAT_COLS)
+    mod.SUPP_CSV = synthetic.write_mfds_csv(tmp / "supp.csv", rows // 4, mod.SUPP_COL_MAP, mod.SUPP_FLOAT_COLS, seed=1)
+    yield "nutrition: food (full)", mod.upload_food
+    yield "nutrition: supplement (full)", mod.upload_supplement
+    yield "nutrition: food (delta seed)", lambda: mod.upload_food(delta=True)
+
+    # 월간 갱신 재현: 1% 행의 에너지 값 변경 후 델타 재실행
+    df = pd.read_csv(mod.FOOD_CSV, dtype=str, keep_default_na=False)
+    step = max(len(df) // max(len(df) // 100, 1), 1)
+    df.loc[df.index[::step], "에너지(kcal)"] = "999.9"
+    refreshed = tmp / "food_refresh.csv"
+    df.to_csv(refreshed, index=False, encoding="utf-8")
+
+    def refresh():
+        mod.FOOD_CSV = refreshed
+        mod.upload_food(delta=True)
+    yield "nutrition: food (delta 1% refresh)", refresh
+
+
+def case_dur(tmp: Path, rows: int, throttle: bool):
+    folder = tmp / "dur"
+    synthetic.write_dur_csvs(folder, max(rows // 8, 1))
+    mod = load_module("upload_dur_rules")
+    mod.SCRIPTS_DIR = folder
+    STATE.schemas["dur_rules"] = set(mod.ALL_TARGET_COLS)
+    yield "dur_rules", mod.main
+
+    def parallel():
+        sys.argv = ["upload_dur_rules.py", "--parallel"]
+        mod.main()
+        check_dur_table(folder, mod.ALL_TARGET_COLS)
+    yield "dur_rules (--parallel)", parallel
+
+    # 매니페스트 증분: 첫 실행(테이블 row_hash 로 비교) → 변경 없음 → 월간 갱신
+    mod.MANIFEST_PATH = tmp / "dur_manifest.json"
+
+    def run(*flags):
+        def fn():
+            sys.argv = ["upload_dur_rules.py", *flags]
+            mod.main()
+        return fn
+    yield "dur_rules (--incremental seed)", run("--incremental")
+    yield "dur_rules (--incremental 변경 없음)", run("--incremental")
+
+    # 월간 갱신 재현: 파일 1개에서 300행 사유 변경 · 50행 삭제 · 50행 추가
+    #                + 연령 조건 파일에서 20행 조건 이상 → 미만 (이전 하한이 남지 않아야 함)
+    path = sorted(folder.glob("*.csv"))[0]
+    df = pd.read_csv(path, dtype=str, keep_default_na=False)
+    detail = next(c for c in df.columns if c.endswith("_detail"))
+    df.loc[df.index[:300], detail] = df.loc[df.index[:300], detail] + " (개정)"
+    added = df.iloc[-50:].assign(item_seq=[str(900000000 + i) for i in range(50)])
+    pd.concat([df.iloc[:-50], added]).to_csv(path, index=False, encoding="utf-8")
+    age_path = next(p for p in sorted(folder.glob("*.csv")) if "age_limit_condition" in pd.read_csv(p, nrows=0).columns)
+    df = pd.read_csv(age_path, dtype=str, keep_default_na=False)
+    flip = df.index[df["age_limit_condition"] == "이상"][:20]
+    df.loc[flip, "age_limit_condition"] = "미만"
+    df.to_csv(age_path, index=False, encoding="utf-8")
+    yield "dur_rules (--delta --prune 월간 갱신)", run("--delta", "--prune")
+
+    def incremental_refresh():
+        run("--incremental")()
+        check_dur_table(folder, mod.ALL_TARGET_COLS)
+    yield "dur_rules (--incremental 월간 갱신)", incremental_refresh
+
+
+def check_dur_table(folder: Path, cols: set[str]):
+    """대역 서버 dur_rules == CSV 변환 결과 ((item_seq, dur_type) 키 집합 · 값, 연령 구간은 항상 비교)"""
+    from age_intervals import AGE_INTERVAL_COLS
+    from dur_records import load_rules_dir
+    expect = {(r["item_seq"], r["dur_type"]): r for r in load_rules_dir(folder, cols)}
+    rows = {(r["item_seq"], r["dur_type"]): r for r in STATE.table("dur_rules").select([])}
+    if rows.keys() != expect.keys():
+        raise AssertionError(f"dur_rules 키 불일치: 테이블 {len(rows):,} vs CSV {len(expect):,}")
+    bad = [k for k, rec in expect.items()
+           if any(rows[k].get(c) != rec.get(c) for c in rec.keys() | set(AGE_INTERVAL_COLS))]
+    if bad:
+        raise AssertionError(f"dur_rules 값 불일치 {len(bad):,}건 (예: {bad[0]})")
+
+
+def case_disease(tmp: Path, rows: int, throttle: bool):
+    mod = load_module("upload_disease_stats")
+    mod.CSV_PATH = synthetic.write_disease_stats_csv(tmp / "disease.csv", rows)
+    mod.INDEX_PATH = tmp / "symptom_index.json.gz"
+    yield "disease_stats", mod.main
+
+
+def case_health(tmp: Path, rows: int, throttle: bool):
+    mod = load_module("upload_health_engine")
+    mod.CHECKUP_CSV = synthetic.write_checkup_csv(tmp / "checkup.csv", rows)
+    mod.CHECKUP_CACHE_DIR = tmp / "checkup_cache"
+    mod.CANCER_INCIDENCE_CSV = synthetic.write_cancer_incidence_csv(tmp / "incidence.csv")
+    mod.CANCER_SURVIVAL_CSV = synthetic.write_cancer_survival_csv(tmp / "survival.csv")
+    mod.DISEASE_STATS_CSV = synthetic.write_disease_stats_csv(tmp / "disease_stats.csv", rows)
+    yield "health_engine", mod.main
+
+
+CASES = {
+    "upload_data": case_upload_data,
+    "nutrition":   case_nutrition,
+    "dur":         case_dur,
+    "disease":     case_disease,
+    "health":      case_health,
+}
+STATE: StubState  # main()에서 생성
+
+
+def print_report(results: list[dict]):
+    print(f"\n{'=' * 96}")
+    print(f"{'케이스':<36}{'행':>9}{'초':>8}{'rows/s':>10}{'요청':>7}{'송신 MB':>9}{'수신 MB':>9}  비고")
+    print("─" * 96)
+    for r in results:
+        rps = r["rows_written"] / r["sec"] if r["sec"] else 0
+        note = r["error"] or ""
+        if r["errors_injected"] or r["rate_limited"]:
+            note += f" 주입오류 {r['errors_injected']} / 429 {r['rate_limited']}"
+        if r["rows_deleted"]:
+            note += f" 삭제 {r['rows_deleted']:,}"
+        print(f"{r['label']:<36}{r['rows_written']:>9,}{r['sec']:>8.2f}{rps:>10,.0f}"
+              f"{r['requests']:>7,}{r['bytes_in'] / 1e6:>9.2f}{r['bytes_out'] / 1e6:>9.2f}  {note}")
+    print("=" * 96)
+
+
+def main():
+    global STATE
+    ap = argparse.ArgumentParser(description="업로더 처리량 벤치마크 (로컬 PostgREST 대역)")
+    ap.add_argument("--rows", type=int, default=20_000, help="케이스별 기준 행 수")
+    ap.add_argument("--only", nargs="*", choices=list(CASES), help="일부 케이스만 실행")
+    ap.add_argument("--latency-ms", type=float, default=0)
+    ap.add_argument("--jitter-ms", type=float, default=0)
+    ap.add_argument("--error-rate", type=float, default=0)
+    ap.add_argument("--rate-limit", type=float, default=0)
+    ap.add_argument("--throttle", action="store_true", help="upload_data.py 배치 간 휴식 유지")
+    ap.add_argument("--verbose", action="store_true", help="업로더 출력 표시")
+    args = ap.parse_args()
+
+    STATE = StubState(args.latency_ms, args.jitter_ms, args.error_rate, args.rate_limit, seed=0)
+    server, base_url = start_in_thread(STATE)
+    os.environ.update({
+        "NEXT_PUBLIC_SUPABASE_URL": base_url,
+        "NEXT_PUBLIC_SUPABASE_ANON_KEY": "bench-anon-key",
+        "SUPABASE_SERVICE_ROLE_KEY": "bench-service-key",
+    })
+    print(f"🧪 PostgREST stand-in: {base_url}  (지연 {args.latency_ms}ms, "
+          f"오류율 {args.error_rate}, 제한 {args.rate_limit or '없음'} req/s)")
+
+    results = []
+    argv = sys.argv
+    try:
+        with tempfile.TemporaryDirectory(prefix="bench_uploaders_") as tmp:
+            for name in args.only or list(CASES):
+                for label, fn in CASES[name](Path(tmp), args.rows, args.throttle):
+                    print(f"  ▶ {label} ...", flush=True)
+                    results.append(run_case(STATE, label, fn, args.verbose))
+    finally:
+        sys.argv = argv
+        server.shutdown()
+
+    print_report(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+엑셀 파서 엔진 비교 (openpyxl vs calamine)
+===========================================
+합성 raw_food_db.xlsx (1만 / 10만 / 50만 행)에 대해 엔진별로 별도 프로세스에서
+  parse   : xlsx_reader.iter_rows 로 행만 읽기
+  convert : process_large_xlsx_to_csv.py 전체 변환 (CSV 저장까지)
+를 실행해 rows/s 와 최대 RSS를 비교하고, 엔진 간 결과 CSV가 바이트 단위로
+같은지 확인한다. process_rda_xlsx.py 읽기 경로도 경계값 시트로 함께 확인.
+
+실행:
+  python3 scripts/bench/bench_xlsx_engines.py
+  python3 scripts/bench/bench_xlsx_engines.py --sizes 10000 100000
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+ROOT_DIR  = BENCH_DIR.parent.parent
+sys.path[:0] = [str(BENCH_DIR), str(ROOT_DIR)]
+
+import synthetic
+import xlsx_reader
+
+
+def child(task: str, engine: str, xlsx: str, out: str):
+    t0 = time.perf_counter()
+    if task == "parse":
+        rows = sum(1 for _ in xlsx_reader.iter_rows(xlsx, engine=engine)) - 1
+    elif task == "convert":
+        import process_large_xlsx_to_csv as plx
+        sys.argv = ["process_large_xlsx_to_csv.py", xlsx, out, "--engine", engine]
+        plx.main()
+        rows = sum(1 for _ in open(out, encoding="utf-8-sig")) - 1
+    else:  # rda
+        import process_rda_xlsx as rda
+        indices = sorted({rda.col_letter_to_index(letter) for letter, _ in rda.COLUMN_MAPPING})
+        data, ncols = rda.read_projected_sheet(xlsx, rda.SHEET_NAME, indices, rda.DATA_START_ROW, engine)
+        df = rda.build_output(data, ncols)
+        df.to_csv(out, index=False, encoding="utf-8-sig")
+        rows = len(df)
+    sec = time.perf_counter() - t0
+    rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # Linux: KB
+    print(json.dumps({"rows": rows, "sec": sec, "rss_mb": rss_mb}))
+
+
+def run_child(task: str, engine: str, xlsx: Path, out: Path) -> dict:
+    res = subprocess.run([sys.executable, __file__, "--child", task, engine, str(xlsx), str(out)],
+                         capture_output=True, text=True)
+    if res.returncode != 0:
+        print(res.stderr[-2000:])
+        sys.exit(1)
+    return json.loads(res.stdout.strip().splitlines()[-1])
+
+
+def same_file(label: str, paths: list[Path]):
+    first = paths[0].read_bytes()
+    for p in paths[1:]:
+        if p.read_bytes() != first:
+            print(f"  ❌ {label}: 엔진 간 출력 불일치 ({paths[0].name} vs {p.name})")
+            sys.exit(1)
+    print(f"  ✅ {label}: 엔진 간 출력 바이트 동일")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="엑셀 파서 엔진 비교 (openpyxl vs calamine)")
+    ap.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 500_000])
+    ap.add_argument("--engines", nargs="+", choices=xlsx_reader.ENGINES, default=list(xlsx_reader.ENGINES))
+    ap.add_argument("--child", nargs=4, metavar=("TASK", "ENGINE", "XLSX", "OUT"), help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.child:
+        return child(*args.child)
+    for e in args.engines:
+        xlsx_reader.check_engine(e)
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="bench_xlsx_") as tmp:
+        tmp = Path(tmp)
+
+        # process_rda_xlsx 읽기 경로: 경계값 시트 + 소형 합성 시트
+        from bench_rda_reader import write_edge_xlsx
+        import process_rda_xlsx as rda
+        for label, xlsx in (("rda 경계값", write_edge_xlsx(tmp / "rda_edge.xlsx")),
+                            ("rda 합성", synthetic.write_rda_xlsx(tmp / "rda.xlsx", 2_000, rda.SHEET_NAME))):
+            outs = [tmp / f"{xlsx.stem}_{e}.csv" for e in args.engines]
+            for e, out in zip(args.engines, outs):
+                run_child("rda", e, xlsx, out)
+            same_file(label, outs)
+
+        for n in args.sizes:
+            print(f"🧪 raw_food_db 합성 엑셀 생성 중 ({n:,}행)...", flush=True)
+            xlsx = synthetic.write_raw_food_xlsx(tmp / f"raw_{n}.xlsx", n)
+            size_mb = xlsx.stat().st_size / 1e6
+            outs = []
+            for e in args.engines:
+                r = run_child("parse", e, xlsx, tmp / "unused")
+                results.append((n, size_mb, "parse", e, r))
+                out = tmp / f"out_{n}_{e}.csv"
+                r = run_child("convert", e, xlsx, out)
+                results.append((n, size_mb, "convert", e, r))
+                outs.append(out)
+                print(f"   {e}: 변환 {r['sec']:.1f}초", flush=True)
+            same_file(f"{n:,}행 변환", outs)
+
+    print(f"\n{'행':>9}{'xlsx MB':>9}  {'작업':<9}{'엔진':<10}{'초':>8}{'rows/s':>11}{'최대 RSS(MB)':>14}")
+    print("─" * 72)
+    for n, size_mb, task, e, r in results:
+        print(f"{n:>9,}{size_mb:>9.1f}  {task:<9}{e:<10}{r['sec']:>8.2f}"
+              f"{r['rows'] / r['sec']:>11,.0f}{r['rss_mb']:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
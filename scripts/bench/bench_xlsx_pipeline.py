@@ -0,0 +1,100 @@
+"""
+process_large_xlsx_to_csv 파이프라인 벤치마크 (순차 vs 프로세스 풀)
+=====================================================================
+같은 합성 raw_food_db.xlsx에 대해 엔진별로
+  parse     : 행 읽기만 (변환 시간의 하한)
+  workers=1 : 읽기 → 변환 → 쓰기 순차 실행
+  workers=N : 변환을 프로세스 풀에 넘기고 순서 보장 작성 스레드로 기록
+를 별도 프로세스에서 실행해 소요 시간·최대 RSS를 비교하고 출력 CSV가 같은지 확인한다.
+코어 수가 적은 환경에서는 프로세스 풀 이득이 작다 (출력에 CPU 수 표시).
+
+실행:
+  python3 scripts/bench/bench_xlsx_pipeline.py
+  python3 scripts/bench/bench_xlsx_pipeline.py --rows 250000 --workers 4 --engines calamine
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+ROOT_DIR  = BENCH_DIR.parent.parent
+sys.path[:0] = [str(BENCH_DIR), str(ROOT_DIR)]
+
+import synthetic
+import xlsx_reader
+
+
+def child(engine: str, workers: str, xlsx: str, out: str):
+    t0 = time.perf_counter()
+    if workers == "parse":
+        rows = sum(1 for _ in xlsx_reader.iter_rows(xlsx, engine=engine)) - 1
+    else:
+        import process_large_xlsx_to_csv as plx
+        sys.argv = ["process_large_xlsx_to_csv.py", xlsx, out, "--engine", engine, "--workers", workers]
+        plx.main()
+        rows = sum(1 for _ in open(out, encoding="utf-8-sig")) - 1
+    sec = time.perf_counter() - t0
+    rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    rss_children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+    print(json.dumps({"rows": rows, "sec": sec, "rss_mb": rss_mb, "worker_rss_mb": rss_children}))
+
+
+def run_child(engine: str, workers: str, xlsx: Path, out: Path) -> dict:
+    res = subprocess.run([sys.executable, __file__, "--child", engine, workers, str(xlsx), str(out)],
+                         capture_output=True, text=True)
+    if res.returncode != 0:
+        print(res.stderr[-2000:])
+        sys.exit(1)
+    return json.loads(res.stdout.strip().splitlines()[-1])
+
+
+def main():
+    ap = argparse.ArgumentParser(description="xlsx→CSV 파이프라인 벤치마크 (순차 vs 프로세스 풀)")
+    ap.add_argument("--rows", type=int, default=100_000)
+    ap.add_argument("--workers", type=int, default=4)
+    ap.add_argument("--engines", nargs="+", choices=xlsx_reader.ENGINES, default=list(xlsx_reader.ENGINES))
+    ap.add_argument("--child", nargs=4, metavar=("ENGINE", "WORKERS", "XLSX", "OUT"), help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.child:
+        return child(*args.child)
+    for e in args.engines:
+        xlsx_reader.check_engine(e)
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="bench_pipeline_") as tmp:
+        tmp = Path(tmp)
+        print(f"🧪 raw_food_db 합성 엑셀 생성 중 ({args.rows:,}행)... (CPU {os.cpu_count()}개)", flush=True)
+        xlsx = synthetic.write_raw_food_xlsx(tmp / "raw.xlsx", args.rows)
+        outs = []
+        for e in args.engines:
+            for w in ("parse", "1", str(args.workers)):
+                out = tmp / f"out_{e}_{w}.csv"
+                r = run_child(e, w, xlsx, out)
+                results.append((e, w, r))
+                if w != "parse":
+                    outs.append(out)
+                print(f"   {e} / {w}: {r['sec']:.1f}초", flush=True)
+        first = outs[0].read_bytes()
+        if any(p.read_bytes() != first for p in outs[1:]):
+            print("  ❌ 실행 방식/엔진 간 출력 CSV 불일치")
+            sys.exit(1)
+        print(f"  ✅ 출력 CSV {len(outs)}개 바이트 동일")
+
+    print(f"\n{'엔진':<10}{'방식':<11}{'초':>8}{'rows/s':>11}{'parse 대비':>11}{'RSS(MB)':>10}{'워커 RSS':>10}")
+    print("─" * 71)
+    parse_sec = {e: r["sec"] for e, w, r in results if w == "parse"}
+    for e, w, r in results:
+        label = "parse" if w == "parse" else f"workers={w}"
+        print(f"{e:<10}{label:<11}{r['sec']:>8.2f}{r['rows'] / r['sec']:>11,.0f}"
+              f"{r['sec'] / parse_sec[e]:>10.2f}x{r['rss_mb']:>10.1f}{r['worker_rss_mb']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
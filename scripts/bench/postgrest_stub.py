@@ -0,0 +1,420 @@
+"""
+로컬 PostgREST 대역(stand-in) 서버
+===================================
+업로드 스크립트가 실제 Supabase 프로젝트 대신 붙을 수 있는 최소한의
+PostgREST 프로토콜 구현 (메모리 저장, 스레드 서버).
+
+지원 범위:
+  - POST   /rest/v1/<table>                 insert / upsert (Prefer: resolution=merge-duplicates, ?on_conflict=)
+  - GET    /rest/v1/<table>?select=...      select (eq/neq/gt/gte/lt/lte/in/is/like/ilike, not.*, order, limit, offset)
+  - HEAD   /rest/v1/<table>                 count 전용 (Prefer: count=exact → Content-Range)
+  - PATCH  /rest/v1/<table>?<filters>       update
+  - DELETE /rest/v1/<table>?<filters>       delete
+  - GET    /rest/v1/                        OpenAPI (definitions.<table>.properties)
+  - GET    /__stats , POST /__reset         벤치마크용 통계 조회 / 초기화
+
+부하 재현 옵션:
+  --latency-ms   요청마다 고정 지연 (+ --jitter-ms 무작위 지연)
+  --error-rate   무작위 503 응답 비율 (0~1)
+  --rate-limit   초당 허용 요청 수 (초과 시 429)
+
+실행:
+  python3 scripts/bench/postgrest_stub.py --port 54321 --latency-ms 30
+  → NEXT_PUBLIC_SUPABASE_URL=http://127.0.0.1:54321 로 업로드 스크립트 실행
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+RESERVED_PARAMS = {"select", "order", "limit", "offset", "on_conflict", "columns"}
+
+
+# ── 필터 파싱 ──────────────────────────────────────────────────
+def _split_in_list(s: str) -> list[str]:
+    """in.(a,"b,c",d) 의 괄호 안쪽 → 값 리스트 (따옴표 값 지원)"""
+    out, buf, quoted = [], "", False
+    for ch in s:
+        if ch == '"':
+            quoted = not quoted
+        elif ch == "," and not quoted:
+            out.append(buf)
+            buf = ""
+        else:
+            buf += ch
+    if buf or out:
+        out.append(buf)
+    return out
+
+
+def _coerce(stored, criteria: str):
+    """저장 값 타입에 맞춰 필터 기준값 변환 (숫자 컬럼은 숫자 비교)"""
+    if isinstance(stored, bool):
+        return criteria.lower() == "true"
+    if isinstance(stored, (int, float)):
+        try:
+            return float(criteria)
+        except ValueError:
+            return criteria
+    return criteria
+
+
+def _like(pattern: str, flags=0):
+    rx = "^" + ".*".join(re.escape(p) for p in pattern.replace("%", "*").split("*")) + "$"
+    return re.compile(rx, flags)
+
+
+def parse_filter(column: str, expr: str):
+    """'not.is.null' / 'eq.x' / 'in.(a,b)' → row → bool 함수"""
+    negate = False
+    if expr.startswith("not."):
+        negate, expr = True, expr[4:]
+    op, _, criteria = expr.partition(".")
+
+    def test(row: dict) -> bool:
+        v = row.get(column)
+        if op == "is":
+            c = criteria.lower()
+            ok = v is None if c == "null" else v is (c == "true")
+        elif op == "in":
+            vals = _split_in_list(criteria[1:-1])
+            ok = v is not None and any(v == _coerce(v, x) for x in vals)
+        elif op in ("like", "ilike"):
+            ok = v is not None and bool(
+                _like(criteria, re.I if op == "ilike" else 0).match(str(v)))
+        elif v is None:
+            ok = False
+        else:
+            c = _coerce(v, criteria)
+            try:
+                ok = {
+                    "eq": v == c, "neq": v != c,
+                    "gt": v > c, "gte": v >= c, "lt": v < c, "lte": v <= c,
+                }[op]
+            except (KeyError, TypeError):
+                ok = False
+        return ok != negate
+
+    return test
+
+
+# ── 메모리 저장소 ──────────────────────────────────────────────
+class Table:
+    def __init__(self):
+        self.rows: dict[int, dict] = {}
+        self.next_id = 1
+        self.indexes: dict[tuple, dict] = {}  # on_conflict 컬럼 → {키: id}
+
+    def _index(self, cols: tuple) -> dict:
+        idx = self.indexes.get(cols)
+        if idx is None:
+            idx = {tuple(r.get(c) for c in cols): rid for rid, r in self.rows.items()}
+            self.indexes[cols] = idx
+        return idx
+
+    def _insert(self, row: dict) -> dict:
+        rid = row.get("id") or self.next_id
+        self.next_id = max(self.next_id, int(rid) + 1)
+        row = {**row, "id": rid}
+        self.rows[rid] = row
+        for cols, idx in self.indexes.items():
+            idx[tuple(row.get(c) for c in cols)] = rid
+        return row
+
+    def _remove(self, rid: int):
+        row = self.rows.pop(rid)
+        for cols, idx in self.indexes.items():
+            key = tuple(row.get(c) for c in cols)
+            if idx.get(key) == rid:
+                del idx[key]
+
+    def write(self, rows: list[dict], columns: list[str] | None,
+              conflict: tuple | None, merge: bool) -> list[dict]:
+        out = []
+        for r in rows:
+            if columns:  # PostgREST: columns 파라미터에 없는 키는 NULL
+                r = {c: r.get(c) for c in columns}
+            if conflict is None:
+                out.append(self._insert(r))
+                continue
+            key = tuple(r.get(c) for c in conflict)
+            rid = self._index(conflict).get(key)
+            if rid is None:
+                out.append(self._insert(r))
+            elif merge:
+                self.rows[rid].update(r)
+                out.append(self.rows[rid])
+            else:  # ignore-duplicates
+                continue
+        return out
+
+    def select(self, filters: list) -> list[dict]:
+        return [r for r in self.rows.values() if all(f(r) for f in filters)]
+
+    def update(self, filters: list, patch: dict) -> list[dict]:
+        hit = self.select(filters)
+        for r in hit:
+            for cols, idx in self.indexes.items():
+                idx.pop(tuple(r.get(c) for c in cols), None)
+            r.update(patch)
+            for cols, idx in self.indexes.items():
+                idx[tuple(r.get(c) for c in cols)] = r["id"]
+        return hit
+
+    def delete(self, filters: list) -> list[dict]:
+        hit = self.select(filters)
+        for r in hit:
+            self._remove(r["id"])
+        return hit
+
+
+class StubState:
+    """저장소 + 부하 재현 설정 + 통계 (핸들러 스레드 간 공유)"""
+
+    def __init__(self, latency_ms: float = 0, jitter_ms: float = 0,
+                 error_rate: float = 0, rate_limit: float = 0,
+                 schemas: dict | None = None, seed: int | None = None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.schemas = {k: set(v) for k, v in (schemas or {}).items()}
+        self.tables: dict[str, Table] = {}
+        self.lock = threading.Lock()
+        self.rng = random.Random(seed)
+        self._tokens = rate_limit
+        self._last_refill = time.monotonic()
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.stats = {
+            "requests": 0, "bytes_in": 0, "bytes_out": 0, "rows_written": 0,
+            "rows_read": 0, "rows_deleted": 0, "errors_injected": 0,
+            "rate_limited": 0, "by_method": {},
+        }
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            s = json.loads(json.dumps(self.stats))
+            s["table_rows"] = {name: len(t.rows) for name, t in self.tables.items()}
+        return s
+
+    def table(self, name: str) -> Table:
+        t = self.tables.get(name)
+        if t is None:
+            t = self.tables[name] = Table()
+        return t
+
+    def take_token(self) -> bool:
+        """토큰 버킷 (rate_limit 요청/초, 버스트 = rate_limit)"""
+        if self.rate_limit <= 0:
+            return True
+        now = time.monotonic()
+        self._tokens = min(self.rate_limit,
+                           self._tokens + (now - self._last_refill) * self.rate_limit)
+        self._last_refill = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+
+# ── HTTP 핸들러 ────────────────────────────────────────────────
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    state: StubState  # make_server()에서 주입
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status: int, body=None, headers: dict | None = None):
+        raw = b"" if body is None else json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(raw)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(raw)
+        with self.state.lock:
+            self.state.stats["bytes_out"] += len(raw)
+
+    def _error(self, status: int, code: str, message: str):
+        self._send(status, {"code": code, "message": message, "details": None, "hint": None})
+
+    def _handle(self):
+        st = self.state
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        url = urlsplit(self.path)
+
+        with st.lock:
+            st.stats["requests"] += 1
+            st.stats["bytes_in"] += length + len(self.path)
+            by = st.stats["by_method"]
+            by[self.command] = by.get(self.command, 0) + 1
+
+        if url.path == "/__stats":
+            return self._send(200, st.snapshot())
+        if url.path == "/__reset":
+            with st.lock:
+                st.tables.clear()
+                st.reset_stats()
+            return self._send(200, {"ok": True})
+
+        delay = st.latency_ms + (st.rng.random() * st.jitter_ms if st.jitter_ms else 0)
+        if delay:
+            time.sleep(delay / 1000.0)
+
+        with st.lock:
+            allowed = st.take_token()
+            if not allowed:
+                st.stats["rate_limited"] += 1
+            inject = allowed and st.error_rate > 0 and st.rng.random() < st.error_rate
+            if inject:
+                st.stats["errors_injected"] += 1
+        if not allowed:
+            return self._error(429, "PGRST429", "rate limit exceeded")
+        if inject:
+            return self._error(503, "PGRST000", "injected error")
+
+        parts = url.path.rstrip("/").split("/")
+        if parts[:3] != ["", "rest", "v1"]:
+            return self._error(404, "PGRST404", f"unknown path {url.path}")
+        if len(parts) == 3:
+            return self._openapi()
+
+        table = parts[3]
+        params = parse_qsl(url.query, keep_blank_values=True)
+        filters = [parse_filter(k, v) for k, v in params if k not in RESERVED_PARAMS]
+        opts = {k: v for k, v in params if k in RESERVED_PARAMS}
+        prefer = self.headers.get("Prefer", "")
+        want_rows = "return=representation" in prefer
+
+        try:
+            payload = json.loads(body) if body else None
+        except ValueError:
+            return self._error(400, "PGRST102", "invalid JSON body")
+
+        with st.lock:
+            t = st.table(table)
+            if self.command in ("GET", "HEAD"):
+                rows = self._ordered(t.select(filters), opts.get("order"))
+                total = len(rows)
+                off = int(opts.get("offset") or 0)
+                lim = opts.get("limit")
+                page = rows[off : off + int(lim) if lim is not None else None]
+                st.stats["rows_read"] += len(page)
+                data = [self._project(r, opts.get("select")) for r in page]
+                status = 200
+            elif self.command == "POST":
+                rows = payload if isinstance(payload, list) else [payload]
+                columns = [c.strip('"') for c in opts["columns"].split(",")] if opts.get("columns") else None
+                conflict = None
+                if "resolution=" in prefer:
+                    conflict = tuple(opts.get("on_conflict", "id").split(","))
+                merge = "resolution=merge-duplicates" in prefer
+                data = t.write(rows, columns, conflict, merge)
+                st.stats["rows_written"] += len(rows)
+                total, status = len(data), 201
+            elif self.command == "PATCH":
+                data = t.update(filters, payload or {})
+                st.stats["rows_written"] += len(data)
+                total, status = len(data), 200
+            elif self.command == "DELETE":
+                data = t.delete(filters)
+                st.stats["rows_deleted"] += len(data)
+                total, status = len(data), 200
+            else:
+                return self._error(405, "PGRST405", self.command)
+            data = [dict(r) for r in data]
+
+        headers = {}
+        if "count=" in prefer or self.command in ("GET", "HEAD"):
+            n = len(data)
+            start = int(opts.get("offset") or 0)
+            rng = f"{start}-{start + n - 1}" if n else "*"
+            headers["Content-Range"] = f"{rng}/{total}" if "count=" in prefer else f"{rng}/*"
+        if self.command in ("GET", "HEAD") or want_rows:
+            return self._send(status, data, headers)
+        return self._send(204 if status != 201 else 201, None, headers)
+
+    @staticmethod
+    def _ordered(rows: list[dict], order: str | None) -> list[dict]:
+        for term in reversed((order or "").split(",") if order else []):
+            col, _, rest = term.partition(".")
+            desc = rest.startswith("desc")
+            present = [r for r in rows if r.get(col) is not None]
+            nulls = [r for r in rows if r.get(col) is None]
+            present.sort(key=lambda r: r[col], reverse=desc)
+            rows = present + nulls
+        return rows
+
+    @staticmethod
+    def _project(row: dict, select: str | None) -> dict:
+        if not select or select == "*":
+            return row
+        cols = [c.strip('"') for c in select.split(",")]
+        return {c: row.get(c) for c in cols}
+
+    def _openapi(self):
+        st = self.state
+        with st.lock:
+            defs = {}
+            for name in set(st.schemas) | set(st.tables):
+                cols = set(st.schemas.get(name, ()))
+                for r in st.tables.get(name, Table()).rows.values():
+                    cols |= r.keys()
+                defs[name] = {"properties": {c: {"type": "string"} for c in sorted(cols | {"id"})}}
+        self._send(200, {"swagger": "2.0", "definitions": defs})
+
+    do_GET = do_HEAD = do_POST = do_PATCH = do_DELETE = _handle
+
+
+def make_server(state: StubState, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+    """state를 공유하는 서버 생성 (port=0 → 빈 포트 자동 할당)"""
+    handler = type("BoundHandler", (Handler,), {"state": state})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def start_in_thread(state: StubState, host: str = "127.0.0.1", port: int = 0):
+    """백그라운드 스레드로 서버 시작 → (server, base_url) 반환"""
+    server = make_server(state, host, port)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    h, p = server.server_address[:2]
+    return server, f"http://{h}:{p}"
+
+
+def main():
+    ap = argparse.ArgumentParser(description="로컬 PostgREST 대역 서버")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=54321)
+    ap.add_argument("--latency-ms", type=float, default=0)
+    ap.add_argument("--jitter-ms", type=float, default=0)
+    ap.add_argument("--error-rate", type=float, default=0)
+    ap.add_argument("--rate-limit", type=float, default=0, help="초당 요청 수 (0 = 무제한)")
+    ap.add_argument("--seed", type=int, default=None)
+    args = ap.parse_args()
+
+    state = StubState(args.latency_ms, args.jitter_ms, args.error_rate,
+                      args.rate_limit, seed=args.seed)
+    server = make_server(state, args.host, args.port)
+    print(f"🧪 PostgREST stand-in: http://{args.host}:{args.port}  (Ctrl+C 종료)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(json.dumps(state.snapshot(), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,345 @@
+"""
+벤치마크용 합성 데이터 생성기
+==============================
+실제 공공데이터와 같은 컬럼 구성·값 형태(쉼표 숫자, '-', 'Tr', 빈 칸 등)를
+가진 CSV를 고정 시드로 생성한다. 업로드/변환 벤치마크가 공통으로 사용.
+
+  write_processed_food_csv   → upload_data.py 입력 (9개 컬럼)
+  write_mfds_csv             → upload_nutrition.upload_food / upload_supplement 입력
+  write_dur_csvs             → upload_dur_rules.py 입력 (카테고리별 파일)
+  write_disease_stats_csv    → upload_disease_stats.py 입력
+  write_checkup_csv          → upload_health_engine.build_health_benchmarks 입력
+  write_cancer_incidence_csv / write_cancer_survival_csv
+  rda_rows / rda_raw_frame   → process_rda_xlsx.py 시트 (헤더 없이 읽은 형태)
+  write_rda_xlsx             → process_rda_xlsx.py 입력 엑셀
+  write_raw_food_xlsx        → process_large_xlsx_to_csv.py / process_new_data.py 입력 엑셀
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+FOOD_WORDS = ["김치", "된장", "불고기", "비빔", "국수", "볶음밥", "찌개", "떡", "만두", "샐러드",
+              "짬뽕", "라면", "우유", "요구르트", "두부", "계란", "닭", "소고기", "돼지", "고등어"]
+CLASS_NAMES = ["곡류 및 그 제품", "육류 및 그 제품", "채소류", "과일류", "우유 및 유제품",
+               "어패류", "음료류", "조미료류", "면류", "빵 및 과자류"]
+SOURCES = ["식품의약품안전처", "농촌진흥청", "한국식품연구원", "업체제출"]
+
+
+def _names(rng, n: int, prefix: str = "") -> np.ndarray:
+    a = rng.choice(FOOD_WORDS, n)
+    b = rng.choice(FOOD_WORDS, n)
+    return np.char.add(np.char.add(np.char.add(prefix, a), b), rng.integers(0, 999, n).astype(str))
+
+
+def _messy_numbers(rng, n: int, scale: float, decimals: int = 2) -> np.ndarray:
+    """숫자 + 쉼표 천단위 + '-' / 'Tr' / 빈 칸이 섞인 문자열 컬럼"""
+    v = np.round(rng.gamma(2.0, scale / 2.0, n), decimals)
+    s = v.astype(str).astype(object)
+    big = v >= 1000
+    s[big] = [f"{x:,.{decimals}f}" for x in v[big]]
+    r = rng.random(n)
+    s[r < 0.03] = "-"
+    s[(r >= 0.03) & (r < 0.05)] = "Tr"
+    s[(r >= 0.05) & (r < 0.10)] = None
+    return s
+
+
+def write_processed_food_csv(path: Path, n: int, seed: int = 0) -> Path:
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({"food_name": _names(rng, n)})
+    for col, scale in (("calories", 300), ("protein", 15), ("fat", 12),
+                       ("carbs", 40), ("sugar", 8), ("sodium", 600)):
+        df[col] = np.round(rng.gamma(2.0, scale / 2.0, n), 1)
+    df["clinical_insight"] = "균형 잡힌 영양 성분입니다."
+    df["synthetic_qa"] = [json.dumps({"question": f"{x}의 칼로리와 영양은?", "answer": "-"},
+                                     ensure_ascii=False) for x in df["food_name"]]
+    df.to_csv(path, index=False, encoding="utf-8-sig")
+    return path
+
+
+def _mfds_frame(rng, n: int, kr_cols: list[str], float_kr: set[str]) -> pd.DataFrame:
+    data = {}
+    for kr in kr_cols:
+        if kr in float_kr:
+            data[kr] = _messy_numbers(rng, n, 50.0)
+        elif kr == "식품코드":
+            data[kr] = np.char.add("D", np.arange(n).astype(str))
+        elif kr == "식품명":
+            data[kr] = _names(rng, n)
+        elif kr.endswith("코드"):
+            data[kr] = rng.integers(1, 30, n).astype(str)
+        elif kr.endswith("분류명") or kr in ("대표식품명", "유형명", "섭취대상"):
+            data[kr] = rng.choice(CLASS_NAMES, n)
+        elif kr in ("출처명", "데이터생성방법명", "데이터구분명", "식품기원명"):
+            data[kr] = rng.choice(SOURCES, n)
+        elif kr.endswith("일자"):
+            data[kr] = rng.choice(["2023-12-31", "2024-06-30", "2025-12-29"], n)
+        else:
+            data[kr] = rng.choice(["100g", "1회 30g", "200ml", "", "1포(5g)"], n)
+    return pd.DataFrame(data)
+
+
+def write_mfds_csv(path: Path, n: int, col_map: dict, float_cols: set, seed: int = 0,
+                   extra_cols: int = 0) -> Path:
+    """식약처 영양성분 CSV (upload_nutrition의 FOOD_/SUPP_COL_MAP 한글 컬럼 그대로).
+    extra_cols: 매핑되지 않은 영양소 컬럼 수 (실제 원본처럼 업로드하지 않는 열 추가)"""
+    rng = np.random.default_rng(seed)
+    float_kr = {kr for kr, en in col_map.items() if en in float_cols}
+    df = _mfds_frame(rng, n, list(col_map), float_kr)
+    for i in range(extra_cols):
+        df[f"미사용성분{i + 1}(mg)"] = _messy_numbers(rng, n, 20.0)
+    df.to_csv(path, index=False, encoding="utf-8")
+    return path
+
+
+# 카테고리 파일명 → 카테고리 고유 컬럼
+DUR_FILES = {
+    "임부금기":     ["preg_contraindication_grade", "preg_contraindication_detail"],
+    "노인주의":     ["caution_detail"],
+    "노인금기":     ["prohibited_detail"],
+    "연령금기":     ["age_limit_value", "age_limit_unit", "age_limit_condition", "age_contraindication_detail"],
+    "어린이주의":   ["age_limit_value", "age_limit_unit", "age_limit_condition", "child_caution_detail"],
+    "용량주의":     ["max_daily_dose_desc", "max_daily_dose_mg"],
+    "지속기간주의": ["max_dosage_days"],
+    "효능군중복":   ["therapeutic_group", "group_classification"],
+}
+DUR_COMMON = ["item_seq", "item_name", "main_ingr_name", "main_ingr_name_raw", "ingr_code",
+              "company_name", "reimbursement", "notice_no", "notice_date"]
+INGREDIENTS = ["이부프로펜", "아세트아미노펜", "아스피린", "와파린", "메트포르민", "아목시실린",
+               "로라제팜", "디아제팜", "졸피뎀", "심바스타틴", "암로디핀", "오메프라졸"]
+GROUPS = ["해열진통소염제", "소화성궤양용제", "최면진정제", "정신신경용제", "혈압강하제", "동맥경화용제"]
+
+
+def _dur_column(rng, col: str, n: int) -> np.ndarray:
+    if col == "age_limit_value":
+        return rng.choice(["1", "2", "6", "12", "15", "18", "65"], n)
+    if col == "age_limit_unit":
+        return rng.choice(["세", "세", "세", "개월", "주"], n)
+    if col == "age_limit_condition":
+        return rng.choice(["미만", "이하", "이상"], n)
+    if col == "preg_contraindication_grade":
+        return rng.choice(["1", "2"], n)
+    if col == "max_daily_dose_mg":
+        return rng.integers(10, 4000, n).astype(str)
+    if col == "max_dosage_days":
+        return rng.integers(3, 120, n).astype(str)
+    if col == "therapeutic_group":
+        return rng.choice(GROUPS, n)
+    if col == "group_classification":
+        return np.char.add("G", rng.integers(1, 40, n).astype(str))
+    # *_detail / *_desc: 일부는 빈 칸
+    s = np.char.add("상세 사유 ", rng.integers(0, 500, n).astype(str)).astype(object)
+    s[rng.random(n) < 0.1] = ""
+    return s
+
+
+def write_dur_csvs(folder: Path, n_per_file: int, seed: int = 0) -> list[Path]:
+    rng = np.random.default_rng(seed)
+    folder.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for stem, extra in DUR_FILES.items():
+        seqs = rng.choice(np.arange(200000000, 200000000 + n_per_file * 3), n_per_file, replace=False)
+        ingr = rng.choice(INGREDIENTS, n_per_file)
+        df = pd.DataFrame({
+            "item_seq": seqs.astype(str),
+            "item_name": _names(rng, n_per_file, "정"),
+            "main_ingr_name": ingr,
+            "main_ingr_name_raw": np.char.add(ingr.astype(str), " 500mg"),
+            "ingr_code": np.char.add("D", rng.integers(100000, 999999, n_per_file).astype(str)),
+            "company_name": rng.choice(["한미약품", "종근당", "대웅제약", "유한양행"], n_per_file),
+            "reimbursement": rng.choice(["급여", "비급여", ""], n_per_file),
+            "notice_no": np.char.add("2024-", rng.integers(1, 300, n_per_file).astype(str)),
+            "notice_date": rng.choice(["20240101", "20240701", "20250101"], n_per_file),
+        })
+        for col in extra:
+            df[col] = _dur_column(rng, col, n_per_file)
+        p = folder / f"{stem}.csv"
+        df.to_csv(p, index=False, encoding="utf-8")
+        paths.append(p)
+    return paths
+
+
+def write_disease_stats_csv(path: Path, n: int, seed: int = 0) -> Path:
+    rng = np.random.default_rng(seed)
+    letters = np.array(list("ABCDEFGHIJKLMNOPQRSTUVWXYZ"))
+    codes = np.char.add(rng.choice(letters, n), np.char.zfill(rng.integers(0, 99, n).astype(str), 2))
+    mt = rng.choice(["양방", "한방"], n)
+    vt = rng.choice(["입원", "외래"], n)
+    df = pd.DataFrame({"medical_type": mt, "visit_type": vt, "kcd_code": codes})
+    df = df.drop_duplicates(["kcd_code", "medical_type", "visit_type"]).reset_index(drop=True)
+    m = len(df)
+    df["disease_name"] = np.char.add("질병 ", df["kcd_code"].to_numpy().astype(str))
+    for col in ("patient_count", "visit_days", "claim_count", "total_cost", "insurer_paid"):
+        df[col] = [f"{x:,}" for x in rng.integers(10, 5_000_000, m)]
+    df["self_paid_estimated"] = rng.integers(0, 1_000_000, m).astype(str)
+    kw = ["두통", "어지러움", "피로감", "기침", "발열", "복통", "소화불량", "요통", "관절통", "불면"]
+    df["symptom_keywords"] = [", ".join(rng.choice(kw, 3, replace=False)) for _ in range(m)]
+    df.to_csv(path, index=False, encoding="utf-8")
+    return path
+
+
+AGE_LABELS = {
+    5: "20~24세", 6: "25~29세", 7: "30~34세", 8: "35~39세", 9: "40~44세", 10: "45~49세",
+    11: "50~54세", 12: "55~59세", 13: "60~64세", 14: "65~69세", 15: "70~74세",
+    16: "75~79세", 17: "80~84세", 18: "85세이상",
+}
+CHECKUP_METRICS = {
+    "height_cm": (165, 9), "weight_kg": (65, 12), "waist_cm": (82, 9),
+    "systolic_bp": (122, 14), "diastolic_bp": (76, 10), "fasting_glucose": (100, 22),
+    "total_cholesterol": (195, 38), "hdl_cholesterol": (56, 14), "ldl_cholesterol": (115, 34),
+    "triglyceride": (4.8, 0.55), "hemoglobin": (14, 1.5), "ast": (3.2, 0.35),
+    "alt": (3.0, 0.5), "gamma_gtp": (3.3, 0.7),
+}
+LOGNORMAL_METRICS = {"triglyceride", "ast", "alt", "gamma_gtp"}
+
+
+def write_checkup_csv(path: Path, n: int, seed: int = 0) -> Path:
+    rng = np.random.default_rng(seed)
+    codes = rng.integers(5, 19, n)
+    df = pd.DataFrame({
+        "gender": rng.choice(["남성", "여성"], n),
+        "age_group": codes,
+        "age_group_label": [AGE_LABELS[c] for c in codes],
+    })
+    for col, (mu, sd) in CHECKUP_METRICS.items():
+        v = rng.normal(mu, sd, n)
+        if col in LOGNORMAL_METRICS:
+            v = np.exp(v)
+        v = np.round(v, 1).astype(object)
+        v[rng.random(n) < 0.02] = None  # 결측
+        df[col] = v
+    df.to_csv(path, index=False, encoding="utf-8")
+    return path
+
+
+CANCERS = [("01. C00-C14", "입술, 구강 및 인두"), ("02. C15", "식도"), ("03. C16", "위"),
+           ("04. C18-C20", "대장"), ("05. C22", "간"), ("06. C33-C34", "폐"),
+           ("07. C50", "유방"), ("08. C73", "갑상선"), ("09. C61", "전립선"),
+           ("10. C81-C96", "혈액암"), ("99. C00-C96", "모든 암")]
+GENDERS = ["남녀전체", "남자", "여자"]
+AGE_STRS = ["00-04세", "05-09세", "10-14세", "15-19세", "20-24세", "25-29세", "30-34세",
+            "35-39세", "40-44세", "45-49세", "50-54세", "55-59세", "60-64세", "65-69세",
+            "70-74세", "75-79세", "80-84세", "85세이상", "연령미상"]
+
+
+def write_cancer_incidence_csv(path: Path, years: int = 25, seed: int = 0) -> Path:
+    rng = np.random.default_rng(seed)
+    rows = []
+    for kcd, name in CANCERS:
+        for g in GENDERS:
+            for a in AGE_STRS:
+                for y in [str(1999 + i) for i in range(years)] + ["1999-2023"]:
+                    rows.append((kcd, name, g, a, y))
+    df = pd.DataFrame(rows, columns=["국제질병분류", "암종", "성별", "연령군", "발생연도"])
+    df["발생자수"] = rng.integers(0, 5000, len(df))
+    df["조발생률"] = np.round(rng.gamma(2.0, 20.0, len(df)), 1)
+    df.loc[rng.random(len(df)) < 0.02, "조발생률"] = np.nan
+    df.to_csv(path, index=False, encoding="utf-8")
+    return path
+
+
+def write_cancer_survival_csv(path: Path, seed: int = 0) -> Path:
+    rng = np.random.default_rng(seed)
+    periods = ["1993-1995", "1996-2000", "2001-2005", "2006-2010", "2011-2015", "2014-2018", "2019-2023"]
+    rows = [(kcd, name, g, p) for kcd, name in CANCERS for g in GENDERS for p in periods]
+    df = pd.DataFrame(rows, columns=["국제질병분류", "암종", "성별", "발생기간"])
+    df["환자수"] = rng.integers(100, 100000, len(df))
+    df["5년상대생존율"] = np.round(rng.uniform(10, 100, len(df)), 1)
+    df.to_csv(path, index=False, encoding="utf-8")
+    return path
+
+
+# ── 국가표준식품성분 DB 시트 (process_rda_xlsx.py) ───────────────
+RDA_NCOLS = 132          # A ~ EB
+RDA_HEADER_ROWS = 4      # DATA_START_ROW
+RDA_TOKENS = ["-", "Tr", "tr", "(0)", "N.D.", "0.0", "0", "미량", ".", "—", "(12.3)",
+              "1,234.5", " 3.2 ", "< 0.1", "12.3a", "-0", "0.00", "nan", ""]
+
+
+def rda_rows(n: int, seed: int = 0) -> list[list]:
+    """헤더 4행 + 데이터 n행. 셀은 int/float/str/None 이 섞인 파이썬 값."""
+    rng = np.random.default_rng(seed)
+    rows = [[f"헤더{r}-{c}" if (r + c) % 3 else None for c in range(RDA_NCOLS)]
+            for r in range(RDA_HEADER_ROWS)]
+    names = _names(rng, n)
+    kind = rng.random((n, RDA_NCOLS))
+    nums = np.round(rng.gamma(1.5, 20.0, (n, RDA_NCOLS)), 2)
+    toks = rng.integers(0, len(RDA_TOKENS), (n, RDA_NCOLS))
+    for i in range(n):
+        row = []
+        for c in range(RDA_NCOLS):
+            k = kind[i, c]
+            if c == 3:
+                row.append(str(names[i]))
+            elif k < 0.35:
+                row.append(float(nums[i, c]))
+            elif k < 0.45:
+                row.append(int(nums[i, c]))
+            elif k < 0.72:
+                row.append(str(nums[i, c]))       # 텍스트로 저장된 숫자
+            elif k < 0.85:
+                row.append(RDA_TOKENS[toks[i, c]])
+            else:
+                row.append(None if k < 0.92 else np.nan)
+        rows.append(row)
+    # 일부 열은 데이터 전체가 결측/토큰 (→ 정수 0 컬럼)
+    for r in rows[RDA_HEADER_ROWS:]:
+        r[131] = "-"
+        r[130] = None
+    return rows
+
+
+def rda_raw_frame(n: int, seed: int = 0) -> pd.DataFrame:
+    """pd.read_excel(header=None) 결과와 같은 모양의 object 프레임"""
+    return pd.DataFrame(rda_rows(n, seed), dtype=object)
+
+
+def write_rda_xlsx(path: Path, n: int, sheet_name: str, seed: int = 0) -> Path:
+    """rda_rows를 엑셀 시트로 저장 (openpyxl write_only 스트리밍)"""
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(sheet_name)
+    for row in rda_rows(n, seed):
+        ws.append([None if isinstance(v, float) and v != v else v for v in row])
+    wb.save(path)
+    return path
+
+
+# ── 가공식품 DB 엑셀 (process_large_xlsx_to_csv.py / process_new_data.py) ──
+RAW_FOOD_HEADER = ["식품코드", "식품명", "제조사명", "1회제공량", "에너지(kcal)", "단백질(g)",
+                   "지방(g)", "탄수화물(g)", "당류(g)", "나트륨(mg)", "데이터기준일자"]
+
+
+def write_raw_food_xlsx(path: Path, n: int, seed: int = 0) -> Path:
+    """raw_food_db.xlsx 모양 (헤더 1행 + n행). 숫자 셀·빈 셀·'-' 문자열 혼합"""
+    from openpyxl import Workbook
+
+    rng = np.random.default_rng(seed)
+    names = _names(rng, n)
+    makers = rng.choice(SOURCES + CLASS_NAMES, n)
+    weight = rng.choice([30, 50, 100, 150, 200, 250, 330], n)
+    nums = {
+        "에너지(kcal)": np.round(rng.gamma(2.0, 150.0, n), 1),
+        "단백질(g)":    np.round(rng.gamma(1.5, 8.0, n), 2),
+        "지방(g)":      np.round(rng.gamma(1.5, 6.0, n), 2),
+        "탄수화물(g)":  np.round(rng.gamma(2.0, 20.0, n), 2),
+        "당류(g)":      np.round(rng.gamma(1.0, 8.0, n), 2),
+        "나트륨(mg)":   np.round(rng.gamma(1.5, 350.0, n), 0),
+    }
+    holes = rng.random((n, len(nums)))
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Sheet1")
+    ws.append(RAW_FOOD_HEADER)
+    for i in range(n):
+        vals = []
+        for j, col in enumerate(nums):
+            h = holes[i, j]
+            vals.append(None if h < 0.03 else "-" if h < 0.05 else float(nums[col][i]))
+        ws.append([f"P{i:07d}", str(names[i]), str(makers[i]), int(weight[i]), *vals, "2024-12-31"])
+    wb.save(path)
+    return path
@@ -0,0 +1,166 @@
+"""
+benchmark_lookup.py
+────────────────────────────────────────────────────────────────────
+health_benchmarks (+ health_benchmark_quantiles) 를 한 번 읽어 NumPy 배열로 두고
+검진 수치 여러 건을 한 번의 벡터 연산으로 채점하는 라이브러리
+
+  BenchmarkLookup.from_supabase : 두 테이블을 1회 조회해 배열 구성
+  BenchmarkLookup(레코드 목록)   : 레코드로 직접 구성 (checkup_aggregate 결과 그대로 사용 가능)
+  score_arrays                  : (성별, 연령대 코드, 지표 행렬) → z-score · 백분위 · 플래그 배열
+  score_frame                   : DataFrame 입력/출력 래퍼 (<지표>_z / _pct / _flag 컬럼)
+
+배열 구조 (g = 성별 2, a = 연령대 코드 0~18, m = 지표 15):
+  avg, std   : [g, a, m]
+  knots      : [g, a, m, len(PCT_GRID)] — 백분위 격자 위치의 값. 분위수 스케치가 있으면
+               스케치에서, 없으면 평균·표준편차 정규분포에서 계산
+백분위는 knots 에서 선형 보간하므로 중성지방처럼 치우친 분포도 스케치 그대로 반영된다.
+벤치마크가 없는 (성별, 연령대)·결측 수치는 NaN, 플래그 0.
+
+사용처: health_scores 야간 일괄 채점
+────────────────────────────────────────────────────────────────────
+"""
+
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+from quantile_sketch import TDigest
+
+# health_benchmarks 필드 기본명 (<metric>_avg / <metric>_std)
+METRICS = [
+    "height", "weight", "waist",
+    "systolic_bp", "diastolic_bp", "fasting_glucose",
+    "total_cholesterol", "hdl_cholesterol", "ldl_cholesterol",
+    "triglyceride", "hemoglobin", "ast", "alt", "gamma_gtp", "bmi",
+]
+GENDERS = {"남성": 0, "여성": 1}
+N_AGE_CODES = 19  # 1~18 (AGE_MAP), 0은 비워 둠
+
+# 백분위 격자 (0.1, 1, 2, …, 99, 99.9)
+PCT_GRID = np.concatenate([[0.1], np.arange(1, 100), [99.9]]).astype(np.float64)
+
+# 백분위 기준 플래그
+FLAG_LOW, FLAG_NORMAL, FLAG_HIGH = -1, 0, 1
+LOW_PCT, HIGH_PCT = 5.0, 95.0
+
+
+def age_to_code(age) -> np.ndarray:
+    """만 나이 → age_group_code (5세 단위, 0~4세 = 1 … 85세 이상 = 18)"""
+    return np.clip(np.asarray(age) // 5 + 1, 1, 18).astype(np.int64)
+
+
+class BenchmarkLookup:
+    def __init__(self, bench_records: list[dict], quantile_records: list[dict] | None = None):
+        shape = (len(GENDERS), N_AGE_CODES, len(METRICS))
+        self.avg = np.full(shape, np.nan)
+        self.std = np.full(shape, np.nan)
+        self.knots = np.full(shape + (len(PCT_GRID),), np.nan)
+        m_pos = {m: i for i, m in enumerate(METRICS)}
+
+        for rec in bench_records:
+            g = GENDERS.get(rec["gender"])
+            if g is None:
+                continue
+            a = int(rec["age_group_code"])
+            for m, i in m_pos.items():
+                self.avg[g, a, i] = _num(rec.get(f"{m}_avg"))
+                self.std[g, a, i] = _num(rec.get(f"{m}_std"))
+
+        # 정규분포 격자 (스케치가 없는 칸의 기본값)
+        z = np.array([NormalDist().inv_cdf(p / 100) for p in PCT_GRID])
+        self.knots[:] = self.avg[..., None] + self.std[..., None] * z
+
+        self.sketched = 0
+        for rec in quantile_records or []:
+            g, i = GENDERS.get(rec["gender"]), m_pos.get(rec["metric"])
+            sketch = rec.get("sketch")
+            if g is None or i is None or not sketch or not sketch.get("means"):
+                continue
+            digest = TDigest.from_dict(sketch)
+            self.knots[g, int(rec["age_group_code"]), i] = digest.quantile(PCT_GRID / 100)
+            self.sketched += 1
+
+    # ── 구성 ─────────────────────────────────────────────────
+    @classmethod
+    def from_supabase(cls, sb, data_year: int | None = None) -> "BenchmarkLookup":
+        """health_benchmarks / health_benchmark_quantiles 를 각각 1회 조회.
+        data_year 생략 시 health_benchmarks 의 최신 연도"""
+        if data_year is None:
+            rows = (sb.table("health_benchmarks").select("data_year")
+                    .order("data_year", desc=True).limit(1).execute().data or [])
+            data_year = rows[0]["data_year"] if rows else None
+
+        def fetch(table: str) -> list[dict]:
+            q = sb.table(table).select("*")
+            if data_year is not None:
+                q = q.eq("data_year", data_year)
+            return q.execute().data or []
+
+        try:
+            quantiles = fetch("health_benchmark_quantiles")
+        except Exception as e:
+            print(f"  ⚠️  health_benchmark_quantiles 조회 실패 — 정규분포 백분위 사용: {e}")
+            quantiles = []
+        return cls(fetch("health_benchmarks"), quantiles)
+
+    # ── 채점 ─────────────────────────────────────────────────
+    def score_arrays(self, gender_idx: np.ndarray, age_code: np.ndarray, values: np.ndarray
+                     ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """gender_idx·age_code: (n,) 정수 (성별 -1 = 알 수 없음), values: (n, len(METRICS))
+        → (z-score, 백분위 0.1~99.9, 플래그 int8) 각 (n, len(METRICS))"""
+        gender_idx = np.asarray(gender_idx, dtype=np.int64)
+        age_code = np.asarray(age_code, dtype=np.int64)
+        x = np.asarray(values, dtype=np.float64)
+        valid = (gender_idx >= 0) & (gender_idx < len(GENDERS)) & (age_code >= 0) & (age_code < N_AGE_CODES)
+        g = np.where(valid, gender_idx, 0)
+        a = np.where(valid, age_code, 0)
+
+        avg = self.avg[g, a]                       # (n, m)
+        std = self.std[g, a]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            z = np.where(std > 0, (x - avg) / std, np.nan)
+
+        k = self.knots[g, a]                       # (n, m, grid)
+        pos = (k <= x[..., None]).sum(axis=-1)     # x 이하 격자 수
+        hi = np.clip(pos, 1, len(PCT_GRID) - 1)
+        k_lo = np.take_along_axis(k, (hi - 1)[..., None], -1)[..., 0]
+        k_hi = np.take_along_axis(k, hi[..., None], -1)[..., 0]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            t = np.clip(np.where(k_hi > k_lo, (x - k_lo) / (k_hi - k_lo), 0.5), 0, 1)
+        pct = PCT_GRID[hi - 1] + t * (PCT_GRID[hi] - PCT_GRID[hi - 1])
+        pct = np.where(np.isnan(x) | np.isnan(k_lo), np.nan, pct)
+
+        z[~valid] = np.nan
+        pct[~valid] = np.nan
+        flag = np.full(x.shape, FLAG_NORMAL, dtype=np.int8)
+        flag[pct < LOW_PCT] = FLAG_LOW
+        flag[pct > HIGH_PCT] = FLAG_HIGH
+        return z, pct, flag
+
+    def score_frame(self, df: pd.DataFrame, metrics: list[str] | None = None) -> pd.DataFrame:
+        """gender(남성/여성) · age_group_code(또는 age) · 지표 컬럼 DataFrame
+        → <지표>_z / <지표>_pct / <지표>_flag 컬럼 DataFrame (입력과 같은 index)"""
+        metrics = [m for m in (metrics or METRICS) if m in df.columns]
+        values = np.full((len(df), len(METRICS)), np.nan)
+        for m in metrics:
+            values[:, METRICS.index(m)] = pd.to_numeric(df[m], errors="coerce").to_numpy(np.float64)
+        gender = df["gender"].map(GENDERS).fillna(-1).to_numpy(np.int64)
+        if "age_group_code" in df.columns:
+            age = df["age_group_code"].fillna(-1).to_numpy(np.int64)
+        else:
+            age = pd.to_numeric(df["age"], errors="coerce").to_numpy(np.float64)
+            age = np.where(np.isnan(age), -1, age_to_code(np.nan_to_num(age)))
+        z, pct, flag = self.score_arrays(gender, age, values)
+
+        out = {}
+        for m in metrics:
+            i = METRICS.index(m)
+            out[f"{m}_z"] = np.round(z[:, i], 3)
+            out[f"{m}_pct"] = np.round(pct[:, i], 1)
+            out[f"{m}_flag"] = flag[:, i]
+        return pd.DataFrame(out, index=df.index)
+
+
+def _num(v) -> float:
+    return np.nan if v is None else float(v)
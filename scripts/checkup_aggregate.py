@@ -0,0 +1,400 @@
+"""
+checkup_aggregate.py
+────────────────────────────────────────────────────────────────────
+건강검진 CSV → 성별·연령대별 평균/표준편차 (청크 단위 1회 읽기)
+
+  GroupMoments      : 그룹별 (표본 수, 평균, M2) 누적기. 청크 결과를 Chan 공식으로 병합
+  GroupSketches     : 그룹·지표별 t-digest 분위수 스케치 (같은 청크 읽기에서 함께 누적)
+  split_ranges      : 파일을 줄 경계에 맞춘 바이트 구간으로 분할
+  aggregate_checkup : 구간마다 프로세스 하나가 CHUNK_ROWS 행씩 읽어 누적 → 메인에서 병합
+  aggregate_years   : 연도별 파일을 한 프로세스 풀에서 동시에 집계 (연도별 결과 유지).
+                      결과는 파일 해시 기준으로 캐시 → 바뀌지 않은 연도는 다시 읽지 않음
+  benchmark_records : 누적 결과 → health_benchmarks 레코드 (기존 groupby mean/std 와 같은 컬럼)
+  quantile_records  : 스케치 → health_benchmark_quantiles 레코드 (p5~p95 + 직렬화 스케치)
+
+전체 파일을 DataFrame으로 올리지 않으므로 메모리는 (청크 크기 × 프로세스 수)로 고정되고,
+여러 해 파일을 이어서 넣어도 늘지 않는다.
+표준편차는 기존 pandas .std() 와 같은 표본 표준편차(ddof=1).
+
+사용처: upload_health_engine.build_health_benchmarks / build_benchmark_quantiles
+────────────────────────────────────────────────────────────────────
+"""
+
+import hashlib
+import io
+import json
+import math
+import multiprocessing as mp
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from quantile_sketch import TDigest
+
+NUMERIC_COLS = [
+    "height_cm", "weight_kg", "waist_cm",
+    "systolic_bp", "diastolic_bp", "fasting_glucose",
+    "total_cholesterol", "hdl_cholesterol", "ldl_cholesterol",
+    "triglyceride", "hemoglobin", "ast", "alt", "gamma_gtp",
+]
+ALL_METRICS = NUMERIC_COLS + ["bmi"]
+GROUP_COLS = ["gender", "age_group", "age_group_label"]
+
+# CSV 컬럼명 → DB 필드 기본명 변환 (height_cm → height, weight_kg → weight)
+DB_FIELD = {"height_cm": "height", "weight_kg": "weight", "waist_cm": "waist"}
+
+# health_benchmark_quantiles 에 저장하는 고정 백분위
+PERCENTILES = [5, 10, 25, 50, 75, 90, 95]
+
+CHUNK_ROWS = 200_000
+DEFAULT_WORKERS = max(1, min(4, os.cpu_count() or 1))
+
+# 캐시 형식 버전 — 집계 방식이 바뀌면 올려서 기존 캐시 무효화
+CACHE_VERSION = 1
+
+
+# ── 누적기 ────────────────────────────────────────────────────
+class GroupMoments:
+    """그룹 key → 지표별 [표본 수, 평균, M2] (shape 3 × len(metrics), float64)"""
+
+    def __init__(self, metrics: list[str] = ALL_METRICS):
+        self.metrics = list(metrics)
+        self.groups: dict[tuple, np.ndarray] = {}
+
+    def update(self, df: pd.DataFrame):
+        """청크 하나를 그룹별로 집계해 병합 (청크 안은 2-pass 로 계산 → 수치 안정)"""
+        g = df.groupby(GROUP_COLS, sort=False)[self.metrics]
+        n = g.count()
+        mean = g.mean()
+        m2 = g.var(ddof=0) * n
+        for key, cnt in n.iterrows():
+            part = np.vstack([cnt.to_numpy(np.float64),
+                              mean.loc[key].to_numpy(np.float64),
+                              m2.loc[key].to_numpy(np.float64)])
+            self._merge_one((key[0], int(key[1]), key[2]), part)
+
+    def _merge_one(self, key: tuple, b: np.ndarray):
+        b = np.nan_to_num(b)  # 표본 0개인 지표: 평균·M2 NaN → 0
+        a = self.groups.get(key)
+        if a is None:
+            self.groups[key] = b.copy()
+            return
+        na, nb = a[0], b[0]
+        n = na + nb
+        delta = b[1] - a[1]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            w = np.where(n > 0, nb / n, 0.0)
+        a[1] += delta * w
+        a[2] += b[2] + delta * delta * na * w
+        a[0] = n
+
+    def merge(self, other: "GroupMoments"):
+        for key, b in other.groups.items():
+            self._merge_one(key, b)
+
+    def to_dict(self) -> dict:
+        return {"metrics": self.metrics,
+                "groups": [[*key, arr.tolist()] for key, arr in self.groups.items()]}
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "GroupMoments":
+        acc = cls(d["metrics"])
+        for gender, age_code, age_label, arr in d["groups"]:
+            acc.groups[(gender, int(age_code), age_label)] = np.asarray(arr, dtype=np.float64)
+        return acc
+
+    def stats(self, key: tuple) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """→ (표본 수, 평균, 표본 표준편차). 표본 0개면 평균 NaN, 2개 미만이면 표준편차 NaN"""
+        n, mean, m2 = self.groups[key]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            avg = np.where(n > 0, mean, np.nan)
+            std = np.where(n > 1, np.sqrt(np.maximum(m2, 0) / (n - 1)), np.nan)
+        return n, avg, std
+
+
+class GroupSketches:
+    """그룹 key → 지표별 TDigest 목록"""
+
+    def __init__(self, metrics: list[str] = ALL_METRICS):
+        self.metrics = list(metrics)
+        self.groups: dict[tuple, list[TDigest]] = {}
+
+    def _get(self, key: tuple) -> list[TDigest]:
+        if key not in self.groups:
+            self.groups[key] = [TDigest() for _ in self.metrics]
+        return self.groups[key]
+
+    def update(self, df: pd.DataFrame):
+        values = df[self.metrics].to_numpy(np.float64)
+        for key, idx in df.groupby(GROUP_COLS, sort=False).indices.items():
+            block = values[idx]
+            for j, digest in enumerate(self._get((key[0], int(key[1]), key[2]))):
+                digest.update(block[:, j])
+
+    def merge(self, other: "GroupSketches"):
+        for key, digests in other.groups.items():
+            for mine, theirs in zip(self._get(key), digests):
+                mine.merge(theirs)
+
+    def to_dict(self) -> dict:
+        return {"metrics": self.metrics,
+                "groups": [[*key, [d.to_dict(digits=None) for d in digests]]
+                           for key, digests in self.groups.items()]}
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "GroupSketches":
+        sk = cls(d["metrics"])
+        for gender, age_code, age_label, digests in d["groups"]:
+            sk.groups[(gender, int(age_code), age_label)] = [TDigest.from_dict(x) for x in digests]
+        return sk
+
+
+# ── 바이트 구간 분할 · 읽기 ───────────────────────────────────
+class _RangeReader(io.RawIOBase):
+    """파일의 [start, end) 바이트만 읽는 파일 객체 (pandas read_csv 입력용)"""
+
+    def __init__(self, path: Path, start: int, end: int):
+        self.f = open(path, "rb")
+        self.f.seek(start)
+        self.left = end - start
+
+    def readable(self):
+        return True
+
+    def readinto(self, buf):
+        n = self.f.readinto(memoryview(buf)[: min(len(buf), self.left)])
+        self.left -= n
+        return n
+
+    def close(self):
+        self.f.close()
+        super().close()
+
+
+def _header(path: Path) -> tuple[list[str], int]:
+    """→ (컬럼명 목록, 데이터 시작 바이트 위치)"""
+    with open(path, "rb") as f:
+        line = f.readline()
+    return line.decode("utf-8-sig").rstrip("\r\n").split(","), len(line)
+
+
+def split_ranges(path: Path, parts: int) -> tuple[list[str], list[tuple[int, int]]]:
+    """데이터 부분을 줄 경계에 맞춘 parts 개 이하 구간으로 분할.
+    검진 CSV는 값 안에 줄바꿈이 없으므로 개행 위치로 자를 수 있다."""
+    header, data_start = _header(path)
+    size = path.stat().st_size
+    cuts = [data_start]
+    with open(path, "rb") as f:
+        for i in range(1, parts):
+            pos = data_start + (size - data_start) * i // parts
+            if pos <= cuts[-1]:
+                continue
+            f.seek(pos - 1)
+            f.readline()  # pos-1 이 개행이면 pos 에서, 아니면 다음 줄 시작에서 자름
+            if cuts[-1] < f.tell() < size:
+                cuts.append(f.tell())
+    cuts.append(size)
+    return header, list(zip(cuts[:-1], cuts[1:]))
+
+
+def read_chunks(path: Path, header: list[str], start: int, end: int, chunk_rows: int = CHUNK_ROWS):
+    """[start, end) 구간을 chunk_rows 행씩 DataFrame으로 yield (BMI 컬럼 포함)"""
+    reader = pd.read_csv(
+        io.BufferedReader(_RangeReader(path, start, end)),
+        header=None, names=header,
+        usecols=GROUP_COLS + NUMERIC_COLS,
+        dtype={c: "float32" for c in NUMERIC_COLS},
+        chunksize=chunk_rows,
+    )
+    with reader:
+        for df in reader:
+            h = df["height_cm"] / 100.0
+            df["bmi"] = (df["weight_kg"] / (h ** 2)).replace([np.inf, -np.inf], np.nan)
+            yield df
+
+
+def aggregate_range(path: str, header: list[str], start: int, end: int,
+                    chunk_rows: int = CHUNK_ROWS, quantiles: bool = False
+                    ) -> tuple[GroupMoments, GroupSketches | None]:
+    acc = GroupMoments()
+    sketches = GroupSketches() if quantiles else None
+    for df in read_chunks(Path(path), header, start, end, chunk_rows):
+        acc.update(df)
+        if sketches is not None:
+            sketches.update(df)
+    return acc, sketches
+
+
+def _run_jobs(jobs: list[tuple], workers: int):
+    """aggregate_range 작업 목록 실행 → 결과를 작업 순서대로 yield"""
+    if workers <= 1 or len(jobs) <= 1:
+        for job in jobs:
+            yield aggregate_range(*job)
+        return
+    ctx = mp.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs)), mp_context=ctx) as pool:
+        yield from pool.map(aggregate_range, *zip(*jobs))
+
+
+def _fold(total: GroupMoments, sketches: GroupSketches | None, part: tuple):
+    total.merge(part[0])
+    if sketches is not None:
+        sketches.merge(part[1])
+
+
+def aggregate_checkup(paths: list[Path] | Path, workers: int = DEFAULT_WORKERS,
+                      chunk_rows: int = CHUNK_ROWS, quantiles: bool = False
+                      ) -> tuple[GroupMoments, GroupSketches | None]:
+    """CSV 1개 이상을 청크 단위로 한 번 읽어 그룹별 누적 결과 반환 → (모멘트, 스케치 또는 None).
+    workers > 1 이면 파일마다 구간을 나눠 프로세스 풀에서 집계 후 병합.
+    quantiles=True 면 같은 읽기에서 분위수 스케치도 만든다."""
+    if isinstance(paths, (str, Path)):
+        paths = [paths]
+    jobs = []
+    for p in map(Path, paths):
+        header, ranges = split_ranges(p, max(1, workers))
+        jobs += [(str(p), header, s, e, chunk_rows, quantiles) for s, e in ranges]
+
+    total = GroupMoments()
+    sketches = GroupSketches() if quantiles else None
+    for part in _run_jobs(jobs, workers):
+        _fold(total, sketches, part)
+    return total, sketches
+
+
+# ── 연도별 집계 · 캐시 ────────────────────────────────────────
+def file_digest(path: Path) -> str:
+    """파일 내용 해시 (blake2b 128bit, delta_sync.row_hash 와 같은 계열 · 1MB 청크)"""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        while chunk := f.read(1 << 20):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _cache_file(cache_dir: Path, year: int, digest: str) -> Path:
+    return cache_dir / f"checkup_{year}_{digest}.json"
+
+
+def load_cached(cache_dir: Path, year: int, digest: str, quantiles: bool
+                ) -> tuple[GroupMoments, GroupSketches | None] | None:
+    """캐시 적중 시 (모멘트, 스케치) — 버전이 다르거나 스케치가 필요한데 없으면 None"""
+    path = _cache_file(cache_dir, year, digest)
+    try:
+        d = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if d.get("version") != CACHE_VERSION or (quantiles and d.get("sketches") is None):
+        return None
+    sketches = GroupSketches.from_dict(d["sketches"]) if quantiles else None
+    return GroupMoments.from_dict(d["moments"]), sketches
+
+
+def save_cached(cache_dir: Path, year: int, digest: str,
+                moments: GroupMoments, sketches: GroupSketches | None):
+    """연도 캐시 기록 (같은 연도의 이전 해시 캐시는 삭제)"""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    for old in cache_dir.glob(f"checkup_{year}_*.json"):
+        old.unlink(missing_ok=True)
+    path = _cache_file(cache_dir, year, digest)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps({
+        "version": CACHE_VERSION,
+        "year": year,
+        "moments": moments.to_dict(),
+        "sketches": sketches.to_dict() if sketches is not None else None,
+    }), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def aggregate_years(files: dict[int, Path], workers: int = DEFAULT_WORKERS,
+                    chunk_rows: int = CHUNK_ROWS, quantiles: bool = False,
+                    cache_dir: Path | None = None
+                    ) -> dict[int, tuple[GroupMoments, GroupSketches | None]]:
+    """{연도: CSV} → {연도: (모멘트, 스케치 또는 None)}
+
+    캐시에 없는 연도만 읽는다. 남은 파일들의 구간을 한 프로세스 풀에 함께 넣어
+    연도 수가 적으면 파일을 더 잘게 나누고, 많으면 파일 단위로 동시에 처리한다.
+    """
+    results = {}
+    digests = {}
+    pending = []
+    for year, path in sorted(files.items()):
+        if cache_dir is not None:
+            digests[year] = file_digest(path)
+            hit = load_cached(cache_dir, year, digests[year], quantiles)
+            if hit is not None:
+                print(f"  ♻️  {year}년: 캐시 사용 ({Path(path).name})")
+                results[year] = hit
+                continue
+        pending.append((year, Path(path)))
+
+    jobs, job_years = [], []
+    parts = max(1, workers // max(1, len(pending)))
+    for year, path in pending:
+        header, ranges = split_ranges(path, parts)
+        jobs += [(str(path), header, s, e, chunk_rows, quantiles) for s, e in ranges]
+        job_years += [year] * len(ranges)
+        results[year] = (GroupMoments(), GroupSketches() if quantiles else None)
+
+    for year, part in zip(job_years, _run_jobs(jobs, workers)):
+        _fold(*results[year], part)
+
+    for year, path in pending:
+        print(f"  📊 {year}년: 집계 완료 ({path.name})")
+        if cache_dir is not None:
+            save_cached(cache_dir, year, digests[year], *results[year])
+    return dict(sorted(results.items()))
+
+
+# ── 레코드 변환 ───────────────────────────────────────────────
+def _round2(v: float):
+    return None if math.isnan(v) else round(float(v), 2)
+
+
+def benchmark_records(acc: GroupMoments, data_year: int = 2024) -> list[dict]:
+    """누적 결과 → health_benchmarks 레코드 (성별·연령대 정렬)"""
+    h_pos = acc.metrics.index("height_cm")
+    records = []
+    for key in sorted(acc.groups):
+        gender, age_code, age_label = key
+        n, avg, std = acc.stats(key)
+        rec = {
+            "gender": gender,
+            "age_group_code": int(age_code),
+            "age_group_label": age_label,
+            "sample_count": int(n[h_pos]),
+            "data_year": data_year,
+        }
+        for i, m in enumerate(acc.metrics):
+            db_field = DB_FIELD.get(m, m)
+            rec[f"{db_field}_avg"] = _round2(avg[i])
+            rec[f"{db_field}_std"] = _round2(std[i])
+        records.append(rec)
+    return records
+
+
+def quantile_records(sketches: GroupSketches, data_year: int = 2024) -> list[dict]:
+    """스케치 → health_benchmark_quantiles 레코드 (그룹 × 지표 1행)"""
+    qs = np.array(PERCENTILES) / 100
+    records = []
+    for key in sorted(sketches.groups):
+        gender, age_code, age_label = key
+        for m, digest in zip(sketches.metrics, sketches.groups[key]):
+            rec = {
+                "gender": gender,
+                "age_group_code": int(age_code),
+                "age_group_label": age_label,
+                "metric": DB_FIELD.get(m, m),
+                "sample_count": digest.n,
+                "data_year": data_year,
+            }
+            values = digest.quantile(qs) if len(digest) else [math.nan] * len(qs)
+            for p, v in zip(PERCENTILES, values):
+                rec[f"p{p}"] = _round2(v)
+            rec["sketch"] = digest.to_dict()
+            records.append(rec)
+    return records
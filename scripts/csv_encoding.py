@@ -0,0 +1,97 @@
+"""
+csv_encoding.py
+────────────────────────────────────────────────────────────────────
+공공데이터 CSV 인코딩 판별 · 스트리밍 변환 (cp949 → UTF-8)
+
+  sniff_encoding   : 파일 앞부분(SNIFF_BYTES)만 읽어 utf-8-sig / utf-8 / cp949 판별
+  transcode_file   : 바이트 스트림을 CHUNK_BYTES 단위로 디코드 → UTF-8(BOM) 로 기록.
+                     DataFrame을 거치지 않으므로 따옴표·숫자 표기·줄바꿈이 원본 그대로
+  transcode_files  : 여러 파일을 프로세스 풀로 동시에 변환
+
+앞부분이 ASCII뿐이면 utf-8로 판별되지만 뒤쪽에 한글(cp949)이 나올 수 있으므로,
+transcode_file은 디코드 오류가 나면 다음 후보 인코딩으로 처음부터 다시 변환한다.
+
+사용처: convert_sejong_csv_encoding.py, dur_records.read_csv_safe (upload_dur_rules)
+────────────────────────────────────────────────────────────────────
+"""
+
+import codecs
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+SNIFF_BYTES = 64 * 1024
+CHUNK_BYTES = 1 << 20
+CANDIDATES = ("utf-8", "cp949")
+
+
+def sniff_encoding(path: Path, sample_bytes: int = SNIFF_BYTES) -> str | None:
+    """앞부분 바이트로 인코딩 추정 → 'utf-8-sig' / 'utf-8' / 'cp949' / None(판별 불가)"""
+    with open(path, "rb") as f:
+        head = f.read(sample_bytes)
+    if head.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    for enc in CANDIDATES:
+        try:
+            # final=False: 샘플 끝에서 잘린 멀티바이트 문자는 오류로 보지 않음
+            codecs.getincrementaldecoder(enc)().decode(head, final=False)
+            return enc
+        except UnicodeDecodeError:
+            continue
+    return None
+
+
+def encoding_candidates(path: Path) -> list[str]:
+    """판별된 인코딩을 맨 앞에 둔 시도 순서"""
+    sniffed = sniff_encoding(path)
+    if sniffed == "utf-8-sig":
+        return ["utf-8-sig"]
+    return ([sniffed] if sniffed else []) + [e for e in CANDIDATES if e != sniffed]
+
+
+def _transcode(src: Path, dst: Path, encoding: str) -> int:
+    decoder = codecs.getincrementaldecoder(encoding)()
+    encoder = codecs.getincrementalencoder("utf-8")()
+    written = 0
+    with open(src, "rb") as fin, open(dst, "wb") as fout:
+        fout.write(codecs.BOM_UTF8)
+        while chunk := fin.read(CHUNK_BYTES):
+            written += fout.write(encoder.encode(decoder.decode(chunk)))
+        written += fout.write(encoder.encode(decoder.decode(b"", final=True), final=True))
+    return written
+
+
+def transcode_file(src: Path, dst: Path, encoding: str | None = None) -> tuple[str, int]:
+    """src → dst (UTF-8, BOM 포함) 스트리밍 변환 → (원본 인코딩, 기록 바이트 수)
+
+    encoding 생략 시 sniff_encoding 결과부터 시도. 모든 후보가 실패하면 UnicodeDecodeError.
+    """
+    src, dst = Path(src), Path(dst)
+    tries = [encoding] if encoding else encoding_candidates(src)
+    for i, enc in enumerate(tries):
+        try:
+            return enc, _transcode(src, dst, enc)
+        except UnicodeDecodeError:
+            dst.unlink(missing_ok=True)
+            if i == len(tries) - 1:
+                raise
+
+
+def _transcode_job(src: str, dst: str, encoding: str | None):
+    try:
+        enc, n = transcode_file(Path(src), Path(dst), encoding)
+        return src, dst, enc, n, None
+    except (OSError, UnicodeDecodeError) as e:
+        return src, dst, None, 0, str(e)
+
+
+def transcode_files(pairs: list[tuple[Path, Path]], encoding: str | None = None,
+                    workers: int | None = None) -> list[tuple]:
+    """(src, dst) 목록을 프로세스 풀로 변환 → [(src, dst, 인코딩, 바이트, 오류 메시지)] (입력 순서)"""
+    if workers is None:
+        workers = min(len(pairs), os.cpu_count() or 1, 4)
+    jobs = [(str(s), str(d), encoding) for s, d in pairs]
+    if workers <= 1 or len(jobs) <= 1:
+        return [_transcode_job(*j) for j in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_transcode_job, *zip(*jobs)))
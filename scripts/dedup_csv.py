@@ -1,66 +1,152 @@
 """
-CSV 파일 ITEM_SEQ 기준 중복 제거 스크립트 (Pandas)
+CSV 파일 ITEM_SEQ 기준 중복 제거 스크립트 (스트리밍)
 =====================================================
 - ITEM_SEQ가 동일한 행 중 마지막(last) 데이터만 유지
 - 중복 제거 전/후 행 수 차이 출력
 - 원본은 .bak 으로 백업 후 덮어쓰기
 
+처리 방식 (파일 크기와 관계없이 메모리 일정):
+  1차 읽기: 행을 스트리밍하며 item_seq → 마지막 행 번호만 기록
+            (MAX_KEYS_IN_MEMORY 초과분은 임시 SQLite 파일로 내림)
+  2차 읽기: 중복이 있을 때만, 각 item_seq의 마지막 행을 원래 순서대로 기록
+  행 수는 1차 읽기에서 바로 집계 (전/후 개수 확인용 재읽기 없음)
+출력은 기존과 같이 UTF-8 · 모든 값 따옴표(QUOTE_ALL) · LF 줄끝.
+
 사용법:
   단일 파일:   python3 dedup_csv.py 파일.csv
   여러 파일:   python3 dedup_csv.py 파일1.csv 파일2.csv
   폴더 전체:   python3 dedup_csv.py --all
 """
 
+import csv
+import os
+import sqlite3
 import sys
-import glob
-import shutil
+import tempfile
 from pathlib import Path
 
-import pandas as pd
-
-
 DEDUP_COL = "item_seq"
-
-
-def dedup_file(path: Path) -> None:
+# item_seq → 마지막 행 번호 dict 최대 크기. 넘으면 SQLite로 내려 씀
+MAX_KEYS_IN_MEMORY = 2_000_000
+
+csv.field_size_limit(sys.maxsize)
+
+
+class LastRowIndex:
+    """key → 마지막 행 번호. 메모리 상한을 넘으면 임시 SQLite 파일로 spill"""
+
+    def __init__(self, max_keys: int = MAX_KEYS_IN_MEMORY):
+        self.max_keys = max_keys
+        self.mem: dict[str, int] = {}
+        self.db = None
+        self._tmp = None
+
+    def set(self, key: str, row: int):
+        self.mem[key] = row
+        if len(self.mem) >= self.max_keys:
+            self._spill()
+
+    def _spill(self):
+        if self.db is None:
+            fd, self._tmp = tempfile.mkstemp(prefix="dedup_", suffix=".sqlite")
+            os.close(fd)
+            self.db = sqlite3.connect(self._tmp)
+            self.db.execute("PRAGMA journal_mode=OFF")
+            self.db.execute("PRAGMA synchronous=OFF")
+            self.db.execute("CREATE TABLE idx (k TEXT PRIMARY KEY, last INTEGER) WITHOUT ROWID")
+        # dict 값이 SQLite 값보다 항상 뒤의 행 → REPLACE 로 마지막 행 유지
+        self.db.executemany("INSERT OR REPLACE INTO idx VALUES (?, ?)", self.mem.items())
+        self.db.commit()
+        self.mem.clear()
+
+    def spilled(self) -> bool:
+        return self.db is not None
+
+    def keep_mask(self, n_rows: int) -> tuple[int, bytearray]:
+        """→ (고유 key 수, 행 번호별 유지 여부 비트맵)"""
+        if self.db is not None:
+            self._spill()
+            rows = (r for (r,) in self.db.execute("SELECT last FROM idx"))
+            unique = self.db.execute("SELECT COUNT(*) FROM idx").fetchone()[0]
+        else:
+            rows, unique = self.mem.values(), len(self.mem)
+        mask = bytearray((n_rows >> 3) + 1)
+        for r in rows:
+            mask[r >> 3] |= 1 << (r & 7)
+        return unique, mask
+
+    def close(self):
+        if self.db is not None:
+            self.db.close()
+            os.unlink(self._tmp)
+            self.db = None
+
+
+def _records(path: Path):
+    """헤더 → 데이터 행 순서로 yield. 빈 줄은 건너뜀 (pandas read_csv 와 동일)"""
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        for row in csv.reader(f):
+            if row:
+                yield row
+
+
+def dedup_file(path: Path, max_keys: int = MAX_KEYS_IN_MEMORY) -> tuple[int, int] | None:
+    """중복 제거 후 (제거 전 행 수, 제거 후 행 수) 반환. 읽기 실패면 None"""
     print(f"\n{'─'*60}")
     print(f"파일: {path.name}")
 
-    # ── 읽기 ─────────────────────────────────────────────────
+    # ── 1차 읽기: item_seq → 마지막 행 번호 ──────────────────
+    index = LastRowIndex(max_keys)
     try:
-        df = pd.read_csv(path, dtype=str, keep_default_na=False)
-    except Exception as e:
+        rows = _records(path)
+        header = next(rows, None)
+        if header is None or DEDUP_COL not in header:
+            n = sum(1 for _ in rows)
+            print(f"  ⚠️  '{DEDUP_COL}' 컬럼 없음 — 건너뜀")
+            return n, n
+        key_pos = header.index(DEDUP_COL)
+        before = 0
+        for before, row in enumerate(rows, 1):
+            index.set(row[key_pos] if key_pos < len(row) else "", before - 1)
+        after, keep = index.keep_mask(before)
+        spilled = index.spilled()
+    except (OSError, UnicodeDecodeError, csv.Error) as e:
         print(f"  ❌ 읽기 실패: {e}")
-        return
-
-    if DEDUP_COL not in df.columns:
-        print(f"  ⚠️  '{DEDUP_COL}' 컬럼 없음 — 건너뜀")
-        return
-
-    before = len(df)
+        return None
+    finally:
+        index.close()
 
-    # ── 중복 제거: ITEM_SEQ 동일 → 마지막 행 유지 ────────────
-    df_dedup = df.drop_duplicates(subset=DEDUP_COL, keep="last").reset_index(drop=True)
-
-    after  = len(df_dedup)
     removed = before - after
 
     print(f"  중복 제거 전: {before:,}건")
     print(f"  중복 제거 후: {after:,}건")
     print(f"  제거된 행수: {removed:,}건  ({removed/before*100:.1f}%)" if before else "  데이터 없음")
+    if spilled:
+        print(f"  💾 키 {after:,}개 → 임시 SQLite 인덱스 사용 (메모리 상한 {max_keys:,}개)")
 
     if removed == 0:
         print("  ✅ 중복 없음 — 파일 변경 없음")
-        return
-
-    # ── 원본 백업 (.bak) ──────────────────────────────────────
+        return before, after
+
+    # ── 2차 읽기: 마지막 행만 임시 파일에 기록 (UTF-8, 따옴표 전체 감싸기) ──
+    tmp = path.with_name(path.name + ".dedup.tmp")
+    width = len(header)
+    rows = _records(path)
+    next(rows)
+    with open(tmp, "w", encoding="utf-8", newline="") as out:
+        w = csv.writer(out, quoting=csv.QUOTE_ALL, lineterminator="\n")
+        w.writerow(header)
+        for i, row in enumerate(rows):
+            if keep[i >> 3] >> (i & 7) & 1:
+                w.writerow(row + [""] * (width - len(row)) if len(row) < width else row)
+
+    # ── 원본 백업 (.bak) 후 교체 ──────────────────────────────
     bak = path.with_suffix(".csv.bak")
-    shutil.copy2(path, bak)
+    os.replace(path, bak)
+    os.replace(tmp, path)
     print(f"  📦 원본 백업: {bak.name}")
-
-    # ── 저장 (UTF-8, 따옴표 전체 감싸기) ──────────────────────
-    df_dedup.to_csv(path, index=False, encoding="utf-8", quoting=1)  # QUOTE_ALL
     print(f"  ✅ 저장 완료: {path.name}")
+    return before, after
 
 
 def main():
@@ -95,23 +181,10 @@ def main():
             print(f"\n❌ 파일 없음: {p}")
             continue
 
-        # 개수 집계용 임시 읽기
-        try:
-            df_tmp = pd.read_csv(p, dtype=str, keep_default_na=False)
-            b = len(df_tmp)
-        except Exception:
-            b = 0
-
-        dedup_file(p)
-
-        try:
-            df_after = pd.read_csv(p, dtype=str, keep_default_na=False)
-            a = len(df_after)
-        except Exception:
-            a = b
-
-        total_before += b
-        total_after  += a
+        counts = dedup_file(p)
+        if counts:
+            total_before += counts[0]
+            total_after  += counts[1]
 
     if len(targets) > 1:
         print(f"\n{'='*60}")
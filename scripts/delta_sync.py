@@ -0,0 +1,101 @@
+"""
+자연키 기준 해시 델타 동기화 유틸
+==================================
+- 레코드마다 안정적인 row_hash 계산 (키 정렬 JSON → blake2b 128bit)
+- 테이블의 기존 key → row_hash 맵을 keyset 페이지 단위로 일괄 조회
+- 신규·변경 레코드만 골라 업로드, 소스에서 사라진 키는 선택적으로 삭제
+
+사용처:
+  scripts/upload_nutrition.py  --delta [--prune]   (food_code 기준)
+  scripts/upload_dur_rules.py  --delta [--prune]   (dur_type별 item_seq 기준)
+
+사전 준비:
+  Supabase Dashboard → SQL Editor → supabase/row_hash_columns.sql 실행
+"""
+
+import hashlib
+import json
+
+HASH_COL   = "row_hash"
+PAGE_SIZE  = 1000   # PostgREST max-rows 기본값
+DELETE_BATCH = 200  # in.(...) 필터 URL 길이 제한 고려
+
+
+def row_hash(rec: dict) -> str:
+    """레코드 내용 → 안정 해시 (키 순서·row_hash 자신과 무관)"""
+    payload = {k: v for k, v in rec.items() if k != HASH_COL}
+    s = json.dumps(payload, sort_keys=True, ensure_ascii=False,
+                   separators=(",", ":"), default=str)
+    return hashlib.blake2b(s.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def has_hash_column(client, table: str) -> bool:
+    """테이블에 row_hash 컬럼이 있는지 확인 (42703/PGRST204 → False)"""
+    try:
+        client.table(table).select(HASH_COL).limit(1).execute()
+        return True
+    except Exception:
+        return False
+
+
+def fetch_hash_map(client, table: str, key_col: str,
+                   filters: dict | None = None) -> dict:
+    """key_col → row_hash 맵 일괄 조회.
+
+    OFFSET 대신 key_col 기준 keyset 페이지네이션을 사용해
+    테이블이 커져도 페이지당 비용이 일정하다. key_col이 NULL인 행
+    (다른 소스에서 적재된 행)은 대상에서 제외한다.
+    """
+    cols = f"{key_col},{HASH_COL}"
+    out: dict = {}
+    last = None
+    while True:
+        q = client.table(table).select(cols).not_.is_(key_col, "null")
+        for col, val in (filters or {}).items():
+            q = q.eq(col, val)
+        if last is not None:
+            q = q.gt(key_col, last)
+        rows = q.order(key_col).limit(PAGE_SIZE).execute().data or []
+        for r in rows:
+            out[r[key_col]] = r.get(HASH_COL)
+        if len(rows) < PAGE_SIZE:
+            break
+        last = rows[-1][key_col]
+    return out
+
+
+def plan_delta(records: list[dict], key_col: str,
+               existing: dict) -> tuple[list[dict], list, int]:
+    """(업로드 대상, 삭제 대상 키, 변경 없음 건수) 반환.
+
+    업로드 대상 레코드에는 row_hash가 채워진다. 같은 키가 여러 번
+    나오면 마지막 레코드를 사용한다 (dedup_csv.py와 동일한 keep=last).
+    """
+    latest: dict = {}
+    for rec in records:
+        latest[rec[key_col]] = rec
+
+    changed, unchanged = [], 0
+    for key, rec in latest.items():
+        h = row_hash(rec)
+        if existing.get(key) == h:
+            unchanged += 1
+        else:
+            changed.append({**rec, HASH_COL: h})
+
+    removed = [k for k in existing if k not in latest]
+    return changed, removed, unchanged
+
+
+def delete_keys(client, table: str, key_col: str, keys: list,
+                filters: dict | None = None) -> int:
+    """key_col IN (...) 배치 삭제 → 삭제 요청 건수 반환"""
+    done = 0
+    for i in range(0, len(keys), DELETE_BATCH):
+        chunk = keys[i : i + DELETE_BATCH]
+        q = client.table(table).delete().in_(key_col, chunk)
+        for col, val in (filters or {}).items():
+            q = q.eq(col, val)
+        q.execute()
+        done += len(chunk)
+    return done
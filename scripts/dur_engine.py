@@ -0,0 +1,274 @@
+"""
+dur_engine.py
+────────────────────────────────────────────────────────────────────
+메모리 DUR 규칙 색인 + 처방 목록 일괄 점검 (Supabase 왕복 없음)
+
+dur_rules 를 약물마다 카테고리별로 조회하면 약 1개당 여러 번 왕복한다. DUR CSV 폴더
+또는 dur_rules 테이블 export 로 색인을 한 번 만들어 두고
+"나이 A, 임신 여부 P 인 환자의 약 N개" 를 호출 1번으로 점검한다.
+
+  DurIndex.from_csv_dir   : DUR 카테고리 CSV 폴더 (dur_records 와 같은 변환)
+  DurIndex.from_export    : dur_rules 테이블 export (CSV / JSON)
+  DurIndex.from_supabase  : dur_rules 전체 조회 (id keyset 페이지)
+  DurIndex.from_snapshot  : dur_snapshot SQLite 스냅샷
+
+  색인 : item_seq → 규칙, ingr_code → 규칙, therapeutic_group → 품목 집합
+  check: 임부금기(임신) · 연령금기/어린이주의(나이 조건, age_intervals 개월 구간) · 노인금기/노인주의(65세 이상) ·
+         용량주의/지속기간주의(한도 안내) + 효능군중복 (효능군 해시 버킷, 약 수에 선형)
+  audit: 처방 프레임(rx_id, item_seq, age, pregnant) → 경고 프레임 (처방 단위 일괄 점검)
+  age_restricted_items: 나이(개월) 배열 → 나이마다 연령 조건에 걸리는 품목 (구간 찌르기 조회)
+
+/api/dni/check 와 처방 일괄 감사의 오프라인 기준 구현.
+
+실행 (처방 CSV 일괄 감사):
+  python3 scripts/dur_engine.py --rx prescriptions.csv --out dur_alerts.csv
+  python3 scripts/dur_engine.py --rx prescriptions.csv --export dur_rules_export.csv
+  python3 scripts/dur_engine.py --rx prescriptions.csv --snapshot scripts/dur_rules.sqlite
+────────────────────────────────────────────────────────────────────
+"""
+
+import argparse
+import json
+import re
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+import pandas as pd
+
+from age_intervals import AgeIntervalIndex, parse_age_limits
+from dur_records import AGE_CSV_COLS, RECORD_COLS, load_rules_dir
+from dur_snapshot import DurSnapshot
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+PAGE_SIZE   = 1000
+
+SEVERITY_CONTRA  = "금기"
+SEVERITY_CAUTION = "주의"
+ELDERLY_AGE      = 65          # 노인금기·노인주의 적용 나이 (세)
+
+PREGNANCY   = "임부금기"
+AGE         = "연령금기"
+CHILD       = "어린이주의"
+ELDERLY     = ("노인금기", "노인주의")
+DOSE        = "용량주의"
+DURATION    = "지속기간주의"
+DUPLICATION = "효능군중복"
+
+ALERT_FIELDS = ("preg_grade", "age_limit_value", "age_limit_unit", "age_limit_condition",
+                "max_daily_dose_mg", "max_dosage_days")
+
+
+def base_type(dur_type: str) -> str:
+    """dur_type → 카테고리 ('연령금기_DUR' → '연령금기', '임부금기2' → '임부금기')"""
+    t = re.sub(r"_DUR$", "", str(dur_type or ""))
+    return re.sub(r"(?<=[가-힣])2$", "", t)
+
+
+class DurIndex:
+    """dur_rules 레코드 → 품목·성분·효능군 색인"""
+
+    def __init__(self, records: list[dict]):
+        self.rules: list[dict] = []
+        self.kinds: list[str] = []
+        self.by_item: dict[str, list[int]] = defaultdict(list)
+        self.by_ingr: dict[str, list[int]] = defaultdict(list)
+        self.group_members: dict[str, set[str]] = defaultdict(set)
+        for rec in records:
+            seq = str(rec.get("item_seq") or "").strip()
+            if not seq:
+                continue
+            rid = len(self.rules)
+            kind = base_type(rec.get("dur_type"))
+            self.rules.append(rec)
+            self.kinds.append(kind)
+            self.by_item[seq].append(rid)
+            if rec.get("ingr_code"):
+                self.by_ingr[str(rec["ingr_code"]).strip()].append(rid)
+            if kind == DUPLICATION and rec.get("therapeutic_group"):
+                self.group_members[rec["therapeutic_group"]].add(seq)
+        self.by_item = dict(self.by_item)
+        self.by_ingr = dict(self.by_ingr)
+        self.group_members = dict(self.group_members)
+
+        # 연령금기·어린이주의 개월 구간 (다른 카테고리는 빈 구간). 타입 컬럼과 같은 파서로 원문에서 계산
+        is_age = pd.Series([k in (AGE, CHILD) for k in self.kinds], dtype=bool)
+        ages = parse_age_limits(*(pd.Series([r.get(c) for r in self.rules], dtype=object)
+                                  for c in AGE_CSV_COLS))
+        self.age_index = AgeIntervalIndex(ages["age_min_months"].where(is_age),
+                                          ages["age_max_months"].where(is_age),
+                                          ages["age_min_inclusive"], ages["age_max_inclusive"])
+        self.age_unparsed = (is_age & ~ages["age_ok"]).tolist()
+        self._age_first = self.age_index.first.tolist()
+        self._age_last = self.age_index.last.tolist()
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    # ── 생성 ───────────────────────────────────────────────────
+    @classmethod
+    def from_csv_dir(cls, folder: Path = SCRIPTS_DIR) -> "DurIndex":
+        return cls(load_rules_dir(folder))
+
+    @classmethod
+    def from_export(cls, path: Path) -> "DurIndex":
+        """dur_rules export (CSV 또는 JSON 배열) → 색인. 빈 값은 없는 컬럼으로 취급"""
+        path = Path(path)
+        if path.suffix.lower() == ".json":
+            rows = json.loads(path.read_text(encoding="utf-8"))
+        else:
+            rows = pd.read_csv(path, dtype=str, keep_default_na=False).to_dict(orient="records")
+        return cls([
+            {k: str(v).strip() for k, v in r.items() if k in RECORD_COLS and v not in (None, "")}
+            for r in rows
+        ])
+
+    @classmethod
+    def from_supabase(cls, sb, table: str = "dur_rules") -> "DurIndex":
+        """dur_rules 전체를 id keyset 페이지로 조회해 색인"""
+        cols = ",".join(["id", *sorted(RECORD_COLS)])
+        records, last = [], 0
+        while True:
+            rows = (sb.table(table).select(cols).gt("id", last)
+                    .order("id").limit(PAGE_SIZE).execute().data or [])
+            records += [{k: v for k, v in r.items() if k != "id" and v not in (None, "")} for r in rows]
+            if len(rows) < PAGE_SIZE:
+                break
+            last = rows[-1]["id"]
+        return cls(records)
+
+    @classmethod
+    def from_snapshot(cls, path: Path) -> "DurIndex":
+        """dur_snapshot SQLite 스냅샷 → 색인 ((item_seq, dur_type) 중복은 스냅샷에서 마지막 행만 남음)"""
+        with DurSnapshot(path) as snap:
+            return cls(snap.records())
+
+    # ── 조회 ───────────────────────────────────────────────────
+    def rule_ids(self, drug: str) -> list[int] | None:
+        """품목기준코드 → 규칙 번호. 품목에 없으면 성분코드로 조회, 둘 다 없으면 None"""
+        drug = str(drug).strip()
+        return self.by_item.get(drug, self.by_ingr.get(drug))
+
+    def members(self, group: str) -> set[str]:
+        """효능군 → 같은 효능군 품목 집합"""
+        return self.group_members.get(group, set())
+
+    def _alert(self, drug: str, rid: int, severity: str, **extra) -> dict:
+        rec = self.rules[rid]
+        out = {
+            "drug": drug,
+            "item_seq": rec.get("item_seq"),
+            "item_name": rec.get("item_name"),
+            "dur_type": rec.get("dur_type"),
+            "severity": severity,
+            "reason": rec.get("restriction_reason"),
+        }
+        out.update((f, rec[f]) for f in ALERT_FIELDS if rec.get(f))
+        out.update(extra)
+        return out
+
+    def check(self, drugs, age: float | None = None, pregnant: bool = False,
+              age_months: float | None = None) -> dict:
+        """약 목록(품목기준코드 또는 성분코드) 점검 → {"alerts": [...], "unknown": [...]}
+
+        age(세) 또는 age_months(개월)가 없으면 나이 조건 규칙은 건너뛴다.
+        나이 조건을 해석할 수 없는 규칙은 age_unparsed=True 로 경고한다 (놓치지 않는 쪽).
+        """
+        if age_months is None and age is not None:
+            age_months = float(age) * 12
+        atom = int(self.age_index.atoms(age_months)[0]) if age_months is not None else None
+        alerts, unknown = [], []
+        groups: dict[str, list[str]] = defaultdict(list)
+
+        for drug in dict.fromkeys(str(d).strip() for d in drugs):
+            rids = self.rule_ids(drug)
+            if rids is None:
+                unknown.append(drug)
+                continue
+            seen_groups = set()
+            for rid in rids:
+                kind = self.kinds[rid]
+                if kind == DUPLICATION:
+                    g = self.rules[rid].get("therapeutic_group")
+                    if g and g not in seen_groups:
+                        seen_groups.add(g)
+                        groups[g].append(drug)
+                elif kind == PREGNANCY:
+                    if pregnant:
+                        alerts.append(self._alert(drug, rid, SEVERITY_CONTRA))
+                elif kind in (AGE, CHILD):
+                    if age_months is None:
+                        continue
+                    severity = SEVERITY_CONTRA if kind == AGE else SEVERITY_CAUTION
+                    if self.age_unparsed[rid]:
+                        alerts.append(self._alert(drug, rid, severity, age_unparsed=True))
+                    elif self._age_first[rid] <= atom <= self._age_last[rid]:
+                        alerts.append(self._alert(drug, rid, severity))
+                elif kind in ELDERLY:
+                    if age_months is not None and age_months >= ELDERLY_AGE * 12:
+                        severity = SEVERITY_CONTRA if kind == ELDERLY[0] else SEVERITY_CAUTION
+                        alerts.append(self._alert(drug, rid, severity))
+                elif kind in (DOSE, DURATION):
+                    alerts.append(self._alert(drug, rid, SEVERITY_CAUTION))
+
+        # 효능군중복: 효능군 버킷에 서로 다른 약이 2개 이상
+        for g, members in groups.items():
+            if len(members) > 1:
+                alerts.append({"drug": None, "dur_type": DUPLICATION, "severity": SEVERITY_CAUTION,
+                               "therapeutic_group": g, "drugs": members})
+        return {"alerts": alerts, "unknown": unknown}
+
+    def age_restricted_items(self, age_months) -> list[set[str]]:
+        """나이(개월) 배열 → 나이마다 연령금기·어린이주의 구간에 걸리는 품목기준코드 집합"""
+        return [{self.rules[rid]["item_seq"] for rid in rids}
+                for rids in self.age_index.stab(age_months)]
+
+    def audit(self, rx: pd.DataFrame, rx_col: str = "rx_id", drug_col: str = "item_seq",
+              age_col: str = "age", preg_col: str = "pregnant") -> pd.DataFrame:
+        """처방 프레임(처방 1건 = 여러 행) → 경고 프레임 (rx_id 열 추가, 효능군중복 drugs 는 ', ' 연결)"""
+        rows = []
+        has_age, has_preg = age_col in rx.columns, preg_col in rx.columns
+        for rx_id, g in rx.groupby(rx_col, sort=False):
+            age = pd.to_numeric(g[age_col], errors="coerce").iloc[0] if has_age else None
+            preg = str(g[preg_col].iloc[0]).strip().lower() in ("1", "true", "y", "yes", "예") if has_preg else False
+            res = self.check(g[drug_col], age=None if pd.isna(age) else age, pregnant=preg)
+            for a in res["alerts"]:
+                rows.append({"rx_id": rx_id, **a, "drugs": ", ".join(a["drugs"]) if "drugs" in a else None})
+            rows += [{"rx_id": rx_id, "drug": d, "dur_type": None, "severity": "미등록"} for d in res["unknown"]]
+        return pd.DataFrame(rows)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="DUR 규칙 메모리 색인으로 처방 CSV 일괄 점검")
+    ap.add_argument("--rx", type=Path, required=True,
+                    help="처방 CSV (rx_id, item_seq[, age, pregnant])")
+    ap.add_argument("--out", type=Path, default=Path("dur_alerts.csv"))
+    src = ap.add_mutually_exclusive_group()
+    src.add_argument("--rules-dir", type=Path, default=SCRIPTS_DIR,
+                     help="DUR 카테고리 CSV 폴더 (기본: scripts/)")
+    src.add_argument("--export", type=Path, help="dur_rules 테이블 export (CSV/JSON)")
+    src.add_argument("--snapshot", type=Path, help="dur_snapshot SQLite 스냅샷")
+    args = ap.parse_args()
+
+    if not args.rx.exists():
+        print(f"❌ 파일 없음: {args.rx}")
+        sys.exit(1)
+    if args.snapshot:
+        index = DurIndex.from_snapshot(args.snapshot)
+    elif args.export:
+        index = DurIndex.from_export(args.export)
+    else:
+        index = DurIndex.from_csv_dir(args.rules_dir)
+    print(f"📚 DUR 규칙 {len(index):,}건 | 품목 {len(index.by_item):,}개 | "
+          f"성분 {len(index.by_ingr):,}개 | 효능군 {len(index.group_members):,}개")
+
+    rx = pd.read_csv(args.rx, dtype=str, keep_default_na=False)
+    alerts = index.audit(rx)
+    alerts.to_csv(args.out, index=False, encoding="utf-8-sig")
+    n_rx = rx["rx_id"].nunique()
+    flagged = alerts["rx_id"].nunique() if len(alerts) else 0
+    print(f"✅ 처방 {n_rx:,}건 점검 → 경고 {len(alerts):,}건 (처방 {flagged:,}건) → {args.out}")
+
+
+if __name__ == "__main__":
+    main()
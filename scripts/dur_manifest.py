@@ -0,0 +1,121 @@
+"""
+dur_manifest.py
+────────────────────────────────────────────────────────────────────
+DUR CSV 증분 갱신용 매니페스트 (Supabase 접속 없음)
+
+upload_dur_rules --incremental 이 쓰는 로컬 JSON. 원본 파일마다
+  sha      : 파일 내용 해시 (blake2b 128bit) — 같으면 파일을 읽지도 않음
+  dur_type : 파일명에서 정한 카테고리
+  rows     : item_seq → row_hash (마지막 업로드 때 이 파일이 올린 행 키 집합)
+을 기록해 두고, 다음 실행에서 바뀐 파일이 속한 dur_type 묶음만 다시 읽어
+신규·변경 (item_seq, dur_type) 행만 upsert, 파일에서 사라진 행은 삭제한다.
+
+  file_sha       : 파일 내용 해시 (청크 단위)
+  load_manifest  : 매니페스트 읽기 — 없거나 버전·업로드 컬럼이 다르면 빈 매니페스트
+  save_manifest  : 임시 파일에 쓴 뒤 교체
+  plan_incremental: 파일 목록 + 매니페스트 → 다시 처리할 dur_type 묶음 / 그대로인 파일
+  group_rows     : 매니페스트의 dur_type 묶음 → item_seq → row_hash (파일명 순, 같은 키는 뒤 파일)
+  has_group      : 매니페스트에 해당 dur_type 기록이 있는지
+
+row_hash 는 업로드 컬럼 구성에 따라 달라지므로 업로드 가능 컬럼 목록을 함께 저장하고,
+달라지면 매니페스트를 버린다. 같은 dur_type 을 쓰는 파일은 한 묶음으로 처리해
+한 파일에서 빠진 행이 다른 파일에 남아 있으면 지우지 않는다.
+────────────────────────────────────────────────────────────────────
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from dur_records import get_dur_type
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+MANIFEST_PATH = SCRIPTS_DIR / ".dur_manifest.json"
+MANIFEST_VERSION = 1
+_CHUNK = 1 << 20
+
+
+def file_sha(path: Path) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        while chunk := f.read(_CHUNK):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _empty(columns) -> dict:
+    return {"version": MANIFEST_VERSION, "columns": sorted(columns), "files": {}}
+
+
+def load_manifest(path: Path, columns) -> tuple[dict, str | None]:
+    """(매니페스트, 버린 이유 또는 None). 파일이 없으면 이유 없이 빈 매니페스트"""
+    path = Path(path)
+    if not path.exists():
+        return _empty(columns), None
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        return _empty(columns), f"읽기 실패 ({e})"
+    if data.get("version") != MANIFEST_VERSION:
+        return _empty(columns), f"버전 다름 ({data.get('version')} ≠ {MANIFEST_VERSION})"
+    if data.get("columns") != sorted(columns):
+        return _empty(columns), "업로드 컬럼 구성이 바뀜 (row_hash 재계산 필요)"
+    data.setdefault("files", {})
+    return data, None
+
+
+def save_manifest(manifest: dict, path: Path):
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(manifest, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def plan_incremental(csv_files, manifest: dict) -> dict:
+    """파일 목록 + 매니페스트 → 증분 계획
+
+    반환:
+      groups    : dur_type → 이 묶음의 현재 파일 목록 (묶음 안 파일이 하나라도 새로·바뀌었거나 사라진 경우)
+      unchanged : 내용 해시가 같아 건너뛰는 파일 이름
+      changed   : 새로·바뀐 파일 이름
+      removed   : 매니페스트에만 있고 폴더에서 사라진 파일 이름
+      shas      : 파일 이름 → 내용 해시
+    """
+    files = manifest["files"]
+    by_type: dict[str, list[Path]] = {}
+    shas, changed, dirty = {}, [], set()
+    for p in sorted(Path(p) for p in csv_files):
+        t = get_dur_type(p.stem)
+        by_type.setdefault(t, []).append(p)
+        shas[p.name] = file_sha(p)
+        entry = files.get(p.name)
+        if entry is None or entry.get("sha") != shas[p.name] or entry.get("dur_type") != t:
+            changed.append(p.name)
+            dirty.add(t)
+            if entry is not None:
+                dirty.add(entry.get("dur_type"))  # 파일명 규칙이 바뀌어 dur_type 이 달라진 경우
+    removed = [name for name in files if name not in shas]
+    dirty |= {files[name].get("dur_type") for name in removed}
+    dirty.discard(None)
+    return {
+        "groups": {t: by_type.get(t, []) for t in sorted(dirty)},
+        "unchanged": [name for name in shas if name not in changed],
+        "changed": changed,
+        "removed": removed,
+        "shas": shas,
+    }
+
+
+def group_rows(manifest: dict, dur_type: str) -> dict:
+    """매니페스트에 기록된 dur_type 묶음의 item_seq → row_hash (파일명 순, 같은 키는 뒤 파일)"""
+    out: dict = {}
+    for name in sorted(manifest["files"]):
+        entry = manifest["files"][name]
+        if entry.get("dur_type") == dur_type:
+            out.update(entry.get("rows", {}))
+    return out
+
+
+def has_group(manifest: dict, dur_type: str) -> bool:
+    return any(e.get("dur_type") == dur_type for e in manifest["files"].values())
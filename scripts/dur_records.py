@@ -0,0 +1,244 @@
+"""
+dur_records.py
+────────────────────────────────────────────────────────────────────
+DUR 카테고리 CSV → dur_rules 레코드 변환 (Supabase 접속 없음)
+
+  get_dur_type         : 파일명 stem → dur_type (임부금기 / 연령금기_DUR / 효능군중복 …)
+  COLUMN_MAP           : 카테고리별 CSV 컬럼 → dur_rules 공통 컬럼
+  read_csv_safe        : 인코딩 판별 후 CSV 읽기
+  build_record_batches : DataFrame → (유효 레코드 수, 레코드 배치 이터레이터) — 컬럼 단위 변환.
+                         연령 조건은 age_intervals 로 개월 구간 타입 컬럼(age_min_months …)도 채움
+  age_parse_failures   : 연령 조건을 해석하지 못한 행 (업로드 시 보고용)
+  load_rules_dir       : 폴더의 DUR CSV 전부 → dur_rules 레코드 리스트
+  transform_file       : CSV 1개 → ("batch", 배치) … ("done", 요약) 메시지 (배치를 만드는 대로 내보냄)
+  transform_file_to_queue : 프로세스 풀 워커용 — transform_file 메시지를 결과 큐로 전송
+                         (upload_dur_rules --parallel. 이 모듈은 import 시 접속·종료 등 부작용 없음)
+
+사용처: upload_dur_rules (업로드), dur_engine (메모리 규칙 색인)
+────────────────────────────────────────────────────────────────────
+"""
+
+import re
+import time
+import unicodedata
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from age_intervals import AGE_INTERVAL_COLS, parse_age_limits
+from csv_encoding import sniff_encoding
+
+# ── 파일명 → clean dur_type: 키워드 기반 매핑 ─────────────────
+# 파일명 stem에서 핵심 한글 키워드를 추출해 간결한 dur_type 생성
+_KEYWORD_MAP: list[tuple[str, str]] = [
+    ("임부금기",    "임부금기"),
+    ("노인금기",    "노인금기"),
+    ("노인주의",    "노인주의"),
+    ("어린이주의",  "어린이주의"),
+    ("연령금기",    "연령금기"),
+    ("용량주의",    "용량주의"),
+    ("지속기간주의","지속기간주의"),
+    ("효능군중복",  "효능군중복"),
+]
+
+def get_dur_type(stem: str) -> str:
+    """파일명 stem → dur_type (NFC 정규화 후 핵심 키워드 추출)"""
+    # macOS는 파일명을 NFD로 저장하므로 NFC로 변환 후 비교
+    s = unicodedata.normalize("NFC", stem.strip())
+
+    for keyword, label in _KEYWORD_MAP:
+        if keyword in s:
+            suffix = "_DUR" if "DUR" in s else ("2" if "약물2" in s or "2 (" in s or s.endswith("2") else "")
+            return label + suffix
+
+    return re.sub(r"[^\w가-힣]", "_", s).strip("_")[:30]
+
+
+# ── 카테고리별 컬럼 → dur_rules 필드 매핑 ─────────────────────
+# 각 파일의 고유 컬럼을 dur_rules 공통 스키마로 변환
+COLUMN_MAP: dict[str, str] = {
+    # 공통
+    "item_seq":                    "item_seq",
+    "item_name":                   "item_name",
+    "main_ingr_name":              "ingr_name",
+    "main_ingr_name_raw":          "ingr_name_raw",
+    "ingr_code":                   "ingr_code",
+    "company_name":                "company_name",
+    "reimbursement":               "reimbursement",
+    "notice_no":                   "notice_no",
+    "notice_date":                 "notice_date",
+
+    # 상세 사유 (카테고리마다 이름이 달라 restriction_reason으로 통합)
+    "age_contraindication_detail": "restriction_reason",
+    "prohibited_detail":           "restriction_reason",
+    "caution_detail":              "restriction_reason",
+    "child_caution_detail":        "restriction_reason",
+    "preg_contraindication_detail":"restriction_reason",
+    "max_daily_dose_desc":         "restriction_reason",  # 용량주의 — 설명을 reason으로
+
+    # 연령 관련
+    "age_limit_value":             "age_limit_value",
+    "age_limit_unit":              "age_limit_unit",
+    "age_limit_condition":         "age_limit_condition",
+
+    # 임부금기 등급
+    "preg_contraindication_grade": "preg_grade",
+
+    # 용량주의 수치
+    "max_daily_dose_mg":           "max_daily_dose_mg",
+
+    # 지속기간주의
+    "max_dosage_days":             "max_dosage_days",
+
+    # 효능군 중복
+    "therapeutic_group":           "therapeutic_group",
+    "group_classification":        "group_classification",
+}
+AGE_CSV_COLS = ["age_limit_value", "age_limit_unit", "age_limit_condition"]
+RECORD_COLS = {"dur_type", *COLUMN_MAP.values(), *AGE_INTERVAL_COLS}
+
+
+def read_csv_safe(path: Path) -> pd.DataFrame:
+    """앞부분으로 판별한 인코딩부터 읽고, 실패 시 UTF-8 → CP949 순으로 fallback"""
+    sniffed = sniff_encoding(path)
+    for enc in dict.fromkeys([sniffed or "utf-8", "utf-8", "cp949", "euc-kr"]):
+        try:
+            df = pd.read_csv(path, dtype=str, encoding=enc, keep_default_na=False)
+            return df
+        except (UnicodeDecodeError, LookupError):
+            continue
+    raise ValueError(f"지원하는 인코딩으로 읽을 수 없음: {path.name}")
+
+
+def build_record_batches(df: pd.DataFrame, dur_type: str, allowed_cols: set[str],
+                         size: int = 1000) -> tuple[int, Iterator[list[dict]]]:
+    """DataFrame → (유효 레코드 수, dur_rules 레코드 배치 이터레이터)
+
+    컬럼 단위로 변환한다 (allowed_cols에 있는 컬럼만 포함):
+    - 값은 앞뒤 공백 제거, 빈 값은 레코드에서 생략
+    - restriction_reason: detail 컬럼들을 COLUMN_MAP 순서대로 back-fill → 첫 번째 비어있지 않은 값
+    - item_seq가 비어 있는 행은 제외
+    - 연령 조건 컬럼이 있으면 AGE_INTERVAL_COLS(개월 구간, 포함 여부)를 뒤에 추가.
+      없는 값도 None 으로 모든 행에 넣는다 — bulk upsert 는 배치 키의 합집합만 갱신하므로
+      생략하면 조건이 바뀐(이상 → 미만, 해석 불가) 행에 이전 구간이 남는다
+    """
+    cols: dict[str, pd.Series] = {}
+    reasons: list[pd.Series] = []
+    for csv_col, db_col in COLUMN_MAP.items():
+        if csv_col not in df.columns or db_col not in allowed_cols:
+            continue
+        val = df[csv_col].fillna("").astype(str).str.strip()
+        if db_col == "restriction_reason":
+            reasons.append(val)
+            cols.setdefault(db_col, val)  # 자리만 확보 (레코드 키 순서 유지)
+        else:
+            cols[db_col] = val
+
+    if reasons:
+        cols["restriction_reason"] = (
+            reasons[0] if len(reasons) == 1
+            else pd.concat(reasons, axis=1).replace("", np.nan).bfill(axis=1).iloc[:, 0].fillna("")
+        )
+
+    if any(c in df.columns for c in AGE_CSV_COLS) and set(AGE_INTERVAL_COLS) <= allowed_cols:
+        ages = _parse_ages(df)
+        for col in AGE_INTERVAL_COLS:
+            cols[col] = ages[col].astype(object).where(ages[col].notna(), None)
+
+    if "item_seq" not in cols:
+        return 0, iter(())
+    keep = (cols["item_seq"] != "").to_numpy()
+    names = list(cols)
+    arrays = [cols[n].to_numpy(dtype=object)[keep] for n in names]
+    always = [n in AGE_INTERVAL_COLS for n in names]
+    total = int(keep.sum())
+
+    def batches():
+        for i in range(0, total, size):
+            chunk = []
+            for vals in zip(*(a[i:i + size] for a in arrays)):
+                rec = {"dur_type": dur_type}
+                rec.update((n, v) for n, v, a in zip(names, vals, always) if a or (v is not None and v != ""))
+                chunk.append(rec)
+            yield chunk
+
+    return total, batches()
+
+
+def _parse_ages(df: pd.DataFrame) -> pd.DataFrame:
+    ages = parse_age_limits(*(df[c] if c in df.columns else None for c in AGE_CSV_COLS))
+    ages.index = df.index
+    return ages
+
+
+def age_parse_failures(df: pd.DataFrame) -> pd.Series:
+    """연령 조건이 있지만 개월 구간으로 해석하지 못한 행 → '값 | 단위 | 조건' 원문 (item_seq 있는 행만)"""
+    if not any(c in df.columns for c in AGE_CSV_COLS) or "item_seq" not in df.columns:
+        return pd.Series([], dtype=object)
+    ages = _parse_ages(df)
+    bad = ages["has_age"] & ~ages["age_ok"] & (df["item_seq"].fillna("").astype(str).str.strip() != "")
+    raw = [df[c].fillna("").astype(str).str.strip() if c in df.columns else "" for c in AGE_CSV_COLS]
+    return (raw[0] + " | " + raw[1] + " | " + raw[2])[bad]
+
+
+def build_records(df: pd.DataFrame, dur_type: str, allowed_cols: set[str]) -> list[dict]:
+    """DataFrame → dur_rules 레코드 리스트 변환 (allowed_cols에 있는 컬럼만 포함)"""
+    _, batches = build_record_batches(df, dur_type, allowed_cols)
+    return [rec for batch in batches for rec in batch]
+
+
+def load_rules_dir(folder: Path, allowed_cols: set[str] | None = None) -> list[dict]:
+    """folder 의 *.csv (백업 제외) 전부 → dur_rules 레코드 리스트 (파일명 순)"""
+    allowed = allowed_cols or RECORD_COLS
+    records = []
+    for path in sorted(p for p in Path(folder).glob("*.csv") if not p.name.endswith(".bak")):
+        records += build_records(read_csv_safe(path), get_dur_type(path.stem), allowed)
+    return records
+
+
+def age_failure_summary(df: pd.DataFrame) -> tuple[int, list[str]]:
+    """연령 조건 해석 불가 행 수 + 자주 나온 원문 예시 3개"""
+    bad = age_parse_failures(df)
+    return len(bad), bad.value_counts().index[:3].tolist()
+
+
+# ── 파일 단위 변환 (upload_dur_rules --parallel 프로세스 풀 워커) ──
+def transform_file(path, allowed_cols: set[str], size: int = 1000) -> Iterator[tuple[str, object]]:
+    """CSV 1개 → ("batch", 레코드 배치) … 후 ("done", 요약) 또는 ("error", 메시지)
+
+    배치를 만드는 대로 내보내 파일 전체 레코드 리스트를 한 번에 넘기지 않는다.
+    요약: dur_type, total, age_failures, transform_sec
+    """
+    t0 = time.perf_counter()
+    p = Path(path)
+    dur_type = get_dur_type(p.stem)
+    try:
+        df = read_csv_safe(p)
+    except Exception as e:
+        yield "error", f"읽기 실패: {e}"
+        return
+    total, batches = build_record_batches(df, dur_type, allowed_cols, size)
+    for chunk in batches:
+        yield "batch", chunk
+    yield "done", {"dur_type": dur_type, "total": total, "age_failures": age_failure_summary(df),
+                   "transform_sec": time.perf_counter() - t0}
+
+
+_out_queue = None
+
+
+def init_transform_worker(out_queue):
+    """프로세스 풀 initializer — transform_file_to_queue 가 보낼 결과 큐 지정"""
+    global _out_queue
+    _out_queue = out_queue
+
+
+def transform_file_to_queue(path: str, allowed_cols: set[str], size: int = 1000):
+    """transform_file 메시지를 (path, 종류, 내용)으로 결과 큐에 보냄 — 파일마다 done/error 가 꼭 한 번 간다"""
+    try:
+        for kind, payload in transform_file(path, allowed_cols, size):
+            _out_queue.put((path, kind, payload))
+    except Exception as e:
+        _out_queue.put((path, "error", f"변환 실패: {e}"))
@@ -0,0 +1,327 @@
+"""
+dur_snapshot.py
+────────────────────────────────────────────────────────────────────
+DUR 규칙 → 단일 SQLite 파일 스냅샷 (네트워크 없이 로컬 조회 · 배포판 비교)
+
+dur_rules 와 같은 레코드(dur_records 변환 + row_hash)를 SQLite 한 파일에 담는다.
+배치 작업·테스트가 Supabase 왕복 없이 품목·성분·카테고리를 조회하고,
+두 규제 배포판(스냅샷 2개)의 차이를 SQL 조인 한 번으로 뽑는다.
+
+  write_snapshot  : 레코드 → SQLite (임시 파일에 쓴 뒤 교체, (item_seq, dur_type) 중복은 마지막 행)
+  build_snapshot  : DUR CSV 파일 목록 → write_snapshot (파일별 건수를 메타에 기록)
+  DurSnapshot     : 읽기 전용 조회 — by_item / by_ingr / by_type (B-tree 인덱스),
+                    search (item_name · ingr_name FTS5), records (DurIndex 재구성용)
+  diff_snapshots  : 배포판 2개 → 추가 / 삭제 / 변경 행 (row_hash 비교, 변경 컬럼 이름 포함)
+
+  스키마: dur_rules (id, DB 와 같은 컬럼, UNIQUE(item_seq, dur_type))
+          인덱스 item_seq / ingr_code / dur_type, FTS5 dur_rules_fts(item_name, ingr_name)
+          snapshot_meta (key, value) — 생성 시각 · 원본 파일 · FTS 토크나이저
+
+  FTS 토크나이저는 부분 문자열 검색이 되는 trigram(SQLite 3.34+)을 쓰고, 없으면 unicode61.
+  trigram 은 3글자 미만 검색어를 색인으로 찾지 못하므로 그때는 LIKE 로 훑는다.
+
+사용처: upload_dur_rules --sqlite PATH (업로드와 함께 스냅샷), dur_engine --snapshot PATH
+
+실행:
+  python3 scripts/dur_snapshot.py --out scripts/dur_rules.sqlite [--rules-dir scripts/]
+  python3 scripts/dur_snapshot.py --search scripts/dur_rules.sqlite 아세트아미노펜
+  python3 scripts/dur_snapshot.py --diff old.sqlite new.sqlite [--diff-out dur_diff.csv]
+────────────────────────────────────────────────────────────────────
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pandas as pd
+
+from age_intervals import AGE_INTERVAL_COLS
+from delta_sync import HASH_COL, row_hash
+from dur_records import COLUMN_MAP, build_records, get_dur_type, read_csv_safe
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+DEFAULT_PATH = SCRIPTS_DIR / "dur_rules.sqlite"
+TABLE_NAME = "dur_rules"
+FTS_TABLE = "dur_rules_fts"
+FTS_COLS = ("item_name", "ingr_name")
+KEY_COLS = ("item_seq", "dur_type")
+
+# 컬럼 순서: dur_type → COLUMN_MAP 순서 → 개월 구간 → row_hash
+SNAPSHOT_COLS = ["dur_type", *dict.fromkeys(COLUMN_MAP.values()), *AGE_INTERVAL_COLS, HASH_COL]
+_COL_TYPES = {"age_min_months": "REAL", "age_max_months": "REAL",
+              "age_min_inclusive": "INTEGER", "age_max_inclusive": "INTEGER"}
+_BOOL_COLS = {"age_min_inclusive", "age_max_inclusive"}
+
+
+def _fts_tokenizer(conn: sqlite3.Connection) -> str:
+    """trigram 토크나이저 지원 여부 확인 → 'trigram' / 'unicode61'"""
+    try:
+        conn.execute("CREATE VIRTUAL TABLE temp._probe USING fts5(x, tokenize='trigram')")
+        conn.execute("DROP TABLE temp._probe")
+        return "trigram"
+    except sqlite3.OperationalError:
+        return "unicode61"
+
+
+def _schema(tokenizer: str) -> list[str]:
+    cols = ",\n  ".join(f"{c} {_COL_TYPES.get(c, 'TEXT')}" for c in SNAPSHOT_COLS)
+    return [
+        f"CREATE TABLE {TABLE_NAME} (\n  id INTEGER PRIMARY KEY,\n  {cols},\n"
+        f"  UNIQUE ({', '.join(KEY_COLS)})\n)",
+        f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5({', '.join(FTS_COLS)}, "
+        f"content='{TABLE_NAME}', content_rowid='id', tokenize='{tokenizer}')",
+        "CREATE TABLE snapshot_meta (key TEXT PRIMARY KEY, value TEXT)",
+    ]
+
+
+_INDEXES = [f"CREATE INDEX idx_{TABLE_NAME}_{c} ON {TABLE_NAME} ({c})"
+            for c in ("item_seq", "ingr_code", "dur_type")]
+
+
+def _row(rec: dict) -> tuple:
+    h = rec.get(HASH_COL) or row_hash(rec)
+    vals = []
+    for c in SNAPSHOT_COLS:
+        v = h if c == HASH_COL else rec.get(c)
+        if c in _BOOL_COLS and v is not None:
+            v = int(str(v).strip().lower() in ("true", "t", "1"))
+        vals.append(v)
+    return tuple(vals)
+
+
+def write_snapshot(records, path: Path = DEFAULT_PATH, meta: dict | None = None) -> int:
+    """dur_rules 레코드 → SQLite 스냅샷 → 저장 행 수
+
+    row_hash 는 --delta 업로드와 같은 값(delta_sync.row_hash)이라 스냅샷과 DB 를 비교할 수 있다.
+    벌크 적재 후 인덱스·FTS 를 만들고, 다 쓴 임시 파일을 교체해 읽는 쪽이 반쯤 쓴 파일을 보지 않게 한다.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.unlink(missing_ok=True)
+
+    conn = sqlite3.connect(tmp)
+    try:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        tokenizer = _fts_tokenizer(conn)
+        for sql in _schema(tokenizer):
+            conn.execute(sql)
+        marks = ", ".join("?" * len(SNAPSHOT_COLS))
+        conn.executemany(
+            f"INSERT OR REPLACE INTO {TABLE_NAME} ({', '.join(SNAPSHOT_COLS)}) VALUES ({marks})",
+            (_row(r) for r in records))
+        for sql in _INDEXES:
+            conn.execute(sql)
+        conn.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+        conn.execute("ANALYZE")
+        n = conn.execute(f"SELECT COUNT(*) FROM {TABLE_NAME}").fetchone()[0]
+        info = {"created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "rows": n, "fts_tokenizer": tokenizer, **(meta or {})}
+        conn.executemany("INSERT INTO snapshot_meta VALUES (?, ?)",
+                         [(k, v if isinstance(v, str) else json.dumps(v, ensure_ascii=False))
+                          for k, v in info.items()])
+        conn.commit()
+    finally:
+        conn.close()
+    os.replace(tmp, path)
+    return n
+
+
+def build_snapshot(csv_files, path: Path = DEFAULT_PATH) -> int:
+    """DUR CSV 파일 목록 → 스냅샷 (업로드 대상 스키마와 무관하게 전체 컬럼) → 저장 행 수"""
+    sources, records = {}, []
+    for p in csv_files:
+        p = Path(p)
+        recs = build_records(read_csv_safe(p), get_dur_type(p.stem), set(SNAPSHOT_COLS))
+        sources[p.name] = len(recs)
+        records += recs
+    return write_snapshot(records, path, {"sources": sources})
+
+
+class DurSnapshot:
+    """SQLite 스냅샷 읽기 전용 조회 (결과는 빈 컬럼을 뺀 dur_rules 레코드 dict)"""
+
+    def __init__(self, path: Path = DEFAULT_PATH):
+        self.path = Path(path)
+        if not self.path.exists():
+            raise FileNotFoundError(f"스냅샷 없음: {self.path}")
+        self.conn = sqlite3.connect(f"{self.path.resolve().as_uri()}?mode=ro", uri=True)
+        self.meta = dict(self.conn.execute("SELECT key, value FROM snapshot_meta"))
+        self.tokenizer = self.meta.get("fts_tokenizer", "unicode61")
+        self._select = f"SELECT {', '.join(SNAPSHOT_COLS)} FROM {TABLE_NAME}"
+
+    def __enter__(self) -> "DurSnapshot":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def __len__(self) -> int:
+        return self.conn.execute(f"SELECT COUNT(*) FROM {TABLE_NAME}").fetchone()[0]
+
+    @staticmethod
+    def _record(row) -> dict:
+        rec = {c: v for c, v in zip(SNAPSHOT_COLS, row) if v is not None and v != ""}
+        for c in _BOOL_COLS & rec.keys():
+            rec[c] = bool(rec[c])
+        return rec
+
+    def _query(self, where: str = "", params: tuple = ()) -> list[dict]:
+        rows = self.conn.execute(f"{self._select} {where}", params)
+        return [self._record(r) for r in rows]
+
+    # ── 조회 ───────────────────────────────────────────────────
+    def by_item(self, item_seq: str) -> list[dict]:
+        return self._query("WHERE item_seq = ? ORDER BY id", (str(item_seq).strip(),))
+
+    def by_ingr(self, ingr_code: str) -> list[dict]:
+        return self._query("WHERE ingr_code = ? ORDER BY id", (str(ingr_code).strip(),))
+
+    def by_type(self, dur_type: str) -> list[dict]:
+        return self._query("WHERE dur_type = ? ORDER BY id", (dur_type,))
+
+    def search(self, text: str, limit: int | None = 20) -> list[dict]:
+        """item_name · ingr_name 부분 문자열 검색 (id 순, 색인으로 못 찾는 짧은 검색어는 LIKE)
+
+        FTS5 rowid 순으로 읽어 limit 개에서 멈춘다 (rank 정렬은 일치 행 전부를 점수 매겨 느림).
+        """
+        text = str(text).strip()
+        if not text:
+            return []
+        lim = "" if limit is None else f" LIMIT {int(limit)}"
+        if self.tokenizer == "trigram" and len(text) >= 3:
+            phrase = '"' + text.replace('"', '""') + '"'
+            rows = self.conn.execute(
+                f"SELECT {', '.join('d.' + c for c in SNAPSHOT_COLS)} FROM {FTS_TABLE} f "
+                f"JOIN {TABLE_NAME} d ON d.id = f.rowid WHERE {FTS_TABLE} MATCH ? "
+                f"ORDER BY f.rowid{lim}", (phrase,))
+            return [self._record(r) for r in rows]
+        pat = "%" + text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        return self._query(f"WHERE item_name LIKE ? ESCAPE '\\' OR ingr_name LIKE ? ESCAPE '\\' "
+                           f"ORDER BY id{lim}", (pat, pat))
+
+    def records(self) -> list[dict]:
+        """전체 레코드 (id 순, row_hash 제외) — DurIndex 재구성용"""
+        return [{k: v for k, v in r.items() if k != HASH_COL} for r in self._query("ORDER BY id")]
+
+
+# ── 배포판 비교 ────────────────────────────────────────────────
+def diff_snapshots(old: Path, new: Path) -> pd.DataFrame:
+    """스냅샷 2개 → 차이 프레임 (status: added/removed/changed, dur_type, item_seq, item_name, changed_cols)
+
+    (item_seq, dur_type) 기준 FULL JOIN 을 UNIQUE 인덱스로 풀고, row_hash 가 다른 행만 컬럼 단위로 비교한다.
+    """
+    conn = sqlite3.connect(f"{Path(new).resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        conn.execute("ATTACH DATABASE ? AS old", (f"{Path(old).resolve().as_uri()}?mode=ro",))
+        on = " AND ".join(f"o.{k} = n.{k}" for k in KEY_COLS)
+        cols = ", ".join(SNAPSHOT_COLS)
+        sql = (
+            f"SELECT 'added', n.dur_type, n.item_seq, n.item_name, NULL, NULL FROM main.{TABLE_NAME} n "
+            f"WHERE NOT EXISTS (SELECT 1 FROM old.{TABLE_NAME} o WHERE {on}) "
+            f"UNION ALL "
+            f"SELECT 'removed', o.dur_type, o.item_seq, o.item_name, NULL, NULL FROM old.{TABLE_NAME} o "
+            f"WHERE NOT EXISTS (SELECT 1 FROM main.{TABLE_NAME} n WHERE {on}) "
+            f"UNION ALL "
+            f"SELECT 'changed', n.dur_type, n.item_seq, n.item_name, o.id, n.id FROM main.{TABLE_NAME} n "
+            f"JOIN old.{TABLE_NAME} o ON {on} WHERE o.{HASH_COL} IS NOT n.{HASH_COL}"
+        )
+        rows = conn.execute(sql).fetchall()
+        changed = [(r[4], r[5]) for r in rows if r[0] == "changed"]
+        diff_cols = {}
+        for i in range(0, len(changed), 500):
+            chunk = changed[i:i + 500]
+            olds = {r[0]: r[1:] for r in conn.execute(
+                f"SELECT id, {cols} FROM old.{TABLE_NAME} WHERE id IN ({','.join('?' * len(chunk))})",
+                [o for o, _ in chunk])}
+            news = {r[0]: r[1:] for r in conn.execute(
+                f"SELECT id, {cols} FROM main.{TABLE_NAME} WHERE id IN ({','.join('?' * len(chunk))})",
+                [n for _, n in chunk])}
+            for o, n in chunk:
+                diff_cols[(o, n)] = ", ".join(
+                    c for c, a, b in zip(SNAPSHOT_COLS, olds[o], news[n])
+                    if c != HASH_COL and (a or None) != (b or None))
+    finally:
+        conn.close()
+
+    out = pd.DataFrame(
+        [(s, t, seq, name, diff_cols.get((o, n)) if s == "changed" else None)
+         for s, t, seq, name, o, n in rows],
+        columns=["status", "dur_type", "item_seq", "item_name", "changed_cols"])
+    return out.sort_values(["dur_type", "item_seq", "status"], ignore_index=True)
+
+
+def print_diff_summary(diff: pd.DataFrame):
+    if diff.empty:
+        print("  변경 없음")
+        return
+    counts = diff.pivot_table(index="dur_type", columns="status", values="item_seq",
+                              aggfunc="count", fill_value=0)
+    counts = counts.reindex(columns=["added", "removed", "changed"], fill_value=0)
+    print(f"  {'dur_type':<20}{'추가':>8}{'삭제':>8}{'변경':>8}")
+    print("  " + "─" * 44)
+    for t, r in counts.iterrows():
+        print(f"  {t[:18]:<20}{r['added']:>8,}{r['removed']:>8,}{r['changed']:>8,}")
+    print("  " + "─" * 44)
+    print(f"  {'전체':<20}{counts['added'].sum():>8,}{counts['removed'].sum():>8,}{counts['changed'].sum():>8,}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="DUR 규칙 SQLite 스냅샷 생성 · 검색 · 배포판 비교")
+    mode = ap.add_mutually_exclusive_group()
+    mode.add_argument("--search", nargs=2, metavar=("DB", "TEXT"), help="품목명·성분명 검색")
+    mode.add_argument("--diff", nargs=2, type=Path, metavar=("OLD", "NEW"), help="스냅샷 2개 비교")
+    ap.add_argument("--out", type=Path, default=DEFAULT_PATH, help="생성할 스냅샷 경로")
+    ap.add_argument("--rules-dir", type=Path, default=SCRIPTS_DIR,
+                    help="DUR 카테고리 CSV 폴더 (기본: scripts/)")
+    ap.add_argument("--limit", type=int, default=20, help="--search 결과 수")
+    ap.add_argument("--diff-out", type=Path, help="--diff 결과 CSV 경로")
+    args = ap.parse_args()
+
+    if args.search:
+        db, text = args.search
+        with DurSnapshot(Path(db)) as snap:
+            hits = snap.search(text, args.limit)
+        print(f"🔎 '{text}' → {len(hits)}건")
+        for r in hits:
+            print(f"  {r.get('item_seq', ''):<12}{r.get('dur_type', ''):<14}"
+                  f"{r.get('item_name', '')}  ({r.get('ingr_name', '')})")
+        return
+
+    if args.diff:
+        old, new = args.diff
+        for p in (old, new):
+            if not p.exists():
+                print(f"❌ 파일 없음: {p}")
+                sys.exit(1)
+        t0 = time.perf_counter()
+        diff = diff_snapshots(old, new)
+        print(f"📊 {old.name} → {new.name}: 차이 {len(diff):,}건 ({time.perf_counter() - t0:.2f}초)")
+        print_diff_summary(diff)
+        if args.diff_out:
+            diff.to_csv(args.diff_out, index=False, encoding="utf-8-sig")
+            print(f"  → {args.diff_out}")
+        return
+
+    csv_files = sorted(p for p in args.rules_dir.glob("*.csv") if not p.name.endswith(".bak"))
+    if not csv_files:
+        print("CSV 파일이 없습니다.")
+        sys.exit(0)
+    t0 = time.perf_counter()
+    n = build_snapshot(csv_files, args.out)
+    size_mb = args.out.stat().st_size / 1e6
+    print(f"✅ DUR 스냅샷: 파일 {len(csv_files)}개 → {n:,}건 ({size_mb:.1f}MB, "
+          f"{time.perf_counter() - t0:.1f}초) → {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+kcd_ranges.py
+────────────────────────────────────────────────────────────────────
+KCD 범위(C00-C14, C18-C20 …) ↔ 개별 KCD 코드(C16, C18.0 …) 매핑
+
+암 참조 테이블(cancer_incidence_reference / cancer_survival_reference)은 kcd_code에
+범위를 저장하고 disease_stats 는 개별 코드를 저장하므로, 조회 시점에 문자열을
+파싱하지 않도록 코드 → 범위 매핑을 미리 펼쳐 kcd_cancer_range_map 으로 올린다.
+
+  code_key        : 코드 → 정수 키 (알파벳 위치 × 100 + 앞 두 자리, C16 → 216). 세부코드는 3단으로
+  parse_range     : "C00-C14" / "C16" / "C81-C86, C88" → [(시작 키, 끝 키), …]
+  KcdRangeIndex   : 범위 경계를 정렬해 만든 기본 구간 → 구간마다 포함 범위 목록.
+                    lookup 은 searchsorted 1회로 코드 수천 개를 한 번에 해석
+  mapping_records : kcd_cancer_range_map 레코드 (범위 안의 모든 3단 코드 + 실제 disease_stats 코드)
+
+조인 예:
+  SELECT ds.*, ci.*
+  FROM disease_stats ds
+  JOIN kcd_cancer_range_map m ON m.kcd_code = ds.kcd_code AND m.is_most_specific
+  JOIN cancer_survival_reference ci ON ci.kcd_code = m.kcd_range;
+
+사용처: upload_health_engine (4. kcd_cancer_range_map)
+────────────────────────────────────────────────────────────────────
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+CODE_PATTERN = r'^([A-Z])(\d{2})'
+_RANGE_PART = re.compile(r'([A-Z]\d{2})(?:\.\d+)?(?:\s*[-~]\s*([A-Z]\d{2})(?:\.\d+)?)?')
+
+
+def code_key(codes) -> np.ndarray:
+    """KCD 코드(배열) → 정수 키. 'C16' → 216, 'c18.0' → 218, 형식이 아니면 -1"""
+    s = pd.Series(np.atleast_1d(np.asarray(codes, dtype=object)), dtype=object)
+    parts = s.astype(str).str.strip().str.upper().str.extract(CODE_PATTERN)
+    letter = parts[0].str.encode("ascii").str[0]
+    keys = (letter - ord("A")) * 100 + pd.to_numeric(parts[1])
+    return keys.fillna(-1).to_numpy(np.int64)
+
+
+def key_code(key: int) -> str:
+    """정수 키 → 3단 코드 (216 → 'C16')"""
+    return f"{chr(ord('A') + key // 100)}{key % 100:02d}"
+
+
+def parse_range(spec: str) -> list[tuple[int, int]]:
+    """범위 문자열 → [(시작 키, 끝 키)]. 쉼표로 나열된 여러 범위·단일 코드 모두 허용"""
+    out = []
+    for a, b in _RANGE_PART.findall(str(spec).upper()):
+        lo = int(code_key([a])[0])
+        hi = int(code_key([b])[0]) if b else lo
+        out.append((min(lo, hi), max(lo, hi)))
+    return out
+
+
+class KcdRangeIndex:
+    """겹치거나 포함관계인 범위(C00-C96 ⊃ C18-C20)를 모두 다루는 정렬 구간 구조"""
+
+    def __init__(self, ranges: list[tuple[str, str | None]]):
+        """ranges: [(범위 라벨, 암종명)] — 라벨은 참조 테이블 kcd_code 값 그대로"""
+        self.labels: list[str] = []
+        self.cancer_type: dict[str, str | None] = {}
+        self.size: dict[str, int] = {}
+        spans = []  # (시작, 끝+1, 라벨 번호)
+        for label, cancer in ranges:
+            if not label or label in self.cancer_type:
+                continue
+            parts = parse_range(label)
+            if not parts:
+                continue
+            rid = len(self.labels)
+            self.labels.append(label)
+            self.cancer_type[label] = cancer
+            self.size[label] = sum(hi - lo + 1 for lo, hi in parts)
+            spans += [(lo, hi + 1, rid) for lo, hi in parts]
+
+        # 기본 구간: 모든 경계를 정렬 → [bounds[i], bounds[i+1]) 안에서는 포함 범위 집합이 같음
+        self.bounds = np.array(sorted({b for lo, hi, _ in spans for b in (lo, hi)}), dtype=np.int64)
+        n_seg = max(len(self.bounds) - 1, 0)
+        members: list[list[int]] = [[] for _ in range(n_seg)]
+        for lo, hi, rid in spans:
+            for seg in range(np.searchsorted(self.bounds, lo), np.searchsorted(self.bounds, hi)):
+                if rid not in members[seg]:
+                    members[seg].append(rid)
+        # 구간별 범위 목록: 좁은(구체적인) 범위 먼저
+        self.seg_labels = np.empty(n_seg + 1, dtype=object)
+        self.seg_best = np.empty(n_seg + 1, dtype=object)
+        for seg, rids in enumerate(members):
+            names = sorted((self.labels[r] for r in rids), key=lambda l: (self.size[l], l))
+            self.seg_labels[seg] = tuple(names)
+            self.seg_best[seg] = names[0] if names else None
+        self.seg_labels[n_seg] = ()  # 범위 밖
+        self.seg_best[n_seg] = None
+
+    def _segments(self, codes) -> np.ndarray:
+        keys = code_key(codes)
+        seg = np.searchsorted(self.bounds, keys, side="right") - 1
+        outside = (keys < 0) | (seg < 0) | (seg >= len(self.bounds) - 1)
+        return np.where(outside, len(self.seg_labels) - 1, seg)
+
+    def lookup(self, codes) -> np.ndarray:
+        """코드 배열 → 포함 범위 라벨 튜플 배열 (좁은 범위 먼저, 없으면 빈 튜플)"""
+        return self.seg_labels[self._segments(codes)]
+
+    def most_specific(self, codes) -> np.ndarray:
+        """코드 배열 → 가장 좁은 범위 라벨 배열 (없으면 None)"""
+        return self.seg_best[self._segments(codes)]
+
+    def mapping_records(self, extra_codes=()) -> list[dict]:
+        """kcd_cancer_range_map 레코드. 범위 안의 모든 3단 코드 + extra_codes(실제 코드 표기)"""
+        codes = []
+        for lo, hi in zip(self.bounds[:-1], self.bounds[1:]):
+            codes += [key_code(k) for k in range(lo, hi)]
+        codes += sorted({str(c).strip() for c in extra_codes if c and str(c).strip()} - set(codes))
+        records = []
+        for code, labels in zip(codes, self.lookup(codes)):
+            for i, label in enumerate(labels):
+                records.append({
+                    "kcd_code": code,
+                    "kcd_range": label,
+                    "cancer_type": self.cancer_type[label],
+                    "range_size": self.size[label],
+                    "is_most_specific": i == 0,
+                })
+        return records
@@ -0,0 +1,117 @@
+"""
+quantile_sketch.py
+────────────────────────────────────────────────────────────────────
+병합 가능한 분위수 스케치 (merging t-digest, NumPy 구현)
+
+  TDigest.update    : 값 배열 추가 (NaN 무시)
+  TDigest.merge     : 다른 스케치 병합 — 청크·프로세스별 결과를 합칠 때 사용
+  TDigest.quantile  : 분위수 추정 (배열 입력 가능)
+  TDigest.cdf       : 값 → 누적 비율 (백분위)
+  to_dict/from_dict : JSON 직렬화 (DB JSONB 컬럼 저장용)
+
+중심점(평균, 가중치)을 k1 척도 함수 k(q) = δ/2 · (asin(2q−1)/π + ½) 로 묶어서
+양 끝(p5, p95 근처)은 촘촘하고 중앙은 성기게 유지한다. δ=200 이면 중심점 100개 안팎.
+정규분포를 가정하지 않으므로 중성지방·감마GTP 같은 치우친 분포에도 그대로 쓸 수 있다.
+
+사용처: checkup_aggregate (health_benchmark_quantiles)
+────────────────────────────────────────────────────────────────────
+"""
+
+import math
+
+import numpy as np
+
+DEFAULT_DELTA = 200
+
+
+class TDigest:
+    def __init__(self, delta: int = DEFAULT_DELTA):
+        self.delta = delta
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.min = math.inf
+        self.max = -math.inf
+
+    @property
+    def n(self) -> int:
+        return int(self.weights.sum())
+
+    def __len__(self) -> int:
+        return len(self.means)
+
+    # ── 추가 · 병합 ──────────────────────────────────────────
+    def update(self, values: np.ndarray):
+        v = np.asarray(values, dtype=np.float64)
+        v = v[~np.isnan(v)]
+        if not len(v):
+            return
+        self.min = min(self.min, float(v.min()))
+        self.max = max(self.max, float(v.max()))
+        self._absorb(v, np.ones(len(v)))
+
+    def merge(self, other: "TDigest"):
+        if not len(other):
+            return
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._absorb(other.means, other.weights)
+
+    def _absorb(self, means: np.ndarray, weights: np.ndarray):
+        m = np.concatenate([self.means, means])
+        w = np.concatenate([self.weights, weights])
+        order = np.argsort(m, kind="stable")
+        m, w = m[order], w[order]
+        total = w.sum()
+        # 각 중심점의 가운데 위치 q → k 척도 정수 구간이 같은 것끼리 묶음
+        q = (np.cumsum(w) - w / 2) / total
+        k = self.delta / 2 * (np.arcsin(np.clip(2 * q - 1, -1, 1)) / math.pi + 0.5)
+        ids = np.floor(k).astype(np.int64)
+        ids -= ids[0]
+        cw = np.bincount(ids, weights=w)
+        cm = np.bincount(ids, weights=w * m)
+        keep = cw > 0
+        self.weights = cw[keep]
+        self.means = cm[keep] / self.weights
+
+    # ── 조회 ─────────────────────────────────────────────────
+    def _knots(self) -> tuple[np.ndarray, np.ndarray]:
+        """누적 가중치 위치 → 값 보간 기준점 (양 끝은 최소·최대값)"""
+        centers = np.cumsum(self.weights) - self.weights / 2
+        xs = np.concatenate([[0.0], centers, [self.weights.sum()]])
+        ys = np.concatenate([[self.min], self.means, [self.max]])
+        return xs, ys
+
+    def quantile(self, q):
+        """q(0~1, 스칼라 또는 배열) → 추정 값. 비어 있으면 NaN"""
+        if not len(self):
+            return np.full(np.shape(q), np.nan) if np.ndim(q) else math.nan
+        xs, ys = self._knots()
+        return np.interp(np.asarray(q, dtype=np.float64) * xs[-1], xs, ys)
+
+    def cdf(self, x):
+        """값(스칼라 또는 배열) → 누적 비율 0~1. 비어 있으면 NaN"""
+        if not len(self):
+            return np.full(np.shape(x), np.nan) if np.ndim(x) else math.nan
+        xs, ys = self._knots()
+        return np.interp(x, ys, xs) / xs[-1]
+
+    # ── 직렬화 ───────────────────────────────────────────────
+    def to_dict(self, digits: int | None = 4) -> dict:
+        """digits=None 이면 평균을 반올림하지 않음 (캐시 등 손실 없는 저장용)"""
+        return {
+            "delta": self.delta,
+            "n": self.n,
+            "min": None if not len(self) else self.min,
+            "max": None if not len(self) else self.max,
+            "means": (self.means if digits is None else np.round(self.means, digits)).tolist(),
+            "weights": self.weights.astype(np.int64).tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "TDigest":
+        t = cls(d.get("delta", DEFAULT_DELTA))
+        t.means = np.asarray(d["means"], dtype=np.float64)
+        t.weights = np.asarray(d["weights"], dtype=np.float64)
+        if len(t.means):
+            t.min, t.max = float(d["min"]), float(d["max"])
+        return t
@@ -0,0 +1,168 @@
+"""
+symptom_index.py
+────────────────────────────────────────────────────────────────────
+disease_stats.symptom_keywords → 증상 키워드 역색인 (keyword → kcd_code 목록)
+
+symptom_keywords 는 "두통, 어지러움, 피로감" 같은 자유 텍스트라 증상 → 질병 조회가
+전체 행 ILIKE 스캔이 된다. 업로드 시점에 키워드를 토큰화·정규화해 역색인을 만들어
+두면 조회는 키워드 키 조회 + 짧은 posting list 병합으로 끝난다.
+
+  tokenize        : 구분자(, / · ; | 줄바꿈) 분리 + 정규화 (NFKC · 소문자 · 괄호/따옴표/# 제거 · 공백 제거)
+                    → "허리 통증" / "허리통증" / "#허리통증" 이 같은 키워드
+  build_postings  : (keyword, kcd_code) 별 patient_count 합 (양방/한방 · 입원/외래 행 합산)
+  index_records   : symptom_keyword_index 레코드 (키워드 1행 = posting list 배열)
+  SymptomIndex    : CSR 배열(offsets / code id / weight) 메모리 색인.
+                    save / load 는 gzip JSON 로컬 파일, match 는 posting list 병합
+
+사용처: upload_disease_stats (disease_stats 업로드 후 역색인 생성 · 업로드 · 로컬 파일 저장)
+────────────────────────────────────────────────────────────────────
+"""
+
+import gzip
+import json
+import re
+import unicodedata
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+SEPARATORS   = r'[,，、/·;|\n]+'
+STRIP_CHARS  = r'[\s()\[\]{}"\'#`]+'
+FILE_VERSION = 1
+_SPLIT = re.compile(SEPARATORS)
+_STRIP = re.compile(STRIP_CHARS)
+
+
+# ── 토큰화 · 정규화 ────────────────────────────────────────────
+def tokenize(texts: pd.Series) -> pd.Series:
+    """키워드 텍스트 Series → 정규화 키워드 Series (원래 행 인덱스 유지, 행당 여러 개)"""
+    s = texts.dropna().astype(str).str.normalize("NFKC").str.lower()
+    tokens = s.str.split(SEPARATORS, regex=True).explode()
+    tokens = tokens.str.replace(STRIP_CHARS, "", regex=True)
+    return tokens[tokens.notna() & (tokens != "")]
+
+
+def normalize_query(query) -> list[str]:
+    """검색어(문자열 또는 목록) → 중복 없는 정규화 키워드 목록 (입력 순서 유지).
+    tokenize 와 같은 규칙 — 질의는 짧으므로 pandas 대신 re 로 처리"""
+    parts = [query] if isinstance(query, str) else list(query)
+    out = []
+    for text in parts:
+        text = unicodedata.normalize("NFKC", str(text)).lower()
+        out += [_STRIP.sub("", t) for t in _SPLIT.split(text)]
+    return [t for t in dict.fromkeys(out) if t]
+
+
+def build_postings(df: pd.DataFrame) -> pd.DataFrame:
+    """disease_stats 프레임 → (keyword, kcd_code, weight) — keyword 순, 같은 keyword 안은 weight 내림차순"""
+    tokens = tokenize(df["symptom_keywords"]).rename("keyword")
+    counts = pd.to_numeric(df["patient_count"], errors="coerce").fillna(0).astype(np.int64)
+    pairs = pd.DataFrame({
+        "row": tokens.index,
+        "keyword": tokens,
+        "kcd_code": df["kcd_code"].reindex(tokens.index),
+        "weight": counts.reindex(tokens.index),
+    }).dropna(subset=["kcd_code"])
+    # 한 행에 같은 키워드가 두 번 적힌 경우는 1번만 (행 단위 중복 제거 후 합산)
+    pairs = pairs.drop_duplicates(["row", "keyword"]).drop(columns="row")
+    out = pairs.groupby(["keyword", "kcd_code"], sort=False, as_index=False)["weight"].sum()
+    return out.sort_values(["keyword", "weight", "kcd_code"],
+                           ascending=[True, False, True], ignore_index=True)
+
+
+def index_records(postings: pd.DataFrame) -> list[dict]:
+    """symptom_keyword_index 레코드: keyword, kcd_codes[], weights[], code_count, total_weight"""
+    g = postings.groupby("keyword", sort=True)
+    codes = g["kcd_code"].agg(list)
+    weights = g["weight"].agg(list)
+    return [
+        {
+            "keyword": kw,
+            "kcd_codes": codes[kw],
+            "weights": [int(w) for w in weights[kw]],
+            "code_count": len(codes[kw]),
+            "total_weight": int(sum(weights[kw])),
+        }
+        for kw in codes.index
+    ]
+
+
+# ── 메모리 색인 ────────────────────────────────────────────────
+class SymptomIndex:
+    """CSR 역색인: keywords[i] 의 posting = codes[code_ids[offsets[i]:offsets[i+1]]]"""
+
+    def __init__(self, keywords: list[str], offsets, code_ids, weights, codes: list[str]):
+        self.keywords = list(keywords)
+        self.offsets  = np.asarray(offsets, dtype=np.int64)
+        self.code_ids = np.asarray(code_ids, dtype=np.int32)
+        self.weights  = np.asarray(weights, dtype=np.int64)
+        self.codes    = np.asarray(codes, dtype=object)
+        self._pos = {kw: i for i, kw in enumerate(self.keywords)}
+
+    @classmethod
+    def from_postings(cls, postings: pd.DataFrame) -> "SymptomIndex":
+        codes = sorted(postings["kcd_code"].unique())
+        code_ids = pd.Index(codes).get_indexer(postings["kcd_code"])
+        keywords, starts = np.unique(postings["keyword"].to_numpy(dtype=str), return_index=True)
+        offsets = np.append(starts, len(postings))
+        return cls(keywords.tolist(), offsets, code_ids, postings["weight"].to_numpy(), codes)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "SymptomIndex":
+        return cls.from_postings(build_postings(df))
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    # ── 로컬 파일 (gzip JSON, 코드는 사전 번호로 저장) ──────────
+    def save(self, path: Path) -> Path:
+        payload = {
+            "version": FILE_VERSION,
+            "codes": self.codes.tolist(),
+            "keywords": self.keywords,
+            "offsets": self.offsets.tolist(),
+            "code_ids": self.code_ids.tolist(),
+            "weights": self.weights.tolist(),
+        }
+        path = Path(path)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+        tmp.replace(path)
+        return path
+
+    @classmethod
+    def load(cls, path: Path) -> "SymptomIndex":
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            d = json.load(f)
+        if d.get("version") != FILE_VERSION:
+            raise ValueError(f"지원하지 않는 색인 파일 버전: {d.get('version')}")
+        return cls(d["keywords"], d["offsets"], d["code_ids"], d["weights"], d["codes"])
+
+    # ── 조회 ───────────────────────────────────────────────────
+    def postings(self, keyword: str) -> list[tuple[str, int]]:
+        """정규화된 키워드 1개 → [(kcd_code, weight)] (weight 내림차순)"""
+        i = self._pos.get(keyword)
+        if i is None:
+            return []
+        sl = slice(self.offsets[i], self.offsets[i + 1])
+        return list(zip(self.codes[self.code_ids[sl]], self.weights[sl].tolist()))
+
+    def match(self, query, limit: int = 20) -> list[dict]:
+        """증상 검색어 → 질병 후보. 일치 키워드 수 내림차순, 같으면 patient_count 합 내림차순"""
+        rows = [self._pos[kw] for kw in normalize_query(query) if kw in self._pos]
+        if not rows:
+            return []
+        idx = np.concatenate([np.arange(self.offsets[i], self.offsets[i + 1]) for i in rows])
+        ids = self.code_ids[idx]
+        n = len(self.codes)
+        hits = np.bincount(ids, minlength=n)
+        score = np.bincount(ids, weights=self.weights[idx], minlength=n)
+        cand = np.flatnonzero(hits)
+        # 정렬 키: 일치 수 ↓, 점수 ↓, 코드 ↑ (코드 id 는 코드 정렬 순서)
+        order = cand[np.lexsort((cand, -score[cand], -hits[cand]))][:limit]
+        return [
+            {"kcd_code": self.codes[c], "matched": int(hits[c]), "score": int(score[c])}
+            for c in order
+        ]
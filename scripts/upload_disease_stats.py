@@ -6,8 +6,14 @@
 Upsert: kcd_code + medical_type + visit_type 조합 기준
 배치 : 500건씩
 
+증상 키워드 역색인 (symptom_index.py):
+  symptom_keywords 를 토큰화·정규화해 keyword → kcd_code posting list 생성
+  → symptom_keyword_index 테이블 (row_hash 비교로 변경 키워드만 upsert, 사라진 키워드 삭제)
+  → scripts/symptom_index.json.gz (로컬 조회용 gzip JSON)
+
 사전 준비:
   Supabase Dashboard → SQL Editor → supabase/disease_stats.sql 실행
+                                   → supabase/symptom_keyword_index.sql 실행 (역색인 업로드 시)
 
 실행:
   python3 scripts/upload_disease_stats.py
@@ -22,6 +28,9 @@ import pandas as pd
 from dotenv import load_dotenv
 from supabase import create_client, Client
 
+from delta_sync import delete_keys, fetch_hash_map, plan_delta
+from symptom_index import SymptomIndex, build_postings, index_records
+
 # ── 환경변수 로드 ──────────────────────────────────────────────
 BASE_DIR = Path(__file__).resolve().parent.parent
 load_dotenv(BASE_DIR / ".env.local")
@@ -39,6 +48,8 @@ supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
 CSV_PATH   = Path(__file__).resolve().parent / "질병통계외래.입원.한방.csv"
 TABLE_NAME = "disease_stats"
 BATCH_SIZE = 500
+INDEX_TABLE = "symptom_keyword_index"
+INDEX_PATH  = Path(__file__).resolve().parent / "symptom_index.json.gz"
 
 # 정수형으로 변환할 컬럼
 INT_COLS = ["patient_count", "visit_days", "claim_count",
@@ -135,6 +146,40 @@ def upload_batch(records: list[dict], batch_no: int, total_batches: int) -> tupl
         return success, fail
 
 
+def upload_symptom_index(df: pd.DataFrame) -> None:
+    """symptom_keywords 역색인 생성 → 로컬 파일 저장 + symptom_keyword_index 동기화"""
+    postings = build_postings(df)
+    index = SymptomIndex.from_postings(postings)
+    index.save(INDEX_PATH)
+    print(f"  키워드 {len(index):,}개 | posting {len(postings):,}건"
+          f" → {INDEX_PATH.name} ({INDEX_PATH.stat().st_size / 1024:,.1f} KB)")
+
+    try:
+        existing = fetch_hash_map(supabase, INDEX_TABLE, "keyword")
+    except Exception as e:
+        print(f"  ⚠️  {INDEX_TABLE} 접근 실패 — 로컬 파일만 저장: {e}")
+        print("     supabase/symptom_keyword_index.sql 을 먼저 실행하세요.")
+        return
+    records, removed, unchanged = plan_delta(index_records(postings), "keyword", existing)
+    print(f"  기존 {len(existing):,}개 | 변경/신규 {len(records):,}개"
+          f" | 동일 {unchanged:,}개 | 사라진 키워드 {len(removed):,}개")
+
+    ok = 0
+    for i in range(0, len(records), BATCH_SIZE):
+        chunk = records[i : i + BATCH_SIZE]
+        try:
+            supabase.table(INDEX_TABLE).upsert(chunk, on_conflict="keyword").execute()
+            ok += len(chunk)
+        except Exception as e:
+            print(f"  ❌ 역색인 배치 {i // BATCH_SIZE + 1} 오류: {e}")
+    if removed:
+        try:
+            delete_keys(supabase, INDEX_TABLE, "keyword", removed)
+        except Exception as e:
+            print(f"  ❌ 삭제 오류: {e}")
+    print(f"  ✅ {INDEX_TABLE}: {ok:,}개 upsert / {len(removed):,}개 삭제")
+
+
 def main():
     if not CSV_PATH.exists():
         print(f"❌ 파일 없음: {CSV_PATH}")
@@ -175,6 +220,10 @@ def main():
     if grand_fail > 0:
         print(f"⚠️  {grand_fail}건 실패 — 위 오류 메시지를 확인하세요.")
 
+    # ── 증상 키워드 역색인 ────────────────────────────────────
+    print(f"\n🔎 증상 키워드 역색인 생성 ({INDEX_TABLE})")
+    upload_symptom_index(df)
+
 
 if __name__ == "__main__":
     main()
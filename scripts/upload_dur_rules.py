@@ -4,29 +4,51 @@ DUR 규칙 CSV → Supabase dur_rules 테이블 업로드
 - scripts/ 폴더의 모든 UTF-8 CSV를 순회
 - 파일명(확장자 제외) → dur_type 자동 할당
 - 카테고리별 detail 컬럼 → restriction_reason 통합
+- 연령 조건(값/단위/조건 TEXT) → 개월 구간 타입 컬럼 (age_min_months …), 해석 불가 값은 파일별 보고
 - 1,000건 배치 upsert (item_seq + dur_type 기준)
 - 실행 시 테이블의 실제 컬럼을 자동 조회 → 없는 컬럼은 필터링
+- --delta: row_hash 비교로 신규·변경 행만 upsert (--prune: 사라진 행 삭제)
+- --parallel: 파일 읽기·변환은 프로세스 풀(--workers, dur_records.transform_file_to_queue — 배치 단위로 전달),
+  업로드는 모든 파일이 공유하는 동시 요청 수 제한 큐(--upload-concurrency)로 처리. 파일별·전체 처리량 출력
+- --incremental: 매니페스트(scripts/.dur_manifest.json — 파일 내용 해시 + 행 키·row_hash)와 비교해
+  바뀐 파일의 dur_type만 다시 읽고, 신규·변경 행 upsert + 파일에서 사라진 행 삭제
+- --sqlite PATH: 같은 CSV로 로컬 SQLite 스냅샷도 생성 (dur_snapshot.py — 인덱스·FTS5 검색·배포판 비교)
 
 사전 준비:
   pip install pandas supabase python-dotenv
 
 실행:
   python3 scripts/upload_dur_rules.py
+  python3 scripts/upload_dur_rules.py --delta [--prune]
+  python3 scripts/upload_dur_rules.py --parallel [--workers 4] [--upload-concurrency 4]
+  python3 scripts/upload_dur_rules.py --incremental
+  python3 scripts/upload_dur_rules.py --sqlite scripts/dur_rules.sqlite
 """
 
+import argparse
+import multiprocessing as mp
 import os
-import re
 import math
+import queue
 import sys
-import unicodedata
+import threading
+import time
 import urllib.request
 import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
-import pandas as pd
 from dotenv import load_dotenv
 from supabase import create_client, Client
 
+from delta_sync import HASH_COL, delete_keys, fetch_hash_map, plan_delta, row_hash
+from age_intervals import AGE_INTERVAL_COLS
+from dur_records import (age_failure_summary, build_record_batches, build_records, get_dur_type,
+                         init_transform_worker, read_csv_safe, transform_file_to_queue)
+from dur_manifest import (MANIFEST_PATH, group_rows, has_group, load_manifest, plan_incremental,
+                          save_manifest)
+from dur_snapshot import build_snapshot
+
 # ── 환경변수 로드 ──────────────────────────────────────────────
 BASE_DIR = Path(__file__).resolve().parent.parent
 load_dotenv(BASE_DIR / ".env.local")
@@ -34,16 +56,22 @@ load_dotenv(BASE_DIR / ".env.local")
 SUPABASE_URL = os.environ.get("NEXT_PUBLIC_SUPABASE_URL", "")
 SUPABASE_KEY = os.environ.get("SUPABASE_SERVICE_ROLE_KEY", "")
 
-if not SUPABASE_URL or not SUPABASE_KEY:
+if __name__ == "__mp_main__":
+    # --parallel spawn 워커는 이 파일을 __mp_main__ 으로 다시 실행한다 — 변환만 하므로 접속 준비 생략
+    supabase = None
+elif not SUPABASE_URL or not SUPABASE_KEY:
     print("❌ .env.local 에서 NEXT_PUBLIC_SUPABASE_URL / SUPABASE_SERVICE_ROLE_KEY 를 찾을 수 없습니다.")
     sys.exit(1)
-
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+else:
+    supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
 
 # ── 설정 ───────────────────────────────────────────────────────
 SCRIPTS_DIR  = Path(__file__).resolve().parent
 BATCH_SIZE   = 1000
 TABLE_NAME   = "dur_rules"
+# --parallel 기본값: 변환 프로세스 수 / 동시 업로드 요청 수
+DEFAULT_WORKERS = max(1, min(4, os.cpu_count() or 1))
+DEFAULT_UPLOAD_CONCURRENCY = 4
 
 # ── 전체 컬럼 정의 (업로드하고 싶은 최종 목표 스키마) ──────────
 ALL_TARGET_COLS = {
@@ -51,7 +79,7 @@ ALL_TARGET_COLS = {
     "ingr_code", "company_name", "reimbursement", "notice_no", "notice_date",
     "restriction_reason", "age_limit_value", "age_limit_unit", "age_limit_condition",
     "preg_grade", "max_daily_dose_mg", "max_dosage_days",
-    "therapeutic_group", "group_classification",
+    "therapeutic_group", "group_classification", HASH_COL, *AGE_INTERVAL_COLS,
 }
 
 # ALTER TABLE 구문 템플릿 (컬럼명 → SQL)
@@ -71,6 +99,11 @@ _ALTER_TEMPLATES: dict[str, str] = {
     "therapeutic_group":    "ALTER TABLE dur_rules ADD COLUMN IF NOT EXISTS therapeutic_group    TEXT;",
     "group_classification": "ALTER TABLE dur_rules ADD COLUMN IF NOT EXISTS group_classification TEXT;",
     "updated_at":           "ALTER TABLE dur_rules ADD COLUMN IF NOT EXISTS updated_at           TIMESTAMPTZ DEFAULT NOW();",
+    HASH_COL:               "ALTER TABLE dur_rules ADD COLUMN IF NOT EXISTS row_hash             TEXT;",
+    "age_min_months":       "ALTER TABLE dur_rules ADD COLUMN IF NOT EXISTS age_min_months       NUMERIC;",
+    "age_max_months":       "ALTER TABLE dur_rules ADD COLUMN IF NOT EXISTS age_max_months       NUMERIC;",
+    "age_min_inclusive":    "ALTER TABLE dur_rules ADD COLUMN IF NOT EXISTS age_min_inclusive    BOOLEAN;",
+    "age_max_inclusive":    "ALTER TABLE dur_rules ADD COLUMN IF NOT EXISTS age_max_inclusive    BOOLEAN;",
 }
 _UNIQUE_SQL = (
     "DO $$ BEGIN\n"
@@ -132,118 +165,6 @@ def preflight_check() -> set[str]:
 
     return available
 
-# ── 파일명 → clean dur_type: 키워드 기반 매핑 ─────────────────
-# 파일명 stem에서 핵심 한글 키워드를 추출해 간결한 dur_type 생성
-_KEYWORD_MAP: list[tuple[str, str]] = [
-    ("임부금기",    "임부금기"),
-    ("노인금기",    "노인금기"),
-    ("노인주의",    "노인주의"),
-    ("어린이주의",  "어린이주의"),
-    ("연령금기",    "연령금기"),
-    ("용량주의",    "용량주의"),
-    ("지속기간주의","지속기간주의"),
-    ("효능군중복",  "효능군중복"),
-]
-
-def get_dur_type(stem: str) -> str:
-    """파일명 stem → dur_type (NFC 정규화 후 핵심 키워드 추출)"""
-    # macOS는 파일명을 NFD로 저장하므로 NFC로 변환 후 비교
-    s = unicodedata.normalize("NFC", stem.strip())
-
-    for keyword, label in _KEYWORD_MAP:
-        if keyword in s:
-            suffix = "_DUR" if "DUR" in s else ("2" if "약물2" in s or "2 (" in s or s.endswith("2") else "")
-            return label + suffix
-
-    return re.sub(r"[^\w가-힣]", "_", s).strip("_")[:30]
-
-
-# ── 카테고리별 컬럼 → dur_rules 필드 매핑 ─────────────────────
-# 각 파일의 고유 컬럼을 dur_rules 공통 스키마로 변환
-COLUMN_MAP: dict[str, str] = {
-    # 공통
-    "item_seq":                    "item_seq",
-    "item_name":                   "item_name",
-    "main_ingr_name":              "ingr_name",
-    "main_ingr_name_raw":          "ingr_name_raw",
-    "ingr_code":                   "ingr_code",
-    "company_name":                "company_name",
-    "reimbursement":               "reimbursement",
-    "notice_no":                   "notice_no",
-    "notice_date":                 "notice_date",
-
-    # 상세 사유 (카테고리마다 이름이 달라 restriction_reason으로 통합)
-    "age_contraindication_detail": "restriction_reason",
-    "prohibited_detail":           "restriction_reason",
-    "caution_detail":              "restriction_reason",
-    "child_caution_detail":        "restriction_reason",
-    "preg_contraindication_detail":"restriction_reason",
-    "max_daily_dose_desc":         "restriction_reason",  # 용량주의 — 설명을 reason으로
-
-    # 연령 관련
-    "age_limit_value":             "age_limit_value",
-    "age_limit_unit":              "age_limit_unit",
-    "age_limit_condition":         "age_limit_condition",
-
-    # 임부금기 등급
-    "preg_contraindication_grade": "preg_grade",
-
-    # 용량주의 수치
-    "max_daily_dose_mg":           "max_daily_dose_mg",
-
-    # 지속기간주의
-    "max_dosage_days":             "max_dosage_days",
-
-    # 효능군 중복
-    "therapeutic_group":           "therapeutic_group",
-    "group_classification":        "group_classification",
-}
-
-
-def read_csv_safe(path: Path) -> pd.DataFrame:
-    """UTF-8 → CP949 순으로 fallback 하여 CSV 읽기"""
-    for enc in ("utf-8", "cp949", "euc-kr"):
-        try:
-            df = pd.read_csv(path, dtype=str, encoding=enc, keep_default_na=False)
-            return df
-        except (UnicodeDecodeError, LookupError):
-            continue
-    raise ValueError(f"지원하는 인코딩으로 읽을 수 없음: {path.name}")
-
-
-def build_records(df: pd.DataFrame, dur_type: str, allowed_cols: set[str]) -> list[dict]:
-    """DataFrame → dur_rules 레코드 리스트 변환 (allowed_cols에 있는 컬럼만 포함)"""
-    records = []
-
-    for _, row in df.iterrows():
-        rec: dict = {"dur_type": dur_type}
-
-        # restriction_reason 충돌 방지: 여러 detail 컬럼이 있을 경우 앞쪽 우선
-        reason_set = False
-
-        for csv_col, db_col in COLUMN_MAP.items():
-            if csv_col not in df.columns:
-                continue
-            if db_col not in allowed_cols:  # 테이블에 없는 컬럼은 건너뜀
-                continue
-            val = row[csv_col].strip() if isinstance(row[csv_col], str) else ""
-            if not val:
-                continue
-
-            if db_col == "restriction_reason":
-                if not reason_set:
-                    rec["restriction_reason"] = val
-                    reason_set = True
-            else:
-                rec[db_col] = val
-
-        # item_seq 없으면 스킵
-        if not rec.get("item_seq"):
-            continue
-
-        records.append(rec)
-
-    return records
 
 
 def check_unique_constraint() -> bool:
@@ -283,8 +204,20 @@ def upload_batch(records: list[dict], use_upsert: bool = True) -> int:
     return len(resp.data) if resp.data else len(records)
 
 
-def process_file(path: Path, allowed_cols: set[str], use_upsert: bool) -> tuple[int, int]:
-    """단일 CSV 처리 → (시도 건수, 성공 건수) 반환"""
+def print_age_failures(n: int, examples: list[str], prefix: str = "  "):
+    if n:
+        print(f"{prefix}⚠️  연령 조건 해석 불가 {n:,}건 (개월 구간 비움) — 예: "
+              + ", ".join(f"'{e}'" for e in examples))
+
+
+def process_file(path: Path, allowed_cols: set[str], use_upsert: bool,
+                 delta: bool = False, prune: bool = False) -> tuple[int, int]:
+    """단일 CSV 처리 → (시도 건수, 성공 건수) 반환
+
+    delta=True : 같은 dur_type의 기존 item_seq → row_hash 맵과 비교해
+                 신규·변경 레코드만 업로드 (시도 건수도 변경분 기준)
+    prune=True : 이 파일에서 사라진 item_seq 행 삭제 (delta 전용)
+    """
     stem = path.stem
     dur_type = get_dur_type(stem)
 
@@ -294,28 +227,268 @@ def process_file(path: Path, allowed_cols: set[str], use_upsert: bool) -> tuple[
         print(f"  ❌ 읽기 실패: {e}")
         return 0, 0
 
-    records = build_records(df, dur_type, allowed_cols)
-    total = len(records)
+    total, batches = build_record_batches(df, dur_type, allowed_cols)
     if total == 0:
         print(f"  ⚠️  유효 레코드 없음 — 건너뜀")
         return 0, 0
-
-    batches = math.ceil(total / BATCH_SIZE)
+    print_age_failures(*age_failure_summary(df))
+
+    if delta:
+        records = [rec for batch in batches for rec in batch]
+        existing = fetch_hash_map(supabase, TABLE_NAME, "item_seq", {"dur_type": dur_type})
+        records, removed, unchanged = plan_delta(records, "item_seq", existing)
+        total = len(records)
+        print(f"  기존 {len(existing):,}건 | 변경/신규 {total:,}건"
+              f" | 동일 {unchanged:,}건 | 파일에서 사라짐 {len(removed):,}건")
+        if prune and removed:
+            try:
+                n = delete_keys(supabase, TABLE_NAME, "item_seq", removed, {"dur_type": dur_type})
+                print(f"  🗑  {n:,}건 삭제")
+            except Exception as e:
+                print(f"  ❌ 삭제 오류: {e}")
+        batches = (records[i : i + BATCH_SIZE] for i in range(0, total, BATCH_SIZE))
+
+    n_batches = math.ceil(total / BATCH_SIZE)
     uploaded = 0
 
-    for i in range(batches):
-        chunk = records[i * BATCH_SIZE : (i + 1) * BATCH_SIZE]
+    for i, chunk in enumerate(batches):
         try:
             n = upload_batch(chunk, use_upsert=use_upsert)
             uploaded += n
-            print(f"  배치 {i+1}/{batches}  {uploaded:,}/{total:,}건 완료")
+            print(f"  배치 {i+1}/{n_batches}  {uploaded:,}/{total:,}건 완료")
         except Exception as e:
             print(f"  ❌ 배치 {i+1} 업로드 오류: {e}")
 
     return total, uploaded
 
 
+# ── --parallel: 파일별 변환(프로세스 풀) + 공유 업로드 큐 ──────
+def run_parallel(csv_files: list[Path], allowed_cols: set[str], use_upsert: bool,
+                 delta: bool, prune_types: set[str], workers: int, concurrency: int) -> tuple[int, int]:
+    """변환 워커가 만드는 배치를 바로 공유 업로드 큐에 넣음 → (시도 건수, 성공 건수)
+
+    워커(dur_records.transform_file_to_queue)는 배치를 만드는 대로 결과 큐로 보내므로
+    파일 전체 레코드가 한 번에 부모로 넘어오지 않는다. 결과 큐 · 대기 배치는 concurrency × 2 로 제한,
+    업로드 동시 요청 수는 concurrency. --delta 는 기존 row_hash 와 비교해야 해서 파일 단위로 모은다.
+    (item_seq, dur_type) 충돌 키가 파일마다 달라 순서와 관계없이 결과가 같다.
+    """
+    wall0 = time.perf_counter()
+    lock = threading.Lock()
+    slots = threading.BoundedSemaphore(concurrency * 2)
+    stats: dict[str, dict] = {}
+    held: dict[str, list[dict]] = {}  # --delta: 파일별로 모으는 레코드
+    pending = []
+
+    def upload_one(st: dict, n_batch: int, chunk: list[dict]):
+        try:
+            n = upload_batch(chunk, use_upsert=use_upsert)
+        except Exception as e:
+            n = 0
+            print(f"  ❌ {st['name']} 배치 {n_batch} 업로드 오류: {e}")
+        finally:
+            slots.release()
+        with lock:
+            st["uploaded"] += n
+            st["done"] = time.perf_counter()
+
+    def enqueue(st: dict, chunk: list[dict]):
+        slots.acquire()  # 대기 배치 수 제한 (메모리 상한)
+        st["n_batches"] += 1
+        pending.append(uploads.submit(upload_one, st, st["n_batches"], chunk))
+
+    def file_stats(name: str) -> dict:
+        if name not in stats:
+            stats[name] = {"name": name, "dur_type": get_dur_type(Path(name).stem), "total": 0,
+                           "uploaded": 0, "transform_sec": 0.0, "start": time.perf_counter(),
+                           "done": None, "n_batches": 0}
+        return stats[name]
+
+    # spawn: 업로드 스레드가 떠 있는 상태에서 fork 하지 않도록
+    ctx = mp.get_context("spawn")
+    out_q = ctx.Queue(maxsize=concurrency * 2)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx,
+                             initializer=init_transform_worker, initargs=(out_q,)) as pool, \
+            ThreadPoolExecutor(max_workers=concurrency) as uploads:
+        futures = {pool.submit(transform_file_to_queue, str(p), allowed_cols, BATCH_SIZE): str(p)
+                   for p in csv_files}
+        remaining = set(futures.values())
+        while remaining:
+            try:
+                path, kind, payload = out_q.get(timeout=0.5)
+            except queue.Empty:
+                # 정상 종료한 워커는 done/error 를 반드시 보냈으므로, 예외로 끝난 파일만 정리
+                for fut, path in futures.items():
+                    if path in remaining and fut.done() and fut.exception():
+                        print(f"  ❌ {Path(path).name}: {fut.exception()}")
+                        remaining.discard(path)
+                continue
+            name = Path(path).name
+            if kind == "batch":
+                st = file_stats(name)
+                if delta:
+                    held.setdefault(name, []).extend(payload)
+                else:
+                    st["total"] += len(payload)
+                    enqueue(st, payload)
+                continue
+            remaining.discard(path)
+            if kind == "error":
+                print(f"  ❌ {name}: {payload}")
+                continue
+            st = file_stats(name)
+            st["transform_sec"] = payload["transform_sec"]
+            dur_type = payload["dur_type"]
+            records = held.pop(name, [])
+            if delta and records:
+                existing = fetch_hash_map(supabase, TABLE_NAME, "item_seq", {"dur_type": dur_type})
+                records, removed, unchanged = plan_delta(records, "item_seq", existing)
+                st["total"] = len(records)
+                print(f"  {name}: 기존 {len(existing):,}건 | 변경/신규 {len(records):,}건"
+                      f" | 동일 {unchanged:,}건 | 파일에서 사라짐 {len(removed):,}건")
+                if dur_type in prune_types and removed:
+                    try:
+                        n = delete_keys(supabase, TABLE_NAME, "item_seq", removed, {"dur_type": dur_type})
+                        print(f"  🗑  {name}: {n:,}건 삭제")
+                    except Exception as e:
+                        print(f"  ❌ {name} 삭제 오류: {e}")
+                for i in range(0, len(records), BATCH_SIZE):
+                    enqueue(st, records[i : i + BATCH_SIZE])
+            print(f"  📄 {name} ({dur_type}): {st['total']:,}건 변환 완료 ({payload['transform_sec']:.1f}초)")
+            print_age_failures(*payload["age_failures"], prefix=f"     {name}: ")
+        for f in pending:
+            f.result()
+
+    wall = time.perf_counter() - wall0
+    print(f"\n{'파일':<40}{'건수':>9}{'성공':>9}{'변환 초':>9}{'업로드 초':>10}{'rows/s':>9}")
+    print("─" * 86)
+    grand_total = grand_uploaded = 0
+    for st in stats.values():
+        up_sec = (st["done"] - st["start"]) if st["done"] else 0.0
+        rps = st["uploaded"] / up_sec if up_sec else 0.0
+        print(f"{st['name'][:38]:<40}{st['total']:>9,}{st['uploaded']:>9,}"
+              f"{st['transform_sec']:>9.2f}{up_sec:>10.2f}{rps:>9,.0f}")
+        grand_total += st["total"]
+        grand_uploaded += st["uploaded"]
+    print("─" * 86)
+    print(f"{'전체 (경과 ' + format(wall, '.1f') + '초)':<40}{grand_total:>9,}{grand_uploaded:>9,}"
+          f"{'':>19}{grand_uploaded / wall if wall else 0:>9,.0f}")
+    return grand_total, grand_uploaded
+
+
+# ── --incremental: 매니페스트 기준 파일·행 단위 증분 ───────────
+def run_incremental(csv_files: list[Path], allowed_cols: set[str], use_upsert: bool,
+                    prune: bool, manifest_path: Path = MANIFEST_PATH) -> tuple[int, int]:
+    """바뀐 파일이 속한 dur_type 묶음만 처리 → (시도 건수, 성공 건수)
+
+    묶음의 이전 행(item_seq → row_hash)은 매니페스트에서 가져와 plan_delta 로 비교하므로
+    Supabase 조회 없이 신규·변경 행만 upsert 하고, 묶음에서 사라진 행은 삭제한다.
+    매니페스트에 기록이 없는 묶음(첫 실행)은 테이블의 row_hash 맵으로 비교하고,
+    그 행들은 다른 경로로 적재됐을 수 있어 prune=True 일 때만 삭제한다.
+    묶음이 오류 없이 끝났을 때만 매니페스트를 갱신해 실패한 묶음은 다음 실행에서 다시 처리된다.
+    """
+    manifest, reason = load_manifest(manifest_path, allowed_cols)
+    if reason:
+        print(f"⚠️  매니페스트 무시: {reason} — 모든 파일을 새로 비교합니다.")
+    plan = plan_incremental(csv_files, manifest)
+    print(f"📋 매니페스트: 변경 없음 {len(plan['unchanged'])}개 · 새로·변경 {len(plan['changed'])}개"
+          f" · 사라진 파일 {len(plan['removed'])}개 → 다시 처리할 dur_type {len(plan['groups'])}개")
+    for name in plan["unchanged"]:
+        print(f"  ⏭  {name}")
+
+    grand_total = grand_uploaded = 0
+    for dur_type, files in plan["groups"].items():
+        print(f"\n📦 {dur_type}: {', '.join(p.name for p in files) or '(파일 없음)'}")
+        ok = True
+        records: list[dict] = []
+        file_rows: dict[str, dict] = {}
+        for p in files:
+            try:
+                df = read_csv_safe(p)
+            except Exception as e:
+                print(f"  ❌ {p.name} 읽기 실패: {e}")
+                ok = False
+                break
+            recs = build_records(df, dur_type, allowed_cols)
+            print_age_failures(*age_failure_summary(df), prefix=f"  {p.name}: ")
+            file_rows[p.name] = {r["item_seq"]: row_hash(r) for r in recs}
+            records += recs
+        if not ok:
+            print("  ⚠️  이 dur_type은 건너뜀 (매니페스트 유지)")
+            continue
+
+        seeded = not has_group(manifest, dur_type)
+        if not seeded:
+            existing = group_rows(manifest, dur_type)
+        elif HASH_COL in allowed_cols:
+            existing = fetch_hash_map(supabase, TABLE_NAME, "item_seq", {"dur_type": dur_type})
+        else:
+            existing = {}
+        changed, removed, unchanged = plan_delta(records, "item_seq", existing)
+        if HASH_COL not in allowed_cols:
+            changed = [{k: v for k, v in r.items() if k != HASH_COL} for r in changed]
+        print(f"  {'테이블' if seeded else '매니페스트'} {len(existing):,}건 | 변경/신규 {len(changed):,}건"
+              f" | 동일 {unchanged:,}건 | 사라짐 {len(removed):,}건")
+
+        if removed and (prune or not seeded):
+            try:
+                n = delete_keys(supabase, TABLE_NAME, "item_seq", removed, {"dur_type": dur_type})
+                print(f"  🗑  {n:,}건 삭제")
+            except Exception as e:
+                print(f"  ❌ 삭제 오류: {e}")
+                ok = False
+        elif removed:
+            print("  ⚠️  첫 실행이라 테이블에만 있는 행은 삭제하지 않음 (--prune 으로 삭제)")
+
+        uploaded = 0
+        n_batches = math.ceil(len(changed) / BATCH_SIZE)
+        for i in range(0, len(changed), BATCH_SIZE):
+            try:
+                uploaded += upload_batch(changed[i : i + BATCH_SIZE], use_upsert=use_upsert)
+                print(f"  배치 {i // BATCH_SIZE + 1}/{n_batches}  {uploaded:,}/{len(changed):,}건 완료")
+            except Exception as e:
+                print(f"  ❌ 배치 {i // BATCH_SIZE + 1} 업로드 오류: {e}")
+                ok = False
+        grand_total += len(changed)
+        grand_uploaded += uploaded
+
+        if not ok:
+            print("  ⚠️  오류가 있어 매니페스트를 갱신하지 않음 — 다음 실행에서 다시 처리")
+            continue
+        for name in [n for n, e in manifest["files"].items() if e.get("dur_type") == dur_type]:
+            del manifest["files"][name]
+        for p in files:
+            manifest["files"][p.name] = {"sha": plan["shas"][p.name], "dur_type": dur_type,
+                                         "rows": file_rows[p.name]}
+        save_manifest(manifest, manifest_path)
+
+    if not plan["groups"]:
+        print("\n✅ 바뀐 파일 없음 — 업로드할 행이 없습니다.")
+    return grand_total, grand_uploaded
+
+
 def main():
+    ap = argparse.ArgumentParser(description="DUR 규칙 CSV → Supabase dur_rules 업로드")
+    ap.add_argument("--delta", action="store_true",
+                    help="row_hash 비교로 신규·변경 행만 upsert")
+    ap.add_argument("--prune", action="store_true",
+                    help="--delta 와 함께: CSV에서 사라진 (item_seq, dur_type) 행 삭제 "
+                         "(--incremental: 매니페스트 기록이 없는 첫 실행에도 삭제)")
+    ap.add_argument("--parallel", action="store_true",
+                    help="파일 변환은 프로세스 풀, 업로드는 공유 큐로 동시 처리")
+    ap.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                    help=f"--parallel 변환 프로세스 수 (기본 {DEFAULT_WORKERS})")
+    ap.add_argument("--upload-concurrency", type=int, default=DEFAULT_UPLOAD_CONCURRENCY,
+                    help=f"--parallel 동시 업로드 요청 수 (기본 {DEFAULT_UPLOAD_CONCURRENCY})")
+    ap.add_argument("--incremental", action="store_true",
+                    help="매니페스트 기준: 바뀐 파일의 신규·변경 행만 upsert, 사라진 행 삭제")
+    ap.add_argument("--sqlite", type=Path, metavar="PATH",
+                    help="업로드 후 전체 DUR 규칙 SQLite 스냅샷 저장 (dur_snapshot.py)")
+    args = ap.parse_args()
+    if args.prune and not (args.delta or args.incremental):
+        ap.error("--prune 은 --delta 또는 --incremental 과 함께 사용해야 합니다.")
+    if args.incremental and (args.delta or args.parallel):
+        ap.error("--incremental 은 --delta / --parallel 과 함께 사용할 수 없습니다.")
+
     csv_files = sorted(
         p for p in SCRIPTS_DIR.glob("*.csv")
         if not p.name.endswith(".bak")
@@ -345,18 +518,51 @@ def main():
         print("     아래 SQL을 Supabase SQL Editor에서 실행 후 재업로드하면 안전합니다:")
         print(f"\n   {_UNIQUE_SQL}\n")
 
+    delta = args.delta
+    if delta and (not use_upsert or HASH_COL not in allowed_cols):
+        print(f"⚠️  --delta 사용 불가 (UNIQUE 제약 또는 {HASH_COL} 컬럼 없음) — 전체 업로드로 진행합니다.\n")
+        delta = False
+
+    incremental = args.incremental
+    if incremental and not use_upsert:
+        print("⚠️  --incremental 사용 불가 (UNIQUE 제약 없음) — 전체 업로드로 진행합니다.\n")
+        incremental = False
+
+    # 같은 dur_type을 공유하는 파일끼리는 서로의 행을 지우지 않도록 prune 제외
+    type_counts: dict[str, int] = {}
+    for p in csv_files:
+        t = get_dur_type(p.stem)
+        type_counts[t] = type_counts.get(t, 0) + 1
+
     print(f"대상 파일: {len(csv_files)}개\n{'='*60}")
 
     grand_total = 0
     grand_uploaded = 0
 
+    if args.parallel:
+        prune_types = {t for t, c in type_counts.items() if c == 1} if delta and args.prune else set()
+        if delta and args.prune and len(prune_types) < len(type_counts):
+            print("   ⚠️  dur_type을 공유하는 파일은 prune 건너뜀")
+        print(f"⚡ 병렬 모드: 변환 프로세스 {max(1, args.workers)}개, "
+              f"동시 업로드 {max(1, args.upload_concurrency)}건\n")
+        grand_total, grand_uploaded = run_parallel(
+            csv_files, allowed_cols, use_upsert, delta, prune_types,
+            max(1, args.workers), max(1, args.upload_concurrency))
+        csv_files = []
+    elif incremental:
+        grand_total, grand_uploaded = run_incremental(csv_files, allowed_cols, use_upsert, args.prune, MANIFEST_PATH)
+        csv_files = []
+
     for path in csv_files:
         stem = path.stem
         dur_type = get_dur_type(stem)
         print(f"\n📄 {path.name}")
         print(f"   dur_type: {dur_type}")
 
-        total, uploaded = process_file(path, allowed_cols, use_upsert)
+        prune = delta and args.prune and type_counts[dur_type] == 1
+        if delta and args.prune and not prune:
+            print("   ⚠️  dur_type을 공유하는 파일이 있어 prune 건너뜀")
+        total, uploaded = process_file(path, allowed_cols, use_upsert, delta, prune)
         grand_total    += total
         grand_uploaded += uploaded
 
@@ -364,11 +570,20 @@ def main():
         print(f"   {status} {uploaded:,} / {total:,}건 업로드")
 
     print(f"\n{'='*60}")
-    print(f"[전체 완료]  파일: {len(csv_files)}개")
+    print(f"[전체 완료]  파일: {sum(type_counts.values())}개")
     print(f"  시도: {grand_total:,}건  /  성공: {grand_uploaded:,}건")
     if grand_total > grand_uploaded:
         print(f"  ⚠️  실패: {grand_total - grand_uploaded:,}건 — 위 오류 메시지를 확인하세요.")
 
+    if args.sqlite:
+        all_files = sorted(p for p in SCRIPTS_DIR.glob("*.csv") if not p.name.endswith(".bak"))
+        t0 = time.perf_counter()
+        try:
+            n = build_snapshot(all_files, args.sqlite)
+            print(f"\n💾 SQLite 스냅샷: {n:,}건 ({time.perf_counter() - t0:.1f}초) → {args.sqlite}")
+        except Exception as e:
+            print(f"\n❌ SQLite 스냅샷 생성 실패: {e}")
+
 
 if __name__ == "__main__":
     main()
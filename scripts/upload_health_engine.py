@@ -2,21 +2,33 @@
 닥터 도슨 신체 컨디션 모니터링 엔진 — 데이터 처리 & Supabase 업로드
 ====================================================================
 처리 대상:
-  1. cleaned_checkup_data_2024.csv     → health_benchmarks
+  1. cleaned_checkup_data_<연도>.csv   → health_benchmarks
+                                         + health_benchmark_quantiles (같은 1회 읽기, 연도별 행)
   2. 국립암센터_암발생 통계 정보.csv     → cancer_incidence_reference
   3. 국립암센터_24개종 암 상대생존율.csv → cancer_survival_reference
+  4. 2·3의 KCD 범위 + 질병통계 코드   → kcd_cancer_range_map (코드 → 범위 매핑)
 
 사전 준비:
   Supabase Dashboard → SQL Editor → supabase/health_engine_tables.sql 실행
+                                   → supabase/health_benchmark_quantiles.sql 실행 (선택 — 연도 키 포함, 없으면 분위수만 건너뜀)
+                                   → supabase/health_benchmarks-data-year.sql 실행 (연도 키)
+                                   → supabase/kcd_cancer_range_map.sql 실행 (선택 — 없으면 4단계만 건너뜀)
 
 실행:
   python3 scripts/upload_health_engine.py
+  python3 scripts/upload_health_engine.py --workers 4   # 검진 집계 프로세스 수
+  python3 scripts/upload_health_engine.py --all-years   # cleaned_checkup_data_*.csv 전 연도
+  python3 scripts/upload_health_engine.py --all-years --years 2023 2024
+  python3 scripts/upload_health_engine.py --no-cache    # 연도별 집계 캐시 무시
+
+연도별 집계 결과는 scripts/.checkup_cache/ 에 파일 해시 기준으로 저장되어
+내용이 바뀌지 않은 연도 파일은 다시 읽지 않는다.
 """
 
-import os, math, sys, re
+import argparse
+import os, re, sys
 from pathlib import Path
 
-import numpy as np
 import pandas as pd
 from dotenv import load_dotenv
 from supabase import create_client, Client
@@ -27,15 +39,32 @@ load_dotenv(BASE_DIR / ".env.local")
 
 SUPABASE_URL = os.environ.get("NEXT_PUBLIC_SUPABASE_URL", "")
 SUPABASE_KEY = os.environ.get("SUPABASE_SERVICE_ROLE_KEY", "")
-if not SUPABASE_URL or not SUPABASE_KEY:
+if __name__ == "__mp_main__":
+    # 검진 집계 spawn 워커는 이 파일을 __mp_main__ 으로 다시 실행한다 — 집계만 하므로 접속 준비 생략
+    sb = None
+elif not SUPABASE_URL or not SUPABASE_KEY:
     print("❌ .env.local 에서 Supabase 키를 찾을 수 없습니다.")
     sys.exit(1)
-
-sb: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+else:
+    sb: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
 
 SCRIPTS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from checkup_aggregate import (CHUNK_ROWS, DEFAULT_WORKERS, aggregate_years,
+                               benchmark_records, quantile_records)
+from kcd_ranges import KcdRangeIndex
+
 BATCH = 500
 
+CHECKUP_CSV          = SCRIPTS_DIR / "cleaned_checkup_data_2024.csv"
+CHECKUP_GLOB         = "cleaned_checkup_data_*.csv"
+CHECKUP_CACHE_DIR    = SCRIPTS_DIR / ".checkup_cache"
+DEFAULT_DATA_YEAR    = 2024
+CANCER_INCIDENCE_CSV = "/Users/jaysmac/Downloads/국립암센터_암발생 통계 정보_20260120.csv"
+CANCER_SURVIVAL_CSV  = "/Users/jaysmac/Downloads/국립암센터_24개종 암 상대생존율_20260120.csv"
+DISEASE_STATS_CSV    = SCRIPTS_DIR / "질병통계외래.입원.한방.csv"  # upload_disease_stats.py 소스
+
 # ── 공통 유틸 ─────────────────────────────────────────────────
 AGE_MAP = {
     1: "0~4세",    2: "5~9세",    3: "10~14세",
@@ -57,19 +86,38 @@ AGE_STR_MAP = {
 }
 GENDER_KR = {"남녀전체": "전체", "남자": "남성", "여자": "여성"}
 
-def nan_to_none(v):
-    if v is None: return None
-    try:
-        if math.isnan(float(v)): return None
-    except (TypeError, ValueError):
-        pass
-    return float(v) if isinstance(v, (float, np.floating)) else v
+def column_batches(columns: dict[str, pd.Series], size: int = BATCH) -> tuple[int, object]:
+    """컬럼 단위로 변환된 Series → (레코드 수, list[dict] 배치 이터레이터).
+    결측은 None, 정수·불리언은 Python 값으로 컬럼마다 한 번에 변환."""
+    names = list(columns)
+    arrays = []
+    for col in columns.values():
+        if pd.api.types.is_float_dtype(col):
+            arr = col.to_numpy(dtype=object)
+            arr[col.isna().to_numpy()] = None
+        elif pd.api.types.is_integer_dtype(col) or pd.api.types.is_bool_dtype(col):
+            arr = col.tolist()
+        else:
+            arr = col.astype(object).where(col.notna(), None).tolist()
+        arrays.append(arr)
+    total = len(arrays[0]) if arrays else 0
+
+    def batches():
+        for i in range(0, total, size):
+            cols = [a[i:i + size] for a in arrays]
+            yield [dict(zip(names, vals)) for vals in zip(*cols)]
+
+    return total, batches()
 
 def upsert_batch(table: str, records: list[dict], conflict: str,
                  total: int, done: int) -> tuple[int, int]:
+    chunks = (records[i : i + BATCH] for i in range(0, len(records), BATCH))
+    return upsert_batches(table, chunks, conflict, total, done)
+
+def upsert_batches(table: str, batches, conflict: str,
+                   total: int, done: int) -> tuple[int, int]:
     ok = fail = 0
-    for i in range(0, len(records), BATCH):
-        chunk = records[i : i + BATCH]
+    for chunk in batches:
         try:
             resp = sb.table(table).upsert(chunk, on_conflict=conflict).execute()
             n = len(resp.data) if resp.data else len(chunk)
@@ -84,144 +132,142 @@ def upsert_batch(table: str, records: list[dict], conflict: str,
 # ════════════════════════════════════════════════════════════════
 # 1. health_benchmarks — 검진 데이터 성별·연령별 집계
 # ════════════════════════════════════════════════════════════════
-def build_health_benchmarks() -> list[dict]:
-    print("\n📊 health_benchmarks 집계 중 (100만 행)...")
-    NUMERIC_COLS = [
-        "height_cm", "weight_kg", "waist_cm",
-        "systolic_bp", "diastolic_bp", "fasting_glucose",
-        "total_cholesterol", "hdl_cholesterol", "ldl_cholesterol",
-        "triglyceride", "hemoglobin", "ast", "alt", "gamma_gtp",
-    ]
-    df = pd.read_csv(
-        SCRIPTS_DIR / "cleaned_checkup_data_2024.csv",
-        usecols=["gender", "age_group", "age_group_label"] + NUMERIC_COLS,
-        dtype={c: "float32" for c in NUMERIC_COLS},
-    )
-
-    # BMI 계산
-    h = df["height_cm"] / 100.0
-    df["bmi"] = (df["weight_kg"] / (h ** 2)).replace([np.inf, -np.inf], np.nan)
-
-    ALL_METRICS = NUMERIC_COLS + ["bmi"]
-
-    # 그룹별 집계
-    grp = df.groupby(["gender", "age_group", "age_group_label"])
-    agg_avg = grp[ALL_METRICS].mean().round(2)
-    agg_std = grp[ALL_METRICS].std().round(2)
-    agg_cnt = grp["height_cm"].count().rename("sample_count")
-
-    records = []
-    for (gender, age_code, age_label), row_avg in agg_avg.iterrows():
-        row_std = agg_std.loc[(gender, age_code, age_label)]
-        cnt = int(agg_cnt.loc[(gender, age_code, age_label)])
-        rec = {
-            "gender": gender,
-            "age_group_code": int(age_code),
-            "age_group_label": age_label,
-            "sample_count": cnt,
-            "data_year": 2024,
-        }
-        # CSV 컬럼명 → DB 필드 기본명 변환 (height_cm → height, weight_kg → weight)
-        DB_FIELD = {
-            "height_cm": "height", "weight_kg": "weight", "waist_cm": "waist",
-            "systolic_bp": "systolic_bp", "diastolic_bp": "diastolic_bp",
-            "fasting_glucose": "fasting_glucose",
-            "total_cholesterol": "total_cholesterol",
-            "hdl_cholesterol": "hdl_cholesterol", "ldl_cholesterol": "ldl_cholesterol",
-            "triglyceride": "triglyceride", "hemoglobin": "hemoglobin",
-            "ast": "ast", "alt": "alt", "gamma_gtp": "gamma_gtp", "bmi": "bmi",
-        }
-        for m in ALL_METRICS:
-            db_field = DB_FIELD.get(m, m)
-            rec[f"{db_field}_avg"] = nan_to_none(row_avg[m])
-            rec[f"{db_field}_std"] = nan_to_none(row_std[m])
-        records.append(rec)
-
-    print(f"  집계 완료: {len(records)}행 (성별 × 연령대 조합)")
-    return records
+def table_ready(table: str, sql_file: str) -> bool:
+    """선택 테이블 접근 확인 — 없으면 마이그레이션 안내 후 False (해당 단계만 건너뜀)"""
+    try:
+        sb.table(table).select("id").limit(1).execute()
+        return True
+    except Exception as e:
+        print(f"\n  ⚠️  {table} 접근 실패 — 이 단계는 건너뜁니다: {e}")
+        print(f"     supabase/{sql_file} 을 먼저 실행하세요.")
+        return False
+
+
+def checkup_year(path: Path) -> int:
+    """파일명의 4자리 연도 (cleaned_checkup_data_2023.csv → 2023). 없으면 DEFAULT_DATA_YEAR"""
+    m = re.search(r'(19|20)\d{2}', Path(path).stem)
+    return int(m.group()) if m else DEFAULT_DATA_YEAR
+
+
+def discover_checkup_files(directory: Path = SCRIPTS_DIR) -> dict[int, Path]:
+    """directory 의 cleaned_checkup_data_<연도>.csv → {연도: 경로}"""
+    files = {}
+    for p in sorted(Path(directory).glob(CHECKUP_GLOB)):
+        year = checkup_year(p)
+        if year in files:
+            print(f"  ⚠️  {year}년 파일 중복 — {p.name} 무시 ({files[year].name} 사용)")
+            continue
+        files[year] = p
+    return files
+
+
+def build_health_benchmarks(workers: int = DEFAULT_WORKERS, files: dict[int, Path] | None = None,
+                            use_cache: bool = True) -> tuple[list[dict], list[dict]]:
+    """→ (health_benchmarks 레코드, health_benchmark_quantiles 레코드). 연도마다 data_year 로 구분"""
+    if files is None:
+        files = {checkup_year(CHECKUP_CSV): Path(CHECKUP_CSV)}
+    years = ", ".join(map(str, sorted(files)))
+    print(f"\n📊 health_benchmarks 집계 중 ({years}년 · 청크 {CHUNK_ROWS:,}행 · 프로세스 {workers}개)...")
+    aggregates = aggregate_years(files, workers=workers, quantiles=True,
+                                 cache_dir=CHECKUP_CACHE_DIR if use_cache else None)
+    records, q_records = [], []
+    for year, (acc, sketches) in aggregates.items():
+        records += benchmark_records(acc, data_year=year)
+        q_records += quantile_records(sketches, data_year=year)
+    print(f"  집계 완료: {len(records)}행 (연도 × 성별 × 연령대 조합)")
+    print(f"  분위수 스케치: {len(q_records)}행 (조합 × 지표, p5~p95)")
+    return records, q_records
 
 
 # ════════════════════════════════════════════════════════════════
 # 2. cancer_incidence_reference — 암발생 통계
 # ════════════════════════════════════════════════════════════════
-def build_cancer_incidence() -> list[dict]:
+# KCD 코드 추출: "01. C00-C14" → "C00-C14"
+KCD_PATTERN = r'(C[\w\-]+)'
+
+
+def extract_kcd(col: pd.Series) -> pd.Series:
+    return col.astype(str).str.extract(KCD_PATTERN, expand=False)
+
+
+def build_cancer_incidence() -> tuple[int, object]:
+    """→ (레코드 수, 배치 이터레이터)"""
     print("\n🦠 cancer_incidence_reference 처리 중...")
     df = pd.read_csv(
-        '/Users/jaysmac/Downloads/국립암센터_암발생 통계 정보_20260120.csv',
+        CANCER_INCIDENCE_CSV,
         encoding='utf-8',
+        dtype={'국제질병분류': str, '성별': str, '연령군': str, '암종': str, '발생연도': str},
     )
 
-    # KCD 코드 추출: "01. C00-C14" → "C00-C14"
-    def extract_kcd(s: str) -> str:
-        m = re.search(r'C[\w\-]+', str(s))
-        return m.group() if m else None
-
-    df['kcd_code']         = df['국제질병분류'].apply(extract_kcd)
-    df['gender']           = df['성별'].map(GENDER_KR)
-    df['age_group_label']  = df['연령군'].map(AGE_STR_MAP).fillna(df['연령군'])
-    df['cancer_type']      = df['암종'].str.strip()
-    # '1999-2023' 같은 기간 범위 행 제외 — 개별 연도 행만 사용
-    df = df[pd.to_numeric(df['발생연도'], errors='coerce').notna()].copy()
-    df['incidence_year']   = df['발생연도'].astype(int)
-    df['patient_count']    = pd.to_numeric(df['발생자수'], errors='coerce').fillna(0).astype(int)
-    df['incidence_rate']   = pd.to_numeric(df['조발생률'],  errors='coerce')
-
-    # 연령미상 제외
-    df = df[df['age_group_label'] != '연령미상']
-
-    records = []
-    for _, row in df.iterrows():
-        records.append({
-            "cancer_type":     row['cancer_type'],
-            "kcd_code":        row['kcd_code'],
-            "gender":          row['gender'],
-            "age_group_label": row['age_group_label'],
-            "incidence_year":  row['incidence_year'],
-            "patient_count":   int(row['patient_count']),
-            "incidence_rate":  nan_to_none(row['incidence_rate']),
-        })
-
-    print(f"  처리 완료: {len(records):,}행")
-    return records
+    # '1999-2023' 같은 기간 범위 행 · 연령미상 제외 — 개별 연도 행만 사용
+    year = pd.to_numeric(df['발생연도'], errors='coerce')
+    age_label = df['연령군'].map(AGE_STR_MAP).fillna(df['연령군'])
+    keep = year.notna() & (age_label != '연령미상')
+    df, year, age_label = df[keep], year[keep], age_label[keep]
+
+    total, batches = column_batches({
+        "cancer_type":     df['암종'].str.strip(),
+        "kcd_code":        extract_kcd(df['국제질병분류']),
+        "gender":          df['성별'].map(GENDER_KR),
+        "age_group_label": age_label,
+        "incidence_year":  year.astype(int),
+        "patient_count":   pd.to_numeric(df['발생자수'], errors='coerce').fillna(0).astype(int),
+        "incidence_rate":  pd.to_numeric(df['조발생률'], errors='coerce'),
+    })
+    print(f"  처리 완료: {total:,}행")
+    return total, batches
 
 
 # ════════════════════════════════════════════════════════════════
 # 3. cancer_survival_reference — 암 생존율
 # ════════════════════════════════════════════════════════════════
-def build_cancer_survival() -> list[dict]:
+LATEST_PERIOD = "2019-2023"
+
+
+def build_cancer_survival() -> tuple[int, object]:
+    """→ (레코드 수, 배치 이터레이터)"""
     print("\n💊 cancer_survival_reference 처리 중...")
     df = pd.read_csv(
-        '/Users/jaysmac/Downloads/국립암센터_24개종 암 상대생존율_20260120.csv',
+        CANCER_SURVIVAL_CSV,
         encoding='utf-8',
+        dtype={'국제질병분류': str, '성별': str, '암종': str, '발생기간': str},
     )
 
-    def extract_kcd(s: str) -> str:
-        m = re.search(r'C[\w\-]+', str(s))
-        return m.group() if m else None
-
-    LATEST_PERIOD = "2019-2023"
-
-    df['kcd_code']               = df['국제질병분류'].apply(extract_kcd)
-    df['gender']                 = df['성별'].map(GENDER_KR)
-    df['cancer_type']            = df['암종'].str.strip()
-    df['period']                 = df['발생기간'].str.strip()
-    df['is_latest']              = df['period'] == LATEST_PERIOD
-    df['patient_count']          = pd.to_numeric(df['환자수'],         errors='coerce').fillna(0).astype(int)
-    df['five_year_survival_rate']= pd.to_numeric(df['5년상대생존율'], errors='coerce')
-
-    records = []
-    for _, row in df.iterrows():
-        records.append({
-            "cancer_type":             row['cancer_type'],
-            "kcd_code":                row['kcd_code'],
-            "gender":                  row['gender'],
-            "period":                  row['period'],
-            "is_latest":               bool(row['is_latest']),
-            "patient_count":           int(row['patient_count']),
-            "five_year_survival_rate": nan_to_none(row['five_year_survival_rate']),
-        })
-
-    print(f"  처리 완료: {len(records)}행")
+    period = df['발생기간'].str.strip()
+    total, batches = column_batches({
+        "cancer_type":             df['암종'].str.strip(),
+        "kcd_code":                extract_kcd(df['국제질병분류']),
+        "gender":                  df['성별'].map(GENDER_KR),
+        "period":                  period,
+        "is_latest":               period == LATEST_PERIOD,
+        "patient_count":           pd.to_numeric(df['환자수'], errors='coerce').fillna(0).astype(int),
+        "five_year_survival_rate": pd.to_numeric(df['5년상대생존율'], errors='coerce'),
+    })
+    print(f"  처리 완료: {total}행")
+    return total, batches
+
+
+# ════════════════════════════════════════════════════════════════
+# 4. kcd_cancer_range_map — KCD 코드 → 암 참조 범위
+# ════════════════════════════════════════════════════════════════
+def build_kcd_range_map() -> list[dict]:
+    """암 참조 두 파일의 (KCD 범위, 암종) + 질병통계 실제 코드 → 매핑 레코드"""
+    print("\n🔗 kcd_cancer_range_map 처리 중...")
+    ranges = []
+    for path in (CANCER_INCIDENCE_CSV, CANCER_SURVIVAL_CSV):
+        df = pd.read_csv(path, encoding='utf-8', usecols=['국제질병분류', '암종'], dtype=str)
+        pairs = pd.DataFrame({"kcd": extract_kcd(df['국제질병분류']), "name": df['암종'].str.strip()})
+        ranges += list(pairs.dropna(subset=["kcd"]).drop_duplicates("kcd").itertuples(index=False, name=None))
+
+    extra = []
+    if Path(DISEASE_STATS_CSV).exists():
+        extra = pd.read_csv(DISEASE_STATS_CSV, usecols=['kcd_code'], dtype=str)['kcd_code'].dropna().unique()
+    else:
+        print(f"  ⚠️  질병통계 파일 없음 — 3단 코드만 매핑: {DISEASE_STATS_CSV}")
+
+    index = KcdRangeIndex(ranges)
+    records = index.mapping_records(extra)
+    print(f"  처리 완료: 범위 {len(index.labels)}개 → {len(records):,}행")
     return records
 
 
@@ -229,6 +275,26 @@ def build_cancer_survival() -> list[dict]:
 # 메인
 # ════════════════════════════════════════════════════════════════
 def main():
+    ap = argparse.ArgumentParser(description="신체 컨디션 모니터링 엔진 참조 테이블 업로드")
+    ap.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                    help=f"검진 데이터 집계 프로세스 수 (기본 {DEFAULT_WORKERS})")
+    ap.add_argument("--all-years", action="store_true",
+                    help=f"{CHECKUP_GLOB} 전 연도 파일 집계 (기본: {Path(CHECKUP_CSV).name}만)")
+    ap.add_argument("--years", type=int, nargs="+", help="--all-years 중 일부 연도만")
+    ap.add_argument("--no-cache", action="store_true", help="연도별 집계 캐시를 쓰지 않고 다시 계산")
+    args = ap.parse_args()
+    if args.years and not args.all_years:
+        ap.error("--years 는 --all-years 와 함께 사용해야 합니다.")
+
+    checkup_files = None
+    if args.all_years:
+        checkup_files = discover_checkup_files(Path(CHECKUP_CSV).parent)
+        if args.years:
+            checkup_files = {y: p for y, p in checkup_files.items() if y in set(args.years)}
+        if not checkup_files:
+            print(f"❌ 검진 파일 없음: {Path(CHECKUP_CSV).parent / CHECKUP_GLOB}")
+            sys.exit(1)
+
     print("=" * 60)
     print("닥터 도슨 신체 컨디션 모니터링 엔진 — 데이터 업로드")
     print("=" * 60)
@@ -241,44 +307,68 @@ def main():
             print(f"  ✅ {tbl}")
         except Exception as e:
             print(f"  ❌ {tbl} 접근 실패: {e}")
-            print("     supabase/health_engine_tables.sql 을 먼저 실행하세요.")
+            print("     supabase/health_engine_tables.sql · health_benchmarks-data-year.sql 을 먼저 실행하세요.")
             sys.exit(1)
 
     results = {}
 
     # ── 1. health_benchmarks ─────────────────────────────────
-    bench_records = build_health_benchmarks()
+    bench_records, quantile_recs = build_health_benchmarks(args.workers, checkup_files,
+                                                           use_cache=not args.no_cache)
     print(f"  Supabase 업로드 중...")
     ok, fail = upsert_batch(
         "health_benchmarks", bench_records,
-        "gender,age_group_code",
+        "gender,age_group_code,data_year",
         len(bench_records), 0,
     )
     print(f"\n  ✅ health_benchmarks: {ok}건 성공 / {fail}건 실패")
     results["health_benchmarks"] = (ok, fail)
 
+    # ── 1-b. health_benchmark_quantiles (선택 — 없으면 스케치 업로드만 건너뜀) ──
+    if table_ready("health_benchmark_quantiles", "health_benchmark_quantiles.sql"):
+        print(f"  분위수 업로드 중...")
+        ok, fail = upsert_batch(
+            "health_benchmark_quantiles", quantile_recs,
+            "gender,age_group_code,metric,data_year",
+            len(quantile_recs), 0,
+        )
+        print(f"\n  ✅ health_benchmark_quantiles: {ok}건 성공 / {fail}건 실패")
+        results["health_benchmark_quantiles"] = (ok, fail)
+
     # ── 2. cancer_incidence_reference ────────────────────────
-    inci_records = build_cancer_incidence()
+    inci_total, inci_batches = build_cancer_incidence()
     print(f"  Supabase 업로드 중...")
-    ok, fail = upsert_batch(
-        "cancer_incidence_reference", inci_records,
+    ok, fail = upsert_batches(
+        "cancer_incidence_reference", inci_batches,
         "cancer_type,gender,age_group_label,incidence_year",
-        len(inci_records), 0,
+        inci_total, 0,
     )
     print(f"\n  ✅ cancer_incidence_reference: {ok:,}건 성공 / {fail}건 실패")
     results["cancer_incidence_reference"] = (ok, fail)
 
     # ── 3. cancer_survival_reference ─────────────────────────
-    surv_records = build_cancer_survival()
+    surv_total, surv_batches = build_cancer_survival()
     print(f"  Supabase 업로드 중...")
-    ok, fail = upsert_batch(
-        "cancer_survival_reference", surv_records,
+    ok, fail = upsert_batches(
+        "cancer_survival_reference", surv_batches,
         "cancer_type,gender,period",
-        len(surv_records), 0,
+        surv_total, 0,
     )
     print(f"\n  ✅ cancer_survival_reference: {ok}건 성공 / {fail}건 실패")
     results["cancer_survival_reference"] = (ok, fail)
 
+    # ── 4. kcd_cancer_range_map (선택 — 없으면 이 단계만 건너뜀) ──
+    if table_ready("kcd_cancer_range_map", "kcd_cancer_range_map.sql"):
+        map_records = build_kcd_range_map()
+        print(f"  Supabase 업로드 중...")
+        ok, fail = upsert_batch(
+            "kcd_cancer_range_map", map_records,
+            "kcd_code,kcd_range",
+            len(map_records), 0,
+        )
+        print(f"\n  ✅ kcd_cancer_range_map: {ok:,}건 성공 / {fail}건 실패")
+        results["kcd_cancer_range_map"] = (ok, fail)
+
     # ── 최종 요약 ─────────────────────────────────────────────
     print("\n" + "=" * 60)
     print("[최종 완료]")
@@ -7,22 +7,44 @@ upload_nutrition.py
   2. 건강기능식품영양성분정보_20251230.csv     → supplement_master (upsert by food_code)
 
 실행: python3 scripts/upload_nutrition.py
+      python3 scripts/upload_nutrition.py --delta          # 변경분만 업로드
+      python3 scripts/upload_nutrition.py --delta --prune  # + 사라진 food_code 삭제
 ────────────────────────────────────────────────────────────────────
 """
 
-import os, re, sys
+import argparse, os, re, sys
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
+from dotenv import load_dotenv
 from supabase import create_client
 
+from delta_sync import (HASH_COL, delete_keys, fetch_hash_map,
+                        has_hash_column, plan_delta)
+
 # ── 환경 변수 ──────────────────────────────────────────────────────
-SUPABASE_URL = "https://fddoizheudxxqescjpbq.supabase.co"
-SUPABASE_KEY = 
+BASE_DIR = Path(__file__).resolve().parent.parent
+load_dotenv(BASE_DIR / ".env.local")
+
+SUPABASE_URL = os.environ.get("NEXT_PUBLIC_SUPABASE_URL", "")
+SUPABASE_KEY = os.environ.get("SUPABASE_SERVICE_ROLE_KEY", "")
+if not SUPABASE_URL or not SUPABASE_KEY:
+    print("❌ .env.local 에서 NEXT_PUBLIC_SUPABASE_URL / SUPABASE_SERVICE_ROLE_KEY 를 찾을 수 없습니다.")
+    sys.exit(1)
 
 FOOD_CSV  = "/Users/jaysmac/Downloads/식품의약품안전처_통합식품영양성분정보(음식)_20251229.csv"
 SUPP_CSV  = "/Users/jaysmac/Downloads/식품의약품안전처_건강기능식품영양성분정보_20251230.csv"
 
 BATCH = 500
 
+# 반복되는 분류명·출처명 → category dtype (고유값 수십 개, 행 수십만)
+CATEGORY_COLS = {
+    "data_type_name", "food_origin_name", "food_major_name", "food_mid_name",
+    "food_sub_name", "food_detail_name", "type_name", "intake_target",
+    "source_name", "data_gen_method_name", "origin_country_name", "is_imported",
+}
+
 sb = create_client(SUPABASE_URL, SUPABASE_KEY)
 
 
@@ -43,23 +65,136 @@ def to_text(v):
     s = str(v).strip()
     return s if s else None
 
-def upload_batches(table: str, records: list, conflict_col: str):
-    """records를 BATCH 단위로 upsert. 결과 요약 반환."""
-    ok = fail = 0
-    total = len(records)
-    for i in range(0, total, BATCH):
-        chunk = records[i:i + BATCH]
+def parse_float(s: pd.Series) -> pd.Series:
+    """to_float의 컬럼 단위 버전 → float64 Series (변환 불가 · 결측 · inf → NaN).
+
+    이미 숫자형인 컬럼은 그대로 쓰고, 문자열 컬럼만 정규식 치환(str.replace)
+    한 번 + pd.to_numeric 으로 변환한다.
+    """
+    if pd.api.types.is_numeric_dtype(s) and not pd.api.types.is_bool_dtype(s):
+        v = s.astype("float64")
+        return v.where(np.isfinite(v))
+    out = pd.Series(np.nan, index=s.index, dtype="float64")
+    s = s[s.notna()]
+    if len(s):
+        cleaned = s.astype(str).str.replace(r"[^\d.\-]", "", regex=True)
+        out[s.index] = pd.to_numeric(cleaned, errors="coerce").astype("float64")
+    return out
+
+def float_column(s: pd.Series) -> np.ndarray:
+    """parse_float 결과 → object 배열 (float 또는 None)"""
+    out = parse_float(s)
+    arr = out.to_numpy().astype(object)
+    arr[out.isna().to_numpy()] = None
+    return arr
+
+def text_column(s: pd.Series) -> np.ndarray:
+    """to_text의 컬럼 단위 버전 → object 배열 (앞뒤 공백 제거된 str 또는 None)"""
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        # 범주형: 고유값(categories)만 strip 후 코드로 펼침
+        cats = s.cat.categories.astype(str).str.strip().to_numpy(dtype=object)
+        cats[cats == ""] = None
+        codes = s.cat.codes.to_numpy()
+        arr = np.full(len(s), None, dtype=object)
+        arr[codes >= 0] = cats[codes[codes >= 0]]
+        return arr
+    arr = np.full(len(s), None, dtype=object)
+    mask = s.notna().to_numpy()
+    if mask.any():
+        arr[mask] = s[mask].astype(str).str.strip().to_numpy(dtype=object)
+        arr[arr == ""] = None
+    return arr
+
+def read_mfds_csv(path, col_map: dict, float_cols: set, encodings=("utf-8",)) -> pd.DataFrame:
+    """식약처 CSV 로드 (메모리 절약).
+
+    - usecols: col_map에 있는 컬럼만 읽음 (매핑 안 된 컬럼은 파싱하지 않음)
+    - CATEGORY_COLS (분류명·출처명 등 반복 값): category dtype
+    - 영양소 컬럼: 원문 그대로 읽어 바로 float64로 변환 (셀마다 str 객체를 두지 않음)
+    encodings 순서대로 시도 (UnicodeDecodeError 시 다음 인코딩).
+    """
+    float_kr = [kr for kr, en in col_map.items() if en in float_cols]
+    dtype = {kr: "category" for kr, en in col_map.items() if en in CATEGORY_COLS}
+    dtype.update({kr: str for kr in float_kr})
+    for i, enc in enumerate(encodings):
+        try:
+            df = pd.read_csv(path, encoding=enc, usecols=lambda c: c in col_map,
+                             dtype=dtype, low_memory=False)
+            break
+        except UnicodeDecodeError:
+            if i == len(encodings) - 1:
+                raise
+    for kr in float_kr:
+        if kr in df.columns:
+            df[kr] = parse_float(df[kr])
+    return df
+
+def build_records(df: pd.DataFrame, col_map: dict, float_cols: set,
+                  size: int = BATCH) -> tuple:
+    """col_map 기준 컬럼 단위 변환 → (유효 레코드 수, 배치 이터레이터).
+
+    food_code·food_name이 비어 있는 행은 제외. df에 없는 컬럼은
+    레코드에도 넣지 않는다 (행 단위 구현과 동일한 키 구성).
+    """
+    names, arrays = [], []
+    for kr, en in col_map.items():
+        if kr not in df.columns:
+            continue
+        names.append(en)
+        arrays.append(float_column(df[kr]) if en in float_cols else text_column(df[kr]))
+
+    keep = np.ones(len(df), dtype=bool)
+    for key in ("food_code", "food_name"):
+        if key not in names:
+            return 0, iter(())
+        keep &= pd.notna(arrays[names.index(key)])
+    arrays = [a[keep] for a in arrays]
+    total = int(keep.sum())
+
+    def batches():
+        for i in range(0, total, size):
+            cols = [a[i:i + size] for a in arrays]
+            yield [dict(zip(names, vals)) for vals in zip(*cols)]
+
+    return total, batches()
+
+def chunked(records: list, size: int = BATCH):
+    for i in range(0, len(records), size):
+        yield records[i:i + size]
+
+def upload_batches(table: str, batches, total: int, conflict_col: str):
+    """배치(list[dict]) 이터러블을 순서대로 upsert. 결과 요약 반환."""
+    ok = fail = done = 0
+    for chunk in batches:
         try:
             sb.table(table).upsert(chunk, on_conflict=conflict_col).execute()
             ok += len(chunk)
         except Exception as e:
             fail += len(chunk)
-            print(f"\n  ❌ 배치 오류 [{i}~{i+len(chunk)}]: {e}")
-        done = min(i + BATCH, total)
+            print(f"\n  ❌ 배치 오류 [{done}~{done+len(chunk)}]: {e}")
+        done += len(chunk)
         print(f"  {done:,}/{total:,}건 완료", end="\r")
     print()
     return ok, fail
 
+def upload_delta(table: str, records: list, conflict_col: str, prune: bool = False):
+    """row_hash 비교로 신규·변경 레코드만 upsert. prune=True면 사라진 키 삭제."""
+    if not has_hash_column(sb, table):
+        print(f"  ⚠️  {table}.{HASH_COL} 컬럼 없음 — 전체 업로드로 진행합니다.")
+        print("     supabase/row_hash_columns.sql 실행 후 --delta 가 적용됩니다.")
+        return upload_batches(table, chunked(records), len(records), conflict_col)
+
+    existing = fetch_hash_map(sb, table, conflict_col)
+    changed, removed, unchanged = plan_delta(records, conflict_col, existing)
+    print(f"  기존 {len(existing):,}건 | 변경/신규 {len(changed):,}건"
+          f" | 동일 {unchanged:,}건 | 소스에서 사라짐 {len(removed):,}건")
+
+    ok, fail = upload_batches(table, chunked(changed), len(changed), conflict_col) if changed else (0, 0)
+    if prune and removed:
+        n = delete_keys(sb, table, conflict_col, removed)
+        print(f"  🗑  {table}: {n:,}건 삭제")
+    return ok, fail
+
 
 # ── 1. 통합식품영양성분정보(음식) → food_knowledge ─────────────────
 FOOD_COL_MAP = {
@@ -127,26 +262,14 @@ FOOD_FLOAT_COLS = {
 
 
 def build_food_records(df: pd.DataFrame) -> list:
-    records = []
-    for _, row in df.iterrows():
-        rec = {}
-        for kr, en in FOOD_COL_MAP.items():
-            if kr not in df.columns:
-                continue
-            val = row[kr]
-            if en in FOOD_FLOAT_COLS:
-                rec[en] = to_float(val)
-            else:
-                rec[en] = to_text(val)
-        if rec.get("food_code") and rec.get("food_name"):
-            records.append(rec)
-    return records
+    _, batches = build_records(df, FOOD_COL_MAP, FOOD_FLOAT_COLS)
+    return [rec for batch in batches for rec in batch]
 
 
-def upload_food():
+def upload_food(delta: bool = False, prune: bool = False):
     print("\n🥗 통합식품영양성분정보(음식) → food_knowledge")
-    df = pd.read_csv(FOOD_CSV, encoding="utf-8", low_memory=False)
-    print(f"  CSV 로드: {len(df):,}행")
+    df = read_mfds_csv(FOOD_CSV, FOOD_COL_MAP, FOOD_FLOAT_COLS)
+    print(f"  CSV 로드: {len(df):,}행 ({df.memory_usage(deep=True).sum() / 1e6:,.0f} MB)")
 
     # food_code 중복 제거 (최신 기준일자 우선)
     if "데이터기준일자" in df.columns:
@@ -155,10 +278,14 @@ def upload_food():
         df = df.drop_duplicates(subset="식품코드", keep="last")
     print(f"  중복 제거 후: {len(df):,}행")
 
-    records = build_food_records(df)
-    print(f"  레코드 변환 완료: {len(records):,}건")
-    print(f"  Supabase 업로드 중 (배치 {BATCH}건)...")
-    ok, fail = upload_batches("food_knowledge", records, "food_code")
+    total, batches = build_records(df, FOOD_COL_MAP, FOOD_FLOAT_COLS)
+    print(f"  레코드 변환 완료: {total:,}건")
+    print(f"  Supabase 업로드 중 (배치 {BATCH}건{', 델타' if delta else ''})...")
+    if delta:
+        records = [rec for batch in batches for rec in batch]
+        ok, fail = upload_delta("food_knowledge", records, "food_code", prune)
+    else:
+        ok, fail = upload_batches("food_knowledge", batches, total, "food_code")
     print(f"  ✅ food_knowledge: {ok:,}건 성공 / {fail:,}건 실패")
     return ok, fail
 
@@ -239,37 +366,26 @@ SUPP_FLOAT_COLS = {
 
 
 def build_supp_records(df: pd.DataFrame) -> list:
-    records = []
-    for _, row in df.iterrows():
-        rec = {}
-        for kr, en in SUPP_COL_MAP.items():
-            if kr not in df.columns:
-                continue
-            val = row[kr]
-            if en in SUPP_FLOAT_COLS:
-                rec[en] = to_float(val)
-            else:
-                rec[en] = to_text(val)
-        if rec.get("food_code") and rec.get("food_name"):
-            records.append(rec)
-    return records
+    _, batches = build_records(df, SUPP_COL_MAP, SUPP_FLOAT_COLS)
+    return [rec for batch in batches for rec in batch]
 
 
-def upload_supplement():
+def upload_supplement(delta: bool = False, prune: bool = False):
     print("\n💊 건강기능식품영양성분정보 → supplement_master")
-    try:
-        df = pd.read_csv(SUPP_CSV, encoding="utf-8", low_memory=False)
-    except UnicodeDecodeError:
-        df = pd.read_csv(SUPP_CSV, encoding="cp949", low_memory=False)
-    print(f"  CSV 로드: {len(df):,}행")
+    df = read_mfds_csv(SUPP_CSV, SUPP_COL_MAP, SUPP_FLOAT_COLS, encodings=("utf-8", "cp949"))
+    print(f"  CSV 로드: {len(df):,}행 ({df.memory_usage(deep=True).sum() / 1e6:,.0f} MB)")
 
     df = df.drop_duplicates(subset="식품코드", keep="last")
     print(f"  중복 제거 후: {len(df):,}행")
 
-    records = build_supp_records(df)
-    print(f"  레코드 변환 완료: {len(records):,}건")
-    print(f"  Supabase 업로드 중 (배치 {BATCH}건)...")
-    ok, fail = upload_batches("supplement_master", records, "food_code")
+    total, batches = build_records(df, SUPP_COL_MAP, SUPP_FLOAT_COLS)
+    print(f"  레코드 변환 완료: {total:,}건")
+    print(f"  Supabase 업로드 중 (배치 {BATCH}건{', 델타' if delta else ''})...")
+    if delta:
+        records = [rec for batch in batches for rec in batch]
+        ok, fail = upload_delta("supplement_master", records, "food_code", prune)
+    else:
+        ok, fail = upload_batches("supplement_master", batches, total, "food_code")
     print(f"  ✅ supplement_master: {ok:,}건 성공 / {fail:,}건 실패")
     return ok, fail
 
@@ -304,6 +420,15 @@ def preflight_check():
 
 # ── main ──────────────────────────────────────────────────────────
 def main():
+    ap = argparse.ArgumentParser(description="식약처 영양 데이터 → Supabase 업로드")
+    ap.add_argument("--delta", action="store_true",
+                    help="row_hash 비교로 신규·변경 행만 업로드")
+    ap.add_argument("--prune", action="store_true",
+                    help="--delta 와 함께: CSV에서 사라진 food_code 삭제")
+    args = ap.parse_args()
+    if args.prune and not args.delta:
+        ap.error("--prune 은 --delta 와 함께 사용해야 합니다.")
+
     print("=" * 60)
     print("닥터 도슨 영양 데이터 업로드")
     print("  ① 통합식품영양성분정보(음식)  → food_knowledge")
@@ -319,17 +444,20 @@ def main():
         sys.exit(1)
     print("  ✅ 모든 테이블 및 컬럼 확인 완료")
 
-    food_ok, food_fail   = upload_food()
-    # supplement_master는 이미 업로드 완료 시 건너뜀
-    try:
-        check = sb.table("supplement_master").select("food_code", count="exact").limit(1).execute()
-        if check.count and check.count > 0:
-            print(f"\n💊 supplement_master: 이미 {check.count:,}건 적재됨 — 건너뜀")
-            supp_ok, supp_fail = check.count, 0
-        else:
+    food_ok, food_fail   = upload_food(args.delta, args.prune)
+    # supplement_master는 이미 업로드 완료 시 건너뜀 (델타 모드는 변경분만 반영)
+    if args.delta:
+        supp_ok, supp_fail = upload_supplement(args.delta, args.prune)
+    else:
+        try:
+            check = sb.table("supplement_master").select("food_code", count="exact").limit(1).execute()
+            if check.count and check.count > 0:
+                print(f"\n💊 supplement_master: 이미 {check.count:,}건 적재됨 — 건너뜀")
+                supp_ok, supp_fail = check.count, 0
+            else:
+                supp_ok, supp_fail = upload_supplement()
+        except Exception:
             supp_ok, supp_fail = upload_supplement()
-    except Exception:
-        supp_ok, supp_fail = upload_supplement()
 
     print("\n" + "=" * 60)
     print("[최종 완료]")
@@ -0,0 +1,33 @@
+-- dur_rules 연령 조건 타입 컬럼 마이그레이션
+-- age_limit_value / age_limit_unit / age_limit_condition (TEXT) → 개월 단위 구간
+-- 업로드: scripts/upload_dur_rules.py (scripts/age_intervals.py 로 파싱, 해석 불가 값은 비워 두고 보고)
+--
+--   12 / 세 / 미만   → age_max_months = 144, age_max_inclusive = false  → age_range (,144)
+--   6개월 / - / 이상  → age_min_months = 6,   age_min_inclusive = true   → age_range [6,)
+
+ALTER TABLE dur_rules ADD COLUMN IF NOT EXISTS age_min_months    NUMERIC;
+ALTER TABLE dur_rules ADD COLUMN IF NOT EXISTS age_max_months    NUMERIC;
+ALTER TABLE dur_rules ADD COLUMN IF NOT EXISTS age_min_inclusive BOOLEAN;
+ALTER TABLE dur_rules ADD COLUMN IF NOT EXISTS age_max_inclusive BOOLEAN;
+
+-- 하한·상한이 모두 없으면 NULL (연령 조건 없음 / 해석 불가), 한쪽이 없으면 그쪽은 무한대
+ALTER TABLE dur_rules ADD COLUMN IF NOT EXISTS age_range NUMRANGE
+    GENERATED ALWAYS AS (
+        CASE WHEN age_min_months IS NULL AND age_max_months IS NULL THEN NULL
+             ELSE numrange(
+                 age_min_months, age_max_months,
+                 (CASE WHEN age_min_inclusive THEN '[' ELSE '(' END) ||
+                 (CASE WHEN age_max_inclusive THEN ']' ELSE ')' END))
+        END
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_dur_rules_age_range ON dur_rules USING GIST (age_range);
+
+COMMENT ON COLUMN dur_rules.age_min_months IS '연령 조건 하한 (개월, NULL = 하한 없음)';
+COMMENT ON COLUMN dur_rules.age_max_months IS '연령 조건 상한 (개월, NULL = 상한 없음)';
+COMMENT ON COLUMN dur_rules.age_range      IS '연령 조건 개월 구간 — 만 7세(84개월) 해당 규칙: age_range @> 84::numeric';
+
+-- 예: 7세 환자에게 연령금기인 품목
+--   SELECT item_seq, item_name, age_limit_value, age_limit_unit, age_limit_condition
+--   FROM dur_rules
+--   WHERE dur_type LIKE '연령금기%' AND age_range @> 84::numeric;
@@ -0,0 +1,67 @@
+-- ================================================================
+-- 건강검진 벤치마크 분위수 (health_benchmarks 보조 테이블)
+-- 업로드: scripts/upload_health_engine.py (health_benchmarks 와 같은 1회 집계)
+-- 선행: supabase/health_engine_tables.sql (update_health_engine_updated_at 함수)
+-- ================================================================
+
+-- 성별·연령대·지표별 고정 백분위 + 병합 가능한 t-digest 스케치
+-- 활용: 사용자 수치의 백분위 = 이 테이블 1행 조회 (정규분포 가정 없음)
+--       중성지방·감마GTP처럼 치우친 분포는 _avg/_std z-score 대신 이 값을 사용
+
+CREATE TABLE IF NOT EXISTS health_benchmark_quantiles (
+    id                BIGSERIAL PRIMARY KEY,
+
+    -- 인구통계 세그먼트 (health_benchmarks 와 동일)
+    gender            TEXT NOT NULL,    -- 남성 / 여성
+    age_group_code    INT  NOT NULL,    -- 5~18 (5세단위)
+    age_group_label   TEXT NOT NULL,    -- 예: 60~64세
+    metric            TEXT NOT NULL,    -- health_benchmarks 필드 기본명 (height, bmi, triglyceride ...)
+    sample_count      INT  DEFAULT 0,   -- 해당 지표 표본 수 (결측 제외)
+
+    -- 고정 백분위
+    p5                NUMERIC(10,2),
+    p10               NUMERIC(10,2),
+    p25               NUMERIC(10,2),
+    p50               NUMERIC(10,2),
+    p75               NUMERIC(10,2),
+    p90               NUMERIC(10,2),
+    p95               NUMERIC(10,2),
+
+    -- 직렬화 스케치: {"delta", "n", "min", "max", "means": [...], "weights": [...]}
+    sketch            JSONB,
+
+    -- 메타
+    data_year         INT  NOT NULL DEFAULT 2024,
+    created_at        TIMESTAMPTZ DEFAULT NOW(),
+    updated_at        TIMESTAMPTZ DEFAULT NOW(),
+
+    CONSTRAINT health_benchmark_quantiles_year_uq UNIQUE (gender, age_group_code, metric, data_year)
+);
+
+-- 연도 키 없이 만들어진 기존 테이블 → data_year 포함 UNIQUE 로 변경 (재실행해도 안전)
+UPDATE health_benchmark_quantiles SET data_year = 2024 WHERE data_year IS NULL;
+ALTER TABLE health_benchmark_quantiles ALTER COLUMN data_year SET NOT NULL;
+ALTER TABLE health_benchmark_quantiles DROP CONSTRAINT IF EXISTS health_benchmark_quantiles_uq;
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint
+        WHERE conname = 'health_benchmark_quantiles_year_uq'
+          AND conrelid = 'health_benchmark_quantiles'::regclass
+    ) THEN
+        ALTER TABLE health_benchmark_quantiles
+            ADD CONSTRAINT health_benchmark_quantiles_year_uq UNIQUE (gender, age_group_code, metric, data_year);
+    END IF;
+END$$;
+
+CREATE INDEX IF NOT EXISTS idx_hbq_gender_age ON health_benchmark_quantiles(gender, age_group_code);
+-- 최신 연도 조회용 (benchmark_lookup.BenchmarkLookup.from_supabase)
+CREATE INDEX IF NOT EXISTS idx_hbq_year ON health_benchmark_quantiles(data_year);
+COMMENT ON TABLE  health_benchmark_quantiles        IS '성별·연령대·지표별 건강검진 백분위 (t-digest 스케치 기반)';
+COMMENT ON COLUMN health_benchmark_quantiles.metric IS 'health_benchmarks 의 <metric>_avg / <metric>_std 와 같은 이름';
+COMMENT ON COLUMN health_benchmark_quantiles.sketch IS 't-digest 중심점(평균·가중치) — 임의 백분위 재계산·연도별 병합용';
+
+DROP TRIGGER IF EXISTS trg_hbq_updated_at ON health_benchmark_quantiles;
+CREATE TRIGGER trg_hbq_updated_at
+    BEFORE UPDATE ON health_benchmark_quantiles
+    FOR EACH ROW EXECUTE FUNCTION update_health_engine_updated_at();
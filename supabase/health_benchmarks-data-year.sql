@@ -0,0 +1,22 @@
+-- health_benchmarks 연도별 보관 마이그레이션
+-- 기존 UNIQUE (gender, age_group_code) → data_year 포함
+-- health_benchmark_quantiles(선택)의 연도 키는 health_benchmark_quantiles.sql 에서 처리
+-- 업로드: scripts/upload_health_engine.py --all-years (연도마다 별도 행으로 upsert)
+
+UPDATE health_benchmarks SET data_year = 2024 WHERE data_year IS NULL;
+ALTER TABLE health_benchmarks ALTER COLUMN data_year SET NOT NULL;
+
+ALTER TABLE health_benchmarks DROP CONSTRAINT IF EXISTS health_benchmarks_uq;
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint
+        WHERE conname = 'health_benchmarks_year_uq' AND conrelid = 'health_benchmarks'::regclass
+    ) THEN
+        ALTER TABLE health_benchmarks
+            ADD CONSTRAINT health_benchmarks_year_uq UNIQUE (gender, age_group_code, data_year);
+    END IF;
+END$$;
+
+-- 최신 연도 조회용 (benchmark_lookup.BenchmarkLookup.from_supabase)
+CREATE INDEX IF NOT EXISTS idx_hb_year ON health_benchmarks(data_year);
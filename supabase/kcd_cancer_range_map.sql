@@ -0,0 +1,39 @@
+-- ================================================================
+-- KCD 코드 → 암 참조 범위 매핑 (kcd_cancer_range_map)
+-- 업로드: scripts/upload_health_engine.py (scripts/kcd_ranges.py 로 범위 펼침)
+-- 선행: supabase/health_engine_tables.sql (update_health_engine_updated_at 함수)
+-- ================================================================
+
+-- cancer_incidence_reference / cancer_survival_reference 의 kcd_code 는 범위(C00-C14, C18-C20),
+-- disease_stats 의 kcd_code 는 개별 코드(C16, C18.0)이므로 조회 때 문자열 파싱 없이
+-- 아래 테이블을 거쳐 인덱스 동등 조인으로 연결한다.
+--
+--   SELECT ds.kcd_code, ds.patient_count, cs.five_year_survival_rate
+--   FROM disease_stats ds
+--   JOIN kcd_cancer_range_map m     ON m.kcd_code = ds.kcd_code AND m.is_most_specific
+--   JOIN cancer_survival_reference cs ON cs.kcd_code = m.kcd_range AND cs.is_latest;
+
+CREATE TABLE IF NOT EXISTS kcd_cancer_range_map (
+    id                BIGSERIAL PRIMARY KEY,
+
+    kcd_code          TEXT NOT NULL,    -- 개별 코드 (3단 C16 + disease_stats 실제 표기)
+    kcd_range         TEXT NOT NULL,    -- 암 참조 테이블 kcd_code 값 (예: C18-C20)
+    cancer_type       TEXT,             -- 한글 암종명 (예: 대장)
+    range_size        INT,              -- 범위에 포함된 3단 코드 수 (작을수록 구체적)
+    is_most_specific  BOOLEAN DEFAULT false, -- 코드별 가장 좁은 범위 여부
+
+    created_at        TIMESTAMPTZ DEFAULT NOW(),
+    updated_at        TIMESTAMPTZ DEFAULT NOW(),
+
+    CONSTRAINT kcd_cancer_range_map_uq UNIQUE (kcd_code, kcd_range)
+);
+
+CREATE INDEX IF NOT EXISTS idx_kcrm_code  ON kcd_cancer_range_map(kcd_code) WHERE is_most_specific;
+CREATE INDEX IF NOT EXISTS idx_kcrm_range ON kcd_cancer_range_map(kcd_range);
+COMMENT ON TABLE  kcd_cancer_range_map            IS 'KCD 개별 코드 → 암 참조 테이블 KCD 범위 (포함관계 전부, 1코드 N행)';
+COMMENT ON COLUMN kcd_cancer_range_map.range_size IS '범위 안 3단 코드 수 — C00-C96(모든 암) 같은 상위 범위일수록 큼';
+
+DROP TRIGGER IF EXISTS trg_kcrm_updated_at ON kcd_cancer_range_map;
+CREATE TRIGGER trg_kcrm_updated_at
+    BEFORE UPDATE ON kcd_cancer_range_map
+    FOR EACH ROW EXECUTE FUNCTION update_health_engine_updated_at();
@@ -0,0 +1,17 @@
+-- ================================================================
+-- 델타 동기화용 row_hash 컬럼
+-- 업로드: scripts/upload_nutrition.py --delta / scripts/upload_dur_rules.py --delta
+-- 레코드 내용 해시(scripts/delta_sync.py)를 저장해 재실행 시 변경분만 업로드
+-- ================================================================
+
+ALTER TABLE food_knowledge    ADD COLUMN IF NOT EXISTS row_hash TEXT;
+ALTER TABLE supplement_master ADD COLUMN IF NOT EXISTS row_hash TEXT;
+ALTER TABLE dur_rules         ADD COLUMN IF NOT EXISTS row_hash TEXT;
+
+-- keyset 페이지 조회(dur_type = ? AND item_seq > ? ORDER BY item_seq)용 복합 인덱스
+-- food_knowledge / supplement_master 는 food_code UNIQUE 인덱스를 그대로 사용
+CREATE INDEX IF NOT EXISTS idx_dur_rules_type_item_seq ON dur_rules(dur_type, item_seq);
+
+COMMENT ON COLUMN food_knowledge.row_hash    IS '업로드 레코드 내용 해시 (blake2b-128, 델타 동기화용)';
+COMMENT ON COLUMN supplement_master.row_hash IS '업로드 레코드 내용 해시 (blake2b-128, 델타 동기화용)';
+COMMENT ON COLUMN dur_rules.row_hash         IS '업로드 레코드 내용 해시 (blake2b-128, 델타 동기화용)';
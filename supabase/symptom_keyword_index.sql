@@ -0,0 +1,40 @@
+-- ================================================================
+-- 증상 키워드 역색인 (symptom_keyword_index)
+-- 업로드: scripts/upload_disease_stats.py (scripts/symptom_index.py 로 생성)
+-- 선행: supabase/disease_stats.sql (update_disease_stats_updated_at 함수)
+-- ================================================================
+
+-- disease_stats.symptom_keywords(자유 텍스트)를 정규화 키워드 단위로 펼친 posting list.
+-- 증상 → 질병 조회가 ILIKE 전체 스캔 대신 키워드 키 조회가 된다.
+--
+--   SELECT keyword, kcd_codes, weights
+--   FROM symptom_keyword_index
+--   WHERE keyword = ANY(ARRAY['두통', '어지러움']);
+--
+-- 키워드는 공백·괄호·# 를 뺀 소문자 NFKC 형태 ("허리 통증" → "허리통증")로 조회한다.
+
+CREATE TABLE IF NOT EXISTS symptom_keyword_index (
+    id            BIGSERIAL PRIMARY KEY,
+
+    keyword       TEXT     NOT NULL,  -- 정규화 키워드
+    kcd_codes     TEXT[]   NOT NULL,  -- posting list (patient_count 합 내림차순)
+    weights       BIGINT[] NOT NULL,  -- kcd_codes 와 같은 순서의 patient_count 합
+    code_count    INT,                -- posting list 길이
+    total_weight  BIGINT,             -- weights 합
+
+    row_hash      TEXT,               -- delta_sync 변경 감지용
+
+    created_at    TIMESTAMPTZ DEFAULT NOW(),
+    updated_at    TIMESTAMPTZ DEFAULT NOW(),
+
+    CONSTRAINT symptom_keyword_index_uq UNIQUE (keyword)
+);
+
+CREATE INDEX IF NOT EXISTS idx_ski_codes ON symptom_keyword_index USING GIN (kcd_codes);
+COMMENT ON TABLE  symptom_keyword_index         IS 'disease_stats.symptom_keywords 역색인 (키워드 → KCD 코드 posting list)';
+COMMENT ON COLUMN symptom_keyword_index.weights IS '양방/한방 · 입원/외래 행을 합산한 patient_count';
+
+DROP TRIGGER IF EXISTS trg_ski_updated_at ON symptom_keyword_index;
+CREATE TRIGGER trg_ski_updated_at
+    BEFORE UPDATE ON symptom_keyword_index
+    FOR EACH ROW EXECUTE FUNCTION update_disease_stats_updated_at();
@@ -4,10 +4,11 @@ import time
 import math
 from pathlib import Path
 
-import pandas as pd
 from supabase import create_client
 from dotenv import load_dotenv
 
+import parquet_io
+
 # 스크립트 위치 = 프로젝트 루트 (CSV/책갈피는 여기 기준)
 SCRIPT_DIR = Path(__file__).resolve().parent
 
@@ -18,6 +19,7 @@ key = os.getenv("NEXT_PUBLIC_SUPABASE_ANON_KEY")
 supabase = create_client(url, key)
 
 # 인자로 CSV 지정 시 part2 업로드, 없으면 기본 25만 건용
+# (.parquet 경로도 가능: row group 단위로 읽고 이어하기 시 앞쪽 그룹은 건너뜀)
 if len(sys.argv) >= 2:
     CSV_FILE = sys.argv[1]
     base = os.path.splitext(os.path.basename(CSV_FILE))[0]
@@ -33,6 +35,13 @@ CSV_PATH = SCRIPT_DIR / CSV_FILE
 STATUS_PATH = SCRIPT_DIR / STATUS_FILE
 
 BATCH_SIZE = 500
+# food_knowledge 에 넣는 컬럼 (Parquet 입력은 이 컬럼만 읽음)
+UPLOAD_COLS = [
+    "food_name", "calories", "protein", "fat", "carbs", "sugar", "sodium",
+    "clinical_insight", "synthetic_qa",
+]
+# 서버 부담 완화를 위한 배치 간 휴식 (초)
+THROTTLE_SEC = 0.5
 
 
 def _sanitize_record(rec: dict) -> dict:
@@ -62,15 +71,14 @@ def run_upload():
         with open(STATUS_PATH, "r") as f:
             start_row = int(f.read().strip())
 
-    # 2. 데이터 읽기
-    df = pd.read_csv(CSV_PATH)
-    total_rows = len(df)
+    # 2. 데이터 읽기 (CSV는 전체 로드, Parquet은 start_row가 든 row group부터 스트리밍)
+    total_rows, batches = parquet_io.read_batches(CSV_PATH, BATCH_SIZE, start_row, UPLOAD_COLS)
 
     print(f"🚀 {CSV_FILE} — 총 {total_rows}건 중 {start_row}번부터 업로드 재개!")
 
     # 3. 루프 돌며 업로드
-    for i in range(start_row, total_rows, BATCH_SIZE):
-        raw_batch = df.iloc[i : i + BATCH_SIZE].to_dict(orient="records")
+    for i, frame in zip(range(start_row, total_rows, BATCH_SIZE), batches):
+        raw_batch = frame.to_dict(orient="records")
         # NaN/Inf 등 JSON 비호환 값 정리
         batch = [_sanitize_record(r) for r in raw_batch]
         
@@ -89,7 +97,7 @@ def run_upload():
             print(f"[성공] {current_pos} / {progress_base:,} 완료 (진행률: {pct:.1f}%)")
 
             # 서버 부담 완화를 위한 짧은 휴식
-            time.sleep(0.5)
+            time.sleep(THROTTLE_SEC)
             
         except Exception as e:
             print(f"🚨 {i}번 지점에서 멈춤: {e}")
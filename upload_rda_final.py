@@ -4,19 +4,23 @@ processed_rda_final.csv → Supabase food_knowledge 테이블 업로드
 - CSV 헤더와 수파베이스 컬럼명 100% 일치하여 insert
 - 500개씩 배치, upload_rda_status.txt로 이어올리기(재시작 시 멈춘 지점부터)
 - 실시간 로그: "O건 완료/총 3,330건"
+- process_rda_xlsx.py --format parquet 결과(.parquet)를 인자로 주면 row group 단위로 읽음
 
 실행: python upload_rda_final.py
+      python upload_rda_final.py processed_rda_final.parquet
 """
 
 import os
+import sys
 import math
 import time
 from pathlib import Path
 
-import pandas as pd
 from supabase import create_client
 from dotenv import load_dotenv
 
+import parquet_io
+
 SCRIPT_DIR = Path(__file__).resolve().parent
 CSV_FILE = "processed_rda_final.csv"
 STATUS_FILE = "upload_rda_status.txt"
@@ -28,6 +32,9 @@ url = os.getenv("NEXT_PUBLIC_SUPABASE_URL")
 key = os.getenv("NEXT_PUBLIC_SUPABASE_ANON_KEY")
 supabase = create_client(url, key)
 
+# 인자로 파일 지정 가능 (.csv / .parquet). 같은 데이터이므로 책갈피 파일은 공유
+if len(sys.argv) >= 2:
+    CSV_FILE = sys.argv[1]
 CSV_PATH = SCRIPT_DIR / CSV_FILE
 STATUS_PATH = SCRIPT_DIR / STATUS_FILE
 
@@ -53,13 +60,12 @@ def run_upload():
         with open(STATUS_PATH, "r") as f:
             start_row = int(f.read().strip())
 
-    df = pd.read_csv(CSV_PATH)
-    total_rows = len(df)
+    total_rows, batches = parquet_io.read_batches(CSV_PATH, BATCH_SIZE, start_row)
 
     print(f"🚀 {CSV_FILE} → food_knowledge (총 {total_rows:,}건, {start_row}번부터 재개)")
 
-    for i in range(start_row, total_rows, BATCH_SIZE):
-        raw_batch = df.iloc[i : i + BATCH_SIZE].to_dict(orient="records")
+    for i, frame in zip(range(start_row, total_rows, BATCH_SIZE), batches):
+        raw_batch = frame.to_dict(orient="records")
         batch = [_sanitize_record(r) for r in raw_batch]
 
         try:
@@ -0,0 +1,172 @@
+"""
+엑셀(xlsx) 읽기 엔진 선택 (openpyxl / calamine)
+
+process_large_xlsx_to_csv.py · process_new_data.py · process_rda_xlsx.py ·
+make_check_sample.py 공용. --engine 옵션으로 파서를 고른다.
+
+  openpyxl : 기본값. 순수 파이썬 read_only 스트리밍
+  calamine : Rust 기반 python-calamine (pip install python-calamine). 수 배 빠름
+
+iter_rows()는 엔진과 관계없이 openpyxl ws.iter_rows(values_only=True)와 같은 행을 돌려준다.
+  - 빈 셀 → None, 정수로 저장된 숫자 → int, 날짜 → datetime.datetime
+  - openpyxl: 그대로 (행마다 시트 치수 <dimension>의 열 수만큼 None 으로 채움, 빈 행·헤더 뒤쪽 빈 칸 유지)
+  - calamine: 시트 XML 의 <dimension> 을 읽어 같은 모양(A1부터, 치수의 행·열 수)으로 맞춤.
+    calamine 은 값 없는 셀을 모르므로, 치수가 없는 시트는 행마다 값 있는 마지막 셀까지로 근사하고
+    치수 안인데 시트 XML 에 <row> 가 없는 끝 행(openpyxl 은 건너뜀)은 빈 행으로 채운다
+trim_row()는 pd.read_excel 처럼 행 뒤쪽 빈 셀을 잘라낸다 (process_rda_xlsx 의 read_excel 대체 경로용).
+read_excel()은 pd.read_excel(engine=...) 래퍼 (DataFrame이 필요한 스크립트용).
+
+엔진별 속도·메모리 비교: python3 scripts/bench/bench_xlsx_engines.py
+"""
+
+import datetime as dt
+import itertools
+import posixpath
+import re
+import zipfile
+from pathlib import Path
+from xml.etree import ElementTree as ET
+
+import pandas as pd
+
+ENGINES = ("openpyxl", "calamine")
+DEFAULT_ENGINE = "openpyxl"
+
+# openpyxl은 지수 표기 없이 저장된 숫자만 int로 읽는다. calamine은 모든 숫자를
+# float로 주므로, 지수 표기 없이 쓰이는 범위(|x| < 1e16)의 정수값만 int로 맞춤
+_INT_LIMIT = 1e16
+
+_DIMENSION_RE = re.compile(rb"<(?:\w+:)?dimension\s+ref=\"([A-Za-z0-9:$]+)\"")
+
+
+def check_engine(engine: str):
+    """엔진 사용 가능 여부 확인 → 불가하면 설치 안내와 함께 종료"""
+    if engine not in ENGINES:
+        raise SystemExit(f"❌ 지원하지 않는 엔진: {engine} (선택: {', '.join(ENGINES)})")
+    try:
+        if engine == "calamine":
+            import python_calamine  # noqa: F401
+        else:
+            import openpyxl  # noqa: F401
+    except ImportError:
+        pkg = "python-calamine" if engine == "calamine" else "openpyxl"
+        raise SystemExit(f"❌ {pkg} 필요: pip install {pkg}")
+
+
+def sheet_names(path, engine: str = DEFAULT_ENGINE) -> list[str]:
+    if engine == "calamine":
+        from python_calamine import CalamineWorkbook
+        return list(CalamineWorkbook.from_path(str(path)).sheet_names)
+    from openpyxl import load_workbook
+    wb = load_workbook(path, read_only=True)
+    try:
+        return list(wb.sheetnames)
+    finally:
+        wb.close()
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _cell_end(ref: str) -> tuple[int, int]:
+    """치수 ref("A1:E8" / "E8") 끝 셀 → (행 수, 열 수)"""
+    m = re.fullmatch(r"\$?([A-Za-z]+)\$?(\d+)", ref.split(":")[-1])
+    col = 0
+    for ch in m.group(1).upper():
+        col = col * 26 + ord(ch) - 64
+    return int(m.group(2)), col
+
+
+def _sheet_dimension(path, sheet_name) -> tuple[int, int] | None:
+    """시트 XML 의 <dimension ref> → (행 수, 열 수). 없으면 None (openpyxl read_only 가 행을 채우는 기준)"""
+    with zipfile.ZipFile(path) as z:
+        sheets = [e for e in ET.fromstring(z.read("xl/workbook.xml")).iter() if _local(e.tag) == "sheet"]
+        sheet = next((e for e in sheets if e.get("name") == sheet_name), None) if sheet_name else sheets[0]
+        rid = next(v for k, v in sheet.attrib.items() if _local(k) == "id")
+        rels = ET.fromstring(z.read("xl/_rels/workbook.xml.rels"))
+        target = next(e.get("Target") for e in rels.iter() if e.get("Id") == rid)
+        name = target.lstrip("/") if target.startswith("/") else posixpath.normpath(posixpath.join("xl", target))
+        with z.open(name) as f:
+            m = _DIMENSION_RE.search(f.read(1 << 16))  # <dimension> 은 시트 XML 앞부분에 있음
+    return _cell_end(m.group(1).decode()) if m else None
+
+
+def trim_row(row) -> tuple:
+    """뒤쪽 빈 셀(None · "") 제거 — pd.read_excel 의 행 규칙 (필요한 호출부에서 직접 적용)"""
+    n = len(row)
+    while n and (row[n - 1] is None or row[n - 1] == ""):
+        n -= 1
+    return tuple(row[:n])
+
+
+def _calamine_value(v):
+    if v == "":
+        return None
+    if type(v) is float and v.is_integer() and abs(v) < _INT_LIMIT:
+        return int(v)
+    if type(v) is dt.date:
+        return dt.datetime(v.year, v.month, v.day)
+    return v
+
+
+def _iter_openpyxl(path, sheet_name):
+    from openpyxl import load_workbook
+    wb = load_workbook(path, read_only=True, data_only=True, keep_links=False)
+    try:
+        ws = wb[sheet_name] if sheet_name else wb.active
+        yield from ws.iter_rows(values_only=True)
+    finally:
+        wb.close()
+
+
+def _iter_calamine(path, sheet_name):
+    from python_calamine import CalamineWorkbook
+    wb = CalamineWorkbook.from_path(str(path))
+    sheet = wb.get_sheet_by_name(sheet_name) if sheet_name else wb.get_sheet_by_index(0)
+    if sheet.start is None:    # 빈 시트 (openpyxl 도 행 없음)
+        return
+    dim = _sheet_dimension(path, sheet_name)
+
+    def rows():
+        # 열은 데이터가 시작되는 열부터 오므로 A1 기준으로 되돌림. 행은 버전에 따라
+        # A1부터(앞쪽 빈 행 포함) 또는 시작 행부터 오는데, 시작 행은 값이 있으므로 첫 행으로 구분
+        first_row, first_col = sheet.start
+        lead = (None,) * first_col
+        it = iter(sheet.iter_rows())
+        head = next(it, None)
+        if head is None:
+            return
+        if first_row and any(v != "" for v in head):
+            for _ in range(first_row):
+                yield ()
+        for row in itertools.chain((head,), it):
+            yield lead + tuple(map(_calamine_value, row))
+
+    if dim is None:
+        # 치수 없는 시트: openpyxl 은 행마다 마지막 셀까지만 → 값 있는 마지막 셀까지로 근사
+        yield from map(trim_row, rows())
+        return
+    # openpyxl read_only: 치수의 행 수까지, 행마다 치수의 열 수로 채우고 자름
+    n_rows, n_cols = dim
+    empty = (None,) * n_cols
+    count = 0
+    for row in rows():
+        if count == n_rows:
+            return
+        yield (row + empty)[:n_cols]
+        count += 1
+    for _ in range(count, n_rows):
+        yield empty
+
+
+def iter_rows(path, sheet_name: str | None = None, engine: str = DEFAULT_ENGINE):
+    """시트 행을 openpyxl ws.iter_rows(values_only=True) 와 같은 튜플로 yield (sheet_name 생략 시 첫/활성 시트)"""
+    if engine == "calamine":
+        return _iter_calamine(path, sheet_name)
+    return _iter_openpyxl(path, sheet_name)
+
+
+def read_excel(path, engine: str = DEFAULT_ENGINE, **kwargs) -> pd.DataFrame:
+    """pd.read_excel(path, engine=engine, **kwargs)"""
+    return pd.read_excel(Path(path), engine=engine, **kwargs)